@@ -0,0 +1,37 @@
+from surface3d_py import Surface3D
+from surface3d_tiles import TileSource
+from bokeh.plotting import curdoc
+
+# Run with: bokeh serve --show EXAMPLE_EARTH_server.py
+#
+# The DEM is opened lazily and only the tiles the view needs are read and
+# sent; zooming in swaps in finer tiles of the visible part of the grid.
+# Works the same for NetCDF/Zarr grids far larger than memory.
+source = TileSource.open(
+    "elev.nc",
+    variable="elevation",
+    tile_size=256,
+    cache_tiles=256,
+    # Metres to the same order as the degree axes
+    transform=lambda z: z.astype("float32") / 100,
+)
+
+surface = Surface3D.from_tiles(
+    source,
+    width=800,
+    height=800,
+    palette='terrain',
+    azimuth=45,
+    elevation=-30,
+    zoom=1.0,
+    enable_hover=True,
+    show_colorbar=True,
+    colorbar_title='Elevation (hm)',
+    x_label='Lon',
+    y_label='Lat',
+    background_color='#0a0a0a',
+    colorbar_text_color='#ffffff',
+    backend='webgl',
+)
+
+curdoc().add_root(surface)
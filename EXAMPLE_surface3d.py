@@ -7,14 +7,7 @@ y = np.linspace(-5, 5, 50)
 X, Y = np.meshgrid(x, y)
 Z = np.sin(np.sqrt(X**2 + Y**2))
 
-surf = Surface3D(
-    lons=X.flatten().tolist(),
-    lats=Y.flatten().tolist(),
-    values=Z.flatten().tolist(),
-    n_lat=50,
-    n_lon=50,
-    palette='viridis',
-)
+surf = Surface3D.from_arrays(Z, x, y, palette='viridis')
 show(surf)
 
 
@@ -28,12 +21,8 @@ y = np.linspace(-5, 5, 50)
 X, Y = np.meshgrid(x, y)
 Z = np.sin(3*np.sqrt(X**2 + Y**2))/np.sqrt(X**2 + Y**2 + 1e-6)
 
-surf = Surface3D(
-    lons=X.flatten().tolist(),
-    lats=Y.flatten().tolist(),
-    values=Z.flatten().tolist(),
-    n_lat=50,
-    n_lon=50,
+surf = Surface3D.from_arrays(
+    Z, x, y,
     palette='gist_earth',
     elevation=-20,
 )
@@ -47,13 +36,13 @@ show(surf)
 import numpy as np
 import math
 
-# Helper functions
+# Helper functions (elementwise on arrays)
 def square(x):
     return x * x
 
 def mod2(a, b):
-    c = a % b
-    return c if c > 0 else c + b
+    c = np.mod(a, b)
+    return np.where(c > 0, c, c + b)
 
 # Create sample data - a parametric rose surface
 n_lat, n_lon = 100, 100  # u_steps, v_steps in parametric terms
@@ -62,54 +51,25 @@ n_lat, n_lon = 100, 100  # u_steps, v_steps in parametric terms
 u = np.linspace(0, 1, n_lat)  # x1 parameter
 v = np.linspace(-(20/9)*math.pi, 15*math.pi, n_lon)  # theta parameter
 
-# Create meshgrids
-u_grid, v_grid = np.meshgrid(u, v)
-
-# Initialize arrays for coordinates
-x = np.zeros_like(u_grid)
-y = np.zeros_like(u_grid)
-z = np.zeros_like(u_grid)
-
-# Calculate parametric rose surface
-for i in range(n_lon):
-    for j in range(n_lat):
-        theta = v[i]
-        x1 = u[j]
-        
-        # Calculate phi
-        phi = (math.pi / 2) * math.exp(-theta / (8 * math.pi))
-        
-        # Calculate y1
-        y1 = (1.9565284531299512 * square(x1) * 
-              square(1.2768869870150188 * x1 - 1) * math.sin(phi))
-        
-        # Calculate X
-        X = 1 - square(1.25 * square(1 - mod2(3.6 * theta, 2 * math.pi) / math.pi) - 0.25) / 2
-        
-        # Calculate r
-        r = X * (x1 * math.sin(phi) + y1 * math.cos(phi))
-        
-        # Calculate coordinates (centered at origin)
-        x[i, j] = r * math.sin(theta)
-        y[i, j] = r * math.cos(theta)
-        z[i, j] = X * (x1 * math.cos(phi) - y1 * math.sin(phi))
-
-# Use x and y as lat/lon equivalents, z as values
-lon_grid = x
-lat_grid = y
-values = z
-
-# Flatten for the component
-lons_flat = lon_grid.flatten()
-lats_flat = lat_grid.flatten()
-values_flat = values.flatten()
+# Create meshgrids: rows follow theta, columns follow x1
+x1, theta = np.meshgrid(u, v)
+
+# Calculate parametric rose surface on the whole grid at once
+phi = (math.pi / 2) * np.exp(-theta / (8 * math.pi))
+y1 = (1.9565284531299512 * square(x1) *
+      square(1.2768869870150188 * x1 - 1) * np.sin(phi))
+X = 1 - square(1.25 * square(1 - mod2(3.6 * theta, 2 * math.pi) / math.pi) - 0.25) / 2
+r = X * (x1 * np.sin(phi) + y1 * np.cos(phi))
+
+# Coordinates (centered at origin); x and y as lon/lat equivalents, z as values
+x = r * np.sin(theta)
+y = r * np.cos(theta)
+z = X * (x1 * np.cos(phi) - y1 * np.sin(phi))
+
 # Create the Surface3D visualization with colorbar
-surface = Surface3D(
-    lons=lons_flat.tolist(),
-    lats=lats_flat.tolist(),
-    values=values_flat.tolist(),
-    n_lat=n_lat,
-    n_lon=n_lon,
+surface = Surface3D.from_arrays(
+    z, x, y,
+    float32=True,
     width=800,
     height=800,
     palette='Reds',  # or 'Viridis256', 'Plasma256', etc.
@@ -153,16 +113,8 @@ x = (1 + 0.3*np.sin(5*V*np.pi)) * np.cos(4*np.pi*V)
 y = (1 + 0.3*np.sin(5*V*np.pi)) * np.sin(4*np.pi*V)
 z = 5*V + 0.2*np.sin(10*U)
 
-lons = x.flatten()
-lats = y.flatten()
-values = z.flatten()
-
-surface = Surface3D(
-    lons=lons.tolist(),
-    lats=lats.tolist(),
-    values=values.tolist(),
-    n_lat=n_lat,
-    n_lon=n_lon,
+surface = Surface3D.from_arrays(
+    z, x, y,
     palette='cool',
     autorotate=True,
     zoom=1.0,
@@ -185,16 +137,8 @@ x = V * np.cos(U) * 5
 y = V * np.sin(U) * 5
 z = np.sin(3*U + V*10) * np.exp(-V*3)
 
-lons = x.flatten()
-lats = y.flatten()
-values = z.flatten()
-
-surface = Surface3D(
-    lons=lons.tolist(),
-    lats=lats.tolist(),
-    values=values.tolist(),
-    n_lat=n_lat,
-    n_lon=n_lon,
+surface = Surface3D.from_arrays(
+    z, x, y,
     palette='gnuplot',
     autorotate=True,
     zoom=1.0,
@@ -213,16 +157,8 @@ x = R * np.sin(k*U) * V * np.cos(U)
 y = R * np.sin(k*U) * V * np.sin(U)
 z = V**2 * 3
 
-lons = x.flatten()
-lats = y.flatten()
-values = z.flatten()
-
-surface = Surface3D(
-    lons=lons.tolist(),
-    lats=lats.tolist(),
-    values=values.tolist(),
-    n_lat=n_lat,
-    n_lon=n_lon,
+surface = Surface3D.from_arrays(
+    z, x, y,
     palette='winter',
     autorotate=True,
     zoom=1.0,
@@ -255,18 +191,9 @@ X = np.sin(V) * (15 * np.sin(U) - 4 * np.sin(3*U))
 Y = 8 * np.cos(V)
 Z = np.sin(V) * (15 * np.cos(U) - 5 * np.cos(2*U) - 2 * np.cos(3*U) - np.cos(4*U))
 
-# Flatten for Surface3D
-lons = X.flatten()
-lats = Z.flatten()   # swap Z to lat so rotation looks better
-values = Y.flatten()  # Y as height
-
-# Create Surface3D
-surface = Surface3D(
-    lons=lons.tolist(),
-    lats=lats.tolist(),
-    values=values.tolist(),
-    n_lat=n_lat,
-    n_lon=n_lon,
+# Create Surface3D: Z as lat so rotation looks better, Y as height
+surface = Surface3D.from_arrays(
+    Y, X, Z,
     palette='Reds_r',
     autorotate=True,
     zoom=0.8,  
@@ -296,26 +223,20 @@ from bokeh.plotting import show, output_file
 from surface3d_py import Surface3D
 
 # Your plotting function
-def plot_surface_bokeh(func, title="Surface", output_path="surface.html", n_lat=100, n_lon=100):
-    # Create grid
-    x = np.linspace(-5, 5, n_lon)
-    y = np.linspace(-5, 5, n_lat)
+def plot_surface_bokeh(func, title="Surface", output_path="surface.html", n_lat=100, n_lon=100, grid=None, **kwargs):
+    # Create grid, or use a shared one
+    if grid is None:
+        x = np.linspace(-5, 5, n_lon)
+        y = np.linspace(-5, 5, n_lat)
+    else:
+        x, y = grid.x, grid.y
     X, Y = np.meshgrid(x, y)
     
     # Compute Z
     Z = func(X, Y)
     
-    # Flatten for Surface3D
-    lons = X.flatten()
-    lats = Y.flatten()
-    values = Z.flatten()
-    
-    surface = Surface3D(
-        lons=lons.tolist(),
-        lats=lats.tolist(),
-        values=values.tolist(),
-        n_lat=n_lat,
-        n_lon=n_lon,
+    # Regular grid: send the 1-D axes and the 2-D Z array instead of full meshgrids
+    options = dict(
         palette='Spectral',
         autorotate=True,
         zoom=0.8,
@@ -325,6 +246,11 @@ def plot_surface_bokeh(func, title="Surface", output_path="surface.html", n_lat=
         colorbar_text_color='#ffffff',
         show_colorbar=True
     )
+    options.update(kwargs)
+    if grid is None:
+        surface = Surface3D.from_arrays(Z, x, y, **options)
+    else:
+        surface = Surface3D.from_arrays(Z, grid=grid, **options)
     
     output_file(output_path, title=title)
     return surface
@@ -341,7 +267,33 @@ best_surfaces = [
     (lambda X,Y: np.sin(X)*np.sin(Y) + np.cos(X*Y), "sin(X)*sin(Y)+cos(X*Y)")
 ]
 
-# Loop through and plot
-for idx, (func, name) in enumerate(best_surfaces, 1):
-    plot = plot_surface_bokeh(func, title=f"Surface {idx}: {name}", output_path=f"surface_best_{idx}.html")
-    show(plot)
+if __name__ == "__main__":
+    # All eight as small multiples on one page: the surfaces reference one
+    # SurfaceGrid, so the axes are sent and held in the browser once
+    from bokeh.layouts import gridplot
+    from bokeh.plotting import save
+    from surface3d_py import SurfaceGrid
+
+    grid = SurfaceGrid.from_arrays(np.linspace(-5, 5, 100), np.linspace(-5, 5, 100))
+    plots = [
+        plot_surface_bokeh(func, title="Surface catalog", output_path="output/surface_catalog.html",
+                           grid=grid, width=400, height=400, colorbar_title=name)
+        for func, name in best_surfaces
+    ]
+    save(gridplot(plots, ncols=4))
+
+    # Render the whole catalog headlessly in parallel, one rotating GIF per surface,
+    # instead of opening a browser tab for each (needs selenium and a browser driver)
+    from importlib.util import find_spec
+
+    if find_spec("selenium") is None:
+        print("selenium is not installed; skipping the GIF export")
+    else:
+        from surface3d_export import export_many
+
+        jobs = []
+        for idx, (func, name) in enumerate(best_surfaces, 1):
+            plot = plot_surface_bokeh(func, title=f"Surface {idx}: {name}", output_path=f"surface_best_{idx}.html")
+            jobs.append((plot, f"output/surface_best_{idx}.gif"))
+        print(export_many(jobs))
+
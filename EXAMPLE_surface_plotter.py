@@ -40,7 +40,7 @@ def compute_surface(equation_str):
         namespace = {'np': np, 'X': X, 'Y': Y}
         Z = eval(equation_str, {"__builtins__": {}}, namespace)
         
-        return X.flatten(), Y.flatten(), Z.flatten(), None
+        return X, Y, Z, None
     except Exception as e:
         return None, None, None, str(e)
 
@@ -54,16 +54,14 @@ if error:
     y = np.linspace(-3, 3, n_points)
     X, Y = np.meshgrid(x, y)
     Z = X * 0
-    X, Y, Z = X.flatten(), Y.flatten(), Z.flatten()
 
 # Create Surface3D
-surface = Surface3D(
-    lons=X.tolist(),
-    lats=Y.tolist(),
-    values=Z.tolist(),
-    n_lat=n_points,
-    n_lon=n_points,
+# Values change in the browser, so the color range stays automatic
+surface = Surface3D.from_arrays(
+    Z, X, Y,
+    compute_range=False,
     palette='terrain',
+    preload_palettes=PALETTES,  # palettes the Select below can switch to
     autorotate=False,
     zoom=1.2,
     width=900,
@@ -133,7 +131,7 @@ status_div = Div(
 )
 
 # CustomJS callback to update surface
-# This updates Surface3D's lons, lats, values properties directly
+# This replaces Surface3D's values on the unchanged grid
 update_callback = CustomJS(
     args=dict(
         equation_input=equation_input,
@@ -153,15 +151,13 @@ update_callback = CustomJS(
         const equation = equation_input.value;
         const n = n_points;
 
-        // Create grid and compute surface
-        const lons = [];
-        const lats = [];
-        const values = [];
+        // Compute new values on the existing grid (rows follow Y, columns X)
+        const values = new Float64Array(n * n);
         
         for (let i = 0; i < n; i++) {
             for (let j = 0; j < n; j++) {
-                const X = x_min + (x_max - x_min) * i / (n - 1);
-                const Y = y_min + (y_max - y_min) * j / (n - 1);
+                const X = x_min + (x_max - x_min) * j / (n - 1);
+                const Y = y_min + (y_max - y_min) * i / (n - 1);
                 
                 // Create safe numpy-like object
                 const np = {
@@ -187,23 +183,17 @@ update_callback = CustomJS(
                 
                 const Z = eval(safe_eq);
                 
-                lons.push(X);
-                lats.push(Y);
-                values.push(Z);
+                values[i * n + j] = Z;
             }
         }
         
-        // Update Surface3D properties directly
-        surface.lons = lons;
-        surface.lats = lats;
+        // A new equation replaces the whole grid, so reassign values: the
+        // z scale and color range are then rebuilt for the new data
         surface.values = values;
         
         // Update palette if changed
         surface.palette = palette_select.value;
         
-        // HACK: Trigger surface re-render by tiny rotation change
-        surface.azimuth = surface.azimuth + 0.0000001;
-        
         status_div.text = "<div style='padding:10px; background:#e8f5e9; border-radius:5px;'><b>✓ Status:</b> Surface updated! Click and drag to rotate.</div>";
         
     } catch (e) {
@@ -237,15 +227,13 @@ preset_callback = CustomJS(
             const equation = equation_input.value;
             const n = n_points;
 
-            // Create grid and compute surface
-            const lons = [];
-            const lats = [];
-            const values = [];
+            // Compute new values on the existing grid (rows follow Y, columns X)
+            const values = new Float64Array(n * n);
             
             for (let i = 0; i < n; i++) {
                 for (let j = 0; j < n; j++) {
-                    const X = x_min + (x_max - x_min) * i / (n - 1);
-                    const Y = y_min + (y_max - y_min) * j / (n - 1);
+                    const X = x_min + (x_max - x_min) * j / (n - 1);
+                    const Y = y_min + (y_max - y_min) * i / (n - 1);
                     
                     // Create safe numpy-like object
                     const np = {
@@ -271,20 +259,14 @@ preset_callback = CustomJS(
                     
                     const Z = eval(safe_eq);
                     
-                    lons.push(X);
-                    lats.push(Y);
-                    values.push(Z);
+                    values[i * n + j] = Z;
                 }
             }
             
-            // Update Surface3D properties directly
-            surface.lons = lons;
-            surface.lats = lats;
+            // A new equation replaces the whole grid, so reassign values: the
+            // z scale and color range are then rebuilt for the new data
             surface.values = values;
             
-            // HACK: Trigger surface re-render by tiny rotation change
-            surface.azimuth = surface.azimuth + 0.0000001;
-            
             status_div.text = "<div style='padding:10px; background:#e8f5e9; border-radius:5px;'><b>✓ Status:</b> Surface updated! Click and drag to rotate.</div>";
             
         } catch (e) {
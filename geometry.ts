@@ -0,0 +1,417 @@
+/**
+ * View-independent surface geometry and colors
+ *
+ * Everything here depends only on the data and the color mapping, never on
+ * azimuth, elevation or zoom, so Surface3DView builds it once per data change
+ * and reuses it across rotation frames.
+ */
+import type {Arrayable} from "core/types"
+import {getValueRange, mapToPaletteIndices, valueStats} from "./palettes"
+import type {PaletteLUT, ValueStats} from "./palettes"
+import {projectSphere} from "./projections"
+import type {GridGeometry, ViewBounds} from "./kernel"
+
+export interface GridData {
+  lons: Arrayable<number>
+  lats: Arrayable<number>
+  x: Arrayable<number>
+  y: Arrayable<number>
+  n_lat: number
+  n_lon: number
+  // Vertex index triples of an irregular triangle mesh; when non-empty,
+  // lons/lats hold one entry per vertex and n_lat/n_lon are not used
+  triangles?: Arrayable<number>
+}
+
+export interface SurfaceData extends GridData {
+  values: Arrayable<number>
+  // Optional [lon_min, lon_max, lat_min, lat_max, z_min, z_max] to scale and
+  // center by instead of the data, when only a window of a grid is sent
+  extent?: Arrayable<number>
+}
+
+export interface DataBounds extends ViewBounds {
+  z_min: number
+  z_max: number
+}
+
+// The value-independent part of the geometry, which surfaces on one
+// SurfaceGrid share
+export interface SurfaceCoordinates {
+  n_lat: number
+  n_lon: number
+  rectilinear: boolean
+  // Rectilinear grid with monotonic axes, i.e. a height field z = f(x, y)
+  // that can be drawn back to front without sorting
+  height_field: boolean
+  // Vertex coordinates in view space (xs = -lon, ys = lat). On rectilinear
+  // grids xs holds the n_lon column values and ys the n_lat row values,
+  // otherwise both hold one entry per vertex.
+  xs: Float64Array
+  ys: Float64Array
+  // Ranges of xs and ys
+  x_stats: ValueStats
+  y_stats: ValueStats
+  // Triangle mesh (see GridGeometry): vertex index triples, with the
+  // vertices stored as one row of a non-rectilinear grid
+  triangles?: Arrayable<number>
+}
+
+export interface SurfaceGeometry extends SurfaceCoordinates {
+  values: Arrayable<number>
+  bounds: DataBounds
+  // Range and NaN count of values (of all frames, for a time series),
+  // computed once per data change. Used for the automatic color range and
+  // to tell whether patched values still fit.
+  stats: ValueStats
+}
+
+export interface SurfaceColors {
+  vmin: number
+  vmax: number
+  // Color index per quad, row-major over (n_lat - 1) x (n_lon - 1), or per
+  // triangle of a mesh
+  quad_index: Uint16Array
+  // CSS color and packed RGBA bytes per index: the palette entries followed
+  // by the NaN color
+  styles: string[]
+  rgba: Uint8Array
+}
+
+/**
+ * True when 1-D x/y axes matching the grid size were supplied
+ */
+export function isRectilinear(data: GridData): boolean {
+  return data.x.length == data.n_lon && data.y.length == data.n_lat && data.n_lon > 0
+}
+
+/**
+ * True when full lons/lats arrays are a meshgrid of two 1-D axes, i.e. every
+ * row repeats the first row's lons and every column the first column's lats
+ */
+function isMeshgrid(lons: Arrayable<number>, lats: Arrayable<number>, n_lat: number, n_lon: number): boolean {
+  if (n_lat < 1 || n_lon < 1 || lons.length != n_lat * n_lon || lats.length != n_lat * n_lon) {
+    return false
+  }
+  for (let i = 0; i < n_lat; i++) {
+    const offset = i * n_lon
+    const lat = lats[offset]
+    for (let j = 0; j < n_lon; j++) {
+      if (lons[offset + j] !== lons[j] || lats[offset + j] !== lat) {
+        return false
+      }
+    }
+  }
+  return true
+}
+
+function isMonotonic(axis: ArrayLike<number>): boolean {
+  if (axis.length < 2) return true
+  const sign = Math.sign(axis[axis.length - 1] - axis[0])
+  if (sign == 0) return false
+  for (let k = 1; k < axis.length; k++) {
+    if (Math.sign(axis[k] - axis[k - 1]) != sign) return false
+  }
+  return true
+}
+
+/**
+ * Build vertex coordinates. Full lons/lats that turn out to be a meshgrid are
+ * collapsed to their axes, so they get the same rectilinear treatment as
+ * explicit x/y axes.
+ */
+export function buildCoordinates(data: GridData): SurfaceCoordinates {
+  const {triangles} = data
+  if (triangles != null && triangles.length > 0) {
+    const n_vertices = data.lons.length
+    const xs = new Float64Array(n_vertices)
+    for (let i = 0; i < n_vertices; i++) {
+      xs[i] = -data.lons[i]
+    }
+    const ys = Float64Array.from(data.lats)
+    return {
+      n_lat: 1, n_lon: n_vertices, rectilinear: false, height_field: false,
+      xs, ys, x_stats: valueStats(xs), y_stats: valueStats(ys), triangles,
+    }
+  }
+  const {n_lat, n_lon} = data
+  const axes = isRectilinear(data)
+  const lons = axes ? data.x : data.lons
+  const lats = axes ? data.y : data.lats
+  const rectilinear = axes || isMeshgrid(lons, lats, n_lat, n_lon)
+
+  let xs: Float64Array
+  let ys: Float64Array
+  if (rectilinear && !axes) {
+    xs = new Float64Array(n_lon)
+    ys = new Float64Array(n_lat)
+    for (let j = 0; j < n_lon; j++) {
+      xs[j] = -lons[j]
+    }
+    for (let i = 0; i < n_lat; i++) {
+      ys[i] = lats[i * n_lon]
+    }
+  } else {
+    xs = new Float64Array(lons.length)
+    for (let i = 0; i < lons.length; i++) {
+      xs[i] = -lons[i]
+    }
+    ys = Float64Array.from(lats)
+  }
+  const height_field = rectilinear && isMonotonic(xs) && isMonotonic(ys)
+  // On rectilinear grids the axes alone give the coordinate ranges
+  return {n_lat, n_lon, rectilinear, height_field, xs, ys, x_stats: valueStats(xs), y_stats: valueStats(ys)}
+}
+
+/**
+ * Build the geometry of values on a grid, from coordinates built (and
+ * possibly shared) beforehand or else from the grid in data
+ */
+export function buildGeometry(data: SurfaceData, coordinates: SurfaceCoordinates = buildCoordinates(data)): SurfaceGeometry {
+  const {x_stats, y_stats} = coordinates
+  const stats = valueStats(data.values)
+  let bounds: DataBounds
+  const {extent} = data
+  if (extent != null && extent.length == 6) {
+    const [lon_min, lon_max, lat_min, lat_max, z_min, z_max] = extent
+    bounds = dataBounds(lon_min, lon_max, lat_min, lat_max, z_min, z_max)
+  } else {
+    // All-NaN values still get a finite, flat surface
+    const finite = stats.min <= stats.max
+    bounds = dataBounds(
+      -x_stats.max, -x_stats.min, y_stats.min, y_stats.max,
+      finite ? stats.min : 0, finite ? stats.max : 0,
+    )
+  }
+  return {...coordinates, values: data.values, bounds, stats}
+}
+
+function dataBounds(
+  lon_min: number,
+  lon_max: number,
+  lat_min: number,
+  lat_max: number,
+  z_min: number,
+  z_max: number
+): DataBounds {
+  return {
+    center_x: -(lon_min + lon_max) / 2,
+    center_y: (lat_min + lat_max) / 2,
+    center_z: (z_min + z_max) / 2,
+    // Use the maximum extent in any dimension for consistent scaling
+    range: Math.max(lon_max - lon_min, lat_max - lat_min, z_max - z_min),
+    z_min,
+    z_max,
+  }
+}
+
+/**
+ * Color every quad by the average of its four corner values (every
+ * triangle of a mesh by the average of its three). The NaN color is given
+ * both as CSS and as RGBA bytes.
+ */
+export function buildColors(
+  geometry: SurfaceGeometry,
+  lut: PaletteLUT,
+  vmin: number,
+  vmax: number,
+  nan_color: string,
+  nan_rgba: ArrayLike<number>
+): SurfaceColors {
+  const {n_lat, n_lon, values, triangles} = geometry
+  const range = getValueRange(values, vmin, vmax, geometry.stats)
+  let averages: Float64Array
+  if (triangles != null) {
+    averages = new Float64Array(triangles.length / 3)
+    for (let t = 0; t < averages.length; t++) {
+      averages[t] = (values[triangles[3 * t]] + values[triangles[3 * t + 1]] + values[triangles[3 * t + 2]]) / 3
+    }
+  } else {
+    averages = new Float64Array(Math.max(n_lat - 1, 0) * Math.max(n_lon - 1, 0))
+    let q = 0
+    for (let i = 0; i < n_lat - 1; i++) {
+      const row = i * n_lon
+      const next = row + n_lon
+      for (let j = 0; j < n_lon - 1; j++) {
+        averages[q++] = (values[row + j] + values[row + j + 1] + values[next + j + 1] + values[next + j]) / 4
+      }
+    }
+  }
+  const size = lut.colors.length
+  const quad_index = mapToPaletteIndices(averages, range.vmin, range.vmax, size, new Uint16Array(averages.length))
+
+  // Palette entries followed by the NaN color, which is index `size`
+  const styles = [...lut.colors, nan_color]
+  const rgba = new Uint8Array(4 * (size + 1))
+  rgba.set(lut.rgba)
+  rgba.set(nan_rgba, 4 * size)
+  return {vmin: range.vmin, vmax: range.vmax, quad_index, styles, rgba}
+}
+
+/**
+ * Recolor, in place and with the existing color range, only the quads that
+ * touch a patched tile of n_rows x n_cols values starting at (row, col)
+ */
+export function patchColors(
+  geometry: SurfaceGeometry,
+  colors: SurfaceColors,
+  row: number,
+  col: number,
+  n_rows: number,
+  n_cols: number
+): void {
+  const {n_lat, n_lon, values} = geometry
+  const {vmin, vmax, quad_index, styles} = colors
+  const size = styles.length - 1
+  const i0 = Math.max(row - 1, 0)
+  const i1 = Math.min(row + n_rows - 1, n_lat - 2)
+  const j0 = Math.max(col - 1, 0)
+  const j1 = Math.min(col + n_cols - 1, n_lon - 2)
+  if (i1 < i0 || j1 < j0) return
+  const averages = new Float64Array(j1 - j0 + 1)
+  for (let i = i0; i <= i1; i++) {
+    const row_start = i * n_lon
+    const next = row_start + n_lon
+    for (let j = j0; j <= j1; j++) {
+      averages[j - j0] = (values[row_start + j] + values[row_start + j + 1] + values[next + j + 1] + values[next + j]) / 4
+    }
+    const q0 = i * (n_lon - 1) + j0
+    mapToPaletteIndices(averages, vmin, vmax, size, quad_index.subarray(q0, q0 + averages.length))
+  }
+}
+
+function strideIndices(n: number, stride: number): number[] {
+  const indices: number[] = []
+  for (let k = 0; k < n - 1; k += stride) {
+    indices.push(k)
+  }
+  // Always keep the last row/column so the outline of the surface is intact
+  if (n > 0) indices.push(n - 1)
+  return indices
+}
+
+/**
+ * Keep every stride-th row and column (plus the last ones) of the vertex
+ * coordinates
+ */
+export function decimateCoordinates(coordinates: SurfaceCoordinates, stride: number): SurfaceCoordinates {
+  const {rectilinear, xs, ys} = coordinates
+  const rows = strideIndices(coordinates.n_lat, stride)
+  const cols = strideIndices(coordinates.n_lon, stride)
+  const n_lat = rows.length
+  const n_lon = cols.length
+
+  const sub_xs = new Float64Array(rectilinear ? n_lon : n_lat * n_lon)
+  const sub_ys = new Float64Array(rectilinear ? n_lat : n_lat * n_lon)
+  if (rectilinear) {
+    for (let j = 0; j < n_lon; j++) sub_xs[j] = xs[cols[j]]
+    for (let i = 0; i < n_lat; i++) sub_ys[i] = ys[rows[i]]
+  } else {
+    for (let i = 0; i < n_lat; i++) {
+      const src = rows[i] * coordinates.n_lon
+      const dst = i * n_lon
+      for (let j = 0; j < n_lon; j++) {
+        sub_xs[dst + j] = xs[src + cols[j]]
+        sub_ys[dst + j] = ys[src + cols[j]]
+      }
+    }
+  }
+  return {
+    n_lat, n_lon, rectilinear,
+    height_field: coordinates.height_field,
+    xs: sub_xs, ys: sub_ys,
+    x_stats: coordinates.x_stats, y_stats: coordinates.y_stats,
+  }
+}
+
+/**
+ * Keep every stride-th row and column (plus the last ones). The result is a
+ * smaller grid of the same kind that shares the bounds of the original.
+ * Coordinates already decimated by the same stride, e.g. cached on a shared
+ * grid, are reused.
+ */
+export function decimateGeometry(
+  geometry: SurfaceGeometry,
+  stride: number,
+  coordinates: SurfaceCoordinates = decimateCoordinates(geometry, stride)
+): SurfaceGeometry {
+  const {values, bounds, stats} = geometry
+  const rows = strideIndices(geometry.n_lat, stride)
+  const cols = strideIndices(geometry.n_lon, stride)
+  const {n_lat, n_lon} = coordinates
+
+  const sub_values = new Float64Array(n_lat * n_lon)
+  for (let i = 0; i < n_lat; i++) {
+    const src = rows[i] * geometry.n_lon
+    const dst = i * n_lon
+    for (let j = 0; j < n_lon; j++) {
+      sub_values[dst + j] = values[src + cols[j]]
+    }
+  }
+  return {...coordinates, values: sub_values, bounds, stats}
+}
+
+/**
+ * Unit vector of every vertex on the globe, three per vertex, placed by
+ * projectSphere without rotation so the globe keeps its lon/lat convention
+ */
+export function globeDirections(coordinates: SurfaceCoordinates): Float64Array {
+  const {n_lat, n_lon, rectilinear, xs, ys} = coordinates
+  const directions = new Float64Array(3 * n_lat * n_lon)
+  for (let i = 0; i < n_lat; i++) {
+    for (let j = 0; j < n_lon; j++) {
+      const idx = i * n_lon + j
+      const lon = -(rectilinear ? xs[j] : xs[idx])
+      const lat = rectilinear ? ys[i] : ys[idx]
+      // Unrotated, projectSphere returns the sphere's x as x, its y as depth
+      // and its z as y
+      const point = projectSphere(lon, lat, 1, 0, 1, 0)
+      directions[3 * idx] = point.x
+      directions[3 * idx + 1] = point.depth
+      directions[3 * idx + 2] = point.y
+    }
+  }
+  return directions
+}
+
+/**
+ * Wrap a lon/lat geometry onto a globe: every vertex moves along its
+ * direction to radius 1 + relief * (value - z_min) / (z_max - z_min), so
+ * values become radial relief above a unit sphere (NaN values, and values
+ * below z_min, sit on it). The result is a non-rectilinear grid (or mesh)
+ * in view space, drawn like a parametric surface with the globe's far side
+ * culled; its quads match the geometry's, so the geometry's colors and
+ * picking still apply.
+ */
+export function buildGlobe(
+  geometry: SurfaceGeometry,
+  relief: number,
+  z_min: number,
+  z_max: number,
+  directions: Float64Array = globeDirections(geometry)
+): GridGeometry {
+  const {n_lat, n_lon, values, triangles} = geometry
+  const n = n_lat * n_lon
+  const xs = new Float64Array(n)
+  const ys = new Float64Array(n)
+  const zs = new Float64Array(n)
+  const k = z_max > z_min ? Math.max(relief, 0) / (z_max - z_min) : 0
+  for (let idx = 0; idx < n; idx++) {
+    // Nothing may sink below the sphere, which the culling relies on
+    const value = values[idx]
+    const r = value > z_min ? 1 + (value - z_min) * k : 1
+    xs[idx] = directions[3 * idx] * r
+    ys[idx] = directions[3 * idx + 1] * r
+    zs[idx] = directions[3 * idx + 2] * r
+  }
+  return {n_lat, n_lon, rectilinear: false, height_field: false, xs, ys, values: zs, triangles, globe: true}
+}
+
+/**
+ * Bounds of a globe with the given relief, centered on the sphere and
+ * scaled so the globe spans about 80% of the canvas at zoom 1
+ */
+export function globeBounds(relief: number): DataBounds {
+  const radius = 1 + Math.max(relief, 0)
+  return {center_x: 0, center_y: 0, center_z: 0, range: 1.5 * radius, z_min: -radius, z_max: radius}
+}
@@ -0,0 +1,99 @@
+/**
+ * Grid coordinates shared by several Surface3D models
+ *
+ * Surfaces that reference the same SurfaceGrid get its coordinate arrays
+ * from one model, which is serialized once per document. The coordinates
+ * derived from them (view-space vertex positions, ranges and the strided
+ * subsets drawn while interacting) are cached here on the model, so every
+ * view on the grid reuses them instead of building its own copies.
+ *
+ * The Python model has no implementation of its own; surface3d.ts registers
+ * this class along with Surface3D.
+ */
+import * as p from "core/properties"
+import {Model} from "model"
+import type {Arrayable} from "core/types"
+import {logger} from "core/logging"
+import {buildCoordinates, decimateCoordinates} from "./geometry"
+import type {SurfaceCoordinates} from "./geometry"
+
+export namespace SurfaceGrid {
+  export type Attrs = p.AttrsOf<Props>
+  export type Props = Model.Props & {
+    lons: p.Property<Arrayable<number>>
+    lats: p.Property<Arrayable<number>>
+    x: p.Property<Arrayable<number>>
+    y: p.Property<Arrayable<number>>
+    n_lat: p.Property<number>
+    n_lon: p.Property<number>
+  }
+}
+
+export interface SurfaceGrid extends SurfaceGrid.Attrs {}
+
+export class SurfaceGrid extends Model {
+  declare properties: SurfaceGrid.Props
+
+  // Registered by hand rather than compiled from __implementation__, so the
+  // qualified name must be given to match the Python model
+  // (surface3d_py.SurfaceGrid)
+  static override __module__ = "surface3d_py"
+
+  private coordinates?: SurfaceCoordinates
+  // Subsets of the coordinates keyed by stride
+  private readonly strided = new Map<number, SurfaceCoordinates>()
+  // Lookups served from the cache vs. rebuilds, across all views on the grid
+  readonly cache_stats = {hits: 0, rebuilds: 0}
+
+  constructor(attrs?: Partial<SurfaceGrid.Attrs>) {
+    super(attrs)
+  }
+
+  override connect_signals(): void {
+    super.connect_signals()
+    // Connected before any view's, so the cache is dropped before the views
+    // on the grid rebuild
+    this.connect(this.change, () => {
+      this.coordinates = undefined
+      this.strided.clear()
+    })
+  }
+
+  /**
+   * Vertex coordinates of the grid, built on the first request
+   */
+  get_coordinates(): SurfaceCoordinates {
+    if (this.coordinates == null) {
+      const {lons, lats, x, y, n_lat, n_lon} = this
+      this.coordinates = buildCoordinates({lons, lats, x, y, n_lat, n_lon})
+      this.cache_stats.rebuilds++
+      logger.debug(`SurfaceGrid: built coordinates (${n_lat}x${n_lon})`)
+    } else {
+      this.cache_stats.hits++
+    }
+    return this.coordinates
+  }
+
+  /**
+   * Coordinates of every stride-th row and column (see decimateGeometry)
+   */
+  get_strided(stride: number): SurfaceCoordinates {
+    let coordinates = this.strided.get(stride)
+    if (coordinates == null) {
+      coordinates = decimateCoordinates(this.get_coordinates(), stride)
+      this.strided.set(stride, coordinates)
+    }
+    return coordinates
+  }
+
+  static {
+    this.define<SurfaceGrid.Props>(({Arrayable, Float, Int}) => ({
+      lons: [ Arrayable(Float), [] ],
+      lats: [ Arrayable(Float), [] ],
+      x: [ Arrayable(Float), [] ],
+      y: [ Arrayable(Float), [] ],
+      n_lat: [ Int, 0 ],
+      n_lon: [ Int, 0 ],
+    }))
+  }
+}
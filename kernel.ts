@@ -0,0 +1,512 @@
+/**
+ * Allocation-free Canvas2D render kernel for Surface3D
+ *
+ * All per-frame state lives in preallocated typed arrays (FrameBuffers) that
+ * are reused between frames; nothing in the inner loops allocates objects.
+ * This module deliberately has no imports so it stays self-contained, which
+ * lets kernelSource() ship it to a Web Worker as plain source text.
+ */
+
+export interface GridGeometry {
+  n_lat: number
+  n_lon: number
+  rectilinear: boolean
+  height_field: boolean
+  xs: ArrayLike<number>
+  ys: ArrayLike<number>
+  values: ArrayLike<number>
+  // Irregular triangle mesh: vertex index triples. The vertices are then
+  // stored as a single row (n_lat = 1, n_lon = number of vertices) of a
+  // non-rectilinear grid.
+  triangles?: ArrayLike<number>
+  // Globe shell (see buildGlobe in geometry.ts): vertices on or above a unit
+  // sphere around the origin, whose far side is culled before sorting
+  globe?: boolean
+}
+
+export interface ViewParams {
+  cos_azim: number
+  sin_azim: number
+  cos_elev: number
+  sin_elev: number
+  scale: number
+  // Screen position of the data center
+  cx: number
+  cy: number
+  // Projected data center, subtracted before scaling
+  center_x_proj: number
+  center_z_proj: number
+}
+
+// Center and size of the data the view is scaled and centered by (see
+// DataBounds in geometry.ts)
+export interface ViewBounds {
+  center_x: number
+  center_y: number
+  center_z: number
+  range: number
+}
+
+export interface FrameBuffers {
+  n_vertices: number
+  n_quads: number
+  // Per-vertex screen coordinates and depth
+  sx: Float32Array
+  sy: Float32Array
+  depth: Float32Array
+  // Per-column rotation terms for rectilinear grids
+  col_x: Float32Array
+  col_y: Float32Array
+  // Per-quad (or per-triangle, for a mesh) depth, quantized sort keys and
+  // draw order (back to front)
+  quad_depth: Float32Array
+  keys: Uint32Array
+  order: Uint32Array
+  order_tmp: Uint32Array
+  counts: Uint32Array
+  // Quads (or triangles) left after culling the far side of a globe
+  visible: Uint32Array
+  // Traversal direction currently stored in order, or -1 after a depth sort
+  traversal: number
+}
+
+const RADIX_BITS = 11
+const RADIX_SIZE = 1 << RADIX_BITS
+const RADIX_MASK = RADIX_SIZE - 1
+const KEY_MAX = (1 << (2 * RADIX_BITS)) - 1
+
+/**
+ * Allocate frame buffers, or return the given ones if they already fit
+ */
+export function ensureFrameBuffers(buffers: FrameBuffers | undefined, n_lat: number, n_lon: number): FrameBuffers {
+  const n_vertices = n_lat * n_lon
+  const n_quads = Math.max(n_lat - 1, 0) * Math.max(n_lon - 1, 0)
+  if (buffers != null && buffers.n_vertices == n_vertices && buffers.n_quads == n_quads && buffers.col_x.length == n_lon) {
+    return buffers
+  }
+  return {
+    n_vertices,
+    n_quads,
+    sx: new Float32Array(n_vertices),
+    sy: new Float32Array(n_vertices),
+    depth: new Float32Array(n_vertices),
+    col_x: new Float32Array(n_lon),
+    col_y: new Float32Array(n_lon),
+    quad_depth: new Float32Array(n_quads),
+    keys: new Uint32Array(n_quads),
+    order: new Uint32Array(n_quads),
+    order_tmp: new Uint32Array(n_quads),
+    counts: new Uint32Array(RADIX_SIZE),
+    visible: new Uint32Array(n_quads),
+    traversal: -1,
+  }
+}
+
+/**
+ * Allocate frame buffers for a triangle mesh, whose per-quad arrays then
+ * hold one entry per triangle, or return the given ones if they already fit
+ */
+export function ensureMeshBuffers(buffers: FrameBuffers | undefined, n_vertices: number, n_triangles: number): FrameBuffers {
+  if (buffers != null && buffers.n_vertices == n_vertices && buffers.n_quads == n_triangles && buffers.col_x.length == 0) {
+    return buffers
+  }
+  return {
+    n_vertices,
+    n_quads: n_triangles,
+    sx: new Float32Array(n_vertices),
+    sy: new Float32Array(n_vertices),
+    depth: new Float32Array(n_vertices),
+    col_x: new Float32Array(0),
+    col_y: new Float32Array(0),
+    quad_depth: new Float32Array(n_triangles),
+    keys: new Uint32Array(n_triangles),
+    order: new Uint32Array(n_triangles),
+    order_tmp: new Uint32Array(n_triangles),
+    counts: new Uint32Array(RADIX_SIZE),
+    visible: new Uint32Array(n_triangles),
+    traversal: -1,
+  }
+}
+
+/**
+ * Rotation terms, scale and centering of a view at the given azimuth and
+ * elevation (in degrees) and zoom on a width x height canvas. Scaling and
+ * centering come from the data bounds, not from projected data, so they stay
+ * consistent at every rotation angle and grid level.
+ */
+export function viewParams(
+  bounds: ViewBounds,
+  azimuth: number,
+  elevation: number,
+  zoom: number,
+  width: number,
+  height: number
+): ViewParams {
+  const elev_rad = elevation * Math.PI / 180
+  const azim_rad = azimuth * Math.PI / 180
+  const cos_azim = Math.cos(azim_rad)
+  const sin_azim = Math.sin(azim_rad)
+  const cos_elev = Math.cos(elev_rad)
+  const sin_elev = Math.sin(elev_rad)
+  const {center_x, center_y, center_z, range} = bounds
+
+  // Fixed scale based on data range, not projection
+  const scale = (Math.min(width, height) / range) * 0.6 * zoom
+
+  // Project the center point to find the offset
+  const center_x_proj = center_x * cos_azim - center_y * sin_azim
+  const center_y_rot = center_x * sin_azim + center_y * cos_azim
+  const center_z_proj = center_y_rot * sin_elev + center_z * cos_elev
+  return {
+    cos_azim, sin_azim, cos_elev, sin_elev, scale,
+    cx: width / 2, cy: height / 2, center_x_proj, center_z_proj,
+  }
+}
+
+/**
+ * Rotate, tilt, scale and center every vertex into sx/sy/depth
+ */
+export function projectVertices(geometry: GridGeometry, view: ViewParams, buffers: FrameBuffers): void {
+  const {n_lat, n_lon, xs, ys, values} = geometry
+  const {cos_azim, sin_azim, cos_elev, sin_elev, scale, cx, cy, center_x_proj, center_z_proj} = view
+  const {sx, sy, depth} = buffers
+
+  if (geometry.rectilinear) {
+    // The azimuth rotation is separable on a rectilinear grid: compute the
+    // column (x) and row (y) terms once and add them per vertex
+    const {col_x, col_y} = buffers
+    for (let j = 0; j < n_lon; j++) {
+      col_x[j] = xs[j] * cos_azim
+      col_y[j] = xs[j] * sin_azim
+    }
+    for (let i = 0; i < n_lat; i++) {
+      const row_x = -ys[i] * sin_azim
+      const row_y = ys[i] * cos_azim
+      const offset = i * n_lon
+      for (let j = 0; j < n_lon; j++) {
+        const idx = offset + j
+        const z = values[idx]
+        const x_rot = col_x[j] + row_x
+        const y_rot = col_y[j] + row_y
+        sx[idx] = cx + (x_rot - center_x_proj) * scale
+        sy[idx] = cy - (y_rot * sin_elev + z * cos_elev - center_z_proj) * scale
+        depth[idx] = y_rot * cos_elev - z * sin_elev
+      }
+    }
+  } else {
+    const n = n_lat * n_lon
+    for (let idx = 0; idx < n; idx++) {
+      const x = xs[idx]
+      const y = ys[idx]
+      const z = values[idx]
+      const x_rot = x * cos_azim - y * sin_azim
+      const y_rot = x * sin_azim + y * cos_azim
+      sx[idx] = cx + (x_rot - center_x_proj) * scale
+      sy[idx] = cy - (y_rot * sin_elev + z * cos_elev - center_z_proj) * scale
+      depth[idx] = y_rot * cos_elev - z * sin_elev
+    }
+  }
+}
+
+/**
+ * Average the four corner depths of every quad into quad_depth
+ */
+export function computeQuadDepths(n_lat: number, n_lon: number, buffers: FrameBuffers): void {
+  const {depth, quad_depth} = buffers
+  let q = 0
+  for (let i = 0; i < n_lat - 1; i++) {
+    const row = i * n_lon
+    const next = row + n_lon
+    for (let j = 0; j < n_lon - 1; j++) {
+      quad_depth[q++] = (depth[row + j] + depth[row + j + 1] + depth[next + j + 1] + depth[next + j]) / 4
+    }
+  }
+}
+
+/**
+ * Average the three corner depths of every triangle into quad_depth
+ */
+export function computeTriangleDepths(triangles: ArrayLike<number>, buffers: FrameBuffers): void {
+  const {depth, quad_depth, n_quads} = buffers
+  for (let t = 0; t < n_quads; t++) {
+    quad_depth[t] = (depth[triangles[3 * t]] + depth[triangles[3 * t + 1]] + depth[triangles[3 * t + 2]]) / 3
+  }
+}
+
+/**
+ * Fill buffers.order with quad indices sorted by ascending depth (back to
+ * front) using a two-pass LSD radix sort on depth quantized to 22 bits.
+ * NaN depths sort first. Ties keep grid order, so the sort is stable.
+ * Given items, only the first count quad indices in it are sorted, e.g. the
+ * quads left after culling.
+ */
+export function sortQuadsByDepth(buffers: FrameBuffers, items?: ArrayLike<number>, count: number = buffers.n_quads): Uint32Array {
+  const {quad_depth, keys, order, order_tmp, counts} = buffers
+
+  // Keys, and the order_tmp entries of pass 1, are by position in items
+  let min = Infinity
+  let max = -Infinity
+  for (let t = 0; t < count; t++) {
+    const d = quad_depth[items != null ? items[t] : t]
+    if (d < min) min = d
+    if (d > max) max = d
+  }
+  const k = max > min ? KEY_MAX / (max - min) : 0
+  for (let t = 0; t < count; t++) {
+    const d = quad_depth[items != null ? items[t] : t]
+    keys[t] = d == d ? Math.floor((d - min) * k) : 0
+  }
+
+  // Pass 1: low bits, from item (or grid) order into order_tmp
+  counts.fill(0)
+  for (let t = 0; t < count; t++) {
+    counts[keys[t] & RADIX_MASK]++
+  }
+  let sum = 0
+  for (let b = 0; b < RADIX_SIZE; b++) {
+    const c = counts[b]
+    counts[b] = sum
+    sum += c
+  }
+  for (let t = 0; t < count; t++) {
+    order_tmp[counts[keys[t] & RADIX_MASK]++] = t
+  }
+
+  // Pass 2: high bits, from order_tmp into order
+  counts.fill(0)
+  for (let t = 0; t < count; t++) {
+    counts[keys[t] >>> RADIX_BITS]++
+  }
+  sum = 0
+  for (let b = 0; b < RADIX_SIZE; b++) {
+    const c = counts[b]
+    counts[b] = sum
+    sum += c
+  }
+  for (let s = 0; s < count; s++) {
+    const t = order_tmp[s]
+    order[counts[keys[t] >>> RADIX_BITS]++] = items != null ? items[t] : t
+  }
+  buffers.traversal = -1
+  return order
+}
+
+/**
+ * True when a projected vertex lies behind the unit sphere of a globe: on
+ * the far side (negative depth) and inside the sphere's outline, given its
+ * screen offset (dx, dy) from the sphere's center and the outline's squared
+ * radius r2 in pixels
+ */
+export function hiddenBySphere(dx: number, dy: number, depth: number, r2: number): boolean {
+  return depth < 0 && dx * dx + dy * dy < r2
+}
+
+/**
+ * Write the quads of a globe that are not hidden behind its unit sphere to
+ * buffers.visible and return how many there are. Relief only raises
+ * vertices above the sphere, so a quad whose four corners are all hidden
+ * cannot be seen; roughly half of a globe is culled this way.
+ */
+export function cullHiddenQuads(n_lat: number, n_lon: number, view: ViewParams, buffers: FrameBuffers): number {
+  const {sx, sy, depth, visible} = buffers
+  const {scale, cx, cy, center_x_proj, center_z_proj} = view
+  const ox = cx - center_x_proj * scale
+  const oy = cy + center_z_proj * scale
+  const r2 = scale * scale
+  let count = 0
+  let q = 0
+  for (let i = 0; i < n_lat - 1; i++) {
+    const row = i * n_lon
+    const next = row + n_lon
+    for (let j = 0; j < n_lon - 1; j++, q++) {
+      const a = row + j
+      const b = a + 1
+      const c = next + j + 1
+      const d = next + j
+      if (
+        hiddenBySphere(sx[a] - ox, sy[a] - oy, depth[a], r2) &&
+        hiddenBySphere(sx[b] - ox, sy[b] - oy, depth[b], r2) &&
+        hiddenBySphere(sx[c] - ox, sy[c] - oy, depth[c], r2) &&
+        hiddenBySphere(sx[d] - ox, sy[d] - oy, depth[d], r2)
+      ) continue
+      visible[count++] = q
+    }
+  }
+  return count
+}
+
+/**
+ * Like cullHiddenQuads, for the triangles of a mesh wrapped onto a globe
+ */
+export function cullHiddenTriangles(triangles: ArrayLike<number>, view: ViewParams, buffers: FrameBuffers): number {
+  const {sx, sy, depth, visible, n_quads} = buffers
+  const {scale, cx, cy, center_x_proj, center_z_proj} = view
+  const ox = cx - center_x_proj * scale
+  const oy = cy + center_z_proj * scale
+  const r2 = scale * scale
+  let count = 0
+  for (let t = 0; t < n_quads; t++) {
+    const a = triangles[3 * t]
+    const b = triangles[3 * t + 1]
+    const c = triangles[3 * t + 2]
+    if (
+      hiddenBySphere(sx[a] - ox, sy[a] - oy, depth[a], r2) &&
+      hiddenBySphere(sx[b] - ox, sy[b] - oy, depth[b], r2) &&
+      hiddenBySphere(sx[c] - ox, sy[c] - oy, depth[c], r2)
+    ) continue
+    visible[count++] = t
+  }
+  return count
+}
+
+/**
+ * Back-to-front order for a height field on a rectilinear grid with
+ * monotonic axes, derived from the view direction alone (no sorting).
+ *
+ * Along any view ray the horizontal distance to the viewer changes
+ * monotonically, and a height field has one surface point per (x, y), so
+ * walking rows and columns from the far side to the near side never draws a
+ * quad before one it hides. Only the signs of the horizontal view direction
+ * matter, so the order is rebuilt only when the view crosses into another
+ * quadrant.
+ */
+export function traverseBackToFront(
+  geometry: GridGeometry,
+  view: ViewParams,
+  buffers: FrameBuffers
+): Uint32Array {
+  const {n_lat, n_lon, xs, ys} = geometry
+  const {order} = buffers
+  // Larger horizontal component y_rot * cos_elev is nearer the viewer, with
+  // y_rot = x * sin_azim + y * cos_azim
+  const toward = view.cos_elev < 0 ? -1 : 1
+  const cols_forward = (xs[n_lon - 1] - xs[0]) * view.sin_azim * toward >= 0
+  const rows_forward = (ys[n_lat - 1] - ys[0]) * view.cos_azim * toward >= 0
+  const traversal = (rows_forward ? 2 : 0) + (cols_forward ? 1 : 0)
+  if (buffers.traversal == traversal) {
+    return order
+  }
+
+  const n_rows = n_lat - 1
+  const n_cols = n_lon - 1
+  let t = 0
+  for (let r = 0; r < n_rows; r++) {
+    const i = rows_forward ? r : n_rows - 1 - r
+    const offset = i * n_cols
+    if (cols_forward) {
+      for (let j = 0; j < n_cols; j++) order[t++] = offset + j
+    } else {
+      for (let j = n_cols - 1; j >= 0; j--) order[t++] = offset + j
+    }
+  }
+  buffers.traversal = traversal
+  return order
+}
+
+/**
+ * Fill and stroke quads in the given order. Colors are given as one index
+ * per quad into styles; fill/stroke styles are only reassigned when the
+ * index changes. Quads colored by the last style, the NaN color, touch a
+ * NaN value and are skipped, as the WebGL backend leaves them out too.
+ */
+export function drawQuads(
+  ctx: CanvasRenderingContext2D | OffscreenCanvasRenderingContext2D,
+  n_lon: number,
+  buffers: FrameBuffers,
+  order: ArrayLike<number>,
+  count: number,
+  quad_index: ArrayLike<number>,
+  styles: ArrayLike<string>
+): void {
+  const {sx, sy} = buffers
+  const n_cols = n_lon - 1
+  const nan_index = styles.length - 1
+  ctx.lineWidth = 1.2
+  ctx.globalAlpha = 1
+  let current = -1
+  for (let t = 0; t < count; t++) {
+    const q = order[t]
+    const color = quad_index[q]
+    if (color === nan_index) continue
+    const i = Math.floor(q / n_cols)
+    const j = q - i * n_cols
+    const idx0 = i * n_lon + j
+    const idx1 = idx0 + 1
+    const idx3 = idx0 + n_lon
+    const idx2 = idx3 + 1
+
+    if (color !== current) {
+      const style = styles[color]
+      ctx.fillStyle = style
+      ctx.strokeStyle = style
+      current = color
+    }
+    ctx.beginPath()
+    ctx.moveTo(sx[idx0], sy[idx0])
+    ctx.lineTo(sx[idx1], sy[idx1])
+    ctx.lineTo(sx[idx2], sy[idx2])
+    ctx.lineTo(sx[idx3], sy[idx3])
+    ctx.closePath()
+    ctx.fill()
+    ctx.stroke()
+  }
+}
+
+/**
+ * Fill and stroke mesh triangles in the given order, like drawQuads with one
+ * color index per triangle
+ */
+export function drawTriangles(
+  ctx: CanvasRenderingContext2D | OffscreenCanvasRenderingContext2D,
+  triangles: ArrayLike<number>,
+  buffers: FrameBuffers,
+  order: ArrayLike<number>,
+  count: number,
+  triangle_index: ArrayLike<number>,
+  styles: ArrayLike<string>
+): void {
+  const {sx, sy} = buffers
+  const nan_index = styles.length - 1
+  ctx.lineWidth = 1.2
+  ctx.globalAlpha = 1
+  let current = -1
+  for (let k = 0; k < count; k++) {
+    const t = order[k]
+    const color = triangle_index[t]
+    if (color === nan_index) continue
+    const a = triangles[3 * t]
+    const b = triangles[3 * t + 1]
+    const c = triangles[3 * t + 2]
+
+    if (color !== current) {
+      const style = styles[color]
+      ctx.fillStyle = style
+      ctx.strokeStyle = style
+      current = color
+    }
+    ctx.beginPath()
+    ctx.moveTo(sx[a], sy[a])
+    ctx.lineTo(sx[b], sy[b])
+    ctx.lineTo(sx[c], sy[c])
+    ctx.closePath()
+    ctx.fill()
+    ctx.stroke()
+  }
+}
+
+/**
+ * Source text of this module's constants and functions, for evaluating in a
+ * Web Worker that has no access to the extension's module system
+ */
+export function kernelSource(): string {
+  const constants = {RADIX_BITS, RADIX_SIZE, RADIX_MASK, KEY_MAX}
+  const functions = [
+    ensureFrameBuffers, ensureMeshBuffers, projectVertices, computeQuadDepths,
+    computeTriangleDepths, sortQuadsByDepth, hiddenBySphere, cullHiddenQuads, cullHiddenTriangles,
+    traverseBackToFront, drawQuads, drawTriangles,
+  ]
+  return [
+    ...Object.entries(constants).map(([name, value]) => `const ${name} = ${value};`),
+    ...functions.map((fn) => fn.toString()),
+  ].join("\n")
+}
@@ -0,0 +1,248 @@
+/**
+ * Screen-space picking for Surface3D
+ *
+ * After a frame, the projected quads are binned into a coarse grid of screen
+ * cells (built on the first hover after each frame). A hover then only tests
+ * the few quads overlapping the cursor's cell and returns the frontmost one
+ * with the data coordinates and value interpolated at the cursor.
+ * Like kernel.ts, this module has no runtime imports.
+ */
+import type {GridGeometry, FrameBuffers} from "./kernel"
+
+export interface PickIndex {
+  cell_size: number
+  n_cols: number
+  n_rows: number
+  // Quads overlapping screen cell c are quads[starts[c]] .. quads[starts[c + 1] - 1]
+  starts: Uint32Array
+  quads: Uint32Array
+}
+
+export interface PickResult {
+  quad: number
+  lon: number
+  lat: number
+  value: number
+}
+
+/**
+ * Bin every drawable quad by its screen bounding box. Quads with a NaN
+ * corner are left out, as they are not drawn.
+ */
+export function buildPickIndex(
+  n_lat: number,
+  n_lon: number,
+  buffers: FrameBuffers,
+  width: number,
+  height: number,
+  cell_size: number = 16
+): PickIndex {
+  const {sx, sy} = buffers
+  const n_cols = Math.max(1, Math.ceil(width / cell_size))
+  const n_rows = Math.max(1, Math.ceil(height / cell_size))
+  const n_cells = n_cols * n_rows
+  const counts = new Uint32Array(n_cells + 1)
+
+  // Visit every quad's clipped cell range; pass 0 counts, pass 1 fills
+  let quads = new Uint32Array(0)
+  for (let pass = 0; pass < 2; pass++) {
+    for (let i = 0; i < n_lat - 1; i++) {
+      for (let j = 0; j < n_lon - 1; j++) {
+        const idx0 = i * n_lon + j
+        const idx1 = idx0 + 1
+        const idx3 = idx0 + n_lon
+        const idx2 = idx3 + 1
+        const x_min = Math.min(sx[idx0], sx[idx1], sx[idx2], sx[idx3])
+        const x_max = Math.max(sx[idx0], sx[idx1], sx[idx2], sx[idx3])
+        const y_min = Math.min(sy[idx0], sy[idx1], sy[idx2], sy[idx3])
+        const y_max = Math.max(sy[idx0], sy[idx1], sy[idx2], sy[idx3])
+        // NaN bounds fail every comparison below and are skipped
+        if (!(x_max >= 0 && y_max >= 0 && x_min < width && y_min < height)) continue
+        const c0 = Math.max(0, Math.floor(x_min / cell_size))
+        const c1 = Math.min(n_cols - 1, Math.floor(x_max / cell_size))
+        const r0 = Math.max(0, Math.floor(y_min / cell_size))
+        const r1 = Math.min(n_rows - 1, Math.floor(y_max / cell_size))
+        const q = i * (n_lon - 1) + j
+        for (let r = r0; r <= r1; r++) {
+          for (let c = c0; c <= c1; c++) {
+            if (pass == 0) {
+              counts[r * n_cols + c + 1]++
+            } else {
+              quads[counts[r * n_cols + c]++] = q
+            }
+          }
+        }
+      }
+    }
+    if (pass == 0) {
+      for (let c = 0; c < n_cells; c++) {
+        counts[c + 1] += counts[c]
+      }
+      quads = new Uint32Array(counts[n_cells])
+    }
+  }
+  // The fill pass advanced every start to the next cell's start; shift back
+  counts.copyWithin(1, 0, n_cells)
+  counts[0] = 0
+  return {cell_size, n_cols, n_rows, starts: counts, quads}
+}
+
+/**
+ * Frontmost quad under the screen point (px, py) and the data coordinates
+ * and value there, or null if the point misses the surface. Each quad is
+ * tested as the two triangles (0, 1, 2) and (0, 2, 3); within a triangle the
+ * projection is affine, so barycentric interpolation is exact.
+ */
+export function pickQuad(
+  index: PickIndex,
+  geometry: GridGeometry,
+  buffers: FrameBuffers,
+  px: number,
+  py: number
+): PickResult | null {
+  const {cell_size, n_cols, n_rows, starts, quads} = index
+  const c = Math.floor(px / cell_size)
+  const r = Math.floor(py / cell_size)
+  if (c < 0 || r < 0 || c >= n_cols || r >= n_rows) return null
+
+  const {n_lon, rectilinear, xs, ys, values} = geometry
+  const {sx, sy, depth} = buffers
+  const cell = r * n_cols + c
+  let best: PickResult | null = null
+  let best_depth = -Infinity
+  for (let k = starts[cell]; k < starts[cell + 1]; k++) {
+    const q = quads[k]
+    const i = Math.floor(q / (n_lon - 1))
+    const j = q - i * (n_lon - 1)
+    const idx0 = i * n_lon + j
+    const corners = [idx0, idx0 + 1, idx0 + n_lon + 1, idx0 + n_lon]
+    for (let t = 0; t < 2; t++) {
+      const a = corners[0]
+      const b = corners[t + 1]
+      const d = corners[t + 2]
+      const det = (sx[b] - sx[a]) * (sy[d] - sy[a]) - (sx[d] - sx[a]) * (sy[b] - sy[a])
+      if (det == 0 || det != det) continue
+      const wb = ((px - sx[a]) * (sy[d] - sy[a]) - (sx[d] - sx[a]) * (py - sy[a])) / det
+      const wd = ((sx[b] - sx[a]) * (py - sy[a]) - (px - sx[a]) * (sy[b] - sy[a])) / det
+      const wa = 1 - wb - wd
+      if (wa < 0 || wb < 0 || wd < 0) continue
+      // Larger depth is nearer the viewer
+      const z = wa * depth[a] + wb * depth[b] + wd * depth[d]
+      if (z <= best_depth) continue
+      best_depth = z
+      const x_at = (v: number) => rectilinear ? xs[v % n_lon] : xs[v]
+      const y_at = (v: number) => rectilinear ? ys[Math.floor(v / n_lon)] : ys[v]
+      best = {
+        quad: q,
+        // View-space x is the negated longitude
+        lon: -(wa * x_at(a) + wb * x_at(b) + wd * x_at(d)),
+        lat: wa * y_at(a) + wb * y_at(b) + wd * y_at(d),
+        value: wa * values[a] + wb * values[b] + wd * values[d],
+      }
+    }
+  }
+  return best
+}
+
+/**
+ * Bin every drawable triangle of a mesh by its screen bounding box, like
+ * buildPickIndex; the index then holds triangle numbers
+ */
+export function buildTrianglePickIndex(
+  triangles: ArrayLike<number>,
+  buffers: FrameBuffers,
+  width: number,
+  height: number,
+  cell_size: number = 16
+): PickIndex {
+  const {sx, sy} = buffers
+  const n_triangles = Math.floor(triangles.length / 3)
+  const n_cols = Math.max(1, Math.ceil(width / cell_size))
+  const n_rows = Math.max(1, Math.ceil(height / cell_size))
+  const n_cells = n_cols * n_rows
+  const counts = new Uint32Array(n_cells + 1)
+
+  let items = new Uint32Array(0)
+  for (let pass = 0; pass < 2; pass++) {
+    for (let t = 0; t < n_triangles; t++) {
+      const a = triangles[3 * t]
+      const b = triangles[3 * t + 1]
+      const c = triangles[3 * t + 2]
+      const x_min = Math.min(sx[a], sx[b], sx[c])
+      const x_max = Math.max(sx[a], sx[b], sx[c])
+      const y_min = Math.min(sy[a], sy[b], sy[c])
+      const y_max = Math.max(sy[a], sy[b], sy[c])
+      if (!(x_max >= 0 && y_max >= 0 && x_min < width && y_min < height)) continue
+      const c0 = Math.max(0, Math.floor(x_min / cell_size))
+      const c1 = Math.min(n_cols - 1, Math.floor(x_max / cell_size))
+      const r0 = Math.max(0, Math.floor(y_min / cell_size))
+      const r1 = Math.min(n_rows - 1, Math.floor(y_max / cell_size))
+      for (let r = r0; r <= r1; r++) {
+        for (let col = c0; col <= c1; col++) {
+          if (pass == 0) {
+            counts[r * n_cols + col + 1]++
+          } else {
+            items[counts[r * n_cols + col]++] = t
+          }
+        }
+      }
+    }
+    if (pass == 0) {
+      for (let cell = 0; cell < n_cells; cell++) {
+        counts[cell + 1] += counts[cell]
+      }
+      items = new Uint32Array(counts[n_cells])
+    }
+  }
+  counts.copyWithin(1, 0, n_cells)
+  counts[0] = 0
+  return {cell_size, n_cols, n_rows, starts: counts, quads: items}
+}
+
+/**
+ * Frontmost mesh triangle under the screen point (px, py), like pickQuad;
+ * `quad` of the result is the triangle number
+ */
+export function pickTriangle(
+  index: PickIndex,
+  geometry: GridGeometry,
+  buffers: FrameBuffers,
+  px: number,
+  py: number
+): PickResult | null {
+  const {cell_size, n_cols, n_rows, starts, quads} = index
+  const col = Math.floor(px / cell_size)
+  const row = Math.floor(py / cell_size)
+  if (col < 0 || row < 0 || col >= n_cols || row >= n_rows) return null
+
+  const {xs, ys, values} = geometry
+  const triangles = geometry.triangles!
+  const {sx, sy, depth} = buffers
+  const cell = row * n_cols + col
+  let best: PickResult | null = null
+  let best_depth = -Infinity
+  for (let k = starts[cell]; k < starts[cell + 1]; k++) {
+    const t = quads[k]
+    const a = triangles[3 * t]
+    const b = triangles[3 * t + 1]
+    const d = triangles[3 * t + 2]
+    const det = (sx[b] - sx[a]) * (sy[d] - sy[a]) - (sx[d] - sx[a]) * (sy[b] - sy[a])
+    if (det == 0 || det != det) continue
+    const wb = ((px - sx[a]) * (sy[d] - sy[a]) - (sx[d] - sx[a]) * (py - sy[a])) / det
+    const wd = ((sx[b] - sx[a]) * (py - sy[a]) - (px - sx[a]) * (sy[b] - sy[a])) / det
+    const wa = 1 - wb - wd
+    if (wa < 0 || wb < 0 || wd < 0) continue
+    // Larger depth is nearer the viewer
+    const z = wa * depth[a] + wb * depth[b] + wd * depth[d]
+    if (z <= best_depth) continue
+    best_depth = z
+    best = {
+      quad: t,
+      // View-space x is the negated longitude
+      lon: -(wa * xs[a] + wb * xs[b] + wd * xs[d]),
+      lat: wa * ys[a] + wb * ys[b] + wd * ys[d],
+      value: wa * values[a] + wb * values[b] + wd * values[d],
+    }
+  }
+  return best
+}
@@ -0,0 +1,108 @@
+/**
+ * Per-stage render profiling for Surface3D
+ *
+ * Each timed stage of a frame is recorded as a performance measure named
+ * "Surface3D <stage>" (and whole frames as "Surface3D frame"), so they show
+ * up in the browser's performance panel. The durations of the last frames
+ * are kept in a ring buffer and summarized as mean milliseconds per stage,
+ * mean/p95/max frame time and frames per second.
+ */
+
+export const STAGES = ["geometry", "colors", "project", "order", "draw", "upload"] as const
+export type Stage = typeof STAGES[number]
+
+const N_STAGES = STAGES.length
+
+export class RenderProfiler {
+  // Per frame: the stage durations followed by the frame duration
+  private readonly durations: Float64Array
+  // Start time of each frame, for the frame rate
+  private readonly starts: Float64Array
+  private readonly current = new Float64Array(N_STAGES)
+  private frame_start: number = 0
+  private n_quads: number = 0
+  // Frames recorded in total; the ring holds the last `size`
+  private count: number = 0
+
+  constructor(readonly size: number = 120) {
+    this.durations = new Float64Array(size * (N_STAGES + 1))
+    this.starts = new Float64Array(size)
+  }
+
+  get frames(): number {
+    return this.count
+  }
+
+  begin_frame(): void {
+    this.current.fill(0)
+    this.frame_start = performance.now()
+  }
+
+  /**
+   * Run one stage of the current frame and record how long it took
+   */
+  time<T>(stage: Stage, fn: () => T): T {
+    const start = performance.now()
+    const result = fn()
+    const end = performance.now()
+    performance.measure(`Surface3D ${stage}`, {start, end})
+    this.current[STAGES.indexOf(stage)] += end - start
+    return result
+  }
+
+  end_frame(n_quads: number): void {
+    const end = performance.now()
+    performance.measure("Surface3D frame", {start: this.frame_start, end})
+    const slot = this.count % this.size
+    const offset = slot * (N_STAGES + 1)
+    this.durations.set(this.current, offset)
+    this.durations[offset + N_STAGES] = end - this.frame_start
+    this.starts[slot] = this.frame_start
+    this.n_quads = n_quads
+    this.count++
+  }
+
+  /**
+   * Summary of the frames in the ring: `<stage>_ms` means, `frame_ms`,
+   * `frame_p95_ms`, `frame_max_ms`, `fps` (between the first and last frame
+   * in the ring), `frames` (recorded in total) and `n_quads` of the last frame
+   */
+  summary(): {[key: string]: number} {
+    const n = Math.min(this.count, this.size)
+    const summary: {[key: string]: number} = {frames: this.count, n_quads: this.n_quads}
+    if (n == 0) return summary
+    const totals = new Float64Array(N_STAGES + 1)
+    const frame_ms = new Float64Array(n)
+    for (let k = 0; k < n; k++) {
+      for (let s = 0; s <= N_STAGES; s++) {
+        totals[s] += this.durations[k * (N_STAGES + 1) + s]
+      }
+      frame_ms[k] = this.durations[k * (N_STAGES + 1) + N_STAGES]
+    }
+    STAGES.forEach((stage, s) => {
+      summary[`${stage}_ms`] = totals[s] / n
+    })
+    frame_ms.sort()
+    summary.frame_ms = totals[N_STAGES] / n
+    summary.frame_p95_ms = frame_ms[Math.min(n - 1, Math.floor(0.95 * n))]
+    summary.frame_max_ms = frame_ms[n - 1]
+
+    // Oldest and newest start in the ring
+    const newest = (this.count - 1) % this.size
+    const oldest = this.count > this.size ? this.count % this.size : 0
+    const span = this.starts[newest] - this.starts[oldest]
+    summary.fps = n > 1 && span > 0 ? 1000 * (n - 1) / span : 0
+    return summary
+  }
+
+  /**
+   * Drop the recorded measures from the performance timeline, which would
+   * otherwise grow with every frame
+   */
+  clear_measures(): void {
+    for (const stage of STAGES) {
+      performance.clearMeasures(`Surface3D ${stage}`)
+    }
+    performance.clearMeasures("Surface3D frame")
+  }
+}
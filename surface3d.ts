@@ -3,13 +3,100 @@
 import * as p from "core/properties"
 import {LayoutDOM, LayoutDOMView} from "models/layouts/layout_dom"
 import {div} from "core/dom"
-import {getPalette, valueToColor, getValueRange} from "./palettes"
+import type {Arrayable, Dict} from "core/types"
+import {color2rgba} from "core/util/color"
+import {logger} from "core/logging"
+import {dict} from "core/util/object"
+import {Signal} from "core/signaling"
+import {register_models} from "base"
+import {getPalette, getPaletteLUT, mapToPaletteIndices, registerPalette, valueStats} from "./palettes"
+import {buildGeometry, buildColors, decimateGeometry, patchColors} from "./geometry"
+import {buildGlobe, globeBounds, globeDirections} from "./geometry"
+import type {SurfaceGeometry, SurfaceColors, DataBounds} from "./geometry"
+import {ensureFrameBuffers, ensureMeshBuffers, projectVertices, computeQuadDepths, computeTriangleDepths} from "./kernel"
+import {sortQuadsByDepth, cullHiddenQuads, cullHiddenTriangles, traverseBackToFront, drawQuads, drawTriangles, viewParams} from "./kernel"
+import type {FrameBuffers, GridGeometry, ViewParams} from "./kernel"
+import {buildPickIndex, buildTrianglePickIndex, pickQuad, pickTriangle} from "./picking"
+import type {PickIndex} from "./picking"
+import {WebGLSurfaceRenderer, viewMatrix} from "./webgl"
+import {WorkerSurfaceRenderer} from "./worker"
+import {RenderProfiler} from "./profiling"
+import type {Stage} from "./profiling"
+import {SurfaceGrid} from "./grid"
+
+// SurfaceGrid is only ever used with Surface3D, so it is registered with it
+// rather than compiled as a custom model of its own
+register_models({SurfaceGrid})
+
+// What the last frame drew, for hover picking. The index is built on the
+// first hover after the frame; buffers are only set if the frame projected
+// the vertices on the CPU (Canvas2D). In globe mode the vertices are
+// projected from the globe shell, while coordinates and values still come
+// from the geometry.
+interface PickState {
+  geometry: SurfaceGeometry
+  shell?: GridGeometry
+  view: ViewParams
+  buffers?: FrameBuffers
+  index?: PickIndex
+}
+
+// A reduced grid drawn instead of the full one while interacting
+interface RenderLevel {
+  geometry: SurfaceGeometry
+  colors: SurfaceColors
+  buffers?: FrameBuffers
+}
 
 export class Surface3DView extends LayoutDOMView {
   declare model: Surface3D
   private container_el?: HTMLDivElement
   private canvas?: HTMLCanvasElement
   private ctx?: CanvasRenderingContext2D
+  private gl_renderer?: WebGLSurfaceRenderer
+  private gl_uploaded?: SurfaceColors
+  private worker_renderer?: WorkerSurfaceRenderer
+  // Geometry and colors last sent to the worker
+  private worker_geometry?: GridGeometry
+  private worker_colors?: SurfaceColors
+  private geometry?: SurfaceGeometry
+  private colors?: SurfaceColors
+  private frame_buffers?: FrameBuffers
+  private pick_state?: PickState
+  // Time-series animation: every frame in one typed buffer, and the geometry
+  // shared by all frames (its stats span all frames)
+  private frame_buffer?: Float32Array | Float64Array
+  private frame_base?: SurfaceGeometry
+  private frame_timer?: number
+  private play_el?: HTMLButtonElement
+  private pick_buffers?: FrameBuffers
+  // Globe shells keyed by the geometry they wrap, and the unit vectors
+  // they are built from keyed by its xs array, which all frames of a time
+  // series (and the surfaces of a shared grid) have in common
+  private globe_shells = new WeakMap<SurfaceGeometry, GridGeometry>()
+  private readonly globe_directions = new WeakMap<Float64Array, Float64Array>()
+  // Shared grid whose changes this view follows
+  private connected_grid: SurfaceGrid | null = null
+  // Coarse level-of-detail grid, drawn while dragging or autorotating
+  private coarse_level?: RenderLevel
+  // Strided subsets of the grid for interactive frames, keyed by stride
+  private readonly strided_levels = new Map<number, RenderLevel>()
+  // Stride for the next interactive frame (0 until the first frame is timed)
+  // and the time until which frames count as interactive
+  private interactive_stride: number = 0
+  private interactive_until: number = 0
+  private idle_timeout?: number
+  // Pending requestAnimationFrame redraw
+  private render_request?: number
+  // Frames served from the geometry cache vs. cache rebuilds; rebuilds are
+  // also reported through logger.debug
+  readonly cache_stats = {hits: 0, geometry_rebuilds: 0, color_rebuilds: 0}
+  // Stage timings while profile or show_fps is on, and when the summary was
+  // last published to render_stats and to the overlay
+  private profiler?: RenderProfiler
+  private stats_reported: number = 0
+  private overlay_updated: number = 0
+  private fps_el?: HTMLDivElement
   private colorbar_canvas?: HTMLCanvasElement
   private colorbar_ctx?: CanvasRenderingContext2D
   private tooltip_el?: HTMLDivElement
@@ -29,20 +116,53 @@ export class Surface3DView extends LayoutDOMView {
 
   override connect_signals(): void {
     super.connect_signals()
-    this.connect(this.model.properties.azimuth.change, () => this.render_surface())
-    this.connect(this.model.properties.elevation.change, () => this.render_surface())
-    this.connect(this.model.properties.zoom.change, () => this.render_surface())
-    this.connect(this.model.properties.palette.change, () => {
-      this.render_surface()
-      this.render_colorbar()
+    const {lons, lats, x, y, values, n_lat, n_lon, palette, vmin, vmax, nan_color} = this.model.properties
+    const {data_extent, frames, n_frames, grid, triangles} = this.model.properties
+    // Invalidate the cached geometry and colors before any redraw below runs
+    for (const prop of [lons, lats, x, y, values, n_lat, n_lon, triangles, data_extent, frames, n_frames]) {
+      this.connect(prop.change, () => this.invalidate_data())
+    }
+    this.connect_grid()
+    this.connect(grid.change, () => {
+      this.connect_grid()
+      this.invalidate_data()
     })
-    this.connect(this.model.properties.vmin.change, () => this.render_colorbar())
-    this.connect(this.model.properties.vmax.change, () => this.render_colorbar())
+    for (const prop of [palette, vmin, vmax, nan_color]) {
+      this.connect(prop.change, () => this.invalidate_colors())
+    }
+    this.connect(this.model.properties.palette_data.change, () => {
+      this.register_palettes()
+      this.invalidate_colors()
+    })
+    const {coarse_lons, coarse_lats, coarse_x, coarse_y, coarse_values, coarse_n_lat, coarse_n_lon} = this.model.properties
+    for (const prop of [coarse_lons, coarse_lats, coarse_x, coarse_y, coarse_values, coarse_n_lat, coarse_n_lon]) {
+      this.connect(prop.change, () => this.drop_reduced_levels())
+    }
+    // Redraws are coalesced to one per animation frame, so a mouse move that
+    // sets azimuth and elevation, or a CustomJS callback that updates several
+    // properties, costs a single render
+    this.connect(this.model.properties.azimuth.change, () => this.request_render())
+    this.connect(this.model.properties.elevation.change, () => this.request_render())
+    this.connect(this.model.properties.zoom.change, () => this.request_render())
+    this.connect(this.model.properties.backend.change, () => {
+      this.setup_renderer()
+      this.request_render()
+    })
+    const {globe, globe_relief} = this.model.properties
+    for (const prop of [globe, globe_relief]) {
+      this.connect(prop.change, () => {
+        this.globe_shells = new WeakMap()
+        this.gl_uploaded = undefined
+        this.worker_geometry = undefined
+        this.request_render()
+      })
+    }
+    this.connect(this.model.values_patched, (patch) => this.on_values_patched(patch))
     this.connect(this.model.properties.background_color.change, () => {
       if (this.container_el) {
         this.container_el.style.background = this.model.background_color
       }
-      this.render_surface()
+      this.request_render()
       this.render_colorbar()
     })
     this.connect(this.model.properties.colorbar_text_color.change, () => this.render_colorbar())
@@ -51,17 +171,43 @@ export class Surface3DView extends LayoutDOMView {
         this.colorbar_canvas.style.display = this.model.show_colorbar ? 'block' : 'none'
       }
     })
+    this.connect(this.model.properties.frame.change, () => {
+      // Same grid, new heights: only the per-frame geometry and colors change
+      this.geometry = undefined
+      this.colors = undefined
+      this.strided_levels.clear()
+      this.update_play_button()
+      this.request_render()
+    })
+    this.connect(this.model.properties.playing.change, () => {
+      if (this.model.playing) {
+        this.start_playback()
+      } else {
+        this.stop_playback()
+      }
+      this.update_play_button()
+    })
+    this.connect(this.model.properties.frame_interval.change, () => {
+      if (this.frame_timer !== undefined) {
+        this.stop_playback()
+        this.start_playback()
+      }
+    })
+    this.connect(this.model.properties.profile.change, () => this.update_profiler())
+    this.connect(this.model.properties.show_fps.change, () => this.update_profiler())
     this.connect(this.model.properties.autorotate.change, () => {
       if (this.model.autorotate) {
         this.start_autorotation()
       } else {
         this.stop_autorotation()
+        this.end_interaction()
       }
     })
   }
 
   override render(): void {
     super.render()
+    this.register_palettes()
     const width = this.model.width ?? 800
     const height = this.model.height ?? 800
     
@@ -74,12 +220,6 @@ export class Surface3DView extends LayoutDOMView {
       cursor: 'grab'
     }})
     
-    // Main canvas
-    this.canvas = document.createElement('canvas')
-    this.canvas.width = width
-    this.canvas.height = height
-    this.container_el.appendChild(this.canvas)
-    
     // Colorbar canvas
     if (this.model.show_colorbar) {
       this.colorbar_canvas = document.createElement('canvas')
@@ -99,15 +239,51 @@ export class Surface3DView extends LayoutDOMView {
     }})
     this.container_el.appendChild(this.tooltip_el)
     
-    this.setup_interactions()
+    // Frame rate overlay
+    this.fps_el = div({style: {
+      position: 'absolute', left: '10px', top: '10px', padding: '4px 8px',
+      background: 'rgba(0, 0, 0, 0.6)', color: '#7CFC00', borderRadius: '4px',
+      fontFamily: 'monospace', fontSize: '12px', pointerEvents: 'none', whiteSpace: 'pre',
+    }})
+    this.container_el.appendChild(this.fps_el)
+    this.update_profiler()
+    
+    // Play/pause control for time series
+    this.play_el = undefined
+    if (this.animated()) {
+      this.play_el = document.createElement('button')
+      Object.assign(this.play_el.style, {
+        position: 'absolute', left: '10px', bottom: '10px', padding: '4px 10px',
+        background: 'rgba(0, 0, 0, 0.6)', color: 'white', border: '1px solid rgba(255, 255, 255, 0.3)',
+        borderRadius: '4px', fontFamily: 'monospace', fontSize: '13px', cursor: 'pointer',
+      })
+      this.play_el.onclick = () => {
+        this.model.playing = !this.model.playing
+      }
+      this.container_el.appendChild(this.play_el)
+      this.update_play_button()
+    }
+    
     this.shadow_el.appendChild(this.container_el)
-    this.ctx = this.canvas.getContext('2d', { willReadFrequently: true })!
+    this.cancel_render()
+    this.canvas = undefined
+    this.setup_renderer()
     this.render_surface()
     this.render_colorbar()
     
     if (this.model.autorotate) {
       this.start_autorotation()
     }
+    this.stop_playback()
+    if (this.model.playing) {
+      this.start_playback()
+    }
+  }
+
+  private register_palettes(): void {
+    for (const [name, rgb] of dict(this.model.palette_data)) {
+      registerPalette(name, rgb)
+    }
   }
 
   private render_colorbar(): void {
@@ -123,7 +299,7 @@ export class Surface3DView extends LayoutDOMView {
     ctx.fillRect(0, 0, width, height)
     
     const palette = getPalette(this.model.palette)
-    const {vmin, vmax} = getValueRange(this.model.values, this.model.vmin, this.model.vmax)
+    const {vmin, vmax} = this.get_colors()
     
     // Colorbar dimensions
     const bar_width = 30
@@ -198,6 +374,7 @@ export class Surface3DView extends LayoutDOMView {
       this.mouse_y = e.clientY - rect.top
       
       if (this.is_dragging) {
+        this.note_interaction()
         const dx = e.clientX - this.drag_start_x
         const dy = e.clientY - this.drag_start_y
         const new_azimuth = this.drag_start_azimuth - dx * 0.5
@@ -212,6 +389,7 @@ export class Surface3DView extends LayoutDOMView {
     this.canvas.onmouseup = () => {
       this.is_dragging = false
       this.container_el!.style.cursor = 'grab'
+      this.end_interaction()
       if (this.model.autorotate) {
         if (this.rotation_resume_timeout) clearTimeout(this.rotation_resume_timeout)
         this.rotation_resume_timeout = window.setTimeout(() => {
@@ -221,7 +399,10 @@ export class Surface3DView extends LayoutDOMView {
     }
     
     this.canvas.onmouseleave = () => {
-      this.is_dragging = false
+      if (this.is_dragging) {
+        this.is_dragging = false
+        this.end_interaction()
+      }
       this.container_el!.style.cursor = 'grab'
       if (this.tooltip_el) this.tooltip_el.style.display = 'none'
     }
@@ -230,158 +411,713 @@ export class Surface3DView extends LayoutDOMView {
       e.preventDefault()
       const delta = -Math.sign(e.deltaY) * 0.1
       const new_zoom = this.model.zoom + delta
+      this.note_interaction()
       this.model.zoom = Math.max(0.5, Math.min(8.0, new_zoom))
     }
   }
 
-  private render_surface(): void {
-    if (!this.ctx) return
-    const ctx = this.ctx
-    const width = this.model.width ?? 800
-    const height = this.model.height ?? 800
+  /**
+   * Recolor after a change of the color mapping, keeping the geometry
+   */
+  private invalidate_colors(): void {
+    this.colors = undefined
+    this.drop_reduced_levels()
+    this.request_render()
+    this.render_colorbar()
+  }
+
+  private invalidate_data(): void {
+    this.geometry = undefined
+    this.colors = undefined
+    this.frame_buffer = undefined
+    this.frame_base = undefined
+    this.interactive_stride = 0
+    this.drop_reduced_levels()
+    this.request_render()
+  }
+
+  /**
+   * Follow changes of the shared grid, if the model has one
+   */
+  private connect_grid(): void {
+    if (this.connected_grid != null) {
+      this.disconnect(this.connected_grid.change, this.on_grid_change)
+    }
+    this.connected_grid = this.model.grid
+    if (this.connected_grid != null) {
+      this.connect(this.connected_grid.change, this.on_grid_change)
+    }
+  }
+
+  private readonly on_grid_change = (): void => this.invalidate_data()
+
+  /**
+   * The shared grid, if the model has one that matches the shape of values
+   */
+  private shared_grid(): SurfaceGrid | null {
+    const {grid, n_lat, n_lon} = this.model
+    if (grid == null || this.model.triangles.length > 0) return null
+    if (grid.n_lat != n_lat || grid.n_lon != n_lon) {
+      logger.warn(`Surface3D: ignoring a ${grid.n_lat}x${grid.n_lon} grid for ${n_lat}x${n_lon} values`)
+      return null
+    }
+    return grid
+  }
+
+  /**
+   * True when the model holds a time series in frames
+   */
+  private animated(): boolean {
+    const {frames, n_frames, n_lat, n_lon, triangles} = this.model
+    return n_frames > 0 && frames.length == n_frames * n_lat * n_lon && triangles.length == 0
+  }
+
+  private get_frame_buffer(): Float32Array | Float64Array {
+    if (this.frame_buffer == null) {
+      const {frames} = this.model
+      this.frame_buffer = frames instanceof Float32Array || frames instanceof Float64Array ? frames : Float64Array.from(frames)
+    }
+    return this.frame_buffer
+  }
+
+  /**
+   * Values of the current frame, a view into the frame buffer
+   */
+  private get_frame_values(): Float32Array | Float64Array {
+    const {n_lat, n_lon, n_frames} = this.model
+    const n = n_lat * n_lon
+    const k = Math.max(0, Math.min(n_frames - 1, Math.floor(this.model.frame)))
+    return this.get_frame_buffer().subarray(k * n, (k + 1) * n)
+  }
+
+  /**
+   * View-independent geometry, rebuilt only when the data changes
+   */
+  private get_geometry(): SurfaceGeometry {
+    if (this.geometry == null) {
+      const {lons, lats, x, y, values, n_lat, n_lon, triangles} = this.model
+      const extent = this.model.data_extent
+      // Coordinates of a shared grid are built once for all its surfaces
+      const coordinates = this.shared_grid()?.get_coordinates()
+      if (this.animated()) {
+        if (this.frame_base == null) {
+          // Built once from all frames, so the bounds (and with them the
+          // scale and centering) stay fixed during playback
+          const data = {lons, lats, x, y, values: this.get_frame_buffer(), n_lat, n_lon, extent}
+          this.frame_base = buildGeometry(data, coordinates)
+        }
+        this.geometry = {...this.frame_base, values: this.get_frame_values()}
+        return this.geometry
+      }
+      this.geometry = buildGeometry({lons, lats, x, y, values, n_lat, n_lon, triangles, extent}, coordinates)
+      this.cache_stats.geometry_rebuilds++
+      logger.debug(`Surface3D: rebuilt geometry cache (${n_lat}x${n_lon}, rebuild #${this.cache_stats.geometry_rebuilds})`)
+    } else {
+      this.cache_stats.hits++
+    }
+    return this.geometry
+  }
+
+  /**
+   * Quad colors, rebuilt only when the data or the color mapping changes
+   */
+  private get_colors(): SurfaceColors {
+    if (this.colors == null) {
+      const geometry = this.get_geometry()
+      // Frames share the stats of the whole series, so an automatic color
+      // range is the same for every frame and colors compare across frames
+      const {vmin, vmax} = this.model
+      this.colors = this.build_colors(geometry, vmin, vmax)
+      this.cache_stats.color_rebuilds++
+      logger.debug(`Surface3D: rebuilt color cache (${this.model.palette}, rebuild #${this.cache_stats.color_rebuilds})`)
+    }
+    return this.colors
+  }
+
+  /**
+   * Globe shell of a geometry (the full grid or a reduced level), built once
+   * per geometry. The relief always spans the full-resolution value range,
+   * so switching levels does not change the heights.
+   */
+  private get_globe(geometry: SurfaceGeometry): GridGeometry {
+    let shell = this.globe_shells.get(geometry)
+    if (shell == null) {
+      let directions = this.globe_directions.get(geometry.xs)
+      if (directions == null) {
+        directions = globeDirections(geometry)
+        this.globe_directions.set(geometry.xs, directions)
+      }
+      const {z_min, z_max} = this.get_geometry().bounds
+      shell = buildGlobe(geometry, this.model.globe_relief, z_min, z_max, directions)
+      this.globe_shells.set(geometry, shell)
+      logger.debug(`Surface3D: built globe shell (${geometry.n_lat}x${geometry.n_lon})`)
+    }
+    return shell
+  }
+
+  /**
+   * Bounds to scale and center the view by: those of the full-resolution
+   * data, or of the globe in globe mode
+   */
+  private view_bounds(geometry: SurfaceGeometry): DataBounds {
+    return this.model.globe ? globeBounds(this.model.globe_relief) : geometry.bounds
+  }
+
+  /**
+   * True while input keeps arriving (dragging, wheel zoom, autorotation).
+   * Frames drawn during an interaction use a reduced grid when
+   * adaptive_quality is on.
+   */
+  private interacting(): boolean {
+    return performance.now() < this.interactive_until
+  }
+
+  /**
+   * Mark the next frames as interactive and schedule a full-resolution redraw
+   * once no input has arrived for idle_delay milliseconds
+   */
+  private note_interaction(): void {
+    if (!this.model.adaptive_quality) return
+    const delay = this.model.idle_delay
+    this.interactive_until = performance.now() + delay
+    if (this.idle_timeout) clearTimeout(this.idle_timeout)
+    this.idle_timeout = window.setTimeout(() => this.end_interaction(), delay)
+  }
+
+  /**
+   * Leave interactive mode right away and redraw at full resolution
+   */
+  private end_interaction(): void {
+    if (this.idle_timeout) clearTimeout(this.idle_timeout)
+    this.idle_timeout = undefined
+    const was_interacting = this.interactive_until != 0
+    this.interactive_until = 0
+    if (was_interacting) this.request_render()
+  }
+
+  /**
+   * The model's values were patched in place: keep the cached geometry and
+   * recolor only the quads around the tile. A patch that covers the whole
+   * grid, or that widens or narrows the data range (which sets the z scale
+   * and an automatic color range), rebuilds the caches as reassigning
+   * values would.
+   */
+  private on_values_patched(patch: Surface3D.ValuesPatch): void {
+    const {row, col, n_rows, n_cols} = patch
+    const {values, n_lat, n_lon} = this.model
+    if (n_rows == n_lat && n_cols == n_lon) {
+      this.invalidate_data()
+      this.render_colorbar()
+      return
+    }
+    if (this.geometry != null) {
+      // One pass over the values is far cheaper than recoloring every quad,
+      // and also catches a tile that overwrote the old minimum or maximum
+      const {min, max} = valueStats(values)
+      if (min != this.geometry.stats.min || max != this.geometry.stats.max) {
+        this.invalidate_data()
+        this.render_colorbar()
+        return
+      }
+    }
+    if (this.colors != null) {
+      patchColors(this.get_geometry(), this.colors, row, col, n_rows, n_cols)
+    }
+    // Interactive levels, globe shells and GPU/worker copies hold the old
+    // values
+    this.strided_levels.clear()
+    this.globe_shells = new WeakMap()
+    this.gl_uploaded = undefined
+    this.worker_geometry = undefined
+    this.worker_colors = undefined
+    this.request_render()
+    this.render_colorbar()
+  }
+
+  private drop_reduced_levels(): void {
+    this.coarse_level = undefined
+    this.strided_levels.clear()
+  }
+
+  /**
+   * Coarse level-of-detail geometry and colors, if the model has one. Colors
+   * use the full-resolution value range so switching levels keeps the colors.
+   */
+  private build_colors(geometry: SurfaceGeometry, vmin: number, vmax: number): SurfaceColors {
+    const lut = getPaletteLUT(this.model.palette)
+    const {nan_color} = this.model
+    return buildColors(geometry, lut, vmin, vmax, nan_color, color2rgba(nan_color))
+  }
+
+  private get_coarse_level(): RenderLevel | undefined {
+    if (this.model.coarse_values.length == 0) return undefined
+    if (this.coarse_level == null) {
+      const {coarse_lons, coarse_lats, coarse_x, coarse_y, coarse_values, coarse_n_lat, coarse_n_lon} = this.model
+      const geometry = buildGeometry({
+        lons: coarse_lons, lats: coarse_lats, x: coarse_x, y: coarse_y,
+        values: coarse_values, n_lat: coarse_n_lat, n_lon: coarse_n_lon,
+      })
+      const {vmin, vmax} = this.get_colors()
+      const colors = this.build_colors(geometry, vmin, vmax)
+      this.coarse_level = {geometry, colors}
+      logger.debug(`Surface3D: rebuilt coarse level (${coarse_n_lat}x${coarse_n_lon})`)
+    }
+    return this.coarse_level
+  }
+
+  /**
+   * Grid drawn while interacting: the coarse level if there is one, thinned
+   * to every n-th row and column when even that misses the frame budget.
+   * Undefined means the full-resolution grid is fast enough.
+   */
+  private get_interactive_level(): RenderLevel | undefined {
+    // A mesh is drawn as it is; its levels of detail are chosen in Python
+    if (this.get_geometry().triangles != null) return undefined
+    const coarse = this.get_coarse_level()
+    const stride = this.interactive_stride
+    if (stride <= 1) return coarse
+    let level = this.strided_levels.get(stride)
+    if (level == null) {
+      // Without a coarse level the strided coordinates of a shared grid
+      // are reused
+      const grid = coarse == null ? this.shared_grid() : null
+      const geometry = decimateGeometry(coarse?.geometry ?? this.get_geometry(), stride, grid?.get_strided(stride))
+      const {vmin, vmax} = this.get_colors()
+      const colors = this.build_colors(geometry, vmin, vmax)
+      level = {geometry, colors}
+      this.strided_levels.set(stride, level)
+      logger.debug(`Surface3D: built interactive level (stride ${stride}, ${geometry.n_lat}x${geometry.n_lon})`)
+    }
+    return level
+  }
+
+  /**
+   * Pick the stride for the next interactive frame from how long the last
+   * frame took. Drawing cost scales with the number of quads, i.e. with
+   * 1 / stride^2, so the stride grows with the square root of the overrun and
+   * only shrinks when the denser grid is predicted to fit the budget.
+   */
+  private update_interactive_stride(elapsed: number, interactive: boolean): void {
+    const budget = this.model.frame_budget
+    if (!interactive) {
+      // Seed the first interaction from a full-resolution frame; a coarse
+      // level is much cheaper, so start from it unthinned
+      if (this.interactive_stride == 0) {
+        const coarse = this.model.coarse_values.length > 0
+        this.interactive_stride = coarse ? 1 : Math.max(1, Math.ceil(Math.sqrt(elapsed / budget)))
+      }
+      return
+    }
+    const stride = Math.max(this.interactive_stride, 1)
+    let next = stride
+    if (elapsed > budget) {
+      next = Math.ceil(stride * Math.sqrt(elapsed / budget))
+    } else if (stride > 1 && elapsed * (stride / (stride - 1)) ** 2 < 0.8 * budget) {
+      next = stride - 1
+    }
+    // Keep at least a handful of cells along the shorter side
+    const {n_lat, n_lon} = this.get_geometry()
+    this.interactive_stride = Math.max(1, Math.min(next, Math.floor(Math.min(n_lat, n_lon) / 8)))
+  }
+
+  /**
+   * Upload centered vertex positions, per-vertex colors and triangle indices
+   * to the GPU. Quads (or mesh triangles) touching a NaN value are left out
+   * of the index buffer, as drawQuads skips them on a Canvas2D. In globe
+   * mode the positions are those of the globe shell, and the depth test
+   * hides the far side.
+   */
+  private upload_gl_geometry(geometry: SurfaceGeometry, colors: SurfaceColors, shell?: GridGeometry): void {
+    const renderer = this.gl_renderer!
+    const {n_lat, n_lon, rectilinear, xs, ys, values} = geometry
+    const {center_x, center_y, center_z} = geometry.bounds
+    const {vmin, vmax, styles, rgba} = colors
     
-    ctx.fillStyle = this.model.background_color
-    ctx.fillRect(0, 0, width, height)
+    const n_vertices = n_lat * n_lon
+    const positions = new Float32Array(3 * n_vertices)
+    if (shell != null) {
+      // Centered on the globe already
+      for (let idx = 0; idx < n_vertices; idx++) {
+        positions[3 * idx] = shell.xs[idx]
+        positions[3 * idx + 1] = shell.ys[idx]
+        positions[3 * idx + 2] = shell.values[idx]
+      }
+    } else {
+      for (let i = 0; i < n_lat; i++) {
+        for (let j = 0; j < n_lon; j++) {
+          const idx = i * n_lon + j
+          const value = values[idx]
+          positions[3 * idx] = (rectilinear ? xs[j] : xs[idx]) - center_x
+          positions[3 * idx + 1] = (rectilinear ? ys[i] : ys[idx]) - center_y
+          positions[3 * idx + 2] = isNaN(value) ? 0 : value - center_z
+        }
+      }
+    }
+    // Per-vertex colors: palette index per value, then one 32-bit copy of the
+    // packed RGBA entry per vertex
+    const vertex_index = mapToPaletteIndices(values, vmin, vmax, styles.length - 1, new Uint16Array(n_vertices))
+    const table = new Uint32Array(rgba.buffer, rgba.byteOffset, rgba.length / 4)
+    const vertex_words = new Uint32Array(n_vertices)
+    for (let idx = 0; idx < n_vertices; idx++) {
+      vertex_words[idx] = table[vertex_index[idx]]
+    }
+    const vertex_colors = new Uint8Array(vertex_words.buffer)
     
+    const {triangles} = geometry
+    const indices = new Uint32Array(triangles != null ? triangles.length : 6 * Math.max(n_lat - 1, 0) * Math.max(n_lon - 1, 0))
+    let k = 0
+    if (triangles != null) {
+      for (let t = 0; t < triangles.length; t += 3) {
+        const a = triangles[t]
+        const b = triangles[t + 1]
+        const c = triangles[t + 2]
+        if (isNaN(values[a]) || isNaN(values[b]) || isNaN(values[c])) continue
+        indices[k++] = a
+        indices[k++] = b
+        indices[k++] = c
+      }
+    } else {
+      for (let i = 0; i < n_lat - 1; i++) {
+        for (let j = 0; j < n_lon - 1; j++) {
+          const idx0 = i * n_lon + j
+          const idx1 = i * n_lon + (j + 1)
+          const idx2 = (i + 1) * n_lon + (j + 1)
+          const idx3 = (i + 1) * n_lon + j
+          if (isNaN(values[idx0]) || isNaN(values[idx1]) || isNaN(values[idx2]) || isNaN(values[idx3])) continue
+          indices[k++] = idx0
+          indices[k++] = idx1
+          indices[k++] = idx2
+          indices[k++] = idx0
+          indices[k++] = idx2
+          indices[k++] = idx3
+        }
+      }
+    }
+    
+    renderer.set_geometry(positions, vertex_colors, indices.subarray(0, k))
+    this.gl_uploaded = colors
+  }
+
+  private render_surface_webgl(): number {
+    const width = this.model.width ?? 800
+    const height = this.model.height ?? 800
+    const geometry = this.timed("geometry", () => this.get_geometry())
+    const colors = this.timed("colors", () => this.get_colors())
+    const shell = this.model.globe ? this.timed("geometry", () => this.get_globe(geometry)) : undefined
+    if (this.gl_uploaded !== colors) {
+      this.timed("upload", () => this.upload_gl_geometry(geometry, colors, shell))
+    }
+    const bounds = this.view_bounds(geometry)
+    const view = this.view_params(bounds, width, height)
     const elev_rad = this.model.elevation * Math.PI / 180
     const azim_rad = this.model.azimuth * Math.PI / 180
-    const zoom = this.model.zoom
-    const lons = this.model.lons
-    const lats = this.model.lats
-    const values = this.model.values
-    
-    // Project 3D surface
-    const projected = []
-    for (let i = 0; i < lons.length; i++) {
-      const x = -lons[i]
-      const y = lats[i]
-      const z = values[i]
-      
-      const x_rot = x * Math.cos(azim_rad) - y * Math.sin(azim_rad)
-      const y_rot = x * Math.sin(azim_rad) + y * Math.cos(azim_rad)
-      const x_proj = x_rot
-      const z_proj = y_rot * Math.sin(elev_rad) + z * Math.cos(elev_rad)
-      const depth = y_rot * Math.cos(elev_rad) - z * Math.sin(elev_rad)
-      
-      projected.push({ x: x_proj, y: z_proj, depth: depth })
+    const matrix = viewMatrix(azim_rad, elev_rad, view.scale, width, height, bounds.range)
+    // Only issuing the draw is timed; the GPU finishes it asynchronously
+    this.timed("draw", () => this.gl_renderer!.draw(matrix, color2rgba(this.model.background_color)))
+    this.pick_state = {geometry, shell, view}
+    return colors.quad_index.length
+  }
+
+  private render_surface_worker(): number {
+    const renderer = this.worker_renderer!
+    const width = this.model.width ?? 800
+    const height = this.model.height ?? 800
+    const geometry = this.timed("geometry", () => this.get_geometry())
+    const colors = this.timed("colors", () => this.get_colors())
+    // In globe mode the worker draws the globe shell, culling its far side
+    const shell = this.model.globe ? this.timed("geometry", () => this.get_globe(geometry)) : undefined
+    // Data is only sent when it changed; frames carry just the view
+    this.timed("upload", () => {
+      const drawn = shell ?? geometry
+      if (this.worker_geometry !== drawn) {
+        renderer.set_geometry(drawn)
+        this.worker_geometry = drawn
+      }
+      if (this.worker_colors !== colors) {
+        renderer.set_colors(colors.quad_index, colors.styles)
+        this.worker_colors = colors
+      }
+    })
+    const view = this.view_params(this.view_bounds(geometry), width, height)
+    // Drawing happens in the worker; only posting the request is timed here
+    this.timed("draw", () => renderer.draw(view, this.model.background_color))
+    this.pick_state = {geometry, shell, view}
+    return colors.quad_index.length
+  }
+
+  /**
+   * Create the renderer for the backend property on a new main canvas. A
+   * canvas stays bound to the first context taken from it, and to the worker
+   * once transferred, so switching backends, or falling back to Canvas2D
+   * after the WebGL or worker setup failed, needs a fresh element.
+   */
+  private setup_renderer(): void {
+    this.dispose_renderers()
+    const {backend} = this.model
+    if (backend == 'webgl') {
+      this.gl_renderer = WebGLSurfaceRenderer.create(this.new_canvas()) ?? undefined
+    } else if (backend == 'worker') {
+      this.worker_renderer = WorkerSurfaceRenderer.create(this.new_canvas()) ?? undefined
     }
+    if (!this.gl_renderer && !this.worker_renderer) {
+      this.ctx = this.new_canvas().getContext('2d')!
+    }
+  }
+
+  /**
+   * Put a new main canvas in place of the current one (or first in the
+   * container) and attach the mouse handlers to it
+   */
+  private new_canvas(): HTMLCanvasElement {
+    const canvas = document.createElement('canvas')
+    canvas.width = this.model.width ?? 800
+    canvas.height = this.model.height ?? 800
+    if (this.canvas?.parentNode != null) {
+      this.canvas.replaceWith(canvas)
+    } else {
+      this.container_el!.prepend(canvas)
+    }
+    this.canvas = canvas
+    this.setup_interactions()
+    return canvas
+  }
+
+  private dispose_renderers(): void {
+    this.gl_renderer?.dispose()
+    this.worker_renderer?.dispose()
+    this.gl_renderer = undefined
+    this.gl_uploaded = undefined
+    this.worker_renderer = undefined
+    this.worker_geometry = undefined
+    this.worker_colors = undefined
+    this.ctx = undefined
+  }
+
+  /**
+   * Rotation terms, scale and centering for the current view (see viewParams)
+   */
+  private view_params(bounds: DataBounds, width: number, height: number): ViewParams {
+    const {azimuth, elevation, zoom} = this.model
+    return viewParams(bounds, azimuth, elevation, zoom, width, height)
+  }
+
+  /**
+   * Schedule a redraw for the next animation frame; repeated requests within
+   * the same frame are merged into one
+   */
+  private request_render(): void {
+    if (this.render_request !== undefined) return
+    this.render_request = requestAnimationFrame(() => {
+      this.render_request = undefined
+      this.render_surface()
+    })
+  }
+
+  private cancel_render(): void {
+    if (this.render_request !== undefined) {
+      cancelAnimationFrame(this.render_request)
+      this.render_request = undefined
+    }
+  }
+
+  /**
+   * True once the canvas shows the current view at full resolution: no
+   * redraw is scheduled, no full-resolution redraw awaits the end of an
+   * interaction, and a worker has drawn the last view sent to it. Headless
+   * export waits for this before taking a screenshot.
+   */
+  get render_complete(): boolean {
+    return this.render_request === undefined && this.idle_timeout === undefined &&
+      (this.worker_renderer?.idle ?? true)
+  }
+
+  /**
+   * Draw a pending redraw right away, e.g. from inside an animation frame
+   * where a new request would only run on the following frame
+   */
+  private flush_render(): void {
+    if (this.render_request !== undefined) {
+      this.cancel_render()
+      this.render_surface()
+    }
+  }
+
+  private render_surface(): void {
+    const profiler = this.profiler
+    profiler?.begin_frame()
+    let n_quads: number
+    if (this.gl_renderer) {
+      n_quads = this.render_surface_webgl()
+    } else if (this.worker_renderer) {
+      n_quads = this.render_surface_worker()
+    } else if (this.ctx) {
+      n_quads = this.render_surface_canvas(this.ctx)
+    } else {
+      return
+    }
+    if (profiler != null) {
+      profiler.end_frame(n_quads)
+      this.report_profile()
+    }
+  }
+
+  private render_surface_canvas(ctx: CanvasRenderingContext2D): number {
+    const width = this.model.width ?? 800
+    const height = this.model.height ?? 800
     
-    // FIXED: Calculate bounds from original data, not projected data
-    // This ensures consistent scaling regardless of rotation angle
-    const data_x_min = -Math.min(...lons)
-    const data_x_max = -Math.max(...lons)
-    const data_y_min = Math.min(...lats)
-    const data_y_max = Math.max(...lats)
-    const data_z_min = Math.min(...values)
-    const data_z_max = Math.max(...values)
-    
-    // Use the maximum extent in any dimension for consistent scaling
-    const data_range = Math.max(
-      data_x_max - data_x_min,
-      data_y_max - data_y_min,
-      data_z_max - data_z_min
-    )
-    
-    // Fixed scale based on data range, not projection
-    const scale = (Math.min(width, height) / data_range) * 0.6 * zoom
-    const cx = width / 2
-    const cy = height / 2
-    
-    // Center the data
-    const data_center_x = (data_x_min + data_x_max) / 2
-    const data_center_y = (data_y_min + data_y_max) / 2
+    ctx.fillStyle = this.model.background_color
+    ctx.fillRect(0, 0, width, height)
     
-    // Scale and center - project center point to find offset
-    const center_x_rot = data_center_x * Math.cos(azim_rad) - data_center_y * Math.sin(azim_rad)
-    const center_y_rot = data_center_x * Math.sin(azim_rad) + data_center_y * Math.cos(azim_rad)
-    const center_z = (data_z_min + data_z_max) / 2
-    const center_x_proj = center_x_rot
-    const center_z_proj = center_y_rot * Math.sin(elev_rad) + center_z * Math.cos(elev_rad)
+    const start = performance.now()
+    // Scaling and centering always come from the full-resolution data, so
+    // switching to a reduced level while interacting does not shift the view
+    const full_geometry = this.timed("geometry", () => this.get_geometry())
+    const interactive = this.interacting()
+    const level = interactive ? this.timed("geometry", () => this.get_interactive_level()) : undefined
+    const geometry = level?.geometry ?? full_geometry
+    const {quad_index, styles} = level?.colors ?? this.timed("colors", () => this.get_colors())
+    const {n_lat, n_lon, triangles} = geometry
+    // In globe mode the vertices are projected from the globe shell, which is
+    // always depth-sorted after culling its far side
+    const shell = this.model.globe ? this.timed("geometry", () => this.get_globe(geometry)) : undefined
+    const projected = shell ?? geometry
+    const view = this.view_params(this.view_bounds(full_geometry), width, height)
     
-    const screen_projected = []
-    for (const p of projected) {
-      screen_projected.push({
-        x: cx + (p.x - center_x_proj) * scale,
-        y: cy - (p.y - center_z_proj) * scale,
-        depth: p.depth
+    if (triangles != null) {
+      // Irregular mesh: always depth-sorted, one color per triangle
+      const buffers = this.frame_buffers = ensureMeshBuffers(this.frame_buffers, n_lon, triangles.length / 3)
+      this.timed("project", () => projectVertices(projected, view, buffers))
+      let count = buffers.n_quads
+      const order = this.timed("order", () => {
+        computeTriangleDepths(triangles, buffers)
+        if (shell == null) return sortQuadsByDepth(buffers)
+        count = cullHiddenTriangles(triangles, view, buffers)
+        return sortQuadsByDepth(buffers, buffers.visible, count)
       })
+      this.timed("draw", () => drawTriangles(ctx, triangles, buffers, order, count, quad_index, styles))
+      this.pick_state = {geometry, shell, view, buffers}
+      return count
     }
-    
-    const palette = getPalette(this.model.palette)
-    const {vmin, vmax} = getValueRange(values, this.model.vmin, this.model.vmax)
-    const n_lat = this.model.n_lat
-    const n_lon = this.model.n_lon
-    
-    // Create and sort quads by depth
-    const quads = []
-    for (let i = 0; i < n_lat - 1; i++) {
-      for (let j = 0; j < n_lon - 1; j++) {
-        const idx0 = i * n_lon + j
-        const idx1 = i * n_lon + (j + 1)
-        const idx2 = (i + 1) * n_lon + (j + 1)
-        const idx3 = (i + 1) * n_lon + j
-        
-        const p0 = screen_projected[idx0]
-        const p1 = screen_projected[idx1]
-        const p2 = screen_projected[idx2]
-        const p3 = screen_projected[idx3]
-        
-        const avg_value = (values[idx0] + values[idx1] + values[idx2] + values[idx3]) / 4
-        const avg_depth = (p0.depth + p1.depth + p2.depth + p3.depth) / 4
-        const color = valueToColor(avg_value, palette, vmin, vmax, this.model.nan_color)
-        
-        quads.push({
-          depth: avg_depth,
-          points: [p0, p1, p2, p3],
-          color: color
-        })
+
+    // Project into preallocated buffers, then sort quads by depth and draw
+    let buffers: FrameBuffers
+    if (level != null) {
+      buffers = level.buffers = ensureFrameBuffers(level.buffers, n_lat, n_lon)
+    } else {
+      buffers = this.frame_buffers = ensureFrameBuffers(this.frame_buffers, n_lat, n_lon)
+    }
+    this.timed("project", () => projectVertices(projected, view, buffers))
+    let count = buffers.n_quads
+    const order = this.timed("order", () => {
+      if (projected.height_field) {
+        // Structured height field: draw order follows from the view direction
+        return traverseBackToFront(projected, view, buffers)
       }
+      // Parametric surfaces can fold over themselves and need a depth sort
+      computeQuadDepths(n_lat, n_lon, buffers)
+      if (shell == null) return sortQuadsByDepth(buffers)
+      // Only the quads not hidden behind the globe are sorted and drawn
+      count = cullHiddenQuads(n_lat, n_lon, view, buffers)
+      return sortQuadsByDepth(buffers, buffers.visible, count)
+    })
+    this.timed("draw", () => drawQuads(ctx, n_lon, buffers, order, count, quad_index, styles))
+    this.pick_state = {geometry, shell, view, buffers}
+    this.update_interactive_stride(performance.now() - start, interactive)
+    return count
+  }
+
+  /**
+   * Run a render stage, timing it while profiling
+   */
+  private timed<T>(stage: Stage, fn: () => T): T {
+    return this.profiler != null ? this.profiler.time(stage, fn) : fn()
+  }
+
+  /**
+   * Start or stop profiling to follow the profile and show_fps properties
+   */
+  private update_profiler(): void {
+    const {profile, show_fps} = this.model
+    if (profile || show_fps) {
+      this.profiler = this.profiler ?? new RenderProfiler()
+    } else {
+      this.profiler?.clear_measures()
+      this.profiler = undefined
     }
-    
-    quads.sort((a, b) => a.depth - b.depth)
-    
-    for (const quad of quads) {
-      ctx.fillStyle = quad.color
-      ctx.strokeStyle = quad.color
-      ctx.lineWidth = 1.2
-      ctx.globalAlpha = 1
-      
-      ctx.beginPath()
-      ctx.moveTo(quad.points[0].x, quad.points[0].y)
-      ctx.lineTo(quad.points[1].x, quad.points[1].y)
-      ctx.lineTo(quad.points[2].x, quad.points[2].y)
-      ctx.lineTo(quad.points[3].x, quad.points[3].y)
-      ctx.closePath()
-      ctx.fill()
-      ctx.stroke()
-      ctx.globalAlpha = 1.0
+    if (this.fps_el != null) {
+      this.fps_el.style.display = show_fps ? 'block' : 'none'
+      this.fps_el.textContent = ''
     }
   }
 
-  private update_tooltip(): void {
-    if (!this.tooltip_el || !this.canvas || !this.ctx) return
-    const imageData = this.ctx.getImageData(this.mouse_x, this.mouse_y, 1, 1)
-    const pixel = imageData.data
-    
-    if (pixel[0] > 10 || pixel[1] > 10 || pixel[2] > 10) {
-      const palette = getPalette(this.model.palette)
-      const {vmin, vmax} = getValueRange(this.model.values, this.model.vmin, this.model.vmax)
-      let closest_idx = 0
-      let min_distance = Infinity
-      
-      for (let i = 0; i < palette.length; i++) {
-        const pal_r = parseInt(palette[i].slice(1, 3), 16)
-        const pal_g = parseInt(palette[i].slice(3, 5), 16)
-        const pal_b = parseInt(palette[i].slice(5, 7), 16)
-        const distance = Math.abs(pal_r - pixel[0]) + Math.abs(pal_g - pixel[1]) + Math.abs(pal_b - pixel[2])
-        if (distance < min_distance) {
-          min_distance = distance
-          closest_idx = i
+  /**
+   * Refresh the overlay a few times a second and, while profiling, publish
+   * the summary to render_stats about once a second. Publishing also clears
+   * the recorded performance measures so the timeline does not keep growing.
+   */
+  private report_profile(): void {
+    const profiler = this.profiler!
+    const now = performance.now()
+    const update_overlay = this.model.show_fps && now - this.overlay_updated >= 250
+    const publish = this.model.profile && now - this.stats_reported >= 1000
+    if (!update_overlay && !publish) return
+    const summary = profiler.summary()
+    if (update_overlay && this.fps_el != null) {
+      this.overlay_updated = now
+      const {fps, frame_ms, frame_p95_ms, n_quads} = summary
+      this.fps_el.textContent = `${fps.toFixed(0)} fps  ${frame_ms.toFixed(1)} ms (p95 ${frame_p95_ms.toFixed(1)})\n${n_quads} quads`
+    }
+    if (publish) {
+      this.stats_reported = now
+      this.model.render_stats = summary
+      profiler.clear_measures()
+    } else if (!this.model.profile) {
+      profiler.clear_measures()
+    }
+  }
+
+  /**
+   * Surface point under the cursor, from the geometry the last frame drew
+   */
+  private pick(): ReturnType<typeof pickQuad> {
+    const state = this.pick_state
+    if (state == null) return null
+    const {n_lat, n_lon, triangles} = state.geometry
+    if (state.index == null) {
+      if (state.buffers == null) {
+        // WebGL and worker frames project elsewhere; project once here for picking
+        if (triangles != null) {
+          state.buffers = this.pick_buffers = ensureMeshBuffers(this.pick_buffers, n_lon, triangles.length / 3)
+        } else {
+          state.buffers = this.pick_buffers = ensureFrameBuffers(this.pick_buffers, n_lat, n_lon)
         }
+        projectVertices(state.shell ?? state.geometry, state.view, state.buffers)
       }
-      
-      const value = vmin + (closest_idx / (palette.length - 1)) * (vmax - vmin)
-      this.tooltip_el.innerHTML = `Value: ${value.toFixed(2)}`
+      const width = this.model.width ?? 800
+      const height = this.model.height ?? 800
+      if (triangles != null) {
+        state.index = buildTrianglePickIndex(triangles, state.buffers, width, height)
+      } else {
+        state.index = buildPickIndex(n_lat, n_lon, state.buffers, width, height)
+      }
+    }
+    if (triangles != null) {
+      return pickTriangle(state.index, state.geometry, state.buffers!, this.mouse_x, this.mouse_y)
+    }
+    return pickQuad(state.index, state.geometry, state.buffers!, this.mouse_x, this.mouse_y)
+  }
+
+  private update_tooltip(): void {
+    if (!this.tooltip_el) return
+    const hit = this.pick()
+    if (hit != null) {
+      const {x_label, y_label, colorbar_title} = this.model
+      // Labels are set as text, never parsed as HTML
+      this.tooltip_el.replaceChildren(
+        div(`${x_label}: ${hit.lon.toFixed(2)}`),
+        div(`${y_label}: ${hit.lat.toFixed(2)}`),
+        div(`${colorbar_title || 'Value'}: ${hit.value.toFixed(2)}`),
+      )
       this.tooltip_el.style.display = 'block'
       this.tooltip_el.style.left = `${this.mouse_x + 15}px`
       this.tooltip_el.style.top = `${this.mouse_y - 30}px`
@@ -390,11 +1126,40 @@ export class Surface3DView extends LayoutDOMView {
     }
   }
 
+  private start_playback(): void {
+    if (this.frame_timer !== undefined || !this.animated()) return
+    this.frame_timer = window.setInterval(() => {
+      const {frame, n_frames} = this.model
+      if (frame + 1 < n_frames) {
+        this.model.frame = frame + 1
+      } else if (this.model.loop) {
+        this.model.frame = 0
+      } else {
+        this.model.playing = false
+      }
+    }, Math.max(this.model.frame_interval, 1))
+  }
+
+  private stop_playback(): void {
+    if (this.frame_timer !== undefined) {
+      clearInterval(this.frame_timer)
+      this.frame_timer = undefined
+    }
+  }
+
+  private update_play_button(): void {
+    if (!this.play_el) return
+    const {frame, n_frames, playing} = this.model
+    this.play_el.textContent = `${playing ? '\u23F8' : '\u25B6'} ${frame + 1}/${n_frames}`
+  }
+
   private start_autorotation(): void {
     if (this.animation_id !== undefined) return
     const animate = () => {
       if (!this.model.autorotate || this.is_dragging) return
+      this.note_interaction()
       this.model.azimuth = (this.model.azimuth + this.model.rotation_speed * 0.5) % 360
+      this.flush_render()
       this.animation_id = requestAnimationFrame(animate)
     }
     animate()
@@ -409,33 +1174,75 @@ export class Surface3DView extends LayoutDOMView {
 
   override remove(): void {
     this.stop_autorotation()
+    this.stop_playback()
     if (this.rotation_resume_timeout) clearTimeout(this.rotation_resume_timeout)
+    if (this.idle_timeout) clearTimeout(this.idle_timeout)
+    this.cancel_render()
+    this.dispose_renderers()
     super.remove()
   }
 }
 
 export namespace Surface3D {
+  export type ValuesPatch = {
+    row: number
+    col: number
+    n_rows: number
+    n_cols: number
+  }
   export type Attrs = p.AttrsOf<Props>
   export type Props = LayoutDOM.Props & {
-    lons: p.Property<number[]>
-    lats: p.Property<number[]>
-    values: p.Property<number[]>
+    lons: p.Property<Arrayable<number>>
+    lats: p.Property<Arrayable<number>>
+    values: p.Property<Arrayable<number>>
+    values_patch: p.Property<(Surface3D.ValuesPatch & {values: Arrayable<number>, seq: number}) | null>
+    x: p.Property<Arrayable<number>>
+    y: p.Property<Arrayable<number>>
+    frames: p.Property<Arrayable<number>>
+    n_frames: p.Property<number>
+    frame: p.Property<number>
+    playing: p.Property<boolean>
+    frame_interval: p.Property<number>
+    loop: p.Property<boolean>
     n_lat: p.Property<number>
     n_lon: p.Property<number>
+    triangles: p.Property<Arrayable<number>>
+    data_extent: p.Property<Arrayable<number>>
+    grid: p.Property<SurfaceGrid | null>
+    coarse_lons: p.Property<Arrayable<number>>
+    coarse_lats: p.Property<Arrayable<number>>
+    coarse_x: p.Property<Arrayable<number>>
+    coarse_y: p.Property<Arrayable<number>>
+    coarse_values: p.Property<Arrayable<number>>
+    coarse_n_lat: p.Property<number>
+    coarse_n_lon: p.Property<number>
     palette: p.Property<string>
+    preload_palettes: p.Property<string[]>
+    palette_data: p.Property<Dict<ArrayBuffer>>
     vmin: p.Property<number>
     vmax: p.Property<number>
     nan_color: p.Property<string>
     azimuth: p.Property<number>
     elevation: p.Property<number>
     zoom: p.Property<number>
+    globe: p.Property<boolean>
+    globe_relief: p.Property<number>
     autorotate: p.Property<boolean>
     rotation_speed: p.Property<number>
     enable_hover: p.Property<boolean>
+    x_label: p.Property<string>
+    y_label: p.Property<string>
     show_colorbar: p.Property<boolean>
     colorbar_title: p.Property<string>
     background_color: p.Property<string>
     colorbar_text_color: p.Property<string>
+    backend: p.Property<"canvas" | "webgl" | "worker">
+    adaptive_quality: p.Property<boolean>
+    frame_budget: p.Property<number>
+    idle_delay: p.Property<number>
+    profile: p.Property<boolean>
+    show_fps: p.Property<boolean>
+    render_stats: p.Property<Dict<number>>
   }
 }
 
@@ -445,32 +1252,105 @@ export class Surface3D extends LayoutDOM {
   declare properties: Surface3D.Props
   declare __view_type__: Surface3DView
 
+  // Emitted after values were patched in place
+  readonly values_patched = new Signal<Surface3D.ValuesPatch, this>(this, "values_patched")
+
   constructor(attrs?: Partial<Surface3D.Attrs>) {
     super(attrs)
   }
 
+  override connect_signals(): void {
+    super.connect_signals()
+    this.connect(this.properties.values_patch.change, () => {
+      const patch = this.values_patch
+      if (patch != null) {
+        this.patch_values(patch.values, patch.row, patch.col, patch.n_rows, patch.n_cols)
+      }
+    })
+  }
+
+  /**
+   * Replace an n_rows x n_cols tile of values (row-major) starting at grid
+   * row/col in place, then recolor and redraw only what it touches. Callable
+   * from CustomJS; Surface3D.patch() in Python arrives here through the
+   * values_patch property. By default the tile spans the remaining columns.
+   */
+  patch_values(tile: Arrayable<number>, row: number = 0, col: number = 0, n_rows?: number, n_cols?: number): void {
+    const {values, n_lat, n_lon} = this
+    if (this.triangles.length > 0) {
+      throw new Error("Surface3D: patch_values needs a grid, not a triangle mesh")
+    }
+    if (this.n_frames > 0) {
+      throw new Error("Surface3D: patch_values updates values, which a time series in frames does not draw")
+    }
+    n_cols = n_cols ?? n_lon - col
+    n_rows = n_rows ?? Math.floor(tile.length / n_cols)
+    if (row < 0 || col < 0 || row + n_rows > n_lat || col + n_cols > n_lon || tile.length < n_rows * n_cols) {
+      throw new Error(`Surface3D: patch of ${n_rows}x${n_cols} at (${row}, ${col}) does not fit the ${n_lat}x${n_lon} grid`)
+    }
+    for (let i = 0; i < n_rows; i++) {
+      const offset = (row + i) * n_lon + col
+      for (let j = 0; j < n_cols; j++) {
+        values[offset + j] = tile[i * n_cols + j]
+      }
+    }
+    this.values_patched.emit({row, col, n_rows, n_cols})
+  }
+
   static {
     this.prototype.default_view = Surface3DView
-    this.define<Surface3D.Props>(({Bool, Float, Int, List, String}) => ({
-      lons: [ List(Float), [] ],
-      lats: [ List(Float), [] ],
-      values: [ List(Float), [] ],
+    this.define<Surface3D.Props>(({Arrayable, Bool, Bytes, Dict, Enum, Float, Int, List, Nullable, Ref, String, Struct}) => ({
+      lons: [ Arrayable(Float), [] ],
+      lats: [ Arrayable(Float), [] ],
+      values: [ Arrayable(Float), [] ],
+      values_patch: [ Nullable(Struct({row: Int, col: Int, n_rows: Int, n_cols: Int, values: Arrayable(Float), seq: Int})), null ],
+      x: [ Arrayable(Float), [] ],
+      y: [ Arrayable(Float), [] ],
+      frames: [ Arrayable(Float), [] ],
+      n_frames: [ Int, 0 ],
+      frame: [ Int, 0 ],
+      playing: [ Bool, false ],
+      frame_interval: [ Float, 100.0 ],
+      loop: [ Bool, true ],
       n_lat: [ Int, 30 ],
       n_lon: [ Int, 60 ],
+      triangles: [ Arrayable(Int), [] ],
+      data_extent: [ Arrayable(Float), [] ],
+      grid: [ Nullable(Ref(SurfaceGrid)), null ],
+      coarse_lons: [ Arrayable(Float), [] ],
+      coarse_lats: [ Arrayable(Float), [] ],
+      coarse_x: [ Arrayable(Float), [] ],
+      coarse_y: [ Arrayable(Float), [] ],
+      coarse_values: [ Arrayable(Float), [] ],
+      coarse_n_lat: [ Int, 0 ],
+      coarse_n_lon: [ Int, 0 ],
       palette: [ String, 'Turbo256' ],
+      preload_palettes: [ List(String), [] ],
+      palette_data: [ Dict(Bytes), {} ],
       vmin: [ Float, NaN ],
       vmax: [ Float, NaN ],
       nan_color: [ String, '#808080' ],
       azimuth: [ Float, 45 ],
       elevation: [ Float, -30 ],
       zoom: [ Float, 1.0 ],
+      globe: [ Bool, false ],
+      globe_relief: [ Float, 0.05 ],
       autorotate: [ Bool, false ],
       rotation_speed: [ Float, 1.0 ],
       enable_hover: [ Bool, true ],
+      x_label: [ String, 'x' ],
+      y_label: [ String, 'y' ],
       show_colorbar: [ Bool, true ],
       colorbar_title: [ String, 'Value' ],
       background_color: [ String, '#0a0a0a' ],
       colorbar_text_color: [ String, '#ffffff' ],
+      backend: [ Enum("canvas", "webgl", "worker"), "canvas" ],
+      adaptive_quality: [ Bool, true ],
+      frame_budget: [ Float, 16.0 ],
+      idle_delay: [ Int, 200 ],
+      profile: [ Bool, false ],
+      show_fps: [ Bool, false ],
+      render_stats: [ Dict(Float), {} ],
     }))
   }
 }
\ No newline at end of file
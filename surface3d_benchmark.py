@@ -0,0 +1,396 @@
+
+"""
+Benchmarks for Surface3D across grid sizes, payload formats and render paths.
+
+For every surface (the ripple, Mexican hat and rose from the examples and
+the ``elev.nc`` DEM), grid size and payload format this records:
+
+* Python side: time to build the model, time to serialize it for a document
+  (``json_item``), the serialized size, and the peak traced memory of both.
+* Browser side, with ``--engine node`` (default): the Canvas2D kernel
+  (project, order, draw) and hover picking from ``kernel.ts``/``picking.ts``,
+  on the geometry ``geometry.ts`` builds, compiled with Bokeh's TypeScript
+  compiler and run in Node.js against a null 2-D context, i.e. the
+  JavaScript cost of a frame without rasterizing.
+  With ``--engine browser``: the real ``render_surface`` and ``pick`` of a
+  Surface3DView in a headless browser through selenium, rasterization
+  included.
+
+Results are written as JSON together with the versions and git commit, and
+``--baseline`` compares against an earlier results file, flagging slowdowns:
+
+    python surface3d_benchmark.py --out bench.json
+    python surface3d_benchmark.py --out new.json --baseline bench.json
+"""
+
+import argparse
+import datetime
+import json
+import math
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import bokeh
+from bokeh.embed import json_item
+
+from surface3d_py import Surface3D
+
+SOURCE_DIR = Path(__file__).resolve().parent
+SIZES = [50, 100, 250, 500, 1000, 2000]
+
+# Metrics compared against a baseline, and the ratio that counts as a regression
+COMPARED = ["build_ms", "serialize_ms", "size_bytes", "peak_mb", "frame_ms", "pick_ms"]
+REGRESSION = 1.2
+
+
+def ripple(n):
+    x = np.linspace(-5, 5, n)
+    X, Y = np.meshgrid(x, x)
+    R = np.sqrt(X**2 + Y**2)
+    return np.sin(3 * R) / np.sqrt(R**2 + 1e-6), x, x
+
+
+def mexican_hat(n):
+    x = np.linspace(-5, 5, n)
+    X, Y = np.meshgrid(x, x)
+    R2 = X**2 + Y**2
+    return (1 - R2) * np.exp(-R2 / 2), x, x
+
+
+def rose(n):
+    x1, theta = np.meshgrid(np.linspace(0, 1, n), np.linspace(-(20 / 9) * math.pi, 15 * math.pi, n))
+    phi = (math.pi / 2) * np.exp(-theta / (8 * math.pi))
+    y1 = 1.9565284531299512 * x1**2 * (1.2768869870150188 * x1 - 1)**2 * np.sin(phi)
+    c = np.mod(3.6 * theta, 2 * math.pi)
+    c = np.where(c > 0, c, c + 2 * math.pi)
+    X = 1 - (1.25 * (1 - c / math.pi)**2 - 0.25)**2 / 2
+    r = X * (x1 * np.sin(phi) + y1 * np.cos(phi))
+    return X * (x1 * np.cos(phi) - y1 * np.sin(phi)), r * np.sin(theta), r * np.cos(theta)
+
+
+def elev(n):
+    """The DEM resampled (nearest point) to n x n, heights in hectometres."""
+    import xarray as xr
+
+    with xr.open_dataset(SOURCE_DIR / "elev.nc") as dataset:
+        array = dataset["elevation"]
+        rows = np.linspace(0, array.shape[0] - 1, n).round().astype(int)
+        cols = np.linspace(0, array.shape[1] - 1, n).round().astype(int)
+        values = array.values[np.ix_(rows, cols)].astype(np.float64) / 100
+        return values, array["longitude"].values[cols], array["latitude"].values[rows]
+
+
+# Surface generators and the payload formats that apply to them: 1-D axes
+# or full 2-D coordinate arrays, in float64 or float32
+SURFACES = {
+    "ripple": (ripple, ["axes-f64", "axes-f32", "mesh-f64"]),
+    "mexican_hat": (mexican_hat, ["axes-f64", "axes-f32", "mesh-f64"]),
+    "rose": (rose, ["mesh-f64", "mesh-f32"]),
+    "elev": (elev, ["axes-f64", "axes-f32", "mesh-f64"]),
+}
+
+
+def payload(values, x, y, payload_format):
+    """(values, x, y) as sent for a payload format."""
+    coords, precision = payload_format.split("-")
+    if coords == "mesh" and x.ndim == 1:
+        x, y = np.meshgrid(x, y)
+    dtype = np.float32 if precision == "f32" else np.float64
+    return values.astype(dtype), x.astype(dtype), y.astype(dtype)
+
+
+def measure_python(values, x, y, repeat):
+    """Best build/serialize times over ``repeat`` runs, size and peak memory."""
+    def build():
+        return Surface3D.from_arrays(values, x, y, width=800, height=800, autorotate=False)
+
+    build_times, serialize_times = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        surface = build()
+        built = time.perf_counter()
+        text = json.dumps(json_item(surface))
+        serialized = time.perf_counter()
+        build_times.append(built - start)
+        serialize_times.append(serialized - built)
+
+    tracemalloc.start()
+    json.dumps(json_item(build()))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "build_ms": 1000 * min(build_times),
+        "serialize_ms": 1000 * min(serialize_times),
+        "size_bytes": len(text),
+        "peak_mb": peak / 2**20,
+    }, surface
+
+
+# Node.js driver: times the Canvas2D kernel on one grid over a turn of
+# azimuths, then hover picks at random points of the last frame. Geometry and
+# view come from buildGeometry and viewParams, as in Surface3DView.
+_NODE_DRIVER = r"""
+const fs = require("fs")
+const path = require("path")
+const dir = process.argv[2]
+const kernel = require(path.join(dir, "kernel.js"))
+const picking = require(path.join(dir, "picking.js"))
+const {buildGeometry} = require(path.join(dir, "geometry.js"))
+const spec = JSON.parse(fs.readFileSync(path.join(dir, "spec.json"), "utf8"))
+const read = (name) => {
+  const bytes = fs.readFileSync(path.join(dir, name))
+  return new Float64Array(bytes.buffer.slice(bytes.byteOffset, bytes.byteOffset + bytes.length))
+}
+const {n_lat, n_lon, axes, width, height, elevation} = spec
+const [x, y] = [read("x.bin"), read("y.bin")]
+const empty = new Float64Array(0)
+const geometry = buildGeometry({
+  lons: axes ? empty : x, lats: axes ? empty : y, x: axes ? x : empty, y: axes ? y : empty,
+  values: read("values.bin"), n_lat, n_lon,
+})
+const {height_field} = geometry
+
+// A 2-D context that accepts every call and draws nothing
+const noop = () => {}
+const ctx = {beginPath: noop, moveTo: noop, lineTo: noop, closePath: noop, fill: noop, stroke: noop}
+
+const view_params = (azimuth) => kernel.viewParams(geometry.bounds, azimuth, elevation, 1, width, height)
+
+const n_quads = (n_lat - 1) * (n_lon - 1)
+const quad_index = new Uint16Array(n_quads)
+// One palette entry followed by the NaN color, which drawQuads skips
+const styles = ["#000000", "#808080"]
+const stages = {project_ms: [], order_ms: [], draw_ms: [], frame_ms: []}
+let buffers
+let view
+for (let k = 0; k <= spec.frames; k++) {
+  view = view_params(45 + 360 * k / spec.frames)
+  const t0 = performance.now()
+  buffers = kernel.ensureFrameBuffers(buffers, n_lat, n_lon)
+  kernel.projectVertices(geometry, view, buffers)
+  const t1 = performance.now()
+  let order
+  if (height_field) {
+    order = kernel.traverseBackToFront(geometry, view, buffers)
+  } else {
+    kernel.computeQuadDepths(n_lat, n_lon, buffers)
+    order = kernel.sortQuadsByDepth(buffers)
+  }
+  const t2 = performance.now()
+  kernel.drawQuads(ctx, n_lon, buffers, order, buffers.n_quads, quad_index, styles)
+  const t3 = performance.now()
+  // The first frame allocates buffers and warms up the JIT
+  if (k == 0) continue
+  stages.project_ms.push(t1 - t0)
+  stages.order_ms.push(t2 - t1)
+  stages.draw_ms.push(t3 - t2)
+  stages.frame_ms.push(t3 - t0)
+}
+
+const t_index = performance.now()
+const index = picking.buildPickIndex(n_lat, n_lon, buffers, width, height)
+const pick_index_ms = performance.now() - t_index
+let seed = 1
+const random = () => (seed = (seed * 16807) % 2147483647) / 2147483647
+const pick_ms = []
+for (let k = 0; k < spec.picks; k++) {
+  const px = random() * width, py = random() * height
+  const t = performance.now()
+  picking.pickQuad(index, geometry, buffers, px, py)
+  pick_ms.push(performance.now() - t)
+}
+process.stdout.write(JSON.stringify({...stages, pick_index_ms, pick_ms}))
+"""
+
+# Browser driver: calls the view's own render_surface and pick directly,
+# reading back a pixel so Canvas2D rasterization is included
+_BROWSER_DRIVER = """
+const [frames, picks] = arguments
+const view = Bokeh.index.roots[0]
+const model = view.model
+model.setv({autorotate: false, adaptive_quality: false})
+view.cancel_render()
+const width = model.width, height = model.height
+const flush = () => view.ctx?.getImageData(0, 0, 1, 1)
+const frame_ms = []
+for (let k = 0; k <= frames; k++) {
+  model.setv({azimuth: (45 + 360 * k / frames) % 360}, {silent: true})
+  const t = performance.now()
+  view.render_surface()
+  flush()
+  if (k > 0) frame_ms.push(performance.now() - t)
+}
+let seed = 1
+const random = () => (seed = (seed * 16807) % 2147483647) / 2147483647
+const pick_ms = []
+for (let k = 0; k <= picks; k++) {
+  view.mouse_x = random() * width
+  view.mouse_y = random() * height
+  const t = performance.now()
+  view.pick()
+  pick_ms.push(performance.now() - t)
+}
+// The first pick builds the index
+return {frame_ms, pick_index_ms: pick_ms[0], pick_ms: pick_ms.slice(1)}
+"""
+
+
+def compile_kernel(directory):
+    """Compile the kernel, picking and geometry modules to CommonJS modules in ``directory``."""
+    from bokeh.util.compiler import nodejs_compile
+
+    for name in ("kernel", "picking", "geometry", "palettes", "projections"):
+        # The compiler resolves a relative file name against the working directory
+        path = SOURCE_DIR / f"{name}.ts"
+        result = nodejs_compile(path.read_text(encoding="utf-8"), lang="typescript", file=str(path))
+        if "error" in result:
+            raise RuntimeError(f"compiling {name}.ts failed: {result['error']}")
+        (Path(directory) / f"{name}.js").write_text(result["code"], encoding="utf-8")
+    (Path(directory) / "driver.js").write_text(_NODE_DRIVER, encoding="utf-8")
+
+
+def measure_node(directory, values, x, y, frames, picks):
+    n_lat, n_lon = values.shape
+    directory = Path(directory)
+    for name, array in (("x", x), ("y", y), ("values", values)):
+        np.ascontiguousarray(array, dtype=np.float64).tofile(directory / f"{name}.bin")
+    spec = dict(n_lat=n_lat, n_lon=n_lon, axes=x.ndim == 1, width=800, height=800, elevation=-30,
+                frames=frames, picks=picks)
+    (directory / "spec.json").write_text(json.dumps(spec), encoding="utf-8")
+    output = subprocess.run(["node", str(directory / "driver.js"), str(directory)],
+                            check=True, capture_output=True, text=True).stdout
+    return summarize(json.loads(output))
+
+
+def measure_browser(surface, frames, picks, driver):
+    from bokeh.io.export import get_layout_html, wait_until_render_complete
+
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".html", delete=False) as page:
+        page.write(get_layout_html(surface))
+    try:
+        driver.get(Path(page.name).as_uri())
+        wait_until_render_complete(driver, 60)
+        return summarize(driver.execute_script(_BROWSER_DRIVER, frames, picks))
+    finally:
+        os.unlink(page.name)
+
+
+def summarize(timings):
+    """Medians of the per-frame and per-pick timings (plus the frame p95)."""
+    summary = {}
+    for key, samples in timings.items():
+        if isinstance(samples, list):
+            summary[key] = float(np.median(samples)) if samples else None
+        else:
+            summary[key] = samples
+    if timings.get("frame_ms"):
+        summary["frame_p95_ms"] = float(np.percentile(timings["frame_ms"], 95))
+    return summary
+
+
+def metadata():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=SOURCE_DIR,
+                                check=True, capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "bokeh": bokeh.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+    }
+
+
+def compare(results, baseline):
+    """Print the metrics that got worse by more than REGRESSION times the baseline."""
+    key = lambda row: (row["surface"], row["size"], row["format"])
+    previous = {key(row): row for row in baseline["results"]}
+    regressions = 0
+    for row in results:
+        old = previous.get(key(row))
+        if old is None:
+            continue
+        for metric in COMPARED:
+            new_value, old_value = row.get(metric), old.get(metric)
+            if new_value is None or not old_value:
+                continue
+            ratio = new_value / old_value
+            if ratio > REGRESSION:
+                regressions += 1
+                print(f"REGRESSION {row['surface']} {row['size']} {row['format']} {metric}: "
+                      f"{old_value:.3g} -> {new_value:.3g} ({ratio:.2f}x)")
+    print(f"{regressions} regression(s) against {baseline['meta'].get('commit')}")
+    return regressions
+
+
+def run(surfaces, sizes, engine, frames, picks, repeat):
+    results = []
+    work_dir = tempfile.mkdtemp(prefix="surface3d-bench")
+    driver = None
+    try:
+        if engine == "node":
+            compile_kernel(work_dir)
+        elif engine == "browser":
+            from bokeh.io.webdriver import webdriver_control
+            driver = webdriver_control.get()
+        for name in surfaces:
+            generate, formats = SURFACES[name]
+            for size in sizes:
+                try:
+                    data = generate(size)
+                except (ImportError, OSError) as e:
+                    print(f"skipping {name}: {e}")
+                    break
+                for payload_format in formats:
+                    values, x, y = payload(*data, payload_format)
+                    row = {"surface": name, "size": size, "format": payload_format}
+                    python_metrics, surface = measure_python(values, x, y, repeat)
+                    row.update(python_metrics)
+                    if engine == "node":
+                        row.update(measure_node(work_dir, values, x, y, frames, picks))
+                    elif engine == "browser":
+                        row.update(measure_browser(surface, frames, picks, driver))
+                    results.append(row)
+                    print(" ".join(f"{k}={v:.4g}" if isinstance(v, float) else f"{k}={v}" for k, v in row.items()))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--surfaces", nargs="+", choices=list(SURFACES), default=list(SURFACES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES, help="grid points per side")
+    parser.add_argument("--engine", choices=["node", "browser", "none"], default="node",
+                        help="render harness; 'none' measures the Python side only")
+    parser.add_argument("--frames", type=int, default=10, help="frames timed per case")
+    parser.add_argument("--picks", type=int, default=200, help="hover picks timed per case")
+    parser.add_argument("--repeat", type=int, default=3, help="Python-side runs per case (best is kept)")
+    parser.add_argument("--out", default="surface3d_benchmark.json", help="results file")
+    parser.add_argument("--baseline", help="earlier results file to compare against")
+    args = parser.parse_args()
+
+    results = run(args.surfaces, args.sizes, args.engine, args.frames, args.picks, args.repeat)
+    report = {"meta": {**metadata(), "engine": args.engine, "frames": args.frames, "picks": args.picks},
+              "results": results}
+    Path(args.out).write_text(json.dumps(report, indent=1), encoding="utf-8")
+    print(f"wrote {len(results)} results to {args.out}")
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        if compare(results, baseline):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+
+"""
+On-disk cache for the compiled Surface3D extension bundle.
+
+Bokeh compiles ``__implementation__`` TypeScript with Node.js the first time
+a process calls ``show()``/``save()``/``file_html()``, which takes seconds.
+The compiled bundle is stored on disk under a name derived from the
+TypeScript sources and the Bokeh version, and placed in Bokeh's in-process
+bundle cache, so later runs and batch worker processes skip compilation.
+Editing any ``.ts`` file or upgrading Bokeh changes the name, so stale
+bundles are never used. Surface3D installs the bundle when a surface is
+first added to a document, so building models never waits for Node.js.
+
+Installing goes through private parts of ``bokeh.util.compiler``, which
+have kept their shape across Bokeh 3.x (written against 3.9). With any
+other Bokeh, or if they are gone, nothing is cached and Bokeh compiles the
+extension itself as usual.
+
+Set ``SURFACE3D_BUNDLE_CACHE`` to change the cache directory (default
+``~/.cache/bokeh_surfaces``). Run ``python surface3d_bundle.py`` to build the
+bundle ahead of a batch job.
+"""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+
+import bokeh
+from bokeh.util import compiler
+
+log = logging.getLogger(__name__)
+
+SOURCE_DIR = Path(__file__).resolve().parent
+
+# The compiler internals install_bundle relies on
+PRIVATE_API = ("_get_custom_models", "_bundle_models", "_bundle_cache", "calc_cache_key")
+
+
+def supported():
+    """True when this Bokeh is a 3.x release with the compiler internals used here."""
+    return bokeh.__version__.split(".")[0] == "3" and all(hasattr(compiler, name) for name in PRIVATE_API)
+
+
+def cache_dir():
+    """Directory holding compiled bundles."""
+    default = Path.home() / ".cache" / "bokeh_surfaces"
+    return Path(os.environ.get("SURFACE3D_BUNDLE_CACHE", default))
+
+
+def source_hash():
+    """Hash of the Bokeh version and every TypeScript source of the extension."""
+    digest = hashlib.sha256(bokeh.__version__.encode())
+    for path in sorted(SOURCE_DIR.glob("*.ts")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def bundle_path():
+    """Path of the cached bundle for the current sources."""
+    return cache_dir() / f"surface3d-{source_hash()}.js"
+
+
+def install_bundle(model_class, rebuild=False):
+    """
+    Make the compiled bundle for ``model_class`` available to Bokeh.
+
+    Reads the bundle from disk, or compiles and stores it on a miss (or when
+    ``rebuild`` is true), then registers it in Bokeh's bundle cache for
+    documents whose only custom model is ``model_class``. Returns the bundle
+    path, or None without doing anything when this Bokeh is not supported.
+    The file is written atomically, so concurrent workers can race on the
+    first build safely.
+    """
+    if not supported():
+        log.warning("Surface3D: no bundle cache for Bokeh %s (needs 3.x with %s); "
+                    "Bokeh compiles the extension instead", bokeh.__version__, ", ".join(PRIVATE_API))
+        return None
+    custom_models = compiler._get_custom_models([model_class])
+    key = compiler.calc_cache_key(custom_models)
+    path = bundle_path()
+    if path.exists() and not rebuild:
+        bundle = path.read_text(encoding="utf-8")
+    else:
+        bundle = compiler._bundle_models(custom_models)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(bundle, encoding="utf-8")
+        os.replace(tmp, path)
+    compiler._bundle_cache[key] = bundle
+    return path
+
+
+if __name__ == "__main__":
+    from surface3d_py import Surface3D
+
+    print(install_bundle(Surface3D, rebuild=True))
@@ -0,0 +1,173 @@
+
+"""
+Headless PNG and animated GIF export of Surface3D.
+
+Each surface is rendered to a standalone page once, loaded in a headless
+browser, and screenshotted; further frames (e.g. a full turn of azimuths, or
+the steps of a time series) only update view properties in the already
+loaded page, so a 36-frame GIF costs one page load. ``export_many`` spreads
+a catalog of surfaces over a process pool: pages are built in the calling
+process with the compiled extension bundle (see ``surface3d_bundle``), and
+every worker process keeps a single browser for all of its jobs.
+
+Like ``bokeh.io.export_png`` this needs selenium with a Chrome or Firefox
+driver, and Pillow.
+"""
+
+import io
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import util
+from pathlib import Path
+
+from bokeh.io.export import get_layout_html, wait_until_render_complete
+
+# Resolve once the surface's view reports its latest frame drawn (by the
+# worker too, with backend="worker"), plus one more animation frame for the
+# page to show it
+_SETTLE_SCRIPT = """
+const [id, done] = [arguments[0], arguments[arguments.length - 1]]
+const view = Bokeh.index.find_one_by_id(id)
+const poll = () => {
+  if (view == null || view.render_complete) {
+    requestAnimationFrame(() => done(null))
+  } else {
+    requestAnimationFrame(poll)
+  }
+}
+requestAnimationFrame(poll)
+"""
+
+_SIZE_SCRIPT = """
+const {width, height} = Bokeh.index.roots[0].el.getBoundingClientRect()
+return [Math.round(width), Math.round(height), window.devicePixelRatio]
+"""
+
+_SET_VIEW_SCRIPT = """
+const [id, attrs] = arguments
+Bokeh.documents[0].get_model_by_id(id).setv(attrs)
+"""
+
+
+def rotation_views(start=0.0, n_frames=36):
+    """Views for one full turn of azimuth in ``n_frames`` steps, starting at ``start``."""
+    return [{"azimuth": (start + 360.0 * k / n_frames) % 360.0} for k in range(n_frames)]
+
+
+def get_frames(surface, views=None, driver=None, timeout=30):
+    """
+    Screenshots of ``surface`` as PIL images, one per view.
+
+    ``views`` is a list of property updates applied in turn in the loaded
+    page, e.g. ``[{"azimuth": 0}, {"azimuth": 10}]`` or
+    ``[{"frame": k} for k in range(surface.n_frames)]``; by default a
+    single screenshot of the surface as it is. ``driver`` is a selenium
+    webdriver, by default Bokeh's shared headless one.
+    """
+    html = get_layout_html(surface)
+    return _render(html, surface.id, views or [{}], driver, timeout)
+
+
+def export_png(surface, filename, driver=None, timeout=30):
+    """Save a screenshot of ``surface`` as a PNG file and return the filename."""
+    [image] = get_frames(surface, driver=driver, timeout=timeout)
+    image.save(filename)
+    return filename
+
+
+def export_gif(surface, filename, views=None, duration=100, loop=0, driver=None, timeout=30):
+    """
+    Save an animated GIF of ``surface`` and return the filename.
+
+    Frames are taken for each of ``views`` (see ``get_frames``), by default
+    a full turn of azimuth from the surface's current one. ``duration`` is
+    the time per frame in milliseconds and ``loop`` the number of repeats
+    (0 repeats forever).
+    """
+    views = views or rotation_views(surface.azimuth)
+    images = get_frames(surface, views, driver=driver, timeout=timeout)
+    _save_gif(images, filename, duration, loop)
+    return filename
+
+
+def export_many(jobs, processes=None, duration=100, timeout=30):
+    """
+    Export many surfaces in parallel and return the filenames written.
+
+    ``jobs`` holds ``(surface, filename)`` or ``(surface, filename, views)``
+    tuples. A ``.gif`` filename gets an animation (a full turn of azimuth
+    unless ``views`` are given), anything else a PNG of the first view.
+    ``processes`` defaults to the number of CPUs.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return []
+    # Fail here with Bokeh's message if selenium is missing, rather than in
+    # every worker
+    import bokeh.io.webdriver  # noqa: F401
+
+    tasks = []
+    for job in jobs:
+        surface, filename, *views = job
+        views = views[0] if views else None
+        if views is None and Path(filename).suffix.lower() == ".gif":
+            views = rotation_views(surface.azimuth)
+        tasks.append((get_layout_html(surface), surface.id, views or [{}], os.fspath(filename), duration, timeout))
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker) as pool:
+        return list(pool.map(_export_task, *zip(*tasks)))
+
+
+def _init_worker():
+    # Bokeh's webdriver control keeps one browser per process for all of the
+    # worker's jobs. Pool workers skip atexit handlers, so close it with a
+    # multiprocessing finalizer instead.
+    from bokeh.io.webdriver import webdriver_control
+    util.Finalize(None, webdriver_control.cleanup, exitpriority=10)
+
+
+def _export_task(html, model_id, views, filename, duration, timeout):
+    images = _render(html, model_id, views, None, timeout)
+    if Path(filename).suffix.lower() == ".gif":
+        _save_gif(images, filename, duration, 0)
+    else:
+        images[0].save(filename)
+    return filename
+
+
+def _render(html, model_id, views, driver, timeout):
+    from PIL import Image
+
+    if driver is None:
+        from bokeh.io.webdriver import webdriver_control
+        driver = webdriver_control.get()
+
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", prefix="surface3d", suffix=".html", delete=False) as page:
+        page.write(html)
+    try:
+        driver.maximize_window()
+        driver.get(Path(page.name).as_uri())
+        wait_until_render_complete(driver, timeout)
+        width, height, dpr = driver.execute_script(_SIZE_SCRIPT)
+        # Room for the whole surface; the screenshot is cropped below
+        driver.set_window_size(width * dpr + 100, height * dpr + 100)
+        driver.set_script_timeout(timeout)
+        # Frames must not depend on when they were taken
+        driver.execute_script(_SET_VIEW_SCRIPT, model_id, {"autorotate": False, "playing": False})
+
+        images = []
+        for attrs in views:
+            if attrs:
+                driver.execute_script(_SET_VIEW_SCRIPT, model_id, attrs)
+            driver.execute_async_script(_SETTLE_SCRIPT, model_id)
+            png = driver.get_screenshot_as_png()
+            image = Image.open(io.BytesIO(png)).convert("RGB").crop((0, 0, width * dpr, height * dpr))
+            images.append(image)
+        return images
+    finally:
+        os.unlink(page.name)
+
+
+def _save_gif(images, filename, duration, loop):
+    first, *rest = images
+    first.save(filename, save_all=True, append_images=rest, duration=duration, loop=loop, optimize=True)
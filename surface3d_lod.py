@@ -0,0 +1,75 @@
+
+"""
+Level-of-detail pyramids for Surface3D.
+
+A pyramid is a list of grid levels, finest first, where each level averages
+2x2 blocks of the previous one (NaN-aware). Surface3D picks two levels from
+it: a fine one matched to the on-screen size of the surface (``width``,
+``height`` and ``zoom``) that is drawn when the view is idle, and a coarse
+one that is drawn while the user drags or the surface autorotates.
+"""
+
+import numpy as np
+
+# On-screen pixels per grid cell to aim for. Cells smaller than this add no
+# visible detail; the interactive level is deliberately much coarser.
+IDLE_PIXELS_PER_CELL = 1.5
+INTERACTIVE_PIXELS_PER_CELL = 6.0
+
+
+def coarsen2d(array):
+    """Average 2x2 blocks of a 2-D array, ignoring NaNs and trimming odd edges."""
+    n_lat, n_lon = (array.shape[0] // 2) * 2, (array.shape[1] // 2) * 2
+    blocks = array[:n_lat, :n_lon].reshape(n_lat // 2, 2, n_lon // 2, 2)
+    valid = ~np.isnan(blocks)
+    total = np.where(valid, blocks, 0).sum(axis=(1, 3))
+    count = valid.sum(axis=(1, 3))
+    out = np.full(total.shape, np.nan, dtype=array.dtype)
+    np.divide(total, count, out=out, where=count > 0)
+    return out
+
+
+def coarsen_axis(axis):
+    """Average consecutive pairs of a 1-D axis, trimming an odd last value."""
+    n = (len(axis) // 2) * 2
+    return axis[:n].reshape(-1, 2).mean(axis=1).astype(axis.dtype, copy=False)
+
+
+def build_pyramid(values, x, y, min_size=16):
+    """
+    Build a pyramid of (values, x, y) levels, finest first.
+
+    ``values`` is a 2-D (n_lat, n_lon) array. ``x``/``y`` are either 1-D axes
+    (n_lon and n_lat values) or 2-D coordinate arrays shaped like ``values``.
+    Levels are added until either dimension would drop below ``min_size``.
+    """
+    values = np.asarray(values)
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if values.ndim != 2:
+        raise ValueError(f"expected a 2-D values array, got shape {values.shape}")
+    if values.dtype.kind != "f":
+        values = values.astype(np.float64)
+
+    levels = [(values, x, y)]
+    while min(values.shape) // 2 >= min_size:
+        values = coarsen2d(values)
+        x = coarsen2d(x) if x.ndim == 2 else coarsen_axis(x)
+        y = coarsen2d(y) if y.ndim == 2 else coarsen_axis(y)
+        levels.append((values, x, y))
+    return levels
+
+
+def choose_level(pyramid, width, height, zoom, pixels_per_cell):
+    """
+    Index of the coarsest level that still has about one cell per
+    ``pixels_per_cell`` screen pixels across the drawn surface.
+
+    Surface3D scales the data to ``0.6 * min(width, height) * zoom`` pixels
+    along its largest extent, which bounds the useful grid resolution.
+    """
+    target = 0.6 * min(width, height) * zoom / pixels_per_cell
+    for index in range(len(pyramid) - 1, -1, -1):
+        if max(pyramid[index][0].shape) >= target:
+            return index
+    return 0
@@ -0,0 +1,270 @@
+
+"""
+Error-bounded adaptive triangle meshes for Surface3D height fields.
+
+A uniform grid spends as many triangles on flat ocean as on a mountain ridge.
+``simplify_grid`` instead covers the grid with a quadtree of blocks, coarsest
+first. A block is kept whole when the triangles fanned from its center point
+to its corners reproduce every grid value inside it to within ``tolerance``
+(in units of the values); otherwise it is split into four. Blocks touching a
+NaN are split down to single cells, and cells with a NaN corner are dropped.
+
+Every kept block is then fanned from its center to all vertices on its
+outline, including the corners of smaller neighbouring blocks, so adjacent
+blocks of different sizes share their edges exactly and the mesh has no
+cracks. (A block clipped to one cell thick at the far end of the grid has no
+grid point inside; it is fanned from its far side, the outline of the grid,
+so its near side still takes in its neighbours' vertices.) Vertices are grid points, so the mesh passes exactly through the data
+at every vertex. Those extra outline vertices change a block's triangles, so
+the final mesh is checked against every grid point it covers and blocks that
+exceed the tolerance are split further until none do.
+
+Errors are computed a whole quadtree level (or batch of triangles) at a time
+with NumPy, which keeps simplifying a few million grid points to seconds.
+"""
+
+import numpy as np
+
+
+def simplify_grid(values, tolerance, max_block=None):
+    """
+    Adaptive triangulation of a 2-D (n_lat, n_lon) grid of values.
+
+    Returns ``(rows, cols, triangles)``: the grid row and column of every mesh
+    vertex, and an (n_triangles, 3) uint32 array of vertex indices.
+    ``max_block`` caps the block size in cells (a power of two); by default
+    blocks may grow to span the whole grid.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim != 2 or min(values.shape) < 2:
+        raise ValueError(f"expected a 2-D grid of at least 2x2 values, got shape {values.shape}")
+    n_lat, n_lon = values.shape
+    size = 1
+    while size < max(n_lat, n_lon) - 1 and (max_block is None or size < max_block):
+        size *= 2
+
+    r0, c0, sizes = _quadtree(values, tolerance, size)
+    while True:
+        r1 = np.minimum(r0 + sizes, n_lat - 1)
+        c1 = np.minimum(c0 + sizes, n_lon - 1)
+        vertices, triangles, leaf = _triangulate(n_lat, n_lon, r0, r1, c0, c1)
+        rows, cols = np.divmod(vertices, n_lon)
+        errors = np.zeros(len(r0))
+        np.maximum.at(errors, leaf, _triangle_errors(values, rows, cols, triangles))
+        split = errors > tolerance
+        if not split.any():
+            break
+        r0, c0, sizes = _split(r0, c0, sizes, split, n_lat, n_lon)
+
+    # Leave out triangles with a NaN corner, then vertices no triangle uses
+    vertex_nan = np.isnan(values[rows, cols])
+    triangles = triangles[~vertex_nan[triangles].any(axis=1)]
+    kept, triangles = np.unique(triangles, return_inverse=True)
+    return rows[kept], cols[kept], triangles.reshape(-1, 3).astype(np.uint32)
+
+
+def mesh_error(values, rows, cols, triangles):
+    """
+    Largest vertical difference between the mesh returned by ``simplify_grid``
+    and the grid values at the grid points it covers (NaN points are ignored).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    errors = _triangle_errors(values, np.asarray(rows), np.asarray(cols), np.asarray(triangles, dtype=np.intp))
+    return float(errors.max(initial=0.0))
+
+
+def _quadtree(values, tolerance, size):
+    """
+    Blocks whose center fan is within ``tolerance``, coarsest first from
+    blocks of ``size`` cells, as arrays of first row, first column and size.
+    """
+    n_lat, n_lon = values.shape
+    leaves = []
+    active = np.ones((_n_blocks(n_lat, size), _n_blocks(n_lon, size)), dtype=bool)
+    while True:
+        if size == 1:
+            leaf = active
+        else:
+            leaf = active & (_block_errors(values, size) <= tolerance)
+        blocks_i, blocks_j = np.nonzero(leaf)
+        leaves.append((blocks_i * size, blocks_j * size, np.full(len(blocks_i), size)))
+        if size == 1:
+            break
+        # Children of the split blocks are tried at the next level down
+        split = active & ~leaf
+        size //= 2
+        rows = np.arange(_n_blocks(n_lat, size)) // 2
+        cols = np.arange(_n_blocks(n_lon, size)) // 2
+        active = split[rows[:, None], cols[None, :]]
+        if not active.any():
+            break
+    return tuple(np.concatenate(arrays) for arrays in zip(*leaves))
+
+
+def _split(r0, c0, sizes, split, n_lat, n_lon):
+    """Replace the blocks flagged in ``split`` by their (up to four) children."""
+    half = sizes[split] // 2
+    children = [(r0[~split], c0[~split], sizes[~split])]
+    for di, dj in ((0, 0), (0, 1), (1, 0), (1, 1)):
+        i0 = r0[split] + di * half
+        j0 = c0[split] + dj * half
+        # Blocks clipped at the grid edge may have fewer children
+        inside = (i0 < n_lat - 1) & (j0 < n_lon - 1)
+        children.append((i0[inside], j0[inside], half[inside]))
+    return tuple(np.concatenate(arrays) for arrays in zip(*children))
+
+
+def _n_blocks(n, size):
+    return max(1, -(-(n - 1) // size))
+
+
+def _block_axis(n, size):
+    """Start, center and end of the block of ``size`` cells each point along an axis falls in."""
+    index = np.arange(n)
+    start = (np.minimum(index, n - 2) // size) * size
+    end = np.minimum(start + size, n - 1)
+    return start, _center(start, end), end
+
+
+def _center(start, end):
+    """
+    Center of blocks spanning [start, end] along an axis. A block one cell
+    thick has no grid point inside, so its center goes on its far side:
+    blocks clipped to one cell lie at the end of the grid, where no
+    neighbour puts vertices partway along the edge, while a center on the
+    near side would skip the vertices its neighbours put there.
+    """
+    return np.where(end - start == 1, end, (start + end) // 2)
+
+
+def _barycentric(i, j, a, b, c):
+    det = (b[0] - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) * (b[1] - a[1])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        w_b = ((i - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) * (j - a[1])) / det
+        w_c = ((b[0] - a[0]) * (j - a[1]) - (i - a[0]) * (b[1] - a[1])) / det
+    return 1 - w_b - w_c, w_b, w_c
+
+
+def _block_errors(values, size):
+    """
+    Largest difference between each block's center fan and the values in it,
+    per block of ``size`` cells (infinite for blocks touching a NaN).
+    """
+    n_lat, n_lon = values.shape
+    r0, rm, r1 = (axis[:, None] for axis in _block_axis(n_lat, size))
+    c0, cm, c1 = (axis[None, :] for axis in _block_axis(n_lon, size))
+    i = np.arange(n_lat)[:, None]
+    j = np.arange(n_lon)[None, :]
+    center = (rm, cm)
+    z_center = values[rm, cm]
+    corners = [(r0, c0), (r0, c1), (r1, c1), (r1, c0)]
+    z_corners = [values[r, c] for r, c in corners]
+
+    # Each point is interpolated on the first of the four fan triangles that
+    # contains it; on an edge shared with a neighbour every triangle gives
+    # the same value, so it does not matter which block a point is given to
+    fan = np.full(values.shape, np.nan)
+    pending = np.ones(values.shape, dtype=bool)
+    for k in range(4):
+        w_m, w_a, w_b = _barycentric(i, j, center, corners[k], corners[(k + 1) % 4])
+        inside = pending & (w_m >= -1e-9) & (w_a >= -1e-9) & (w_b >= -1e-9)
+        with np.errstate(invalid="ignore"):
+            z = w_m * z_center + w_a * z_corners[k] + w_b * z_corners[(k + 1) % 4]
+        fan = np.where(inside, z, fan)
+        pending &= ~inside
+    error = np.abs(values - fan)
+    error[np.isnan(error)] = np.inf
+
+    # Blocks include their far edge, which the point assignment above gives
+    # to the next block: fold the next row and column into each one
+    error = np.maximum(error, np.concatenate([error[1:], error[-1:]], axis=0))
+    error = np.maximum(error, np.concatenate([error[:, 1:], error[:, -1:]], axis=1))
+    starts_i = np.arange(0, max(n_lat - 1, 1), size)
+    starts_j = np.arange(0, max(n_lon - 1, 1), size)
+    return np.maximum.reduceat(np.maximum.reduceat(error, starts_i, axis=0), starts_j, axis=1)
+
+
+def _triangulate(n_lat, n_lon, r0, r1, c0, c1):
+    """
+    Fan every block [r0, r1] x [c0, c1] from its center over the vertices on
+    its outline. Returns the flat grid index of every vertex, the triangles
+    and the block each triangle belongs to.
+    """
+    rm = _center(r0, r1)
+    cm = _center(c0, c1)
+    used = np.zeros((n_lat, n_lon), dtype=bool)
+    for r, c in ((r0, c0), (r0, c1), (r1, c0), (r1, c1), (rm, cm)):
+        used[r, c] = True
+
+    # Vertex ids follow row-major order, so the vertices along a row are
+    # consecutive ids; along a column they are consecutive in column-major
+    # order, mapped back to ids through by_column
+    row_major = np.flatnonzero(used)
+    col_major = np.flatnonzero(used.T)
+    by_column = np.searchsorted(row_major, (col_major % n_lat) * n_lon + col_major // n_lat)
+    center = np.searchsorted(row_major, rm * n_lon + cm)
+    block = np.arange(len(r0))
+
+    triangles = []
+    blocks = []
+    # Edges as (fixed row or column, first, last); an edge the center lies on
+    # (a block one cell thick) has no triangles
+    for fixed, first, last, along_row, skip in (
+        (r0, c0, c1, True, rm == r0),
+        (r1, c0, c1, True, rm == r1),
+        (c0, r0, r1, False, cm == c0),
+        (c1, r0, r1, False, cm == c1),
+    ):
+        keep = ~skip
+        fixed, first, last, fan_center = fixed[keep], first[keep], last[keep], center[keep]
+        leaf = block[keep]
+        if along_row:
+            start = np.searchsorted(row_major, fixed * n_lon + first)
+            stop = np.searchsorted(row_major, fixed * n_lon + last)
+        else:
+            start = np.searchsorted(col_major, fixed * n_lat + first)
+            stop = np.searchsorted(col_major, fixed * n_lat + last)
+        # One triangle per segment between consecutive outline vertices
+        count = stop - start
+        offsets = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+        a = np.repeat(start, count) + offsets
+        if along_row:
+            a, b = a, a + 1
+        else:
+            a, b = by_column[a], by_column[a + 1]
+        triangles.append(np.stack([np.repeat(fan_center, count), a, b], axis=1))
+        blocks.append(np.repeat(leaf, count))
+    return row_major, np.concatenate(triangles), np.concatenate(blocks)
+
+
+def _triangle_errors(values, rows, cols, triangles, batch=1 << 21):
+    """
+    Largest difference between each triangle and the values at the grid
+    points it covers, ignoring NaNs. Triangles are rasterized over their
+    bounding boxes in batches of similar size.
+    """
+    n_lat, n_lon = values.shape
+    corners = [(rows[triangles[:, k]], cols[triangles[:, k]]) for k in range(3)]
+    i_min = np.minimum.reduce([i for i, _ in corners])
+    j_min = np.minimum.reduce([j for _, j in corners])
+    span = np.maximum(
+        np.maximum.reduce([i for i, _ in corners]) - i_min,
+        np.maximum.reduce([j for _, j in corners]) - j_min,
+    ) + 1
+    errors = np.zeros(len(triangles))
+    # Triangles of a single cell cover no grid points besides their corners
+    for n in np.unique(span[span > 2]):
+        di, dj = np.divmod(np.arange(n * n), n)
+        selected = np.flatnonzero(span == n)
+        for chunk in np.array_split(selected, -(-len(selected) * n * n // batch)):
+            i = np.minimum(i_min[chunk, None] + di, n_lat - 1)
+            j = np.minimum(j_min[chunk, None] + dj, n_lon - 1)
+            (ai, aj), (bi, bj), (ci, cj) = ((ri[chunk, None], rj[chunk, None]) for ri, rj in corners)
+            w_a, w_b, w_c = _barycentric(i, j, (ai, aj), (bi, bj), (ci, cj))
+            inside = (w_a >= -1e-9) & (w_b >= -1e-9) & (w_c >= -1e-9)
+            with np.errstate(invalid="ignore"):
+                z = w_a * values[ai, aj] + w_b * values[bi, bj] + w_c * values[ci, cj]
+                diff = np.abs(z - values[i, j])
+            diff[~inside | np.isnan(diff)] = 0
+            errors[chunk] = diff.max(axis=1)
+    return errors
@@ -0,0 +1,3176 @@
+
+"""
+Color palettes for Surface3D.
+
+Each palette is stored as a string of six hex digits per color. Only the
+palettes a document actually uses are embedded in it, packed as 3 RGB bytes
+per color (see ``Surface3D.palette_data``).
+"""
+
+DEFAULT_PALETTE = "Turbo256"
+
+
+def palette_names():
+    """Sorted names of all available palettes."""
+    return sorted(PALETTES)
+
+
+def get_palette(name):
+    """Palette as a list of ``#rrggbb`` colors; unknown names give the default palette."""
+    packed = PALETTES.get(name, PALETTES[DEFAULT_PALETTE])
+    return ["#" + packed[i:i + 6] for i in range(0, len(packed), 6)]
+
+
+def pack_palette(name):
+    """Palette as packed RGB bytes, 3 per color; unknown names give the default palette."""
+    return bytes.fromhex(PALETTES.get(name, PALETTES[DEFAULT_PALETTE]))
+
+
+PALETTES = {
+    "Turbo256": (
+        "30123b31154232184a341b51351e5836215f37256638286d392b743a2e7b3b31813c34883c378e3d3a943e3d9a3e40a0"
+        "3e43a53f46ab3f49b03f4cb53f52bf3f55c43e58c83e5bcc3e5ed03d61d43d64d83c68dc3c6bdf3b6ee23a71e53974e8"
+        "3977eb387aed377df03680f23583f43486f63389f8328cfa318ffc2f92fd2e95fe2d98ff2c9bff2b9eff2aa1ff2aa4ff"
+        "29a7fe28aafe28adfd28b0fc28b2fb28b5fa28b8f928bbf828bef628c1f529c3f329c6f22ac9f02accee2bceec2cd1ea"
+        "2dd3e82ed6e62fd8e431dbe132dddf34e0dd36e2da38e4d83ae6d53ce8d23fead041eccd44eeca46f0c749f1c44cf3c1"
+        "4ff5be52f6bb55f8b858f9b45bfbb15efcae62fdab65fea869ffa46cffa170ff9e73ff9b77ff987aff957eff9281ff8f"
+        "85ff8c88ff898cff878fff8493ff8196fe7f9afe7c9dfd7aa1fd77a4fc75a7fc73abfb71aefa6fb2f96db5f86bb8f769"
+        "bcf667bff665c2f564c5f462c9f360ccf25fcff15dd2f05cd5ef5ad9ee59dced57dfec56e2eb55e5ea53e8e952ebe851"
+        "eee750f1e64ff4e54ef7e34df9e24cfce14bffe049ffdf48ffde47ffdd46ffdb45ffda43ffd942ffd741ffd640ffd53e"
+        "ffd33dffd23cffd03affcf39ffcd37ffcc36ffca35ffc933ffc732ffc630ffc42fffc32dffc12cffc02affbe29ffbd27"
+        "ffbb26ffba24ffb823ffb621ffb520ffb31effb21dffb01bffaf1affad18ffac17ffaa15ffa914ffa712ffa611ffa40f"
+        "ffa30effa10cffa00bff9e09ff9d08ff9b06ff9a05ff9803ff9702ff9500"
+    ),
+    "Viridis256": (
+        "44015444025645045745055946075a46085c460a5d460b5e470d60470e61471063471164471365481467481668481769"
+        "48186a481a6c481b6d481c6e481d6f481f70482071482173482374482475482576482677482878482979472a7a472c7a"
+        "472d7b472e7c472f7d46307e46327e46337f463480453581453781453882443983443a83443b84433d84433e85423f85"
+        "4240864241864142874144874045884046883f47883f48893e49893e4a893e4c8a3d4d8a3d4e8a3c4f8a3c508b3b518b"
+        "3b528b3a538b3a548c39558c39568c38588c38598c375a8c375b8d365c8d365d8d355e8d355f8d34608d34618d33628d"
+        "33638d32648e32658e31668e31678e31688e30698e306a8e2f6b8e2f6c8e2e6d8e2e6e8e2e6f8e2d708e2d718e2c718e"
+        "2c728e2c738e2b748e2b758e2a768e2a778e2a788e29798e297a8e297b8e287c8e287d8e277e8e277f8e27808e26818e"
+        "26828e26828e25838e25848e25858e24868e24878e23888e23898e238a8d228b8d228c8d228d8d218e8d218f8d21908d"
+        "21918c20928c20928c20938c1f948c1f958b1f968b1f978b1f988b1f998a1f9a8a1e9b8a1e9c891e9d891f9e891f9f88"
+        "1fa0881fa1881fa1871fa28720a38620a48621a58521a68522a78522a88423a98324aa8325ab8225ac8226ad8127ad81"
+        "28ae8029af7f2ab07f2cb17e2db27d2eb37c2fb47c31b57b32b67a34b67935b77937b87838b9773aba763bbb753dbc74"
+        "3fbc7340bd7242be7144bf7046c06f48c16e4ac16d4cc26c4ec36b50c46a52c56954c56856c66758c7655ac8645cc863"
+        "5ec96260ca6063cb5f65cb5e67cc5c69cd5b6ccd5a6ece5870cf5773d05675d05477d1537ad1517cd2507fd34e81d34d"
+        "84d44b86d54989d5488bd6468ed64590d74393d74195d84098d83e9bd93c9dd93ba0da39a2da37a5db36a8db34aadc32"
+        "addc30b0dd2fb2dd2db5de2bb8de29bade28bddf26c0df25c2df23c5e021c8e020cae11fcde11dd0e11cd2e21bd5e21a"
+        "d8e219dae319dde318dfe318e2e418e5e419e7e419eae51aece51befe51cf1e51df4e61ef6e620f8e621fbe723fde725"
+    ),
+    "Plasma256": (
+        "0d088710078813078916078a19068c1b068d1d068e20068f2206902406912605912805922a05932c05942e05952f0596"
+        "31059733059735049837049938049a3a049a3c049b3e049c3f049c41049d43039e44039e46039f48039f4903a04b03a1"
+        "4c02a14e02a25002a25102a35302a35502a45601a45801a45901a55b01a55c01a65e01a66001a66100a76300a76400a7"
+        "6600a76700a86900a86a00a86c00a86e00a86f00a87100a87201a87401a87501a87701a87801a87a02a87b02a87d03a8"
+        "7e03a88004a88104a78305a78405a78606a68707a68808a68a09a58b0aa58d0ba58e0ca48f0da4910ea3920fa39410a2"
+        "9511a19613a19814a099159f9a169f9c179e9d189d9e199da01a9ca11b9ba21d9aa31e9aa51f99a62098a72197a82296"
+        "aa2395ab2494ac2694ad2793ae2892b02991b12a90b22b8fb32c8eb42e8db52f8cb6308bb7318ab83289ba3388bb3488"
+        "bc3587bd3786be3885bf3984c03a83c13b82c23c81c33d80c43e7fc5407ec6417dc7427cc8437bc9447aca457acb4679"
+        "cc4778cc4977cd4a76ce4b75cf4c74d04d73d14e72d24f71d35171d45270d5536fd5546ed6556dd7566cd8576bd9586a"
+        "da5a6ada5b69db5c68dc5d67dd5e66de5f65de6164df6263e06363e16462e26561e26660e3685fe4695ee56a5de56b5d"
+        "e66c5ce76e5be76f5ae87059e97158e97257ea7457eb7556eb7655ec7754ed7953ed7a52ee7b52ef7c51ef7e50f07f4f"
+        "f0804ef1814df1834cf2844bf3854bf3864af48849f48948f58b47f58c46f68d45f68f44f79044f79143f79342f89441"
+        "f89540f9973ff9983ef99a3efa9b3dfa9c3cfa9e3bfb9f3afba139fba238fca338fca537fca636fca835fca934fdab33"
+        "fdac33fdae32fdaf31fdb130fdb22ffdb42ffdb52efeb72dfeb82cfeba2cfebb2bfebd2afebe2afec029fdc229fdc328"
+        "fdc527fdc627fdc827fdca26fdcb26fccd25fcce25fcd025fcd225fbd324fbd524fbd724fad824fada24f9dc24f9dd25"
+        "f8df25f8e125f7e225f7e425f6e626f6e826f5e926f5eb27f4ed27f3ee27f3f027f2f227f1f426f1f525f0f724f0f921"
+    ),
+    "Inferno256": (
+        "00000401000501010601010802010902020b02020d03030f03031204041405041606051806051a07061c08071e090720"
+        "0a08220b09240c09260d0a290e0b2b100b2d110c2f120d31130d34140e36150e38160f3b180f3d19103f1a10421c1044"
+        "1d11471e114920114b21114e22115024125325125527125829115a2a115c2c115f2d11612f1163311165331067341069"
+        "36106b38106c390f6e3b0f703d0f713f0f72400f74420f75440f764510774710784910784a10794c117a4e117b4f127b"
+        "51127c52137c54137d56147d57157e59157e5a167e5c167f5d177f5f187f601880621980641a80651a80671b80681c81"
+        "6a1c816b1d816d1d816e1e81701f81721f817320817521817621817822817922827b23827c23827e2482802582812581"
+        "8326818426818627818827818928818b29818c29818e2a81902a81912b81932b80942c80962c80982d80992d809b2e7f"
+        "9c2e7f9e2f7fa02f7fa1307ea3307ea5317ea6317da8327daa337dab337cad347cae347bb0357bb2357bb3367ab5367a"
+        "b73779b83779ba3878bc3978bd3977bf3a77c03a76c23b75c43c75c53c74c73d73c83e73ca3e72cc3f71cd4071cf4070"
+        "d0416fd2426fd3436ed5446dd6456cd8456cd9466bdb476adc4869de4968df4a68e04c67e24d66e34e65e44f64e55064"
+        "e75263e85362e95462ea5661eb5760ec5860ed5a5fee5b5eef5d5ef05f5ef1605df2625df2645cf3655cf4675cf4695c"
+        "f56b5cf66c5cf66e5cf7705cf7725cf8745cf8765cf9785df9795df97b5dfa7d5efa7f5efa815ffb835ffb8560fb8761"
+        "fc8961fc8a62fc8c63fc8e64fc9065fd9266fd9467fd9668fd9869fd9a6afd9b6bfe9d6cfe9f6dfea16efea36ffea571"
+        "fea772fea973feaa74feac76feae77feb078feb27afeb47bfeb67cfeb77efeb97ffebb81febd82febf84fec185fec287"
+        "fec488fec68afec88cfeca8dfecc8ffecd90fecf92fed194fed395fed597fed799fed89afdda9cfddc9efddea0fde0a1"
+        "fde2a3fde3a5fde5a7fde7a9fde9aafdebacfcecaefceeb0fcf0b2fcf2b4fcf4b6fcf6b8fcf7b9fcf9bbfcfbbdfcfdbf"
+    ),
+    "Cividis256": (
+        "00204d00204e00214f00215000225100225100235200235300235400235500245600245700255800255900265a00265b"
+        "00275c00275d00285e00285f002961002962002a63002a64002b66002b67002c68002c6a002d6b002d6d002e6e002e6f"
+        "002f71002f7200307400307500317700317800327a00327b00337d00337e003480003481003583003584003586003687"
+        "00378800378900388a00388b003a8c003a8d003b8e003c8f003c90003d91003e91003f92003f93004093004194004295"
+        "004395004496004596004696004797004897004998004a98004b98004c99004d99004e99004f9900509a00519a00529a"
+        "00539a00549a00559b00569b00579b00589b00599b005a9b005b9b005d9b005e9b005f9b00609b00619b00629b00639b"
+        "00649b00659b00669b00679b00689b006a9a006b9a006c9a006d9a006e9a006f99007099007199007299007399007498"
+        "007598007698007797007897007997007a96007b96007c96007d95007e95007f94008094008193008293008392008492"
+        "00859100869100879000888f00898f008a8e008b8d008c8d008d8c008e8b008f8a008f8a009089009188009287009386"
+        "009485009585009684009783009882009881009980009a7f009b7e009c7d009d7c009e7b009f7a00a07800a17700a276"
+        "00a37400a47300a57200a67100a76f00a86e00a96d00aa6b00ab6a00ac6900ad6700ae6600af6400b06300b16200b260"
+        "00b35f00b45d00b55c00b65a00b75900b85700b95600ba5400bb5300bc5100bd5000be4e00bf4d00c04b00c14a00c248"
+        "00c34700c44500c54400c64200c74100c83f00c93e00ca3c00cb3b00cc3900cd3800ce3600cf3500d03400d13200d231"
+        "00d33002d42e0bd52d12d62c18d72b1dd82921d92825da2729db262cdc252fdd2432de2335df2238e0213ae2203de31f"
+        "3fe41e42e51d44e61d46e71c49e81b4be91b4dea1a4feb1951ec1953ed1855ee1857ef1759f0175bf1175df2165ff316"
+        "61f41663f51665f61567f71569f8156bf9156dfa156ffb1571fc1573fd1575fe1577ff15"
+    ),
+    "Accent": (
+        "7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f"
+        "7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f"
+        "beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4"
+        "beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4"
+        "fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086"
+        "fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086"
+        "ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99"
+        "ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99"
+        "386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0"
+        "386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0"
+        "f0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027f"
+        "f0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027f"
+        "bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17"
+        "bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17"
+        "666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666"
+        "666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666"
+    ),
+    "Accent_r": (
+        "666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666"
+        "666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666"
+        "bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17"
+        "bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17bf5b17"
+        "f0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027f"
+        "f0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027ff0027f"
+        "386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0"
+        "386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0386cb0"
+        "ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99"
+        "ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99"
+        "fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086"
+        "fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086fdc086"
+        "beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4"
+        "beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4beaed4"
+        "7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f"
+        "7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f7fc97f"
+    ),
+    "Blues": (
+        "f7fbfff6fafff5fafef5f9fef4f9fef3f8fef2f8fdf2f7fdf1f7fdf0f6fdeff6fceef5fceef5fcedf4fcecf4fbebf3fb"
+        "eaf3fbeaf2fbe9f2fae8f1fae7f1fae7f0fae6f0f9e5eff9e4eff9e3eef9e3eef8e2edf8e1edf8e0ecf8dfecf7dfebf7"
+        "deebf7ddeaf7dceaf6dce9f6dbe9f6dae8f6d9e8f5d9e7f5d8e7f5d7e6f5d6e6f4d6e5f4d5e5f4d4e4f4d3e4f3d3e3f3"
+        "d2e3f3d1e2f3d0e2f2d0e1f2cfe1f2cee0f2cde0f1cddff1ccdff1cbdef1cadef0caddf0c9ddf0c8dcf0c7dcefc7dbef"
+        "c6dbefc4daeec3daeec2d9eec1d9edbfd8edbed8ecbdd7ecbcd7ebbad6ebb9d6eab8d5eab7d4eab5d4e9b4d3e9b3d3e8"
+        "b2d2e8b0d2e7afd1e7aed1e7add0e6abd0e6aacfe5a9cfe5a8cee4a6cee4a5cde3a4cce3a3cce3a1cbe2a0cbe29fcae1"
+        "9dcae19cc9e19ac8e099c7e097c6df95c5df94c4df92c4de91c3de8fc2de8dc1dd8cc0dd8abfdd89bedc87bddc85bcdc"
+        "84bcdb82bbdb81badb7fb9da7db8da7cb7da7ab6d979b5d977b5d975b4d874b3d872b2d871b1d76fb0d76dafd76caed6"
+        "6aaed669add568acd566abd465aad464a9d363a8d361a7d260a7d25fa6d15da5d15ca4d05ba3d05aa2cf58a1cf57a0ce"
+        "56a0ce549fcd539ecd529dcc519ccc4f9bcb4e9acb4d99ca4b98ca4a98c94997c94896c84695c84594c74493c74292c6"
+        "4191c64090c53f8fc53e8ec43d8dc43c8cc33b8bc23a8ac23989c13888c13787c03686c03585bf3484bf3383be3282be"
+        "3181bd3080bd2f7fbc2e7ebc2d7dbb2c7cba2b7bba2a7ab92979b92777b82676b82575b72474b72373b62272b62171b5"
+        "2070b4206fb41f6eb31e6db21d6cb11c6bb01c6ab01b69af1a68ae1967ad1966ad1865ac1764ab1663aa1562a91561a9"
+        "1460a8135fa7125ea6125da6115ca5105ba40f5aa30e59a20e58a20d57a10c56a00b559f0a549e0a539e09529d08519c"
+        "08509b084f99084e98084d96084c95084b93084a9108499008488e08478d08468b08458a084488084387084285084184"
+        "084082083e81083d7f083c7d083b7c083a7a08397908387708377608367408357308347108337008326e08316d08306b"
+    ),
+    "Blues_r": (
+        "08306b08316d08326e083370083471083573083674083776083877083979083a7a083b7c083c7d083d7f083e81084082"
+        "08418408428508438708448808458a08468b08478d08488e084990084a91084b93084c95084d96084e98084f9908509b"
+        "08519c09529d0a539e0a549e0b559f0c56a00d57a10e58a20e59a20f5aa3105ba4115ca5125da6125ea6135fa71460a8"
+        "1561a91562a91663aa1764ab1865ac1966ad1967ad1a68ae1b69af1c6ab01c6bb01d6cb11e6db21f6eb3206fb42070b4"
+        "2171b52272b62373b62474b72575b72676b82777b82979b92a7ab92b7bba2c7cba2d7dbb2e7ebc2f7fbc3080bd3181bd"
+        "3282be3383be3484bf3585bf3686c03787c03888c13989c13a8ac23b8bc23c8cc33d8dc43e8ec43f8fc54090c54191c6"
+        "4292c64493c74594c74695c84896c84997c94a98c94b98ca4d99ca4e9acb4f9bcb519ccc529dcc539ecd549fcd56a0ce"
+        "57a0ce58a1cf5aa2cf5ba3d05ca4d05da5d15fa6d160a7d261a7d263a8d364a9d365aad466abd468acd569add56aaed6"
+        "6caed66dafd76fb0d771b1d772b2d874b3d875b4d877b5d979b5d97ab6d97cb7da7db8da7fb9da81badb82bbdb84bcdb"
+        "85bcdc87bddc89bedc8abfdd8cc0dd8dc1dd8fc2de91c3de92c4de94c4df95c5df97c6df99c7e09ac8e09cc9e19dcae1"
+        "9fcae1a0cbe2a1cbe2a3cce3a4cce3a5cde3a6cee4a8cee4a9cfe5aacfe5abd0e6add0e6aed1e7afd1e7b0d2e7b2d2e8"
+        "b3d3e8b4d3e9b5d4e9b7d4eab8d5eab9d6eabad6ebbcd7ebbdd7ecbed8ecbfd8edc1d9edc2d9eec3daeec4daeec6dbef"
+        "c7dbefc7dcefc8dcf0c9ddf0caddf0cadef0cbdef1ccdff1cddff1cde0f1cee0f2cfe1f2d0e1f2d0e2f2d1e2f3d2e3f3"
+        "d3e3f3d3e4f3d4e4f4d5e5f4d6e5f4d6e6f4d7e6f5d8e7f5d9e7f5d9e8f5dae8f6dbe9f6dce9f6dceaf6ddeaf7deebf7"
+        "dfebf7dfecf7e0ecf8e1edf8e2edf8e3eef8e3eef9e4eff9e5eff9e6f0f9e7f0fae7f1fae8f1fae9f2faeaf2fbeaf3fb"
+        "ebf3fbecf4fbedf4fceef5fceef5fceff6fcf0f6fdf1f7fdf2f7fdf2f8fdf3f8fef4f9fef5f9fef5fafef6fafff7fbff"
+    ),
+    "BrBG": (
+        "5430055631055833055b34065d35065f3606613806633906663a07683c076a3d076c3e076e4007714108734208754308"
+        "7745087946087c47097e4909804a09824b09844c09874e0a894f0a8b500a8d520b8f540c91560d93580f955910975b12"
+        "995d139b5f149d61169f6317a16518a3671aa5691ba76a1da96c1eab6e1fad7021af7222b17423b37625b57826b77928"
+        "b97b29bb7d2abd7f2cbf812dc08430c28633c38936c48b3ac58e3dc79040c89343c99546ca9849cc9a4ccd9d50cea053"
+        "cfa256d1a559d2a75cd3aa5fd4ac62d6af65d7b169d8b46cd9b76fdbb972dcbc75ddbe78dec17bdfc37ee0c481e1c684"
+        "e2c787e3c989e4ca8ce5cc8fe6cd92e7cf94e8d097e8d29ae9d39dead59febd6a2ecd8a5edd9a8eedbaaefdcadf0deb0"
+        "f1dfb3f1e1b5f2e2b8f3e4bbf4e5bef5e7c0f6e8c3f6e9c5f6e9c7f6eac9f6eacbf6ebcdf6ebcff6ecd1f6ecd3f6edd5"
+        "f6edd7f6eed9f6eedbf5efdcf5efdef5f0e0f5f0e2f5f1e4f5f1e6f5f2e8f5f2eaf5f3ecf5f3eef5f4f0f5f4f2f5f5f4"
+        "f4f5f5f2f4f4f0f4f3eff3f3edf3f2ebf3f2e9f2f1e7f2f0e6f1f0e4f1efe2f0eee0f0eedef0edddefeddbefecd9eeeb"
+        "d7eeebd5edead4ede9d2ede9d0ece8ceece8ccebe7cbebe6c9eae6c7eae5c4e9e4c1e8e2bfe7e1bce5dfb9e4deb6e3dd"
+        "b4e2dbb1e1daaee0d8abdfd7a8ddd5a6dcd4a3dbd3a0dad19dd9d09ad8ce98d7cd95d6cc92d4ca8fd3c98dd2c78ad1c6"
+        "87d0c584cfc381cec27fccc07ccabe79c8bc76c6ba73c3b870c1b66dbfb46abdb267bbb064b9ae61b7ac5eb5aa5bb3a8"
+        "58b0a755aea552aca34faaa14da89f4aa69d47a49b44a299419f973e9d953b9b9338999135978f33958d31938b2f9189"
+        "2d8f872b8d85298b83278a8225888023867e21847c1f827a1d80781a7e76187c74167a7214787012766e10746c0e726a"
+        "0c71690a6f67086d65066b6304696102675f01655d01645b016259016058015f56015d54015b52015a5001584f01564d"
+        "01554b015349015147005046004e44004c42004b4000493e00483d00463b004439004337004135003f34003e32003c30"
+    ),
+    "BrBG_r": (
+        "003c30003e32003f3400413500433700443900463b00483d00493e004b40004c42004e4400504601514701534901554b"
+        "01564d01584f015a50015b52015d54015f5601605801625901645b01655d02675f046961066b63086d650a6f670c7169"
+        "0e726a10746c12766e147870167a72187c741a7e761d80781f827a21847c23867e258880278a82298b832b8d852d8f87"
+        "2f918931938b33958d35978f3899913b9b933e9d95419f9744a29947a49b4aa69d4da89f4faaa152aca355aea558b0a7"
+        "5bb3a85eb5aa61b7ac64b9ae67bbb06abdb26dbfb470c1b673c3b876c6ba79c8bc7ccabe7fccc081cec284cfc387d0c5"
+        "8ad1c68dd2c78fd3c992d4ca95d6cc98d7cd9ad8ce9dd9d0a0dad1a3dbd3a6dcd4a8ddd5abdfd7aee0d8b1e1dab4e2db"
+        "b6e3ddb9e4debce5dfbfe7e1c1e8e2c4e9e4c7eae5c9eae6cbebe6ccebe7ceece8d0ece8d2ede9d4ede9d5edead7eeeb"
+        "d9eeebdbefecddefeddef0ede0f0eee2f0eee4f1efe6f1f0e7f2f0e9f2f1ebf3f2edf3f2eff3f3f0f4f3f2f4f4f4f5f5"
+        "f5f5f4f5f4f2f5f4f0f5f3eef5f3ecf5f2eaf5f2e8f5f1e6f5f1e4f5f0e2f5f0e0f5efdef5efdcf6eedbf6eed9f6edd7"
+        "f6edd5f6ecd3f6ecd1f6ebcff6ebcdf6eacbf6eac9f6e9c7f6e9c5f6e8c3f5e7c0f4e5bef3e4bbf2e2b8f1e1b5f1dfb3"
+        "f0deb0efdcadeedbaaedd9a8ecd8a5ebd6a2ead59fe9d39de8d29ae8d097e7cf94e6cd92e5cc8fe4ca8ce3c989e2c787"
+        "e1c684e0c481dfc37edec17bddbe78dcbc75dbb972d9b76fd8b46cd7b169d6af65d4ac62d3aa5fd2a75cd1a559cfa256"
+        "cea053cd9d50cc9a4cca9849c99546c89343c79040c58e3dc48b3ac38936c28633c08430bf812dbd7f2cbb7d2ab97b29"
+        "b77928b57826b37625b17423af7222ad7021ab6e1fa96c1ea76a1da5691ba3671aa165189f63179d61169b5f14995d13"
+        "975b1295591093580f91560d8f540c8d520b8b500a894f0a874e0a844c09824b09804a097e49097c4709794608774508"
+        "7543087342087141086e40076c3e076a3d07683c07663a076339066138065f36065d35065b3406583305563105543005"
+    ),
+    "BuGn": (
+        "f7fcfdf6fcfdf6fcfdf5fbfdf5fbfcf4fbfcf4fbfcf3fafcf2fafcf2fafcf1fafcf1fafcf0f9fbf0f9fbeff9fbeff9fb"
+        "eef8fbedf8fbedf8fbecf8fbecf8faebf7faebf7faeaf7fae9f7fae9f7fae8f6fae8f6fae7f6f9e7f6f9e6f5f9e5f5f9"
+        "e5f5f9e4f5f8e3f4f8e3f4f7e2f4f7e1f4f6e0f3f5dff3f5dff3f4def2f4ddf2f3dcf2f2dbf2f2dbf1f1daf1f1d9f1f0"
+        "d8f0efd8f0efd7f0eed6f0eed5efedd4efecd4efecd3eeebd2eeebd1eeead1eee9d0ede9cfede8ceede8cdece7cdece6"
+        "ccece6caebe5c8ebe4c7eae3c5e9e2c4e9e1c2e8e0c0e7dfbfe7debde6debce6ddbae5dcb8e4dbb7e4dab5e3d9b4e2d8"
+        "b2e2d7b0e1d6afe1d5ade0d4acdfd4aadfd3a8ded2a7ddd1a5ddd0a4dccfa2dccea0dbcd9fdacc9ddacb9cd9ca9ad8ca"
+        "98d8c997d7c795d6c694d6c592d5c490d4c38fd4c28dd3c08cd2bf8ad2be88d1bd87d0bc85cfbb84cfb982ceb880cdb7"
+        "7fcdb67dccb57ccbb47acbb378cab177c9b075c9af74c8ae72c7ad70c6ac6fc6aa6dc5a96cc4a86ac4a768c3a667c2a5"
+        "65c2a364c1a263c0a062c09f61bf9e60bf9c5ebe9b5dbd995cbd985bbc965abb9559bb9357ba9256ba9155b98f54b88e"
+        "53b88c52b78b51b6894fb6884eb5864db5854cb4844bb3824ab38148b27f47b17e46b17c45b07b44af7943af7841ae77"
+        "40ad753fac743fab723eaa703da96f3ca86d3ba76c3aa66a39a56938a36737a26636a16435a063349f61339e60329d5e"
+        "319c5c309b5b2f9a592f98582e97562d96552c95532b94522a935029924f28914d27904c268f4a258d48248c47238b45"
+        "228a442189442088431f87421e87411d86401c85401a843f19833e18823d17813d16803c157f3b147e3a137d39127c39"
+        "117b38107a370e79360d78360c77350b77340a763309753208743207733106723005712f03702e026f2e016e2d006d2c"
+        "006c2c006b2b00692a00682a006729006529006428006328006227006027005f26005e26005c25005b25005a24005924"
+        "005723005622005522005321005221005120005020004e1f004d1f004c1e004a1e00491d00481d00471c00451c00441b"
+    ),
+    "BuGn_r": (
+        "00441b00451c00471c00481d00491d004a1e004c1e004d1f004e1f005020005120005221005321005522005622005723"
+        "005924005a24005b25005c25005e26005f2600602700622700632800642800652900672900682a00692a006b2b006c2c"
+        "006d2c016e2d026f2e03702e05712f0672300773310874320975320a76330b77340c77350d78360e7936107a37117b38"
+        "127c39137d39147e3a157f3b16803c17813d18823d19833e1a843f1c85401d86401e87411f8742208843218944228a44"
+        "238b45248c47258d48268f4a27904c28914d29924f2a93502b94522c95532d96552e97562f98582f9a59309b5b319c5c"
+        "329d5e339e60349f6135a06336a16437a26638a36739a5693aa66a3ba76c3ca86d3da96f3eaa703fab723fac7440ad75"
+        "41ae7743af7844af7945b07b46b17c47b17e48b27f4ab3814bb3824cb4844db5854eb5864fb68851b68952b78b53b88c"
+        "54b88e55b98f56ba9157ba9259bb935abb955bbc965cbd985dbd995ebe9b60bf9c61bf9e62c09f63c0a064c1a265c2a3"
+        "67c2a568c3a66ac4a76cc4a86dc5a96fc6aa70c6ac72c7ad74c8ae75c9af77c9b078cab17acbb37ccbb47dccb57fcdb6"
+        "80cdb782ceb884cfb985cfbb87d0bc88d1bd8ad2be8cd2bf8dd3c08fd4c290d4c392d5c494d6c595d6c697d7c798d8c9"
+        "9ad8ca9cd9ca9ddacb9fdacca0dbcda2dccea4dccfa5ddd0a7ddd1a8ded2aadfd3acdfd4ade0d4afe1d5b0e1d6b2e2d7"
+        "b4e2d8b5e3d9b7e4dab8e4dbbae5dcbce6ddbde6debfe7dec0e7dfc2e8e0c4e9e1c5e9e2c7eae3c8ebe4caebe5ccece6"
+        "cdece6cdece7ceede8cfede8d0ede9d1eee9d1eeead2eeebd3eeebd4efecd4efecd5efedd6f0eed7f0eed8f0efd8f0ef"
+        "d9f1f0daf1f1dbf1f1dbf2f2dcf2f2ddf2f3def2f4dff3f4dff3f5e0f3f5e1f4f6e2f4f7e3f4f7e3f4f8e4f5f8e5f5f9"
+        "e5f5f9e6f5f9e7f6f9e7f6f9e8f6fae8f6fae9f7fae9f7faeaf7faebf7faebf7faecf8faecf8fbedf8fbedf8fbeef8fb"
+        "eff9fbeff9fbf0f9fbf0f9fbf1fafcf1fafcf2fafcf2fafcf3fafcf4fbfcf4fbfcf5fbfcf5fbfdf6fcfdf6fcfdf7fcfd"
+    ),
+    "BuPu": (
+        "f7fcfdf6fbfdf6fbfcf5fafcf4fafcf3f9fcf3f9fbf2f8fbf1f8fbf1f7faf0f7faeff6faeef6faeef5f9edf5f9ecf4f9"
+        "ebf4f8ebf3f8eaf3f8e9f2f8e9f2f7e8f1f7e7f1f7e6f0f7e6f0f6e5eff6e4eff6e4eef5e3eef5e2edf5e1edf5e1ecf4"
+        "e0ecf4dfebf4deeaf3ddeaf3dce9f2dbe8f2dae7f1d9e6f1d8e6f0d7e5f0d6e4f0d4e3efd3e2efd2e2eed1e1eed0e0ed"
+        "cfdfedcedfeccddeecccddeccbdcebcadbebc9dbeac8daeac7d9e9c6d8e9c5d8e9c4d7e8c3d6e8c2d5e7c1d4e7c0d4e6"
+        "bfd3e6bed2e6bdd1e5bcd1e5bbd0e4bacfe4b9cee4b7cee3b6cde3b5cce3b4cce2b3cbe2b2cae1b1c9e1b0c9e1afc8e0"
+        "aec7e0adc7e0acc6dfabc5dfaac4dea9c4dea8c3dea7c2dda6c2dda5c1dca4c0dca3bfdca2bfdba1bedba0bddb9fbcda"
+        "9ebcda9dbad99db9d99cb8d89cb7d79bb6d79ab4d69ab3d599b2d599b1d498b0d398aed397add296acd296abd195aad0"
+        "95a8d094a7cf94a6ce93a5ce92a4cd92a3cd91a1cc91a0cb909fcb909eca8f9dc98f9bc98e9ac88d99c88d98c78c97c6"
+        "8c95c68c94c58c93c48c91c48c90c38c8fc28c8dc28c8cc18c8bc08c89c08c88bf8c86be8c85be8c84bd8c82bc8c81bc"
+        "8c80bb8c7eba8c7dba8c7cb98c7ab88c79b88c78b78c76b78c75b68c74b58c72b58c71b48c70b38c6eb38c6db28c6cb1"
+        "8c6ab18c69b08c68af8c66af8b65ae8b64ad8b62ad8b61ac8b60ac8b5eab8b5daa8b5caa8a5aa98a59a88a58a88a56a7"
+        "8a55a78a54a68a52a58a51a58950a4894fa3894da3894ca2894ba28949a18948a08947a088459f88449e88439e88419d"
+        "88409c883e9b873d9a873b99873a98873897873696863595863394863293863092852f91852d90852b8f852a8e85288d"
+        "84278c84258b84248a842289832088831f86831d85831c84831a8382198282178182158082147f81127e81117d810f7c"
+        "800f7b7e0e797c0e787b0d76790d75770c73760c71740b70730b6e710a6d6f0a6b6e096a6c09686a0867690865670864"
+        "65076264076162065f61065d5f055c5d055a5c04595a045758035657035455025354025152015050014e4f004d4d004b"
+    ),
+    "BuPu_r": (
+        "4d004b4f004d50014e5201505402515502535703545803565a04575c04595d055a5f055c61065d62065f640761650762"
+        "6708646908656a08676c09686e096a6f0a6b710a6d730b6e740b70760c71770c73790d757b0d767c0e787e0e79800f7b"
+        "810f7c81117d81127e82147f821580821781821982831a83831c84831d85831f8683208884228984248a84258b84278c"
+        "85288d852a8e852b8f852d90852f91863092863293863394863595873696873897873a98873b99873d9a883e9b88409c"
+        "88419d88439e88449e88459f8947a08948a08949a1894ba2894ca2894da3894fa38950a48a51a58a52a58a54a68a55a7"
+        "8a56a78a58a88a59a88a5aa98b5caa8b5daa8b5eab8b60ac8b61ac8b62ad8b64ad8b65ae8c66af8c68af8c69b08c6ab1"
+        "8c6cb18c6db28c6eb38c70b38c71b48c72b58c74b58c75b68c76b78c78b78c79b88c7ab88c7cb98c7dba8c7eba8c80bb"
+        "8c81bc8c82bc8c84bd8c85be8c86be8c88bf8c89c08c8bc08c8cc18c8dc28c8fc28c90c38c91c48c93c48c94c58c95c6"
+        "8c97c68d98c78d99c88e9ac88f9bc98f9dc9909eca909fcb91a0cb91a1cc92a3cd92a4cd93a5ce94a6ce94a7cf95a8d0"
+        "95aad096abd196acd297add298aed398b0d399b1d499b2d59ab3d59ab4d69bb6d79cb7d79cb8d89db9d99dbad99ebcda"
+        "9fbcdaa0bddba1bedba2bfdba3bfdca4c0dca5c1dca6c2dda7c2dda8c3dea9c4deaac4deabc5dfacc6dfadc7e0aec7e0"
+        "afc8e0b0c9e1b1c9e1b2cae1b3cbe2b4cce2b5cce3b6cde3b7cee3b9cee4bacfe4bbd0e4bcd1e5bdd1e5bed2e6bfd3e6"
+        "c0d4e6c1d4e7c2d5e7c3d6e8c4d7e8c5d8e9c6d8e9c7d9e9c8daeac9dbeacadbebcbdcebccddeccddeeccedfeccfdfed"
+        "d0e0edd1e1eed2e2eed3e2efd4e3efd6e4f0d7e5f0d8e6f0d9e6f1dae7f1dbe8f2dce9f2ddeaf3deeaf3dfebf4e0ecf4"
+        "e1ecf4e1edf5e2edf5e3eef5e4eef5e4eff6e5eff6e6f0f6e6f0f7e7f1f7e8f1f7e9f2f7e9f2f8eaf3f8ebf3f8ebf4f8"
+        "ecf4f9edf5f9eef5f9eef6faeff6faf0f7faf1f7faf1f8fbf2f8fbf3f9fbf3f9fcf4fafcf5fafcf6fbfcf6fbfdf7fcfd"
+    ),
+    "CMRmap": (
+        "00000001010402020804040c05051006061407071808081c0a0a200b0b240c0c280d0d2c0e0e3010103411113812123c"
+        "13134014144416164817174c1818501919541a1a581c1c5c1d1d601e1e641f1f6820206c22227023237424247825257c"
+        "2626802826822926842a26862b26882c268a2e268c2f268e30269031269232269434269635269836269a37269c38269e"
+        "3a26a03b26a23c26a43d26a63e26a84026aa4126ac4226ae4326b04426b24626b44726b64826b84926ba4a26bc4c26be"
+        "4d26bf5027bd5227bb5428b95728b75928b55c29b35e29b1602aaf632aad652aab682ba96a2ba76c2ca56f2ca3712ca1"
+        "732d9f762d9d782e9b7b2e997d2e97802f95822f9384309187308f89308d8b318b8e3189903287933285953283973381"
+        "9a337e9d347ca13479a43476a73573aa3570ad366eb1366bb43668b73765ba3762bd3860c1385dc4385ac73957ca3954"
+        "cd3a52d13a4fd43a4cd73b49da3b46dd3c44e13c41e43c3ee73d3bea3d38ed3e36f13e33f43e30f73f2dfa3f2afd4028"
+        "ff4126fe4324fd4523fc4722fb4921fb4b20fa4d1ef94f1df8511cf7531bf7551af65718f55917f45b16f35d15f35f14"
+        "f26112f16311f06510ef670fef690eee6b0ced6d0bec6f0aeb7109eb7308ea7506e97705e87904e77b03e77d02e67f00"
+        "e68100e68301e68502e68703e68904e68b05e68d05e68f06e69107e69308e69508e69709e6990ae69b0be69d0ce69f0c"
+        "e6a10de6a30ee6a50fe6a710e6a910e6ab11e6ad12e6af13e6b114e6b314e6b515e6b716e6b917e6bb18e6bd18e6bf19"
+        "e6c01ce6c11fe6c322e6c426e6c529e6c62ce6c72fe6c932e6ca36e6cb39e6cc3ce6cd3fe6cf42e6d046e6d149e6d24c"
+        "e6d34fe6d552e6d656e6d759e6d85ce6d95fe6db62e6dc66e6dd69e6de6ce6df6fe6e172e6e276e6e379e6e47ce6e57f"
+        "e6e683e7e787e8e88be9e98fe9e993eaea97ebeb9becec9fededa3ededa7eeeeabefefaff0f0b3f1f1b7f1f1bbf2f2bf"
+        "f3f3c3f4f4c7f5f5cbf5f5cff6f6d3f7f7d7f8f8dbf9f9dff9f9e3fafae7fbfbebfcfceffdfdf3fdfdf7fefefbffffff"
+    ),
+    "CMRmap_r": (
+        "fffffffefefbfdfdf7fdfdf3fcfceffbfbebfafae7f9f9e3f9f9dff8f8dbf7f7d7f6f6d3f5f5cff5f5cbf4f4c7f3f3c3"
+        "f2f2bff1f1bbf1f1b7f0f0b3efefafeeeeabededa7ededa3ecec9febeb9beaea97e9e993e9e98fe8e88be7e787e6e683"
+        "e6e57fe6e47ce6e379e6e276e6e172e6df6fe6de6ce6dd69e6dc66e6db62e6d95fe6d85ce6d759e6d656e6d552e6d34f"
+        "e6d24ce6d149e6d046e6cf42e6cd3fe6cc3ce6cb39e6ca35e6c932e6c72fe6c62ce6c529e6c425e6c322e6c11fe6c01c"
+        "e6bf19e6bd18e6bb18e6b917e6b716e6b515e6b314e6b114e6af13e6ad12e6ab11e6a910e6a710e6a50fe6a30ee6a10d"
+        "e69f0de69d0ce69b0be6990ae69709e69509e69308e69107e68f06e68d05e68b05e68904e68703e68502e68301e68101"
+        "e67f00e77d02e77b03e87904e97705ea7506eb7308eb7109ec6f0aed6d0bee6b0cef690eef670ff06510f16311f26112"
+        "f35f14f35d15f45b16f55917f65718f7551af7531bf8511cf94f1dfa4d1efb4b20fb4921fc4722fd4523fe4324ff4126"
+        "fd4028fa3f2af73f2df43e30f13e33ed3e36ea3d38e73d3be43c3ee13c41dd3c44da3b46d73b49d43a4cd13a4fcd3a52"
+        "ca3954c73957c4385ac1385dbd3860ba3762b73765b43668b1366bad366eaa3570a73573a43476a134799d347c9a337e"
+        "9833819532839332859032878e31898b318b89308d87308f843091822f93802f957d2e977b2e99782e9b762d9d742d9f"
+        "712ca16f2ca36c2ca56a2ba7682ba9652aab632aad602aaf5e29b15b29b35928b55728b75428b95227bb5027bd4d26bf"
+        "4c26be4a26bc4926ba4826b84726b64626b44426b24326b04226ae4126ac4026aa3e26a83d26a63c26a43b26a23a26a0"
+        "38269e37269c36269a3526983426963226943126923026902f268e2e268c2c268a2b26882a2686292684282682262680"
+        "25257c24247823237422227020206c1f1f681e1e641d1d601c1c5c1a1a5819195418185017174c161648141444131340"
+        "12123c1111381010340e0e300d0d2c0c0c280b0b240a0a2008081c07071806061405051004040c020208010104000000"
+    ),
+    "Dark2": (
+        "1b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e77"
+        "1b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e77"
+        "d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02"
+        "d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02"
+        "7570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b3"
+        "7570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b3"
+        "e7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298a"
+        "e7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298a"
+        "66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e"
+        "66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e"
+        "e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02"
+        "e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02"
+        "a6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761d"
+        "a6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761d"
+        "666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666"
+        "666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666"
+    ),
+    "Dark2_r": (
+        "666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666"
+        "666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666666"
+        "a6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761d"
+        "a6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761da6761d"
+        "e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02"
+        "e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02e6ab02"
+        "66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e"
+        "66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e66a61e"
+        "e7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298a"
+        "e7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298ae7298a"
+        "7570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b3"
+        "7570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b37570b3"
+        "d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02"
+        "d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02d95f02"
+        "1b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e77"
+        "1b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e771b9e77"
+    ),
+    "GnBu": (
+        "f7fcf0f6fceff6fbeff5fbeef4fbedf3fbedf3faecf2faebf1faebf1f9eaf0f9e9eff9e9eef9e8eef8e7edf8e7ecf8e6"
+        "ebf7e5ebf7e5eaf7e4e9f7e3e9f6e3e8f6e2e7f6e2e6f6e1e6f5e0e5f5e0e4f5dfe4f4dee3f4dee2f4dde1f4dce1f3dc"
+        "e0f3dbdff3dadff2dadef2d9ddf2d8ddf2d7dcf1d7dcf1d6dbf1d5daf1d5daf0d4d9f0d3d8f0d3d8f0d2d7efd1d7efd1"
+        "d6efd0d5efcfd5eeced4eeced3eecdd3eeccd2edccd1edcbd1edcad0edcad0ecc9cfecc8ceecc8ceecc7cdebc6ccebc6"
+        "ccebc5cbeac4c9eac4c8eac3c7e9c3c6e9c2c5e8c2c4e8c1c3e7c1c2e7c0c0e6c0bfe6bfbee6bfbde5bebce5bebbe4bd"
+        "bae4bdb9e3bcb7e3bcb6e3bbb5e2bbb4e2bab3e1bab2e1b9b1e0b9afe0b8aedfb8addfb7acdfb7abdeb6aadeb6a9ddb5"
+        "a7ddb5a6dcb6a5dcb6a3dbb7a2dbb7a0dab89fdab89ed9b89cd9b99bd8b999d7ba98d7ba97d6bb95d6bb94d5bc92d5bc"
+        "91d4bd8fd4bd8ed3be8dd3be8bd2bf8ad2bf88d1c087d1c086d0c084cfc183cfc181cec280cec27fcdc37dcdc37cccc4"
+        "7accc479cbc577cac576c9c675c8c673c8c772c7c770c6c86fc5c86ec5c86cc4c96bc3c969c2ca68c1ca67c1cb65c0cb"
+        "64bfcc62becc61bdcd5fbdcd5ebcce5dbbce5bbacf5abacf58b9d057b8d056b7d054b6d153b6d151b5d250b4d24fb3d3"
+        "4db2d34cb1d24bb0d14aafd149add048accf47abcf46aace45a8cd43a7cd42a6cc41a5cb40a4cb3fa2ca3ea1c93da0c9"
+        "3c9fc83b9dc73a9cc7389bc6379ac53699c53597c43496c33395c33294c23192c13091c12f90c02d8fbf2c8ebf2b8cbe"
+        "2a8bbe298abd2889bc2788bc2687bb2586bb2484ba2283ba2182b92081b81f80b81e7fb71d7eb71c7cb61b7bb61a7ab5"
+        "1979b51878b41677b31576b31475b21373b21272b11171b11070b00f6faf0e6eaf0d6dae0b6cae0a6aad0969ad0868ac"
+        "0867ab0866a90864a80863a70862a50861a4085fa3085ea1085da0085c9f085a9d08599c08589b085799085598085497"
+        "085395085294085093084f91084e90084d8e084b8d084a8c08498a084889084688084586084485084384084182084081"
+    ),
+    "GnBu_r": (
+        "08408108418208438408448508458608468808488908498a084a8c084b8d084d8e084e90084f91085093085294085395"
+        "08549708559808579908589b08599c085a9d085c9f085da0085ea1085fa30861a40862a50863a70864a80866a90867ab"
+        "0868ac0969ad0a6aad0b6cae0d6dae0e6eaf0f6faf1070b01171b11272b11373b21475b21576b31677b31878b41979b5"
+        "1a7ab51b7bb61c7cb61d7eb71e7fb71f80b82081b82182b92283ba2484ba2586bb2687bb2788bc2889bc298abd2a8bbe"
+        "2b8cbe2c8ebf2d8fbf2f90c03091c13192c13294c23395c33496c33597c43699c5379ac5389bc63a9cc73b9dc73c9fc8"
+        "3da0c93ea1c93fa2ca40a4cb41a5cb42a6cc43a7cd45a8cd46aace47abcf48accf49add04aafd14bb0d14cb1d24db2d3"
+        "4fb3d350b4d251b5d253b6d154b6d156b7d057b8d058b9d05abacf5bbacf5dbbce5ebcce5fbdcd61bdcd62becc64bfcc"
+        "65c0cb67c1cb68c1ca69c2ca6bc3c96cc4c96ec5c86fc5c870c6c872c7c773c8c775c8c676c9c677cac579cbc57accc4"
+        "7cccc47dcdc37fcdc380cec281cec283cfc184cfc186d0c087d1c088d1c08ad2bf8bd2bf8dd3be8ed3be8fd4bd91d4bd"
+        "92d5bc94d5bc95d6bb97d6bb98d7ba99d7ba9bd8b99cd9b99ed9b89fdab8a0dab8a2dbb7a3dbb7a5dcb6a6dcb6a7ddb5"
+        "a9ddb5aadeb6abdeb6acdfb7addfb7aedfb8afe0b8b1e0b9b2e1b9b3e1bab4e2bab5e2bbb6e3bbb7e3bcb9e3bcbae4bd"
+        "bbe4bdbce5bebde5bebee6bfbfe6bfc0e6c0c2e7c0c3e7c1c4e8c1c5e8c2c6e9c2c7e9c3c8eac3c9eac4cbeac4ccebc5"
+        "ccebc6cdebc6ceecc7ceecc8cfecc8d0ecc9d0edcad1edcad1edcbd2edccd3eeccd3eecdd4eeced5eeced5efcfd6efd0"
+        "d7efd1d7efd1d8f0d2d8f0d3d9f0d3daf0d4daf1d5dbf1d5dcf1d6dcf1d7ddf2d7ddf2d8def2d9dff2dadff3dae0f3db"
+        "e1f3dce1f4dce2f4dde3f4dee4f4dee4f5dfe5f5e0e6f5e0e6f6e1e7f6e2e8f6e2e9f6e3e9f7e3eaf7e4ebf7e5ebf7e5"
+        "ecf8e6edf8e7eef8e7eef9e8eff9e9f0f9e9f1f9eaf1faebf2faebf3faecf3fbedf4fbedf5fbeef6fbeff6fceff7fcf0"
+    ),
+    "Grays": (
+        "fffffffffffffefefefefefefdfdfdfdfdfdfcfcfcfcfcfcfbfbfbfbfbfbfafafafafafaf9f9f9f9f9f9f8f8f8f8f8f8"
+        "f7f7f7f7f7f7f7f7f7f6f6f6f6f6f6f5f5f5f5f5f5f4f4f4f4f4f4f3f3f3f3f3f3f2f2f2f2f2f2f1f1f1f1f1f1f0f0f0"
+        "f0f0f0efefefeeeeeeeeeeeeedededececececececebebebeaeaeae9e9e9e9e9e9e8e8e8e7e7e7e7e7e7e6e6e6e5e5e5"
+        "e4e4e4e4e4e4e3e3e3e2e2e2e1e1e1e1e1e1e0e0e0dfdfdfdfdfdfdedededddddddcdcdcdcdcdcdbdbdbdadadadadada"
+        "d9d9d9d8d8d8d7d7d7d6d6d6d5d5d5d4d4d4d4d4d4d3d3d3d2d2d2d1d1d1d0d0d0cfcfcfcecececdcdcdcccccccccccc"
+        "cbcbcbcacacac9c9c9c8c8c8c7c7c7c6c6c6c5c5c5c5c5c5c4c4c4c3c3c3c2c2c2c1c1c1c0c0c0bfbfbfbebebebebebe"
+        "bdbdbdbbbbbbbababab9b9b9b8b8b8b6b6b6b5b5b5b4b4b4b3b3b3b2b2b2b0b0b0afafafaeaeaeadadadabababaaaaaa"
+        "a9a9a9a8a8a8a7a7a7a5a5a5a4a4a4a3a3a3a2a2a2a0a0a09f9f9f9e9e9e9d9d9d9c9c9c9a9a9a999999989898979797"
+        "9595959494949393939292929191919090908f8f8f8e8e8e8d8d8d8c8c8c8a8a8a898989888888878787868686858585"
+        "8484848383838282828181817f7f7f7e7e7e7d7d7d7c7c7c7b7b7b7a7a7a797979787878777777767676757575737373"
+        "7272727171717070706f6f6f6e6e6e6d6d6d6c6c6c6b6b6b6a6a6a696969686868676767666666656565646464636363"
+        "6262626161616060605f5f5f5e5e5e5d5d5d5c5c5c5b5b5b5a5a5a585858575757565656555555545454535353525252"
+        "5151515050504e4e4e4d4d4d4b4b4b4a4a4a4848484747474646464444444343434141414040403f3f3f3d3d3d3c3c3c"
+        "3a3a3a3939393838383636363535353333333232323030302f2f2f2e2e2e2c2c2c2b2b2b292929282828272727252525"
+        "2424242323232222222121211f1f1f1e1e1e1d1d1d1c1c1c1b1b1b1a1a1a181818171717161616151515141414131313"
+        "1111111010100f0f0f0e0e0e0d0d0d0c0c0c0a0a0a090909080808070707060606050505030303020202010101000000"
+    ),
+    "Greens": (
+        "f7fcf5f6fcf4f6fcf4f5fbf3f5fbf2f4fbf2f4fbf1f3faf0f2faf0f2faeff1faeef1faeef0f9edf0f9eceff9eceff9eb"
+        "eef8eaedf8eaedf8e9ecf8e8ecf8e8ebf7e7ebf7e7eaf7e6e9f7e5e9f7e5e8f6e4e8f6e3e7f6e3e7f6e2e6f5e1e5f5e1"
+        "e5f5e0e4f5dfe3f4dee2f4dde1f3dce0f3dbdff3dadef2d9ddf2d8dcf2d7dbf1d6dbf1d5daf0d4d9f0d3d8f0d2d7efd1"
+        "d6efd0d5efcfd4eeced3eecdd2edccd1edcbd0edcacfecc9ceecc8cdecc7ccebc6cbebc5cbeac4caeac3c9eac2c8e9c1"
+        "c7e9c0c6e8bfc4e8bdc3e7bcc2e7bbc1e6bac0e6b9bee5b8bde5b6bce4b5bbe4b4bae3b3b8e3b2b7e2b1b6e2afb5e1ae"
+        "b4e1adb2e0acb1e0abb0dfaaafdfa8aedea7acdea6abdda5aadda4a9dca3a8dca2a7dba0a5db9fa4da9ea3da9da2d99c"
+        "a0d99b9fd8999ed7989cd7979bd69699d59598d59497d49295d39194d39092d28f91d28e90d18d8ed08b8dd08a8bcf89"
+        "8ace8888ce8787cd8686cc8584cc8383cb8281ca8180ca807fc97f7dc87e7cc87c7ac77b79c67a78c67976c57875c477"
+        "73c47672c37570c2746ec1736dc0726bc0726abf7168be7066bd6f65bd6f63bc6e62bb6d60ba6c5eb96b5db96b5bb86a"
+        "5ab76958b66856b56755b56753b46652b36550b2644eb2644db1634bb0624aaf6148ae6046ae6045ad5f43ac5e42ab5d"
+        "40aa5d3fa95c3fa85b3ea75a3da65a3ca5593ba4583aa35739a25738a15637a055369f54359e53349d53339c52329b51"
+        "319a503099502f984f2f974e2e964d2d954d2c944c2b934b2a924a29914a289049278f48268e47258d47248c46238b45"
+        "228a442189442088431f87421e87411d86401c85401a843f19833e18823d17813d16803c157f3b147e3a137d39127c39"
+        "117b38107a370e79360d78360c77350b77340a763309753208743207733106723005712f03702e026f2e016e2d006d2c"
+        "006c2c006b2b00692a00682a006729006529006428006328006227006027005f26005e26005c25005b25005a24005924"
+        "005723005622005522005321005221005120005020004e1f004d1f004c1e004a1e00491d00481d00471c00451c00441b"
+    ),
+    "Greens_r": (
+        "00441b00451c00471c00481d00491d004a1e004c1e004d1f004e1f005020005120005221005321005522005622005723"
+        "005924005a24005b25005c25005e26005f2600602700622700632800642800652900672900682a00692a006b2b006c2c"
+        "006d2c016e2d026f2e03702e05712f0672300773310874320975320a76330b77340c77350d78360e7936107a37117b38"
+        "127c39137d39147e3a157f3b16803c17813d18823d19833e1a843f1c85401d86401e87411f8742208843218944228a44"
+        "238b45248c46258d47268e47278f4828904929914a2a924a2b934b2c944c2d954d2e964d2f974e2f984f309950319a50"
+        "329b51339c52349d53359e53369f5437a05538a15639a2573aa3573ba4583ca5593da65a3ea75a3fa85b3fa95c40aa5d"
+        "42ab5d43ac5e45ad5f46ae6048ae604aaf614bb0624db1634eb26450b26452b36553b46655b56756b56758b6685ab769"
+        "5bb86a5db96b5eb96b60ba6c62bb6d63bc6e65bd6f66bd6f68be706abf716bc0726dc0726ec17370c27472c37573c476"
+        "75c47776c57878c67979c67a7ac77b7cc87c7dc87e7fc97f80ca8081ca8183cb8284cc8386cc8587cd8688ce878ace88"
+        "8bcf898dd08a8ed08b90d18d91d28e92d28f94d39095d39197d49298d59499d5959bd6969cd7979ed7989fd899a0d99b"
+        "a2d99ca3da9da4da9ea5db9fa7dba0a8dca2a9dca3aadda4abdda5acdea6aedea7afdfa8b0dfaab1e0abb2e0acb4e1ad"
+        "b5e1aeb6e2afb7e2b1b8e3b2bae3b3bbe4b4bce4b5bde5b6bee5b8c0e6b9c1e6bac2e7bbc3e7bcc4e8bdc6e8bfc7e9c0"
+        "c8e9c1c9eac2caeac3cbeac4cbebc5ccebc6cdecc7ceecc8cfecc9d0edcad1edcbd2edccd3eecdd4eeced5efcfd6efd0"
+        "d7efd1d8f0d2d9f0d3daf0d4dbf1d5dbf1d6dcf2d7ddf2d8def2d9dff3dae0f3dbe1f3dce2f4dde3f4dee4f5dfe5f5e0"
+        "e5f5e1e6f5e1e7f6e2e7f6e3e8f6e3e8f6e4e9f7e5e9f7e5eaf7e6ebf7e7ebf7e7ecf8e8ecf8e8edf8e9edf8eaeef8ea"
+        "eff9ebeff9ecf0f9ecf0f9edf1faeef1faeef2faeff2faf0f3faf0f4fbf1f4fbf2f5fbf2f5fbf3f6fcf4f6fcf4f7fcf5"
+    ),
+    "Greys": (
+        "fffffffffffffefefefefefefdfdfdfdfdfdfcfcfcfcfcfcfbfbfbfbfbfbfafafafafafaf9f9f9f9f9f9f8f8f8f8f8f8"
+        "f7f7f7f7f7f7f7f7f7f6f6f6f6f6f6f5f5f5f5f5f5f4f4f4f4f4f4f3f3f3f3f3f3f2f2f2f2f2f2f1f1f1f1f1f1f0f0f0"
+        "f0f0f0efefefeeeeeeeeeeeeedededececececececebebebeaeaeae9e9e9e9e9e9e8e8e8e7e7e7e7e7e7e6e6e6e5e5e5"
+        "e4e4e4e4e4e4e3e3e3e2e2e2e1e1e1e1e1e1e0e0e0dfdfdfdfdfdfdedededddddddcdcdcdcdcdcdbdbdbdadadadadada"
+        "d9d9d9d8d8d8d7d7d7d6d6d6d5d5d5d4d4d4d4d4d4d3d3d3d2d2d2d1d1d1d0d0d0cfcfcfcecececdcdcdcccccccccccc"
+        "cbcbcbcacacac9c9c9c8c8c8c7c7c7c6c6c6c5c5c5c5c5c5c4c4c4c3c3c3c2c2c2c1c1c1c0c0c0bfbfbfbebebebebebe"
+        "bdbdbdbbbbbbbababab9b9b9b8b8b8b6b6b6b5b5b5b4b4b4b3b3b3b2b2b2b0b0b0afafafaeaeaeadadadabababaaaaaa"
+        "a9a9a9a8a8a8a7a7a7a5a5a5a4a4a4a3a3a3a2a2a2a0a0a09f9f9f9e9e9e9d9d9d9c9c9c9a9a9a999999989898979797"
+        "9595959494949393939292929191919090908f8f8f8e8e8e8d8d8d8c8c8c8a8a8a898989888888878787868686858585"
+        "8484848383838282828181817f7f7f7e7e7e7d7d7d7c7c7c7b7b7b7a7a7a797979787878777777767676757575737373"
+        "7272727171717070706f6f6f6e6e6e6d6d6d6c6c6c6b6b6b6a6a6a696969686868676767666666656565646464636363"
+        "6262626161616060605f5f5f5e5e5e5d5d5d5c5c5c5b5b5b5a5a5a585858575757565656555555545454535353525252"
+        "5151515050504e4e4e4d4d4d4b4b4b4a4a4a4848484747474646464444444343434141414040403f3f3f3d3d3d3c3c3c"
+        "3a3a3a3939393838383636363535353333333232323030302f2f2f2e2e2e2c2c2c2b2b2b292929282828272727252525"
+        "2424242323232222222121211f1f1f1e1e1e1d1d1d1c1c1c1b1b1b1a1a1a181818171717161616151515141414131313"
+        "1111111010100f0f0f0e0e0e0d0d0d0c0c0c0a0a0a090909080808070707060606050505030303020202010101000000"
+    ),
+    "Greys_r": (
+        "0000000101010202020303030505050606060707070808080909090a0a0a0c0c0c0d0d0d0e0e0e0f0f0f101010111111"
+        "1313131414141515151616161717171818181a1a1a1b1b1b1c1c1c1d1d1d1e1e1e1f1f1f212121222222232323242424"
+        "2525252727272828282929292b2b2b2c2c2c2e2e2e2f2f2f3030303232323333333535353636363838383939393a3a3a"
+        "3c3c3c3d3d3d3f3f3f4040404141414343434444444646464747474848484a4a4a4b4b4b4d4d4d4e4e4e505050515151"
+        "5252525353535454545555555656565757575858585a5a5a5b5b5b5c5c5c5d5d5d5e5e5e5f5f5f606060616161626262"
+        "6363636464646565656666666767676868686969696a6a6a6b6b6b6c6c6c6d6d6d6e6e6e6f6f6f707070717171727272"
+        "7373737575757676767777777878787979797a7a7a7b7b7b7c7c7c7d7d7d7e7e7e7f7f7f818181828282838383848484"
+        "8585858686868787878888888989898a8a8a8c8c8c8d8d8d8e8e8e8f8f8f909090919191929292939393949494959595"
+        "9797979898989999999a9a9a9c9c9c9d9d9d9e9e9e9f9f9fa0a0a0a2a2a2a3a3a3a4a4a4a5a5a5a7a7a7a8a8a8a9a9a9"
+        "aaaaaaabababadadadaeaeaeafafafb0b0b0b2b2b2b3b3b3b4b4b4b5b5b5b6b6b6b8b8b8b9b9b9babababbbbbbbdbdbd"
+        "bebebebebebebfbfbfc0c0c0c1c1c1c2c2c2c3c3c3c4c4c4c5c5c5c5c5c5c6c6c6c7c7c7c8c8c8c9c9c9cacacacbcbcb"
+        "cccccccccccccdcdcdcecececfcfcfd0d0d0d1d1d1d2d2d2d3d3d3d4d4d4d4d4d4d5d5d5d6d6d6d7d7d7d8d8d8d9d9d9"
+        "dadadadadadadbdbdbdcdcdcdcdcdcdddddddedededfdfdfdfdfdfe0e0e0e1e1e1e1e1e1e2e2e2e3e3e3e4e4e4e4e4e4"
+        "e5e5e5e6e6e6e7e7e7e7e7e7e8e8e8e9e9e9e9e9e9eaeaeaebebebececececececedededeeeeeeeeeeeeefefeff0f0f0"
+        "f0f0f0f1f1f1f1f1f1f2f2f2f2f2f2f3f3f3f3f3f3f4f4f4f4f4f4f5f5f5f5f5f5f6f6f6f6f6f6f7f7f7f7f7f7f7f7f7"
+        "f8f8f8f8f8f8f9f9f9f9f9f9fafafafafafafbfbfbfbfbfbfcfcfcfcfcfcfdfdfdfdfdfdfefefefefefeffffffffffff"
+    ),
+    "OrRd": (
+        "fff7ecfff7ebfff6eafff6e9fff5e7fff5e6fff4e5fff4e4fff3e3fff3e2fff2e1fff2e0fff1defff1ddfff0dcfff0db"
+        "feefdafeefd9feefd8feeed7feeed5feedd4feedd3feecd2feecd1feebd0feebcffeeacefeeaccfee9cbfee9cafee8c9"
+        "fee8c8fee7c7fee7c5fee6c4fee5c3fee5c1fee4c0fee4bffee3bdfee2bcfee2bbfee1b9fee0b8fee0b7fedfb5fedfb4"
+        "fddeb3fdddb1fdddb0fddcaffddbadfddbacfddaabfdd9aafdd9a8fdd8a7fdd8a6fdd7a4fdd6a3fdd6a2fdd5a0fdd49f"
+        "fdd49efdd39dfdd29cfdd19bfdd19bfdd09afdcf99fdce98fdce97fdcd96fdcc96fdcb95fdca94fdca93fdc992fdc892"
+        "fdc791fdc690fdc68ffdc58efdc48dfdc38dfdc38cfdc28bfdc18afdc089fdbf89fdbf88fdbe87fdbd86fdbc85fdbb85"
+        "fdba83fdb982fdb881fdb67ffdb57efdb37dfdb27bfdb07afdaf79fdad77fdac76fdab75fda973fda872fda671fda56f"
+        "fca36efca26dfca06bfc9f6afc9e69fc9c67fc9b66fc9964fc9863fc9662fc9560fc935ffc925efc915cfc8f5bfc8e5a"
+        "fc8c59fb8b58fb8a58fb8957fa8757fa8656f98556f98455f98254f88154f88053f77f53f77d52f67c52f67b51f67a51"
+        "f57850f57750f4764ff4754ff4734ef3724ef3714df2704cf26e4cf26d4bf16c4bf16a4af0694af06849f06749ef6548"
+        "ef6447ee6246ed6145ec5f43ec5d42eb5c41ea5a3fe9583ee9573de8553ce7533ae65239e55038e54e36e44d35e34b34"
+        "e24933e24831e14630e0442fdf432ddf412cde3f2bdd3e2adc3c28dc3a27db3926da3724d93523d93422d83221d7301f"
+        "d62f1ed52d1dd42c1cd32a1bd2291ad12719cf2618ce2417cd2316cc2116cb2015ca1e14c91d13c71b12c61a11c51810"
+        "c4170fc3150ec2140dc1120cc0110bbe0f0abd0e09bc0c08bb0b07ba0906b90805b80604b70503b50302b40201b30000"
+        "b20000b00000ae0000ad0000ab0000a90000a80000a60000a50000a30000a10000a000009e00009c00009b0000990000"
+        "9700009600009400009300009100008f00008e00008c00008a00008900008700008600008400008200008100007f0000"
+    ),
+    "OrRd_r": (
+        "7f00008100008200008400008600008700008900008a00008c00008e00008f0000910000930000940000960000970000"
+        "9900009b00009c00009e0000a00000a10000a30000a50000a60000a80000a90000ab0000ad0000ae0000b00000b20000"
+        "b30000b40201b50302b70503b80604b90805ba0906bb0b07bc0c08bd0e09be0f0ac0110bc1120cc2140dc3150ec4170f"
+        "c51810c61a11c71b12c91d13ca1e14cb2015cc2116cd2316ce2417cf2618d12719d2291ad32a1bd42c1cd52d1dd62f1e"
+        "d7301fd83221d93422d93523da3724db3926dc3a27dc3c28dd3e2ade3f2bdf412cdf432de0442fe14630e24831e24933"
+        "e34b34e44d35e54e36e55038e65239e7533ae8553ce9573de9583eea5a3feb5c41ec5d42ec5f43ed6145ee6246ef6447"
+        "ef6548f06749f06849f0694af16a4af16c4bf26d4bf26e4cf2704cf3714df3724ef4734ef4754ff4764ff57750f57850"
+        "f67a51f67b51f67c52f77d52f77f53f88053f88154f98254f98455f98556fa8656fa8757fb8957fb8a58fb8b58fc8c59"
+        "fc8e5afc8f5bfc915cfc925efc935ffc9560fc9662fc9863fc9964fc9b66fc9c67fc9e69fc9f6afca06bfca26dfca36e"
+        "fda56ffda671fda872fda973fdab75fdac76fdad77fdaf79fdb07afdb27bfdb37dfdb57efdb67ffdb881fdb982fdba83"
+        "fdbb85fdbc85fdbd86fdbe87fdbf88fdbf89fdc089fdc18afdc28bfdc38cfdc38dfdc48dfdc58efdc68ffdc690fdc791"
+        "fdc892fdc992fdca93fdca94fdcb95fdcc96fdcd96fdce97fdce98fdcf99fdd09afdd19bfdd19bfdd29cfdd39dfdd49e"
+        "fdd49ffdd5a0fdd6a2fdd6a3fdd7a4fdd8a6fdd8a7fdd9a8fdd9aafddaabfddbacfddbadfddcaffdddb0fdddb1fddeb3"
+        "fedfb4fedfb5fee0b7fee0b8fee1b9fee2bbfee2bcfee3bdfee4bffee4c0fee5c1fee5c3fee6c4fee7c5fee7c7fee8c8"
+        "fee8c9fee9cafee9cbfeeaccfeeacefeebcffeebd0feecd1feecd2feedd3feedd4feeed5feeed7feefd8feefd9feefda"
+        "fff0dbfff0dcfff1ddfff1defff2e0fff2e1fff3e2fff3e3fff4e4fff4e5fff5e6fff5e7fff6e9fff6eafff7ebfff7ec"
+    ),
+    "Oranges": (
+        "fff5ebfff5eafff4e9fff4e8fff3e7fff3e6fff2e6fff2e5fff1e4fff1e3fff0e2fff0e1ffefe0ffefdfffeedeffeedd"
+        "feeddcfeeddcfeeddbfeecdafeecd9feebd8feebd7feead6feead5fee9d4fee9d3fee8d2fee8d2fee7d1fee7d0fee6cf"
+        "fee6cefee5ccfee5cbfee4cafee3c8fee2c7fee2c6fee1c4fee0c3fee0c1fedfc0fedebffedebdfeddbcfedcbbfedcb9"
+        "fddbb8fddab6fdd9b5fdd9b4fdd8b2fdd7b1fdd7affdd6aefdd5adfdd5abfdd4aafdd3a9fdd3a7fdd2a6fdd1a4fdd1a3"
+        "fdd0a2fdcfa0fdce9efdcd9cfdcb9bfdca99fdc997fdc895fdc794fdc692fdc590fdc48ffdc38dfdc28bfdc189fdc088"
+        "fdbf86fdbe84fdbd83fdbb81fdba7ffdb97dfdb87cfdb77afdb678fdb576fdb475fdb373fdb271fdb170fdb06efdaf6c"
+        "fdae6afdad69fdac67fdab66fda965fda863fda762fda660fda55ffda45dfda35cfda25afda159fda057fd9f56fd9e54"
+        "fd9d53fd9c51fd9b50fd9a4efd994dfd984bfd974afd9649fd9547fd9446fd9344fd9243fd9141fd9040fd8f3efd8e3d"
+        "fd8c3bfc8b3afc8a39fc8937fb8836fb8735fb8634fa8532fa8331f98230f9812ef9802df87f2cf87e2bf87d29f77b28"
+        "f77a27f67925f67824f67723f57622f57520f5741ff4721ef4711cf3701bf36f1af36e19f26d17f26c16f26b15f16913"
+        "f16813f06712ef6612ee6511ee6410ed6310ec620feb610feb600eea5f0ee95e0de85d0ce75c0ce75b0be65a0be5590a"
+        "e4580ae45709e35608e25508e15407e15307e05206df5106de5005de4e05dd4d04dc4c03db4b03db4a02da4902d94801"
+        "d84801d64701d54601d34601d14501d04501ce4401cd4401cb4302c94202c84202c64102c54102c34002c14002c03f02"
+        "be3f02bd3e02bb3d02b93d02b83c02b63c02b53b02b33b02b13a03b03903ae3903ad3803ab3803a93703a83703a63603"
+        "a53603a43503a23503a13403a034039f33039e33039c32039b32039a3103993103973003963003952f03942f03932f03"
+        "912e04902e048f2d048e2d048c2c048b2c048a2b04892b04882a04862a048529048429048328048128048027047f2704"
+    ),
+    "Oranges_r": (
+        "7f2704802704812804832804842904852904862a04882a04892b048a2b048b2c048c2c048e2d048f2d04902e04912e04"
+        "932f03942f03952f039630039730039931039a31039b32039c32039e33039f3303a03403a13403a23503a43503a53603"
+        "a63603a83703a93703ab3803ad3803ae3903b03903b13a03b33b02b53b02b63c02b83c02b93d02bb3d02bd3e02be3f02"
+        "c03f02c14002c34002c54102c64102c84202c94202cb4302cd4401ce4401d04501d14501d34601d54601d64701d84801"
+        "d94801da4902db4a02db4b03dc4c03dd4d04de4e05de5005df5106e05206e15307e15407e25508e35608e45709e4580a"
+        "e5590ae65a0be75b0be75c0ce85d0ce95e0dea5f0eeb600eeb610fec620fed6310ee6410ee6511ef6612f06712f16813"
+        "f16913f26b15f26c16f26d17f36e19f36f1af3701bf4711cf4721ef5741ff57520f57622f67723f67824f67925f77a27"
+        "f77b28f87d29f87e2bf87f2cf9802df9812ef98230fa8331fa8532fb8634fb8735fb8836fc8937fc8a39fc8b3afd8c3b"
+        "fd8e3dfd8f3efd9040fd9141fd9243fd9344fd9446fd9547fd9649fd974afd984bfd994dfd9a4efd9b50fd9c51fd9d53"
+        "fd9e54fd9f56fda057fda159fda25afda35cfda45dfda55ffda660fda762fda863fda965fdab66fdac67fdad69fdae6a"
+        "fdaf6cfdb06efdb170fdb271fdb373fdb475fdb576fdb678fdb77afdb87cfdb97dfdba7ffdbb81fdbd83fdbe84fdbf86"
+        "fdc088fdc189fdc28bfdc38dfdc48ffdc590fdc692fdc794fdc895fdc997fdca99fdcb9bfdcd9cfdce9efdcfa0fdd0a2"
+        "fdd1a3fdd1a4fdd2a6fdd3a7fdd3a9fdd4aafdd5abfdd5adfdd6aefdd7affdd7b1fdd8b2fdd9b4fdd9b5fddab6fddbb8"
+        "fedcb9fedcbbfeddbcfedebdfedebffedfc0fee0c1fee0c3fee1c4fee2c6fee2c7fee3c8fee4cafee5cbfee5ccfee6ce"
+        "fee6cffee7d0fee7d1fee8d2fee8d2fee9d3fee9d4feead5feead6feebd7feebd8feecd9feecdafeeddbfeeddcfeeddc"
+        "ffeeddffeedeffefdfffefe0fff0e1fff0e2fff1e3fff1e4fff2e5fff2e6fff3e6fff3e7fff4e8fff4e9fff5eafff5eb"
+    ),
+    "PRGn": (
+        "40004b42024d44034f4605524807544b08564d0a584f0c5a510d5d530f5f5510615712635914655c15685e176a60196c"
+        "621a6e641c70661e73681f756a21776c23796f247b71267e732880752982772b84782e857931877b34887c368a7e398c"
+        "7f3c8d803f8f824190834492844793864a95874c97894f988a529a8b559b8d579d8e5a9e8f5da09160a29262a39465a5"
+        "9568a6966ba8986da99970ab9b72ac9c74ae9e76af9f78b1a17ab2a37cb3a47fb5a681b6a783b8a985b9ab87bbac89bc"
+        "ae8bbdb08dbfb18fc0b391c2b493c3b695c4b897c6b99ac7bb9cc9bc9ecabea0cbc0a2cdc1a4cec3a6cfc4a8d0c6aad1"
+        "c7abd2c9add3caafd4cbb1d5cdb3d6ceb5d7d0b7d8d1b8d9d3badad4bcdbd6bedcd7c0ddd8c2dedac3dfdbc5e0ddc7e1"
+        "dec9e2e0cbe3e1cde4e3cee5e4d0e6e6d2e7e7d4e8e8d5e9e8d7e9e9d8eaead9eaeadbebebdcecebdeececdfedede0ed"
+        "ede2eeeee3eeefe4efefe6f0f0e7f0f0e9f1f1eaf1f2ebf2f2edf3f3eef3f4eff4f4f1f4f5f2f5f5f4f6f6f5f6f7f6f7"
+        "f6f7f6f5f7f5f4f6f3f3f6f2f2f6f1f1f5efeff5eeeef5ecedf5ebecf4eaebf4e8e9f4e7e8f4e5e7f3e4e6f3e3e5f3e1"
+        "e4f2e0e2f2dee1f2dde0f2dbdff1dadef1d9ddf1d7dbf1d6daf0d4d9f0d3d7efd1d5eecfd3eecdd1edcbcfecc9cdebc7"
+        "cbeac5c9e9c3c7e9c1c5e8bfc3e7bdc1e6bbbfe5b9bde4b7bbe4b5b9e3b3b7e2b1b5e1afb3e0adb1e0abafdfa9addea7"
+        "abdda5a9dca3a7dba1a5da9fa2d89c9fd79a9cd59799d39596d19293d09090ce8d8dcc8b8aca8987c88684c78481c581"
+        "7ec37f7bc17c78c07a75be7772bc756fba726cb97069b76d66b56b63b36860b2665db0635aae6158ac5f55aa5e53a85c"
+        "50a65a4ea3594ba157499f55469d54449b524199513f974f3c954d3a924c37904a358e48328c47308a452e88432b8642"
+        "29844026823e247f3d217d3b1f7b391c79381a7736197535187334177133166f32156d31146b3013692f12672e11652d"
+        "10632b0f612a0e5f290d5c280c5a270b58260a5625085424075223065022054e20044c1f034a1e02481d01461c00441b"
+    ),
+    "PRGn_r": (
+        "00441b01461c02481d034a1e044c1f054e200650220752230854240a56250b58260c5a270d5c280e5f290f612a10632b"
+        "11652d12672e13692f146b30156d31166f321771331873341975351a77361c79381f7b39217d3b247f3d26823e298440"
+        "2b86422e8843308a45328c47358e4837904a3a924c3c954d3f974f419951449b52469d54499f554ba1574ea35950a65a"
+        "53a85c55aa5e58ac5f5aae615db06360b26663b36866b56b69b76d6cb9706fba7272bc7575be7778c07a7bc17c7ec37f"
+        "81c58184c78487c8868aca898dcc8b90ce8d93d09096d19299d3959cd5979fd79aa2d89ca5da9fa7dba1a9dca3abdda5"
+        "addea7afdfa9b1e0abb3e0adb5e1afb7e2b1b9e3b3bbe4b5bde4b7bfe5b9c1e6bbc3e7bdc5e8bfc7e9c1c9e9c3cbeac5"
+        "cdebc7cfecc9d1edcbd3eecdd5eecfd7efd1d9f0d3daf0d4dbf1d6ddf1d7def1d9dff1dae0f2dbe1f2dde2f2dee4f2e0"
+        "e5f3e1e6f3e3e7f3e4e8f4e5e9f4e7ebf4e8ecf4eaedf5ebeef5eceff5eef1f5eff2f6f1f3f6f2f4f6f3f5f7f5f6f7f6"
+        "f7f6f7f6f5f6f5f4f6f5f2f5f4f1f4f4eff4f3eef3f2edf3f2ebf2f1eaf1f0e9f1f0e7f0efe6f0efe4efeee3eeede2ee"
+        "ede0edecdfedebdeecebdceceadbebead9eae9d8eae8d7e9e8d5e9e7d4e8e6d2e7e4d0e6e3cee5e1cde4e0cbe3dec9e2"
+        "ddc7e1dbc5e0dac3dfd8c2ded7c0ddd6bedcd4bcdbd3badad1b8d9d0b7d8ceb5d7cdb3d6cbb1d5caafd4c9add3c7abd2"
+        "c6aad1c4a8d0c3a6cfc1a4cec0a2cdbea0cbbc9ecabb9cc9b99ac7b897c6b695c4b493c3b391c2b18fc0b08dbfae8bbd"
+        "ac89bcab87bba985b9a783b8a681b6a47fb5a37cb3a17ab29f78b19e76af9c74ae9b72ac9970ab986da9966ba89568a6"
+        "9465a59262a39160a28f5da08e5a9e8d579d8b559b8a529a894f98874c97864a95844793834492824190803f8f7f3c8d"
+        "7e398c7c368a7b3488793187782e85772b8475298273288071267e6f247b6c23796a2177681f75661e73641c70621a6e"
+        "60196c5e176a5c1568591465571263551061530f5f510d5d4f0c5a4d0a584b085648075446055244034f42024d40004b"
+    ),
+    "Paired": (
+        "a6cee3a6cee3a6cee3a6cee3a6cee3a6cee3a6cee3a6cee3a6cee3a6cee3a6cee3a6cee3a6cee3a6cee3a6cee3a6cee3"
+        "a6cee3a6cee3a6cee3a6cee3a6cee3a6cee31f78b41f78b41f78b41f78b41f78b41f78b41f78b41f78b41f78b41f78b4"
+        "1f78b41f78b41f78b41f78b41f78b41f78b41f78b41f78b41f78b41f78b41f78b4b2df8ab2df8ab2df8ab2df8ab2df8a"
+        "b2df8ab2df8ab2df8ab2df8ab2df8ab2df8ab2df8ab2df8ab2df8ab2df8ab2df8ab2df8ab2df8ab2df8ab2df8ab2df8a"
+        "33a02c33a02c33a02c33a02c33a02c33a02c33a02c33a02c33a02c33a02c33a02c33a02c33a02c33a02c33a02c33a02c"
+        "33a02c33a02c33a02c33a02c33a02cfb9a99fb9a99fb9a99fb9a99fb9a99fb9a99fb9a99fb9a99fb9a99fb9a99fb9a99"
+        "fb9a99fb9a99fb9a99fb9a99fb9a99fb9a99fb9a99fb9a99fb9a99fb9a99fb9a99e31a1ce31a1ce31a1ce31a1ce31a1c"
+        "e31a1ce31a1ce31a1ce31a1ce31a1ce31a1ce31a1ce31a1ce31a1ce31a1ce31a1ce31a1ce31a1ce31a1ce31a1ce31a1c"
+        "fdbf6ffdbf6ffdbf6ffdbf6ffdbf6ffdbf6ffdbf6ffdbf6ffdbf6ffdbf6ffdbf6ffdbf6ffdbf6ffdbf6ffdbf6ffdbf6f"
+        "fdbf6ffdbf6ffdbf6ffdbf6ffdbf6fff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00"
+        "ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00cab2d6cab2d6cab2d6cab2d6cab2d6cab2d6"
+        "cab2d6cab2d6cab2d6cab2d6cab2d6cab2d6cab2d6cab2d6cab2d6cab2d6cab2d6cab2d6cab2d6cab2d6cab2d6cab2d6"
+        "6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a"
+        "6a3d9a6a3d9a6a3d9a6a3d9a6a3d9affff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99"
+        "ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99b15928b15928b15928b15928b15928b15928"
+        "b15928b15928b15928b15928b15928b15928b15928b15928b15928b15928b15928b15928b15928b15928b15928b15928"
+    ),
+    "Paired_r": (
+        "b15928b15928b15928b15928b15928b15928b15928b15928b15928b15928b15928b15928b15928b15928b15928b15928"
+        "b15928b15928b15928b15928b15928b15928ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99"
+        "ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff99ffff996a3d9a6a3d9a6a3d9a6a3d9a6a3d9a"
+        "6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a6a3d9a"
+        "cab2d6cab2d6cab2d6cab2d6cab2d6cab2d6cab2d6cab2d6cab2d6cab2d6cab2d6cab2d6cab2d6cab2d6cab2d6cab2d6"
+        "cab2d6cab2d6cab2d6cab2d6cab2d6ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00"
+        "ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00fdbf6ffdbf6ffdbf6ffdbf6ffdbf6f"
+        "fdbf6ffdbf6ffdbf6ffdbf6ffdbf6ffdbf6ffdbf6ffdbf6ffdbf6ffdbf6ffdbf6ffdbf6ffdbf6ffdbf6ffdbf6ffdbf6f"
+        "e31a1ce31a1ce31a1ce31a1ce31a1ce31a1ce31a1ce31a1ce31a1ce31a1ce31a1ce31a1ce31a1ce31a1ce31a1ce31a1c"
+        "e31a1ce31a1ce31a1ce31a1ce31a1cfb9a99fb9a99fb9a99fb9a99fb9a99fb9a99fb9a99fb9a99fb9a99fb9a99fb9a99"
+        "fb9a99fb9a99fb9a99fb9a99fb9a99fb9a99fb9a99fb9a99fb9a99fb9a9933a02c33a02c33a02c33a02c33a02c33a02c"
+        "33a02c33a02c33a02c33a02c33a02c33a02c33a02c33a02c33a02c33a02c33a02c33a02c33a02c33a02c33a02c33a02c"
+        "b2df8ab2df8ab2df8ab2df8ab2df8ab2df8ab2df8ab2df8ab2df8ab2df8ab2df8ab2df8ab2df8ab2df8ab2df8ab2df8a"
+        "b2df8ab2df8ab2df8ab2df8ab2df8a1f78b41f78b41f78b41f78b41f78b41f78b41f78b41f78b41f78b41f78b41f78b4"
+        "1f78b41f78b41f78b41f78b41f78b41f78b41f78b41f78b41f78b41f78b4a6cee3a6cee3a6cee3a6cee3a6cee3a6cee3"
+        "a6cee3a6cee3a6cee3a6cee3a6cee3a6cee3a6cee3a6cee3a6cee3a6cee3a6cee3a6cee3a6cee3a6cee3a6cee3a6cee3"
+    ),
+    "Pastel1": (
+        "fbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4ae"
+        "fbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aeb3cde3b3cde3b3cde3"
+        "b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3"
+        "b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5"
+        "ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5"
+        "ccebc5ccebc5ccebc5ccebc5ccebc5decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4"
+        "decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4"
+        "decbe4decbe4fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6"
+        "fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6ffffccffffcc"
+        "ffffccffffccffffccffffccffffccffffccffffccffffccffffccffffccffffccffffccffffccffffccffffccffffcc"
+        "ffffccffffccffffccffffccffffccffffccffffccffffccffffccffffcce5d8bde5d8bde5d8bde5d8bde5d8bde5d8bd"
+        "e5d8bde5d8bde5d8bde5d8bde5d8bde5d8bde5d8bde5d8bde5d8bde5d8bde5d8bde5d8bde5d8bde5d8bde5d8bde5d8bd"
+        "e5d8bde5d8bde5d8bde5d8bde5d8bde5d8bde5d8bdfddaecfddaecfddaecfddaecfddaecfddaecfddaecfddaecfddaec"
+        "fddaecfddaecfddaecfddaecfddaecfddaecfddaecfddaecfddaecfddaecfddaecfddaecfddaecfddaecfddaecfddaec"
+        "fddaecfddaecfddaecf2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2"
+        "f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2"
+    ),
+    "Pastel1_r": (
+        "f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2"
+        "f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2f2fddaecfddaecfddaec"
+        "fddaecfddaecfddaecfddaecfddaecfddaecfddaecfddaecfddaecfddaecfddaecfddaecfddaecfddaecfddaecfddaec"
+        "fddaecfddaecfddaecfddaecfddaecfddaecfddaecfddaecfddaece5d8bde5d8bde5d8bde5d8bde5d8bde5d8bde5d8bd"
+        "e5d8bde5d8bde5d8bde5d8bde5d8bde5d8bde5d8bde5d8bde5d8bde5d8bde5d8bde5d8bde5d8bde5d8bde5d8bde5d8bd"
+        "e5d8bde5d8bde5d8bde5d8bde5d8bdffffccffffccffffccffffccffffccffffccffffccffffccffffccffffccffffcc"
+        "ffffccffffccffffccffffccffffccffffccffffccffffccffffccffffccffffccffffccffffccffffccffffccffffcc"
+        "ffffccffffccfed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6"
+        "fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6fed9a6decbe4decbe4"
+        "decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4"
+        "decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4decbe4ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5"
+        "ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5"
+        "ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3"
+        "b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3b3cde3"
+        "b3cde3b3cde3b3cde3fbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4ae"
+        "fbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4aefbb4ae"
+    ),
+    "Pastel2": (
+        "b3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cd"
+        "b3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cd"
+        "fdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdac"
+        "fdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdac"
+        "cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8"
+        "cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8"
+        "f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4"
+        "f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4"
+        "e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9"
+        "e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9"
+        "fff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2ae"
+        "fff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2ae"
+        "f1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2cc"
+        "f1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2cc"
+        "cccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccc"
+        "cccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccc"
+    ),
+    "Pastel2_r": (
+        "cccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccc"
+        "cccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccc"
+        "f1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2cc"
+        "f1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2ccf1e2cc"
+        "fff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2ae"
+        "fff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2aefff2ae"
+        "e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9"
+        "e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9e6f5c9"
+        "f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4"
+        "f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4f4cae4"
+        "cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8"
+        "cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8cbd5e8"
+        "fdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdac"
+        "fdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdacfdcdac"
+        "b3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cd"
+        "b3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cdb3e2cd"
+    ),
+    "PiYG": (
+        "8e015290025492035594045797055999065a9b075c9d085e9f095fa10a61a40b63a60c65a80d66aa0e68ac0f6aae106b"
+        "b1116db3126fb51370b71472b91574bb1675bd1777c01879c2197ac41a7cc51d7ec62080c72482c82884c92b86ca2f88"
+        "cb3289cc368bcd3a8dce3d8fcf4191d04493d14895d24c97d34f99d4539bd5579dd65a9fd75ea1d861a2d965a4da69a6"
+        "db6ca8dc70aadd73acde77aedf79b0df7cb1e07eb3e181b5e283b7e286b8e388bae48bbce58dbee590bfe692c1e795c3"
+        "e897c4e89ac6e99cc8ea9fcaeba1cbeba3cdeca6cfeda8d1eeabd2eeadd4efb0d6f0b2d7f1b5d9f1b7daf2b8dbf2badc"
+        "f3bcddf3bddef4bfdff4c1dff5c2e0f5c4e1f5c6e2f6c7e3f6c9e3f7cbe4f7cce5f8cee6f8d0e7f9d1e8f9d3e8fad4e9"
+        "fad6eafbd8ebfbd9ecfcdbedfcddedfddeeefde0effde1effde2f0fce3f0fce4f0fce5f1fce5f1fbe6f1fbe7f2fbe8f2"
+        "fbe9f2faeaf2faebf3faecf3faedf3f9eef4f9eef4f9eff4f9f0f5f9f1f5f8f2f5f8f3f6f8f4f6f8f5f6f7f6f7f7f7f7"
+        "f7f7f6f6f7f5f5f7f3f5f7f2f4f7f0f3f7eff3f6edf2f6ecf1f6eaf1f6e8f0f6e7eff6e5eff6e4eef6e2edf6e1edf6df"
+        "ecf6deebf6dcebf6dbeaf5d9e9f5d8e9f5d6e8f5d5e7f5d3e7f5d2e6f5d0e4f4cde2f3cae1f3c7dff2c4ddf1c1dbf0bf"
+        "d9f0bcd8efb9d6eeb6d4edb3d2ecb0d0ecadcfebaacdeaa7cbe9a4c9e8a2c7e89fc6e79cc4e699c2e596c0e593bee490"
+        "bde38dbbe28ab9e187b7e085b5df82b2dd7fb0dc7daeda7aacd977a9d874a7d672a5d56fa3d36ca1d26a9ed0679ccf64"
+        "9acd6198cc5f95cb5c93c95991c8578fc6548cc5518ac34f88c24c86c04983bf4681bd447fbc417dba407bb93e79b73d"
+        "77b53c75b43b73b23971b0386faf376dad366bac3469aa3367a83266a73164a52f62a32e60a22d5ea02c5c9e2a5a9d29"
+        "589b285699275498255296245094234e93224c91214b8f21498d20488c20468a2045881f43861f42841f40831e3f811e"
+        "3d7f1e3c7d1d3a7b1d397a1d37781c36761c34741c33721c31711b306f1b2e6d1b2d6b1a2b691a2a681a286619276419"
+    ),
+    "PiYG_r": (
+        "2764192866192a681a2b691a2d6b1a2e6d1b306f1b31711b33721c34741c36761c37781c397a1d3a7b1d3c7d1d3d7f1e"
+        "3f811e40831e42841f43861f45881f468a20488c20498d204b8f214c91214e9322509423529624549825569927589b28"
+        "5a9d295c9e2a5ea02c60a22d62a32e64a52f66a73167a83269aa336bac346dad366faf3771b03873b23975b43b77b53c"
+        "79b73d7bb93e7dba407fbc4181bd4483bf4686c04988c24c8ac34f8cc5518fc65491c85793c95995cb5c98cc5f9acd61"
+        "9ccf649ed067a1d26aa3d36ca5d56fa7d672a9d874acd977aeda7ab0dc7db2dd7fb5df82b7e085b9e187bbe28abde38d"
+        "bee490c0e593c2e596c4e699c6e79cc7e89fc9e8a2cbe9a4cdeaa7cfebaad0ecadd2ecb0d4edb3d6eeb6d8efb9d9f0bc"
+        "dbf0bfddf1c1dff2c4e1f3c7e2f3cae4f4cde6f5d0e7f5d2e7f5d3e8f5d5e9f5d6e9f5d8eaf5d9ebf6dbebf6dcecf6de"
+        "edf6dfedf6e1eef6e2eff6e4eff6e5f0f6e7f1f6e8f1f6eaf2f6ecf3f6edf3f7eff4f7f0f5f7f2f5f7f3f6f7f5f7f7f6"
+        "f7f7f7f7f6f7f8f5f6f8f4f6f8f3f6f8f2f5f9f1f5f9f0f5f9eff4f9eef4f9eef4faedf3faecf3faebf3faeaf2fbe9f2"
+        "fbe8f2fbe7f2fbe6f1fce5f1fce5f1fce4f0fce3f0fde2f0fde1effde0effddeeefcddedfcdbedfbd9ecfbd8ebfad6ea"
+        "fad4e9f9d3e8f9d1e8f8d0e7f8cee6f7cce5f7cbe4f6c9e3f6c7e3f5c6e2f5c4e1f5c2e0f4c1dff4bfdff3bddef3bcdd"
+        "f2badcf2b8dbf1b7daf1b5d9f0b2d7efb0d6eeadd4eeabd2eda8d1eca6cfeba3cdeba1cbea9fcae99cc8e89ac6e897c4"
+        "e795c3e692c1e590bfe58dbee48bbce388bae286b8e283b7e181b5e07eb3df7cb1df79b0de77aedd73acdc70aadb6ca8"
+        "da69a6d965a4d861a2d75ea1d65a9fd5579dd4539bd34f99d24c97d14895d04493cf4191ce3d8fcd3a8dcc368bcb3289"
+        "ca2f88c92b86c82884c72482c62080c51d7ec41a7cc2197ac01879bd1777bb1675b91574b71472b51370b3126fb1116d"
+        "ae106bac0f6aaa0e68a80d66a60c65a40b63a10a619f095f9d085e9b075c99065a9705599404579203559002548e0152"
+    ),
+    "PuBu": (
+        "fff7fbfef6fbfef6fafdf5fafdf5fafcf4fafbf4f9fbf3f9faf3f9faf2f8f9f2f8f8f1f8f8f1f8f7f0f7f7f0f7f6eff7"
+        "f5eff6f5eef6f4eef6f4edf6f3edf5f2ecf5f2ecf5f1ebf5f1ebf4f0eaf4f0eaf4efe9f3eee9f3eee8f3ede8f3ede7f2"
+        "ece7f2ebe6f2eae6f1e9e5f1e8e4f0e7e3f0e7e3f0e6e2efe5e1efe4e1efe3e0eee2dfeee1dfede0deede0ddeddfddec"
+        "dedcecdddbecdcdaebdbdaebdad9ead9d8ead9d8ead8d7e9d7d6e9d6d6e9d5d5e8d4d4e8d3d4e7d2d3e7d2d2e7d1d2e6"
+        "d0d1e6ced0e6cdd0e5cccfe5cacee5c9cee4c8cde4c6cce3c5cce3c4cbe3c2cbe2c1cae2c0c9e2bfc9e1bdc8e1bcc7e1"
+        "bbc7e0b9c6e0b8c6e0b7c5dfb5c4dfb4c4dfb3c3deb1c2deb0c2deafc1ddadc1ddacc0ddabbfdca9bfdca8bedca7bddb"
+        "a5bddba4bcdaa2bcdaa1bbda9fbad99ebad99cb9d99ab8d899b8d897b7d796b6d794b6d793b5d691b5d68fb4d68eb3d5"
+        "8cb3d58bb2d489b1d488b1d486b0d384b0d383afd381aed280aed27eadd17dacd17bacd179abd078abd076aad075a9cf"
+        "73a9cf71a8ce6fa7ce6da6cd6ba5cd69a5cc67a4cc65a3cb63a2cb62a2cb60a1ca5ea0ca5c9fc95a9ec9589ec8569dc8"
+        "549cc7529bc7509ac64e9ac64c99c54a98c54897c44697c44496c34295c34094c33f93c23d93c23b92c13991c13790c0"
+        "358fc0348ebf328dbf308cbe2f8bbe2d8abd2c89bd2a88bc2987bc2786bb2685bb2484ba2383ba2182b92081b91e80b8"
+        "1c7fb81b7eb7197db7187cb6167bb6157ab51379b51278b41077b40f76b30d75b30c74b20a73b20872b10771b10570b0"
+        "056faf056fae056ead056dac056dab056caa056ba9056ba7056aa60569a50569a40568a30567a20567a10566a005659f"
+        "04649e04649d04639b04629a046299046198046097046096045f95045e94045e93045d92045c90045b8f045b8e045a8d"
+        "04598c04588a04578804568704558504548304538204528003517e034f7d034e7b034d79034c78034b76034a74034973"
+        "03487103476f03466e03456c03446a034369034267034165023f64023e62023d60023c5f023b5d023a5b02395a023858"
+    ),
+    "PuBuGn": (
+        "fff7fbfef6fbfef6fafdf5fafdf4fafcf4f9fbf3f9fbf2f9faf2f8faf1f8f9f0f8f8f0f7f8eff7f7eef7f7eef6f6edf6"
+        "f5ecf5f5ecf5f4ebf5f4eaf4f3eaf4f2e9f4f2e9f3f1e8f3f1e7f3f0e7f2f0e6f2efe5f2eee5f1eee4f1ede3f1ede3f0"
+        "ece2f0ebe1f0eae1efe9e0efe8e0efe7dfeee7dfeee6deeee5deede4ddede3ddede2dcede1dcece0dbece0daecdfdaeb"
+        "ded9ebddd9ebdcd8eadbd8eadad7ead9d7e9d9d6e9d8d6e9d7d5e8d6d5e8d5d4e8d4d4e7d3d3e7d2d2e7d2d2e7d1d1e6"
+        "d0d1e6ced0e6cdd0e5cccfe5cacee5c9cee4c8cde4c6cce3c5cce3c4cbe3c2cbe2c1cae2c0c9e2bfc9e1bdc8e1bcc7e1"
+        "bbc7e0b9c6e0b8c6e0b7c5dfb5c4dfb4c4dfb3c3deb1c2deb0c2deafc1ddadc1ddacc0ddabbfdca9bfdca8bedca7bddb"
+        "a5bddba3bcdaa1bcda9fbbda9dbad99bbad999b9d997b8d895b8d893b7d791b6d790b6d78eb5d68cb5d68ab4d688b3d5"
+        "86b3d584b2d482b1d480b1d47eb0d37cb0d37aafd378aed276aed274add172acd170acd16eabd06cabd06aaad068a9cf"
+        "66a9cf65a8ce63a7ce62a6cd60a5cd5fa5cc5da4cc5ba3cb5aa2cb58a2cb57a1ca55a0ca549fc9529ec9519ec84f9dc8"
+        "4e9cc74c9bc74b9ac6499ac64799c54698c54497c44397c44196c34095c33e94c33d93c23b93c23a92c13891c13790c0"
+        "3590bf338fbd328fbc308eba2e8eb82d8db62b8db52a8cb3288cb1268bb0258bae238bac218aab208aa91e89a71d89a6"
+        "1b88a41988a21887a016879f14869d13869b11859a0f85980e84960c84950b839309839107839006828e04828c02818a"
+        "028189028087027f86027f84027e83027d81027d80027c7e027b7d027b7b027a79027978027976027875027773027772"
+        "01767001756f01756d01746c01736a017369017267017165017164017062016f61016f5f016e5e016d5c016d5b016c59"
+        "016b58016a5701695601675501665401655301645101635001614f01604e015f4d015e4c015d4b015b4a015a49015948"
+        "01584601574501554401544301534201524101514001503f014e3e014d3d014c3b014b3a014a39014838014737014636"
+    ),
+    "PuBuGn_r": (
+        "014636014737014838014a39014b3a014c3b014d3d014e3e01503f015140015241015342015443015544015745015846"
+        "015948015a49015b4a015d4b015e4c015f4d01604e01614f016350016451016553016654016755016956016a57016b58"
+        "016c59016d5b016d5c016e5e016f5f016f6101706201716401716501726701736901736a01746c01756d01756f017670"
+        "027772027773027875027976027978027a79027b7b027b7d027c7e027d80027d81027e83027f84027f86028087028189"
+        "02818a04828c06828e0783900983910b83930c84950e84960f859811859a13869b14869d16879f1887a01988a21b88a4"
+        "1d89a61e89a7208aa9218aab238bac258bae268bb0288cb12a8cb32b8db52d8db62e8eb8308eba328fbc338fbd3590bf"
+        "3790c03891c13a92c13b93c23d93c23e94c34095c34196c34397c44497c44698c54799c5499ac64b9ac64c9bc74e9cc7"
+        "4f9dc8519ec8529ec9549fc955a0ca57a1ca58a2cb5aa2cb5ba3cb5da4cc5fa5cc60a5cd62a6cd63a7ce65a8ce66a9cf"
+        "68a9cf6aaad06cabd06eabd070acd172acd174add176aed278aed27aafd37cb0d37eb0d380b1d482b1d484b2d486b3d5"
+        "88b3d58ab4d68cb5d68eb5d690b6d791b6d793b7d795b8d897b8d899b9d99bbad99dbad99fbbdaa1bcdaa3bcdaa5bddb"
+        "a7bddba8bedca9bfdcabbfdcacc0ddadc1ddafc1ddb0c2deb1c2deb3c3deb4c4dfb5c4dfb7c5dfb8c6e0b9c6e0bbc7e0"
+        "bcc7e1bdc8e1bfc9e1c0c9e2c1cae2c2cbe2c4cbe3c5cce3c6cce3c8cde4c9cee4cacee5cccfe5cdd0e5ced0e6d0d1e6"
+        "d1d1e6d2d2e7d2d2e7d3d3e7d4d4e7d5d4e8d6d5e8d7d5e8d8d6e9d9d6e9d9d7e9dad7eadbd8eadcd8eaddd9ebded9eb"
+        "dfdaebe0daece0dbece1dcece2dcede3ddede4ddede5deede6deeee7dfeee7dfeee8e0efe9e0efeae1efebe1f0ece2f0"
+        "ede3f0ede3f1eee4f1eee5f1efe5f2f0e6f2f0e7f2f1e7f3f1e8f3f2e9f3f2e9f4f3eaf4f4eaf4f4ebf5f5ecf5f5ecf5"
+        "f6edf6f7eef6f7eef7f8eff7f8f0f7f9f0f8faf1f8faf2f8fbf2f9fbf3f9fcf4f9fdf4fafdf5fafef6fafef6fbfff7fb"
+    ),
+    "PuBu_r": (
+        "02385802395a023a5b023b5d023c5f023d60023e62023f6403416503426703436903446a03456c03466e03476f034871"
+        "034973034a74034b76034c78034d79034e7b034f7d03517e04528004538204548304558504568704578804588a04598c"
+        "045a8d045b8e045b8f045c90045d92045e93045e94045f9504609604609704619804629904629a04639b04649d04649e"
+        "05659f0566a00567a10567a20568a30569a40569a5056aa6056ba7056ba9056caa056dab056dac056ead056fae056faf"
+        "0570b00771b10872b10a73b20c74b20d75b30f76b31077b41278b41379b5157ab5167bb6187cb6197db71b7eb71c7fb8"
+        "1e80b82081b92182b92383ba2484ba2685bb2786bb2987bc2a88bc2c89bd2d8abd2f8bbe308cbe328dbf348ebf358fc0"
+        "3790c03991c13b92c13d93c23f93c24094c34295c34496c34697c44897c44a98c54c99c54e9ac6509ac6529bc7549cc7"
+        "569dc8589ec85a9ec95c9fc95ea0ca60a1ca62a2cb63a2cb65a3cb67a4cc69a5cc6ba5cd6da6cd6fa7ce71a8ce73a9cf"
+        "75a9cf76aad078abd079abd07bacd17dacd17eadd180aed281aed283afd384b0d386b0d388b1d489b1d48bb2d48cb3d5"
+        "8eb3d58fb4d691b5d693b5d694b6d796b6d797b7d799b8d89ab8d89cb9d99ebad99fbad9a1bbdaa2bcdaa4bcdaa5bddb"
+        "a7bddba8bedca9bfdcabbfdcacc0ddadc1ddafc1ddb0c2deb1c2deb3c3deb4c4dfb5c4dfb7c5dfb8c6e0b9c6e0bbc7e0"
+        "bcc7e1bdc8e1bfc9e1c0c9e2c1cae2c2cbe2c4cbe3c5cce3c6cce3c8cde4c9cee4cacee5cccfe5cdd0e5ced0e6d0d1e6"
+        "d1d2e6d2d2e7d2d3e7d3d4e7d4d4e8d5d5e8d6d6e9d7d6e9d8d7e9d9d8ead9d8eadad9eadbdaebdcdaebdddbecdedcec"
+        "dfddece0ddede0deede1dfede2dfeee3e0eee4e1efe5e1efe6e2efe7e3f0e7e3f0e8e4f0e9e5f1eae6f1ebe6f2ece7f2"
+        "ede7f2ede8f3eee8f3eee9f3efe9f3f0eaf4f0eaf4f1ebf4f1ebf5f2ecf5f2ecf5f3edf5f4edf6f4eef6f5eef6f5eff6"
+        "f6eff7f7f0f7f7f0f7f8f1f8f8f1f8f9f2f8faf2f8faf3f9fbf3f9fbf4f9fcf4fafdf5fafdf5fafef6fafef6fbfff7fb"
+    ),
+    "PuOr": (
+        "7f3b08813c08833d08853e088740088941088b42088d43078f44079145079346079548079749079a4a079c4b079e4c07"
+        "a04d07a24e07a44f07a65107a85206aa5306ac5406ae5506b05606b25706b45906b65a07b75c07b95e08bb5f08bd6109"
+        "be630ac0640ac2660bc4680bc6690cc76b0cc96d0dcb6e0dcd700ece720fd0730fd27510d47610d57811d77a11d97b12"
+        "db7d12dc7f13de8013e08214e18417e2861ae3881de58a20e68d23e78f27e8912ae9932dea9530eb9733ed9936ee9b39"
+        "ef9e3cf0a03ff1a242f2a446f3a649f4a84cf6aa4ff7ac52f8ae55f9b158fab35bfbb55efcb761fdb965fdba68fdbc6b"
+        "fdbd6efdbf72fdc175fdc278fdc47bfdc57ffdc782fdc885fdca88fdcc8cfecd8ffecf92fed095fed299fed39cfed59f"
+        "fed7a2fed8a6fedaa9fedbacfeddaffedeb3fee0b6fee1b9fde2bbfde3befde4c0fde5c3fce5c5fce6c8fce7cafce8cd"
+        "fbe9cffbead2fbebd5faecd7faeddafaeedcfaeedff9efe1f9f0e4f9f1e6f9f2e9f8f3ecf8f4eef8f5f1f7f6f3f7f7f6"
+        "f6f6f7f5f5f6f4f4f6f3f3f5f2f2f5f0f1f4eff0f4eeeef3ededf3ebecf3eaebf2e9eaf2e8e9f1e7e8f1e5e7f0e4e5f0"
+        "e3e4efe2e3efe1e2eedfe1eedee0eddddfeddcddecdadcecd9dbebd8daebd7d8ead5d6e9d4d4e8d2d3e7d1d1e6cfcfe5"
+        "cecde4cccbe3cbc9e2c9c8e1c8c6e0c6c4dfc5c2dec3c0ddc2bedcc0bddbbfbbdabdb9d9bcb7d8bab5d7b9b3d6b7b1d5"
+        "b6b0d4b4aed3b3acd2b1aad1afa8d0ada6ceaba3cda9a1cba79fcaa59dc8a39bc7a198c59f96c49d94c29b92c19990bf"
+        "988dbe968bbc9489bb9287b99085b88e82b68c80b58a7eb3887cb2867ab08477af8275ad8073ac7e70ab7d6da97b6aa8"
+        "7967a67764a57661a4745ea2725ba170589f6f559e6d529c6b4f9b6a4c9a684998664697644395634094613d935f3a91"
+        "5d37905c348e5a318d582e8c572b8a5528895326875225845023824f22804d207d4c1f7b4a1d78491c76471a74451871"
+        "44176f42156c41146a3f12683e11653c0f633b0e61390c5e380b5c3609593508573306553205523003502f024d2d004b"
+    ),
+    "PuOr_r": (
+        "2d004b2f024d300350320552330655350857360959380b5c390c5e3b0e613c0f633e11653f126841146a42156c44176f"
+        "451871471a74491c764a1d784c1f7b4d207d4f2280502382522584532687552889572b8a582e8c5a318d5c348e5d3790"
+        "5f3a91613d936340946443956646976849986a4c9a6b4f9b6d529c6f559e70589f725ba1745ea27661a47764a57967a6"
+        "7b6aa87d6da97e70ab8073ac8275ad8477af867ab0887cb28a7eb38c80b58e82b69085b89287b99489bb968bbc988dbe"
+        "9990bf9b92c19d94c29f96c4a198c5a39bc7a59dc8a79fcaa9a1cbaba3cdada6ceafa8d0b1aad1b3acd2b4aed3b6b0d4"
+        "b7b1d5b9b3d6bab5d7bcb7d8bdb9d9bfbbdac0bddbc2bedcc3c0ddc5c2dec6c4dfc8c6e0c9c8e1cbc9e2cccbe3cecde4"
+        "cfcfe5d1d1e6d2d3e7d4d4e8d5d6e9d7d8ead8daebd9dbebdadcecdcddecdddfeddee0eddfe1eee1e2eee2e3efe3e4ef"
+        "e4e5f0e5e7f0e7e8f1e8e9f1e9eaf2eaebf2ebecf3ededf3eeeef3eff0f4f0f1f4f2f2f5f3f3f5f4f4f6f5f5f6f6f6f7"
+        "f7f7f6f7f6f3f8f5f1f8f4eef8f3ecf9f2e9f9f1e6f9f0e4f9efe1faeedffaeedcfaeddafaecd7fbebd5fbead2fbe9cf"
+        "fce8cdfce7cafce6c8fce5c5fde5c3fde4c0fde3befde2bbfee1b9fee0b6fedeb3feddaffedbacfedaa9fed8a6fed7a2"
+        "fed59ffed39cfed299fed095fecf92fecd8ffdcc8cfdca88fdc885fdc782fdc57ffdc47bfdc278fdc175fdbf72fdbd6e"
+        "fdbc6bfdba68fdb965fcb761fbb55efab35bf9b158f8ae55f7ac52f6aa4ff4a84cf3a649f2a446f1a242f0a03fef9e3c"
+        "ee9b39ed9936eb9733ea9530e9932de8912ae78f27e68d23e58a20e3881de2861ae18417e08214de8013dc7f13db7d12"
+        "d97b12d77a11d57811d47610d27510d0730fce720fcd700ecb6e0dc96d0dc76b0cc6690cc4680bc2660bc0640abe630a"
+        "bd6109bb5f08b95e08b75c07b65a07b45906b25706b05606ae5506ac5406aa5306a85206a65107a44f07a24e07a04d07"
+        "9e4c079c4b079a4a079749079548079346079145078f44078d43078b4208894108874008853e08833d08813c087f3b08"
+    ),
+    "PuRd": (
+        "f7f4f9f6f3f9f6f3f8f5f2f8f5f2f8f4f1f7f4f0f7f3f0f7f3eff6f2eff6f2eef6f1edf6f1edf5f0ecf5f0ecf5efebf4"
+        "efeaf4eeeaf4eee9f3ede9f3ede8f3ece7f2ece7f2ebe6f2ebe6f1eae5f1eae5f1e9e4f1e9e3f0e8e3f0e8e2f0e7e2ef"
+        "e7e1efe6e0eee6deeee5ddede5dcece4dbece3d9ebe3d8eae2d7eae2d6e9e1d4e8e0d3e8e0d2e7dfd1e6dfcfe6decee5"
+        "ddcde4ddcce4dccae3dcc9e2dbc8e2dac6e1dac5e0d9c4e0d9c3dfd8c1ded7c0ded7bfddd6bedcd6bcdcd5bbdbd4bada"
+        "d4b9dad4b8d9d3b6d9d3b5d8d3b4d7d2b3d7d2b2d6d1b1d6d1afd5d1aed4d0add4d0acd3d0abd3cfaad2cfa8d2cfa7d1"
+        "cea6d0cea5d0cea4cfcda3cfcda1cecda0cdcc9fcdcc9ecccc9dcccb9ccbcb9bcacb99caca98c9ca97c9ca96c8c995c7"
+        "c993c7ca92c6cb90c5cb8fc5cc8ec4cd8cc3cd8bc2ce89c2cf88c1cf86c0d085c0d183bfd282bed280bdd37fbdd47dbc"
+        "d47cbbd57abad679bad677b9d776b8d874b8d873b7d972b6da70b5db6fb5db6db4dc6cb3dd6ab3dd69b2de67b1df66b0"
+        "df64afdf62aee060ade05eace05dabe05ba9e159a8e157a7e155a6e153a5e251a3e24fa2e24da1e24ca0e34a9fe3489e"
+        "e3469ce3449be4429ae44099e43e98e43d96e53b95e53994e53793e53592e63390e6318fe62f8ee62d8de72c8ce72a8a"
+        "e72989e62887e52786e42684e32682e32581e2247fe1237ee0237cdf227adf2179de2177dd2075dc1f74dc1e72db1e71"
+        "da1d6fd91c6dd81c6cd81b6ad71a68d61967d51965d41863d41762d31760d2165fd1155dd1145bd0145acf1358ce1256"
+        "cd1256cb1155c91054c81054c60f53c40f53c30e52c10e51bf0d51bd0c50bc0c50ba0b4fb80b4eb70a4eb50a4db3094d"
+        "b2094cb0084bae074bad074aab064aa90649a70548a60548a40447a20347a103469f02459d02459c01449a0144980043"
+        "97004295004194004092003f91003d8f003c8d003b8c003a8a0039890038870037860036840034830033810032800031"
+        "7e00307d002f7b002e79002d78002b76002a7500297300287200277000266f00256d00246c00226a002169002067001f"
+    ),
+    "PuRd_r": (
+        "67001f6900206a00216c00226d00246f002570002672002773002875002976002a78002b79002d7b002e7d002f7e0030"
+        "8000318100328300338400348600368700378900388a00398c003a8d003b8f003c91003d92003f940040950041970042"
+        "9800439a01449c01449d02459f0245a10346a20347a40447a60548a70548a90649ab064aad074aae074bb0084bb2094c"
+        "b3094db50a4db70a4eb80b4eba0b4fbc0c50bd0c50bf0d51c10e51c30e52c40f53c60f53c81054c91054cb1155cd1256"
+        "ce1256cf1358d0145ad1145bd1155dd2165fd31760d41762d41863d51965d61967d71a68d81b6ad81c6cd91c6dda1d6f"
+        "db1e71dc1e72dc1f74dd2075de2177df2179df227ae0237ce1237ee2247fe32581e32682e42684e52786e62887e72989"
+        "e72a8ae72c8ce62d8de62f8ee6318fe63390e53592e53793e53994e53b95e43d96e43e98e44099e4429ae3449be3469c"
+        "e3489ee34a9fe24ca0e24da1e24fa2e251a3e153a5e155a6e157a7e159a8e05ba9e05dabe05eace060addf62aedf64af"
+        "df66b0de67b1dd69b2dd6ab3dc6cb3db6db4db6fb5da70b5d972b6d873b7d874b8d776b8d677b9d679bad57abad47cbb"
+        "d47dbcd37fbdd280bdd282bed183bfd085c0cf86c0cf88c1ce89c2cd8bc2cd8cc3cc8ec4cb8fc5cb90c5ca92c6c993c7"
+        "c995c7ca96c8ca97c9ca98c9cb99cacb9bcacb9ccbcc9dcccc9ecccc9fcdcda0cdcda1cecda3cfcea4cfcea5d0cea6d0"
+        "cfa7d1cfa8d2cfaad2d0abd3d0acd3d0add4d1aed4d1afd5d1b1d6d2b2d6d2b3d7d3b4d7d3b5d8d3b6d9d4b8d9d4b9da"
+        "d4badad5bbdbd6bcdcd6bedcd7bfddd7c0ded8c1ded9c3dfd9c4e0dac5e0dac6e1dbc8e2dcc9e2dccae3ddcce4ddcde4"
+        "decee5dfcfe6dfd1e6e0d2e7e0d3e8e1d4e8e2d6e9e2d7eae3d8eae3d9ebe4dbece5dcece5ddede6deeee6e0eee7e1ef"
+        "e7e2efe8e2f0e8e3f0e9e3f0e9e4f1eae5f1eae5f1ebe6f1ebe6f2ece7f2ece7f2ede8f3ede9f3eee9f3eeeaf4efeaf4"
+        "efebf4f0ecf5f0ecf5f1edf5f1edf6f2eef6f2eff6f3eff6f3f0f7f4f0f7f4f1f7f5f2f8f5f2f8f6f3f8f6f3f9f7f4f9"
+    ),
+    "Purples": (
+        "fcfbfdfcfbfdfbfafcfbfafcfaf9fcfaf9fcfaf8fbf9f8fbf9f7fbf8f7fbf8f7faf8f6faf7f6faf7f5faf6f5f9f6f4f9"
+        "f5f4f9f5f4f9f5f3f8f4f3f8f4f2f8f3f2f8f3f1f7f3f1f7f2f0f7f2f0f7f1f0f6f1eff6f1eff6f0eef6f0eef5efedf5"
+        "efedf5eeecf5eeecf4edebf4ecebf4eceaf3ebe9f3eae9f3eae8f2e9e8f2e8e7f2e8e6f2e7e6f1e6e5f1e6e5f1e5e4f0"
+        "e4e3f0e4e3f0e3e2efe2e2efe2e1efe1e0eee0e0eee0dfeedfdfeddedeeddeddedddddecdcdcecdcdcecdbdbecdadaeb"
+        "dadaebd9d9ead8d8ead7d7e9d6d6e9d5d5e9d4d4e8d3d3e8d2d2e7d1d2e7d0d1e6cfd0e6cecfe5cecee5cdcde4cccce4"
+        "cbcbe3cacae3c9c9e2c8c8e2c7c8e1c6c7e1c5c6e1c4c5e0c3c4e0c2c3dfc1c2dfc0c1debfc0debebfddbebeddbdbedc"
+        "bcbddcbbbbdbbabadbb9b9dab8b8d9b7b7d9b6b6d8b5b5d7b4b4d7b3b3d6b2b2d5b1b1d5b0afd4afaed4aeadd3aeacd2"
+        "adabd2acaad1aba9d0aaa8d0a9a7cfa8a6cfa7a4cea6a3cda5a2cda4a1cca3a0cba29fcba19ecaa09dca9f9cc99e9bc8"
+        "9e9ac89d99c79c98c79b97c69a96c69995c69894c59793c59692c49591c49490c39390c3928fc3918ec2908dc28f8cc1"
+        "8e8bc18e8ac08d89c08c88bf8b87bf8a86bf8986be8885be8784bd8683bd8582bc8481bc8380bb827fbb817ebb807dba"
+        "807cba7f7bb97e79b87d78b77d77b77c75b67b74b57b72b47a71b47970b3796eb2786db2776cb1776ab07669af7567af"
+        "7566ae7465ad7363ad7262ac7261ab715faa705eaa705ca96f5ba86e5aa86e58a76d57a66c55a56c54a56b53a46a51a3"
+        "6950a3694fa2684da1674ca1674ba066499f65489f65479e64459e63449d63439c62429c61409b613f9a603e9a5f3c99"
+        "5e3b985e3a985d38975c37975c36965b34955a33955a3294593093582f93582e92572c92562b91552a9055289054278f"
+        "53268f53258e52238d51228d51218c50208c4f1f8b4f1d8b4e1c8a4d1b894d1a894c18884c17884b16874a15874a1486"
+        "491285481185481084470f84460d83460c83450b82440a8244098143078042068042057f41047f40027e40017e3f007d"
+    ),
+    "Purples_r": (
+        "3f007d40017e40027e41047f42057f420680430780440981440a82450b82460c83460d83470f84481084481185491285"
+        "4a14864a15874b16874c17884c18884d1a894d1b894e1c8a4f1d8b4f1f8b50208c51218c51228d52238d53258e53268f"
+        "54278f552890552a90562b91572c92582e92582f935930935a32945a33955b34955c36965c37975d38975e3a985e3b98"
+        "5f3c99603e9a613f9a61409b62429c63439c63449d64459e65479e65489f66499f674ba0674ca1684da1694fa26950a3"
+        "6a51a36b53a46c54a56c55a56d57a66e58a76e5aa86f5ba8705ca9705eaa715faa7261ab7262ac7363ad7465ad7566ae"
+        "7567af7669af776ab0776cb1786db2796eb27970b37a71b47b72b47b74b57c75b67d77b77d78b77e79b87f7bb9807cba"
+        "807dba817ebb827fbb8380bb8481bc8582bc8683bd8784bd8885be8986be8a86bf8b87bf8c88bf8d89c08e8ac08e8bc1"
+        "8f8cc1908dc2918ec2928fc39390c39490c39591c49692c49793c59894c59995c69a96c69b97c69c98c79d99c79e9ac8"
+        "9e9bc89f9cc9a09dcaa19ecaa29fcba3a0cba4a1cca5a2cda6a3cda7a4cea8a6cfa9a7cfaaa8d0aba9d0acaad1adabd2"
+        "aeacd2aeadd3afaed4b0afd4b1b1d5b2b2d5b3b3d6b4b4d7b5b5d7b6b6d8b7b7d9b8b8d9b9b9dababadbbbbbdbbcbddc"
+        "bdbedcbebeddbebfddbfc0dec0c1dec1c2dfc2c3dfc3c4e0c4c5e0c5c6e1c6c7e1c7c8e1c8c8e2c9c9e2cacae3cbcbe3"
+        "cccce4cdcde4cecee5cecfe5cfd0e6d0d1e6d1d2e7d2d2e7d3d3e8d4d4e8d5d5e9d6d6e9d7d7e9d8d8ead9d9eadadaeb"
+        "dadaebdbdbecdcdcecdcdcecddddecdeddeddedeeddfdfede0dfeee0e0eee1e0eee2e1efe2e2efe3e2efe4e3f0e4e3f0"
+        "e5e4f0e6e5f1e6e5f1e7e6f1e8e6f2e8e7f2e9e8f2eae8f2eae9f3ebe9f3eceaf3ecebf4edebf4eeecf4eeecf5efedf5"
+        "efedf5f0eef5f0eef6f1eff6f1eff6f1f0f6f2f0f7f2f0f7f3f1f7f3f1f7f3f2f8f4f2f8f4f3f8f5f3f8f5f4f9f5f4f9"
+        "f6f4f9f6f5f9f7f5faf7f6faf8f6faf8f7faf8f7fbf9f7fbf9f8fbfaf8fbfaf9fcfaf9fcfbfafcfbfafcfcfbfdfcfbfd"
+    ),
+    "RdBu": (
+        "67001f6a011f6d02207003207304217605217906227c07227f0823810823840924870a248a0b258d0c25900d26930e26"
+        "960f279910279c11279f1228a21328a51429a81529ab162aae172ab1182bb3192cb41c2db61f2eb72230b82531ba2832"
+        "bb2a34bd2d35be3036bf3338c13639c2383ac43b3cc53e3dc6413ec84440c94741cb4942cc4c44ce4f45cf5246d05548"
+        "d25849d35a4ad55d4cd6604dd7634fd86551da6853db6b55dc6e57dd7059de735cdf765ee17860e27b62e37e64e48066"
+        "e58368e6866ae8896ce98b6eea8e70eb9172ec9374ee9677ef9979f09c7bf19e7df2a17ff3a481f4a683f5a886f5aa89"
+        "f5ac8bf6af8ef6b191f6b394f7b596f7b799f7b99cf8bb9ef8bda1f8bfa4f9c2a7f9c4a9f9c6acfac8affacab1fbccb4"
+        "fbceb7fbd0b9fcd3bcfcd5bffcd7c2fdd9c4fddbc7fddcc9fdddcbfcdecdfcdfcffce0d0fce2d2fbe3d4fbe4d6fbe5d8"
+        "fbe6dafae7dcfae8defae9dffaeae1f9ebe3f9ede5f9eee7f9efe9f9f0ebf8f1edf8f2eff8f3f0f8f4f2f7f5f4f7f6f6"
+        "f6f7f7f5f6f7f3f5f6f2f5f6f0f4f6eff3f5edf2f5ecf2f5eaf1f5e9f0f4e7f0f4e6eff4e4eef4e3edf3e1edf3e0ecf3"
+        "deebf2ddebf2dbeaf2dae9f2d8e9f1d7e8f1d5e7f1d4e6f1d2e6f0d1e5f0cfe4efcce2efcae1eec7e0edc5dfecc2ddec"
+        "c0dcebbddbeabbdaeab8d8e9b6d7e8b3d6e8b1d5e7aed3e6acd2e5a9d1e5a7d0e4a5cee3a2cde3a0cce29dcbe19bc9e0"
+        "98c8e096c7df93c6de90c4dd8dc2dc8ac0db87beda84bcd981bad87eb8d77bb6d678b4d575b2d471b0d36eaed26bacd1"
+        "68abd065a9cf62a7ce5fa5cd5ca3cb59a1ca569fc9529dc84f9bc74c99c64997c54695c44393c34291c2408fc13f8ec0"
+        "3e8cbf3c8abe3b88be3a87bd3885bc3783bb3681ba3480b9337eb8327cb7307ab62f79b52e77b52c75b42b73b32a71b2"
+        "2870b1276eb0266caf246aae2369ad2267ac2065ab1f63a81e61a51d5fa21c5c9f1b5a9c1a5899195696185493175290"
+        "15508d144e8a134c8712498411478110457e0f437b0e41790d3f760c3d730a3b7009386d08366a073467063264053061"
+    ),
+    "RdBu_r": (
+        "05306106326407346708366a09386d0a3b700c3d730d3f760e41790f437b10457e114781124984134c87144e8a15508d"
+        "1752901854931956961a58991b5a9c1c5c9f1d5fa21e61a51f63a82065ab2267ac2369ad246aae266caf276eb02870b1"
+        "2a71b22b73b32c75b42e77b52f79b5307ab6327cb7337eb83480b93681ba3783bb3885bc3a87bd3b88be3c8abe3e8cbf"
+        "3f8ec0408fc14291c24393c34695c44997c54c99c64f9bc7529dc8569fc959a1ca5ca3cb5fa5cd62a7ce65a9cf68abd0"
+        "6bacd16eaed271b0d375b2d478b4d57bb6d67eb8d781bad884bcd987beda8ac0db8dc2dc90c4dd93c6de96c7df98c8e0"
+        "9bc9e09dcbe1a0cce2a2cde3a5cee3a7d0e4a9d1e5acd2e5aed3e6b1d5e7b3d6e8b6d7e8b8d8e9bbdaeabddbeac0dceb"
+        "c2ddecc5dfecc7e0edcae1eecce2efcfe4efd1e5f0d2e6f0d4e6f1d5e7f1d7e8f1d8e9f1dae9f2dbeaf2ddebf2deebf2"
+        "e0ecf3e1edf3e3edf3e4eef4e6eff4e7f0f4e9f0f4eaf1f5ecf2f5edf2f5eff3f5f0f4f6f2f5f6f3f5f6f5f6f7f6f7f7"
+        "f7f6f6f7f5f4f8f4f2f8f3f0f8f2eff8f1edf9f0ebf9efe9f9eee7f9ede5f9ebe3faeae1fae9dffae8defae7dcfbe6da"
+        "fbe5d8fbe4d6fbe3d4fce2d2fce0d0fcdfcffcdecdfdddcbfddcc9fddbc7fdd9c4fcd7c2fcd5bffcd3bcfbd0b9fbceb7"
+        "fbccb4facab1fac8aff9c6acf9c4a9f9c2a7f8bfa4f8bda1f8bb9ef7b99cf7b799f7b596f6b394f6b191f6af8ef5ac8b"
+        "f5aa89f5a886f4a683f3a481f2a17ff19e7df09c7bef9979ee9677ec9374eb9172ea8e70e98b6ee8896ce6866ae58368"
+        "e48066e37e64e27b62e17860df765ede735cdd7059dc6e57db6b55da6853d86551d7634fd6604dd55d4cd35a4ad25849"
+        "d05548cf5246ce4f45cc4c44cb4942c94741c84440c6413ec53e3dc43b3cc2383ac13639bf3338be3036bd2d35bb2a34"
+        "ba2832b82531b72230b61f2eb41c2db3192cb1182bae172aab162aa81529a51429a213289f12289c1127991027960f27"
+        "930e26900d268d0c258a0b25870a248409248108237f08237c07227906227605217304217003206d02206a011f67001f"
+    ),
+    "RdGy": (
+        "67001f6a011f6d02207003207304217605217906227c07227f0823810823840924870a248a0b258d0c25900d26930e26"
+        "960f279910279c11279f1228a21328a51429a81529ab162aae172ab1182bb3192cb41c2db61f2eb72230b82531ba2832"
+        "bb2a34bd2d35be3036bf3338c13639c2383ac43b3cc53e3dc6413ec84440c94741cb4942cc4c44ce4f45cf5246d05548"
+        "d25849d35a4ad55d4cd6604dd7634fd86551da6853db6b55dc6e57dd7059de735cdf765ee17860e27b62e37e64e48066"
+        "e58368e6866ae8896ce98b6eea8e70eb9172ec9374ee9677ef9979f09c7bf19e7df2a17ff3a481f4a683f5a886f5aa89"
+        "f5ac8bf6af8ef6b191f6b394f7b596f7b799f7b99cf8bb9ef8bda1f8bfa4f9c2a7f9c4a9f9c6acfac8affacab1fbccb4"
+        "fbceb7fbd0b9fcd3bcfcd5bffcd7c2fdd9c4fddbc7fddcc9fddecbfddfcefde1d0fde2d2fde3d4fee5d6fee6d9fee8db"
+        "fee9ddfeebdffeece1feede4feefe6fef0e8fef2eafef3ecfef4effef6f1fff7f3fff9f5fffaf7fffbfafffdfcfffefe"
+        "fefefefdfdfdfcfcfcfbfbfbfafafaf8f8f8f7f7f7f6f6f6f5f5f5f3f3f3f2f2f2f1f1f1f0f0f0efefefedededececec"
+        "ebebebeaeaeae9e9e9e7e7e7e6e6e6e5e5e5e4e4e4e2e2e2e1e1e1e0e0e0dfdfdfdddddddcdcdcdadadad9d9d9d7d7d7"
+        "d6d6d6d4d4d4d3d3d3d1d1d1d0d0d0cecececdcdcdcbcbcbcacacac8c8c8c7c7c7c5c5c5c4c4c4c2c2c2c1c1c1bfbfbf"
+        "bebebebcbcbcbbbbbbb9b9b9b7b7b7b5b5b5b3b3b3b1b1b1afafafadadadabababa9a9a9a7a7a7a5a5a5a3a3a3a1a1a1"
+        "9f9f9f9d9d9d9b9b9b9999999797979595959393939191918f8f8f8d8d8d8b8b8b898989878787858585828282808080"
+        "7e7e7e7c7c7c7979797777777575757373737070706e6e6e6c6c6c6969696767676565656363636060605e5e5e5c5c5c"
+        "5a5a5a5757575555555353535050504e4e4e4c4c4c4a4a4a4848484646464444444242424040403e3e3e3c3c3c3a3a3a"
+        "3838383636363434343232323030302e2e2e2c2c2c2a2a2a2828282626262424242222222020201e1e1e1c1c1c1a1a1a"
+    ),
+    "RdGy_r": (
+        "1a1a1a1c1c1c1e1e1e2020202222222424242626262828282a2a2a2c2c2c2e2e2e303030323232343434363636383838"
+        "3a3a3a3c3c3c3e3e3e4040404242424444444646464848484a4a4a4c4c4c4e4e4e5050505353535555555757575a5a5a"
+        "5c5c5c5e5e5e6060606363636565656767676969696c6c6c6e6e6e7070707373737575757777777979797c7c7c7e7e7e"
+        "8080808282828585858787878989898b8b8b8d8d8d8f8f8f9191919393939595959797979999999b9b9b9d9d9d9f9f9f"
+        "a1a1a1a3a3a3a5a5a5a7a7a7a9a9a9abababadadadafafafb1b1b1b3b3b3b5b5b5b7b7b7b9b9b9bbbbbbbcbcbcbebebe"
+        "bfbfbfc1c1c1c2c2c2c4c4c4c5c5c5c7c7c7c8c8c8cacacacbcbcbcdcdcdcececed0d0d0d1d1d1d3d3d3d4d4d4d6d6d6"
+        "d7d7d7d9d9d9dadadadcdcdcdddddddfdfdfe0e0e0e1e1e1e2e2e2e4e4e4e5e5e5e6e6e6e7e7e7e9e9e9eaeaeaebebeb"
+        "ecececedededefefeff0f0f0f1f1f1f2f2f2f3f3f3f5f5f5f6f6f6f7f7f7f8f8f8fafafafbfbfbfcfcfcfdfdfdfefefe"
+        "fffefefffdfcfffbfafffaf7fff9f5fff7f3fef6f1fef4effef3ecfef2eafef0e8feefe6feede4feece1feebdffee9dd"
+        "fee8dbfee6d9fee5d6fde3d4fde2d2fde1d0fddfcefddecbfddcc9fddbc7fdd9c4fcd7c2fcd5bffcd3bcfbd0b9fbceb7"
+        "fbccb4facab1fac8aff9c6acf9c4a9f9c2a7f8bfa4f8bda1f8bb9ef7b99cf7b799f7b596f6b394f6b191f6af8ef5ac8b"
+        "f5aa89f5a886f4a683f3a481f2a17ff19e7df09c7bef9979ee9677ec9374eb9172ea8e70e98b6ee8896ce6866ae58368"
+        "e48066e37e64e27b62e17860df765ede735cdd7059dc6e57db6b55da6853d86551d7634fd6604dd55d4cd35a4ad25849"
+        "d05548cf5246ce4f45cc4c44cb4942c94741c84440c6413ec53e3dc43b3cc2383ac13639bf3338be3036bd2d35bb2a34"
+        "ba2832b82531b72230b61f2eb41c2db3192cb1182bae172aab162aa81529a51429a213289f12289c1127991027960f27"
+        "930e26900d268d0c258a0b25870a248409248108237f08237c07227906227605217304217003206d02206a011f67001f"
+    ),
+    "RdPu": (
+        "fff7f3fff6f2fff6f2fff5f1fff4f0fff3f0fff3effff2eefef1edfef1edfef0ecfeefebfeeeebfeeeeafeede9feece9"
+        "feebe8feebe7feeae7fee9e6fee9e5fee8e5fee7e4fee6e3fde6e2fde5e2fde4e1fde4e0fde3e0fde2dffde1defde1de"
+        "fde0ddfddfdcfddedbfddddafdddd9fddcd8fddbd7fddad7fdd9d6fdd8d5fdd7d4fdd7d3fdd6d2fdd5d1fdd4d0fdd3cf"
+        "fcd2cefcd1cdfcd1cdfcd0ccfccfcbfccecafccdc9fcccc8fcccc7fccbc6fccac5fcc9c4fcc8c3fcc7c3fcc6c2fcc6c1"
+        "fcc5c0fcc4c0fcc2bffcc1bffcc0bffcbfbefcbebefcbcbdfbbbbdfbbabdfbb9bcfbb8bcfbb6bcfbb5bbfbb4bbfbb3bb"
+        "fbb2bafbb0bafbafbafbaeb9fbadb9fbacb9fbaab8fba9b8faa8b8faa7b7faa6b7faa5b7faa3b6faa2b6faa1b6faa0b5"
+        "fa9eb5fa9db4fa9bb4fa99b3fa97b2f996b2f994b1f992b0f991b0f98faff98daef98baef98aadf988adf986acf984ab"
+        "f883abf881aaf87fa9f87ea9f87ca8f87aa8f878a7f877a6f875a6f873a5f871a4f770a4f76ea3f76ca3f76ba2f769a1"
+        "f767a1f666a1f564a0f462a0f361a0f35f9ff25d9ff15c9ff05a9eef599eee579eee559ded549dec529deb509cea4f9c"
+        "ea4d9ce94b9ce84a9be7489be6479be5459ae5439ae4429ae34099e23e99e13d99e13b98e03a98df3898de3697dd3597"
+        "dc3397db3196d93095d82e94d62d93d52b93d32992d22891d02690cf258fcd238fcc218eca208dc91e8cc71d8cc61b8b"
+        "c4198ac31889c21688c01588bf1387bd1186bc1085ba0e84b90d84b70b83b60982b40881b30681b10580b0037fae017e"
+        "ad017eab017eaa017da8017da6017da5017da3017da1017ca0017c9e017c9c017c9b017b99017b98017b96017b94017b"
+        "93017a91017a8f017a8e017a8c01798b01798901798701798601798401788201788101787f01787d01777c01777a0177"
+        "7901777701767601767401757301757101756f01746e01746c01736b0173690173680172660172650171630171620171"
+        "6000705f00705d006f5b006f5a006e58006e57006e55006d54006d52006c51006c4f006c4e006b4c006b4b006a49006a"
+    ),
+    "RdPu_r": (
+        "49006a4b006a4c006b4e006b4f006c51006c52006c54006d55006d57006e58006e5a006e5b006f5d006f5f0070600070"
+        "6201716301716501716601726801726901736b01736c01736e01746f0174710175730175740175760176770176790177"
+        "7a01777c01777d01777f01788101788201788401788601798701798901798b01798c01798e017a8f017a91017a93017a"
+        "94017b96017b98017b99017b9b017b9c017c9e017ca0017ca1017ca3017da5017da6017da8017daa017dab017ead017e"
+        "ae017eb0037fb10580b30681b40881b60982b70b83b90d84ba0e84bc1085bd1186bf1387c01588c21688c31889c4198a"
+        "c61b8bc71d8cc91e8cca208dcc218ecd238fcf258fd02690d22891d32992d52b93d62d93d82e94d93095db3196dc3397"
+        "dd3597de3697df3898e03a98e13b98e13d99e23e99e34099e4429ae5439ae5459ae6479be7489be84a9be94b9cea4d9c"
+        "ea4f9ceb509cec529ded549dee559dee579eef599ef05a9ef15c9ff25d9ff35f9ff361a0f462a0f564a0f666a1f767a1"
+        "f769a1f76ba2f76ca3f76ea3f770a4f871a4f873a5f875a6f877a6f878a7f87aa8f87ca8f87ea9f87fa9f881aaf883ab"
+        "f984abf986acf988adf98aadf98baef98daef98faff991b0f992b0f994b1f996b2fa97b2fa99b3fa9bb4fa9db4fa9eb5"
+        "faa0b5faa1b6faa2b6faa3b6faa5b7faa6b7faa7b7faa8b8fba9b8fbaab8fbacb9fbadb9fbaeb9fbafbafbb0bafbb2ba"
+        "fbb3bbfbb4bbfbb5bbfbb6bcfbb8bcfbb9bcfbbabdfbbbbdfcbcbdfcbebefcbfbefcc0bffcc1bffcc2bffcc4c0fcc5c0"
+        "fcc6c1fcc6c2fcc7c3fcc8c3fcc9c4fccac5fccbc6fcccc7fcccc8fccdc9fccecafccfcbfcd0ccfcd1cdfcd1cdfcd2ce"
+        "fdd3cffdd4d0fdd5d1fdd6d2fdd7d3fdd7d4fdd8d5fdd9d6fddad7fddbd7fddcd8fdddd9fddddafddedbfddfdcfde0dd"
+        "fde1defde1defde2dffde3e0fde4e0fde4e1fde5e2fde6e2fee6e3fee7e4fee8e5fee9e5fee9e6feeae7feebe7feebe8"
+        "feece9feede9feeeeafeeeebfeefebfef0ecfef1edfef1edfff2eefff3effff3f0fff4f0fff5f1fff6f2fff6f2fff7f3"
+    ),
+    "RdYlBu": (
+        "a50026a70226a90426ab0626ad0826af0926b10b26b30d26b50f26b71126b91326bb1526bd1726be1827c01a27c21c27"
+        "c41e27c62027c82227ca2427cc2627ce2827d02927d22b27d42d27d62f27d83128d93429da362adb382bdc3b2cdd3d2d"
+        "de402ee0422fe14430e24731e34933e44c34e54e35e65036e75337e95538ea5739eb5a3aec5c3bed5f3cee613eef633f"
+        "f16640f26841f36b42f46d43f47044f57245f57547f57748f67a49f67c4af67f4bf7814cf7844ef8864ff88950f88c51"
+        "f98e52f99153f99355fa9656fa9857fa9b58fb9d59fba05bfba35cfca55dfca85efcaa5ffdad60fdaf62fdb164fdb366"
+        "fdb567fdb769fdb96bfdbb6dfdbd6ffdbf71fdc173fdc374fdc576fdc778fec87afeca7cfecc7efece7ffed081fed283"
+        "fed485fed687fed889feda8afedc8cfede8efee090fee192fee294fee496fee597fee699fee79bfee99dfeea9ffeeba1"
+        "feeca2feeda4feefa6fff0a8fff1aafff2acfff3adfff5affff6b1fff7b3fff8b5fffab7fffbb9fffcbafffdbcfffebe"
+        "feffc0fdfec2fcfec5fbfdc7fafdc9f8fccbf7fccef6fbd0f5fbd2f3fbd4f2fad6f1fad9f0f9dbeff9ddedf8dfecf8e2"
+        "ebf7e4eaf7e6e9f6e8e7f6ebe6f5ede5f5efe4f4f1e2f4f4e1f3f6e0f3f8def2f7dcf1f7daf0f6d8eff6d6eef5d4edf4"
+        "d1ecf4cfebf3cdeaf3cbe9f2c9e8f2c7e7f1c5e6f0c3e5f0c1e4efbfe3efbde2eebbe1edb9e0edb6dfecb4deecb2ddeb"
+        "b0dceaaedbeaacdae9aad8e9a8d6e8a6d5e7a3d3e6a1d1e59fd0e49dcee39bcce299cae197c9e094c7df92c5de90c3dd"
+        "8ec2dc8cc0db8abeda87bdd985bbd983b9d881b7d77fb6d67db4d57ab2d478b0d376afd274add172abd070a9cf6ea6ce"
+        "6da4cc6ba2cb69a0ca679ec9659bc86399c76297c66095c45e93c35c90c25a8ec1588cc0578abf5588be5385bd5183bb"
+        "4f81ba4d7fb94b7db84a7ab74878b64676b54574b34471b2436fb1426cb0416aaf4167ad4065ac3f62ab3e60aa3e5ea8"
+        "3d5ba73c59a63b56a53a54a43a51a2394fa1384ca0374a9f36479e36459c35429b34409a333d99333b97323896313695"
+    ),
+    "RdYlBu_r": (
+        "313695323896333b97333d9934409a35429b36459c36479e374a9f384ca0394fa13a51a23a54a43b56a53c59a63d5ba7"
+        "3e5ea83e60aa3f62ab4065ac4167ad416aaf426cb0436fb14471b24574b34676b54878b64a7ab74b7db84d7fb94f81ba"
+        "5183bb5385bd5588be578abf588cc05a8ec15c90c25e93c36095c46297c66399c7659bc8679ec969a0ca6ba2cb6da4cc"
+        "6ea6ce70a9cf72abd074add176afd278b0d37ab2d47db4d57fb6d681b7d783b9d885bbd987bdd98abeda8cc0db8ec2dc"
+        "90c3dd92c5de94c7df97c9e099cae19bcce29dcee39fd0e4a1d1e5a3d3e6a6d5e7a8d6e8aad8e9acdae9aedbeab0dcea"
+        "b2ddebb4deecb6dfecb9e0edbbe1edbde2eebfe3efc1e4efc3e5f0c5e6f0c7e7f1c9e8f2cbe9f2cdeaf3cfebf3d1ecf4"
+        "d4edf4d6eef5d8eff6daf0f6dcf1f7def2f7e0f3f8e1f3f6e2f4f4e4f4f1e5f5efe6f5ede7f6ebe9f6e8eaf7e6ebf7e4"
+        "ecf8e2edf8dfeff9ddf0f9dbf1fad9f2fad6f3fbd4f5fbd2f6fbd0f7fccef8fccbfafdc9fbfdc7fcfec5fdfec2feffc0"
+        "fffebefffdbcfffcbafffbb9fffab7fff8b5fff7b3fff6b1fff5affff3adfff2acfff1aafff0a8feefa6feeda4feeca2"
+        "feeba1feea9ffee99dfee79bfee699fee597fee496fee294fee192fee090fede8efedc8cfeda8afed889fed687fed485"
+        "fed283fed081fece7ffecc7efeca7cfec87afdc778fdc576fdc374fdc173fdbf71fdbd6ffdbb6dfdb96bfdb769fdb567"
+        "fdb366fdb164fdaf62fdad60fcaa5ffca85efca55dfba35cfba05bfb9d59fa9b58fa9857fa9656f99355f99153f98e52"
+        "f88c51f88950f8864ff7844ef7814cf67f4bf67c4af67a49f57748f57547f57245f47044f46d43f36b42f26841f16640"
+        "ef633fee613eed5f3cec5c3beb5a3aea5739e95538e75337e65036e54e35e44c34e34933e24731e14430e0422fde402e"
+        "dd3d2ddc3b2cdb382bda362ad93429d83128d62f27d42d27d22b27d02927ce2827cc2627ca2427c82227c62027c41e27"
+        "c21c27c01a27be1827bd1726bb1526b91326b71126b50f26b30d26b10b26af0926ad0826ab0626a90426a70226a50026"
+    ),
+    "RdYlGn": (
+        "a50026a70226a90426ab0626ad0826af0926b10b26b30d26b50f26b71126b91326bb1526bd1726be1827c01a27c21c27"
+        "c41e27c62027c82227ca2427cc2627ce2827d02927d22b27d42d27d62f27d83128d93429da362adb382bdc3b2cdd3d2d"
+        "de402ee0422fe14430e24731e34933e44c34e54e35e65036e75337e95538ea5739eb5a3aec5c3bed5f3cee613eef633f"
+        "f16640f26841f36b42f46d43f47044f57245f57547f57748f67a49f67c4af67f4bf7814cf7844ef8864ff88950f88c51"
+        "f98e52f99153f99355fa9656fa9857fa9b58fb9d59fba05bfba35cfca55dfca85efcaa5ffdad60fdaf62fdb163fdb365"
+        "fdb567fdb768fdb96afdbb6cfdbd6dfdbf6ffdc171fdc372fdc574fdc776fec877feca79fecc7bfece7cfed07efed27f"
+        "fed481fed683fed884feda86fedc88fede89fee08bfee18dfee28ffee491fee593fee695fee797fee999feea9bfeeb9d"
+        "feec9ffeeda1feefa3fff0a6fff1a8fff2aafff3acfff5aefff6b0fff7b2fff8b4fffab6fffbb8fffcbafffdbcfffebe"
+        "feffbefdfebcfbfdbafafdb8f8fcb6f7fcb4f5fbb2f4fab0f2faaef1f9aceff8aaeef8a8ecf7a6ebf7a3e9f6a1e8f59f"
+        "e6f59de5f49be3f399e2f397e0f295dff293ddf191dcf08fdaf08dd9ef8bd7ee8ad5ed88d3ec87d1ec86cfeb85cdea83"
+        "cbe982c9e881c7e77fc5e67ec3e67dc1e57bbfe47abde379bbe278b9e176b7e075b5df74b3df72b1de71afdd70addc6f"
+        "abdb6da9da6ca7d96ba5d86aa2d76aa0d6699dd5699bd46998d36896d26893d16891d0688ecf678ccd6789cc6787cb67"
+        "84ca6682c9667fc8667dc7657ac66578c56575c46573c26470c1646ec0646bbf6469be6366bd6363bc6260ba625db961"
+        "5ab76057b65f54b45f51b35e4eb15d4bb05c48ae5c45ad5b42ac5a3faa593ca95939a75836a65733a45630a3562da155"
+        "2aa054279f53249d53219c521e9a511b995019975018954f17934e16914d15904c148e4b138c4a128a49118848108647"
+        "0f84460e82450d80440c7f430b7d420a7b4109794008773f07753e06733d05713c04703b036e3a026c39016a38006837"
+    ),
+    "RdYlGn_r": (
+        "006837016a38026c39036e3a04703b05713c06733d07753e08773f0979400a7b410b7d420c7f430d80440e82450f8446"
+        "108647118848128a49138c4a148e4b15904c16914d17934e18954f1997501b99501e9a51219c52249d53279f532aa054"
+        "2da15530a35633a45636a65739a7583ca9593faa5942ac5a45ad5b48ae5c4bb05c4eb15d51b35e54b45f57b65f5ab760"
+        "5db96160ba6263bc6266bd6369be636bbf646ec06470c16473c26475c46578c5657ac6657dc7657fc86682c96684ca66"
+        "87cb6789cc678ccd678ecf6791d06893d16896d26898d3689bd4699dd569a0d669a2d76aa5d86aa7d96ba9da6cabdb6d"
+        "addc6fafdd70b1de71b3df72b5df74b7e075b9e176bbe278bde379bfe47ac1e57bc3e67dc5e67ec7e77fc9e881cbe982"
+        "cdea83cfeb85d1ec86d3ec87d5ed88d7ee8ad9ef8bdaf08ddcf08fddf191dff293e0f295e2f397e3f399e5f49be6f59d"
+        "e8f59fe9f6a1ebf7a3ecf7a6eef8a8eff8aaf1f9acf2faaef4fab0f5fbb2f7fcb4f8fcb6fafdb8fbfdbafdfebcfeffbe"
+        "fffebefffdbcfffcbafffbb8fffab6fff8b4fff7b2fff6b0fff5aefff3acfff2aafff1a8fff0a6feefa3feeda1feec9f"
+        "feeb9dfeea9bfee999fee797fee695fee593fee491fee28ffee18dfee08bfede89fedc88feda86fed884fed683fed481"
+        "fed27ffed07efece7cfecc7bfeca79fec877fdc776fdc574fdc372fdc171fdbf6ffdbd6dfdbb6cfdb96afdb768fdb567"
+        "fdb365fdb163fdaf62fdad60fcaa5ffca85efca55dfba35cfba05bfb9d59fa9b58fa9857fa9656f99355f99153f98e52"
+        "f88c51f88950f8864ff7844ef7814cf67f4bf67c4af67a49f57748f57547f57245f47044f46d43f36b42f26841f16640"
+        "ef633fee613eed5f3cec5c3beb5a3aea5739e95538e75337e65036e54e35e44c34e34933e24731e14430e0422fde402e"
+        "dd3d2ddc3b2cdb382bda362ad93429d83128d62f27d42d27d22b27d02927ce2827cc2627ca2427c82227c62027c41e27"
+        "c21c27c01a27be1827bd1726bb1526b91326b71126b50f26b30d26b10b26af0926ad0826ab0626a90426a70226a50026"
+    ),
+    "Reds": (
+        "fff5f0fff4effff4eefff3edfff2ecfff2ebfff1eafff0e9fff0e8ffefe8ffeee7ffeee6ffede5ffece4ffece3ffebe2"
+        "feeae1feeae0fee9dffee8defee8ddfee7dcfee7dbfee6dafee5d9fee5d8fee4d8fee3d7fee3d6fee2d5fee1d4fee1d3"
+        "fee0d2fedfd0fedecffedccdfedbccfedacafed9c9fed8c7fdd7c6fdd5c4fdd4c2fdd3c1fdd2bffdd1befdd0bcfdcebb"
+        "fdcdb9fdccb8fdcbb6fdcab5fdc9b3fdc7b2fdc6b0fdc5aefcc4adfcc3abfcc2aafcc1a8fcbfa7fcbea5fcbda4fcbca2"
+        "fcbba1fcb99ffcb89efcb79cfcb69bfcb499fcb398fcb296fcb095fcaf93fcae92fcad90fcab8ffcaa8dfca98cfca78b"
+        "fca689fca588fca486fca285fca183fca082fc9e80fc9d7ffc9c7dfc9b7cfc997afc9879fc9777fc9576fc9474fc9373"
+        "fc9272fc9070fc8f6ffc8e6efc8d6dfc8b6bfc8a6afc8969fc8767fc8666fc8565fc8464fc8262fc8161fc8060fc7f5f"
+        "fb7d5dfb7c5cfb7b5bfb7a5afb7858fb7757fb7656fb7555fb7353fb7252fb7151fb7050fb6e4efb6d4dfb6c4cfb6b4b"
+        "fb694afa6849fa6648fa6547f96346f96245f96044f85f43f85d42f75c41f75b40f7593ff6583ef6563df6553cf5533b"
+        "f5523af4503af44f39f44d38f34c37f34a36f34935f24734f24633f14432f14331f14130f0402ff03f2ef03d2def3c2c"
+        "ee3a2ced392bec382beb372aea362ae93529e83429e63328e53228e43027e32f27e22e27e12d26e02c26de2b25dd2a25"
+        "dc2924db2824da2723d92523d82422d72322d52221d42121d32020d21f20d11e1fd01d1fcf1c1fce1a1ecc191ecb181d"
+        "ca181dc9181dc8171cc7171cc5171cc4161cc3161bc2161bc1161bbf151bbe151abd151abc141abb141ab91419b81419"
+        "b71319b61319b51318b31218b21218b11218b01217af1117ad1117ac1117ab1016aa1016a91016a81016a60f15a50f15"
+        "a30f15a10e159f0e149d0d149c0d149a0c14980c13960b13940b13920a13900a128e09128c09128a0812880811860811"
+        "8407118207118006107e06107c05107a051079040f77040f75030f73030f71020e6f020e6d010e6b010e69000d67000d"
+    ),
+    "Reds_r": (
+        "67000d69000d6b010e6d010e6f020e71020e73030f75030f77040f79040f7a05107c05107e0610800610820711840711"
+        "8608118808118a08128c09128e0912900a12920a13940b13960b13980c139a0c149c0d149d0d149f0e14a10e15a30f15"
+        "a50f15a60f15a81016a91016aa1016ab1016ac1117ad1117af1117b01217b11218b21218b31218b51318b61319b71319"
+        "b81419b91419bb141abc141abd151abe151abf151bc1161bc2161bc3161bc4161cc5171cc7171cc8171cc9181dca181d"
+        "cb181dcc191ece1a1ecf1c1fd01d1fd11e1fd21f20d32020d42121d52221d72322d82422d92523da2723db2824dc2924"
+        "dd2a25de2b25e02c26e12d26e22e27e32f27e43027e53228e63328e83429e93529ea362aeb372aec382bed392bee3a2c"
+        "ef3c2cf03d2df03f2ef0402ff14130f14331f14432f24633f24734f34935f34a36f34c37f44d38f44f39f4503af5523a"
+        "f5533bf6553cf6563df6583ef7593ff75b40f75c41f85d42f85f43f96044f96245f96346fa6547fa6648fa6849fb694a"
+        "fb6b4bfb6c4cfb6d4dfb6e4efb7050fb7151fb7252fb7353fb7555fb7656fb7757fb7858fb7a5afb7b5bfb7c5cfb7d5d"
+        "fc7f5ffc8060fc8161fc8262fc8464fc8565fc8666fc8767fc8969fc8a6afc8b6bfc8d6dfc8e6efc8f6ffc9070fc9272"
+        "fc9373fc9474fc9576fc9777fc9879fc997afc9b7cfc9c7dfc9d7ffc9e80fca082fca183fca285fca486fca588fca689"
+        "fca78bfca98cfcaa8dfcab8ffcad90fcae92fcaf93fcb095fcb296fcb398fcb499fcb69bfcb79cfcb89efcb99ffcbba1"
+        "fcbca2fcbda4fcbea5fcbfa7fcc1a8fcc2aafcc3abfcc4adfdc5aefdc6b0fdc7b2fdc9b3fdcab5fdcbb6fdccb8fdcdb9"
+        "fdcebbfdd0bcfdd1befdd2bffdd3c1fdd4c2fdd5c4fdd7c6fed8c7fed9c9fedacafedbccfedccdfedecffedfd0fee0d2"
+        "fee1d3fee1d4fee2d5fee3d6fee3d7fee4d8fee5d8fee5d9fee6dafee7dbfee7dcfee8ddfee8defee9dffeeae0feeae1"
+        "ffebe2ffece3ffece4ffede5ffeee6ffeee7ffefe8fff0e8fff0e9fff1eafff2ebfff2ecfff3edfff4eefff4effff5f0"
+    ),
+    "Set1": (
+        "e41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1c"
+        "e41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1c377eb8377eb8377eb8"
+        "377eb8377eb8377eb8377eb8377eb8377eb8377eb8377eb8377eb8377eb8377eb8377eb8377eb8377eb8377eb8377eb8"
+        "377eb8377eb8377eb8377eb8377eb8377eb8377eb8377eb8377eb84daf4a4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a"
+        "4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a"
+        "4daf4a4daf4a4daf4a4daf4a4daf4a984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3"
+        "984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3"
+        "984ea3984ea3ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00"
+        "ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ffff33ffff33"
+        "ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33"
+        "ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33a65628a65628a65628a65628a65628a65628"
+        "a65628a65628a65628a65628a65628a65628a65628a65628a65628a65628a65628a65628a65628a65628a65628a65628"
+        "a65628a65628a65628a65628a65628a65628a65628f781bff781bff781bff781bff781bff781bff781bff781bff781bf"
+        "f781bff781bff781bff781bff781bff781bff781bff781bff781bff781bff781bff781bff781bff781bff781bff781bf"
+        "f781bff781bff781bf999999999999999999999999999999999999999999999999999999999999999999999999999999"
+        "999999999999999999999999999999999999999999999999999999999999999999999999999999999999999999999999"
+    ),
+    "Set1_r": (
+        "999999999999999999999999999999999999999999999999999999999999999999999999999999999999999999999999"
+        "999999999999999999999999999999999999999999999999999999999999999999999999999999f781bff781bff781bf"
+        "f781bff781bff781bff781bff781bff781bff781bff781bff781bff781bff781bff781bff781bff781bff781bff781bf"
+        "f781bff781bff781bff781bff781bff781bff781bff781bff781bfa65628a65628a65628a65628a65628a65628a65628"
+        "a65628a65628a65628a65628a65628a65628a65628a65628a65628a65628a65628a65628a65628a65628a65628a65628"
+        "a65628a65628a65628a65628a65628ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33"
+        "ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33ffff33"
+        "ffff33ffff33ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00"
+        "ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00ff7f00984ea3984ea3"
+        "984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3"
+        "984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea3984ea34daf4a4daf4a4daf4a4daf4a4daf4a4daf4a"
+        "4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a"
+        "4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a4daf4a377eb8377eb8377eb8377eb8377eb8377eb8377eb8377eb8377eb8"
+        "377eb8377eb8377eb8377eb8377eb8377eb8377eb8377eb8377eb8377eb8377eb8377eb8377eb8377eb8377eb8377eb8"
+        "377eb8377eb8377eb8e41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1c"
+        "e41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1ce41a1c"
+    ),
+    "Set2": (
+        "66c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a5"
+        "66c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a5"
+        "fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62"
+        "fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62"
+        "8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb"
+        "8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb"
+        "e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3"
+        "e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3"
+        "a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854"
+        "a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854"
+        "ffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92f"
+        "ffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92f"
+        "e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494"
+        "e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494"
+        "b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3"
+        "b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3"
+    ),
+    "Set2_r": (
+        "b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3"
+        "b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3b3"
+        "e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494"
+        "e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494e5c494"
+        "ffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92f"
+        "ffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92fffd92f"
+        "a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854"
+        "a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854a6d854"
+        "e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3"
+        "e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3e78ac3"
+        "8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb"
+        "8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb8da0cb"
+        "fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62"
+        "fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62fc8d62"
+        "66c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a5"
+        "66c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a566c2a5"
+    ),
+    "Set3": (
+        "8dd3c78dd3c78dd3c78dd3c78dd3c78dd3c78dd3c78dd3c78dd3c78dd3c78dd3c78dd3c78dd3c78dd3c78dd3c78dd3c7"
+        "8dd3c78dd3c78dd3c78dd3c78dd3c78dd3c7ffffb3ffffb3ffffb3ffffb3ffffb3ffffb3ffffb3ffffb3ffffb3ffffb3"
+        "ffffb3ffffb3ffffb3ffffb3ffffb3ffffb3ffffb3ffffb3ffffb3ffffb3ffffb3bebadabebadabebadabebadabebada"
+        "bebadabebadabebadabebadabebadabebadabebadabebadabebadabebadabebadabebadabebadabebadabebadabebada"
+        "fb8072fb8072fb8072fb8072fb8072fb8072fb8072fb8072fb8072fb8072fb8072fb8072fb8072fb8072fb8072fb8072"
+        "fb8072fb8072fb8072fb8072fb807280b1d380b1d380b1d380b1d380b1d380b1d380b1d380b1d380b1d380b1d380b1d3"
+        "80b1d380b1d380b1d380b1d380b1d380b1d380b1d380b1d380b1d380b1d380b1d3fdb462fdb462fdb462fdb462fdb462"
+        "fdb462fdb462fdb462fdb462fdb462fdb462fdb462fdb462fdb462fdb462fdb462fdb462fdb462fdb462fdb462fdb462"
+        "b3de69b3de69b3de69b3de69b3de69b3de69b3de69b3de69b3de69b3de69b3de69b3de69b3de69b3de69b3de69b3de69"
+        "b3de69b3de69b3de69b3de69b3de69fccde5fccde5fccde5fccde5fccde5fccde5fccde5fccde5fccde5fccde5fccde5"
+        "fccde5fccde5fccde5fccde5fccde5fccde5fccde5fccde5fccde5fccde5d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9"
+        "d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9"
+        "bc80bdbc80bdbc80bdbc80bdbc80bdbc80bdbc80bdbc80bdbc80bdbc80bdbc80bdbc80bdbc80bdbc80bdbc80bdbc80bd"
+        "bc80bdbc80bdbc80bdbc80bdbc80bdccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5"
+        "ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ffed6fffed6fffed6fffed6fffed6fffed6f"
+        "ffed6fffed6fffed6fffed6fffed6fffed6fffed6fffed6fffed6fffed6fffed6fffed6fffed6fffed6fffed6fffed6f"
+    ),
+    "Set3_r": (
+        "ffed6fffed6fffed6fffed6fffed6fffed6fffed6fffed6fffed6fffed6fffed6fffed6fffed6fffed6fffed6fffed6f"
+        "ffed6fffed6fffed6fffed6fffed6fffed6fccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5"
+        "ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5ccebc5bc80bdbc80bdbc80bdbc80bdbc80bd"
+        "bc80bdbc80bdbc80bdbc80bdbc80bdbc80bdbc80bdbc80bdbc80bdbc80bdbc80bdbc80bdbc80bdbc80bdbc80bdbc80bd"
+        "d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9"
+        "d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9fccde5fccde5fccde5fccde5fccde5fccde5fccde5fccde5fccde5fccde5fccde5"
+        "fccde5fccde5fccde5fccde5fccde5fccde5fccde5fccde5fccde5fccde5fccde5b3de69b3de69b3de69b3de69b3de69"
+        "b3de69b3de69b3de69b3de69b3de69b3de69b3de69b3de69b3de69b3de69b3de69b3de69b3de69b3de69b3de69b3de69"
+        "fdb462fdb462fdb462fdb462fdb462fdb462fdb462fdb462fdb462fdb462fdb462fdb462fdb462fdb462fdb462fdb462"
+        "fdb462fdb462fdb462fdb462fdb46280b1d380b1d380b1d380b1d380b1d380b1d380b1d380b1d380b1d380b1d380b1d3"
+        "80b1d380b1d380b1d380b1d380b1d380b1d380b1d380b1d380b1d380b1d3fb8072fb8072fb8072fb8072fb8072fb8072"
+        "fb8072fb8072fb8072fb8072fb8072fb8072fb8072fb8072fb8072fb8072fb8072fb8072fb8072fb8072fb8072fb8072"
+        "bebadabebadabebadabebadabebadabebadabebadabebadabebadabebadabebadabebadabebadabebadabebadabebada"
+        "bebadabebadabebadabebadabebadaffffb3ffffb3ffffb3ffffb3ffffb3ffffb3ffffb3ffffb3ffffb3ffffb3ffffb3"
+        "ffffb3ffffb3ffffb3ffffb3ffffb3ffffb3ffffb3ffffb3ffffb3ffffb38dd3c78dd3c78dd3c78dd3c78dd3c78dd3c7"
+        "8dd3c78dd3c78dd3c78dd3c78dd3c78dd3c78dd3c78dd3c78dd3c78dd3c78dd3c78dd3c78dd3c78dd3c78dd3c78dd3c7"
+    ),
+    "Spectral": (
+        "9e0142a00343a20643a40844a70b44a90d45ab0f45ad1246af1446b11747b41947b61b48b81e48ba2049bc2249be254a"
+        "c1274ac32a4bc52c4bc72e4cc9314ccb334dcd364dd0384ed23a4ed43d4fd63f4fd7414ed8434ed9444dda464ddc484c"
+        "dd4a4cde4c4bdf4e4be1504be2514ae3534ae45549e55749e75948e85b48e95c47ea5e47eb6046ed6246ee6445ef6645"
+        "f06744f26944f36b43f46d43f47044f57245f57547f57748f67a49f67c4af67f4bf7814cf7844ef8864ff88950f88c51"
+        "f98e52f99153f99355fa9656fa9857fa9b58fb9d59fba05bfba35cfca55dfca85efcaa5ffdad60fdaf62fdb163fdb365"
+        "fdb567fdb768fdb96afdbb6cfdbd6dfdbf6ffdc171fdc372fdc574fdc776fec877feca79fecc7bfece7cfed07efed27f"
+        "fed481fed683fed884feda86fedc88fede89fee08bfee18dfee28ffee491fee593fee695fee797fee999feea9bfeeb9d"
+        "feec9ffeeda1feefa3fff0a6fff1a8fff2aafff3acfff5aefff6b0fff7b2fff8b4fffab6fffbb8fffcbafffdbcfffebe"
+        "ffffbefefebdfdfebbfcfebafbfdb8fafdb7f9fcb5f8fcb4f7fcb2f6fbb0f5fbaff4faadf3faacf2faaaf1f9a9f0f9a7"
+        "eff9a6eef8a4edf8a3ecf7a1ebf7a0eaf79ee9f69de8f69be7f59ae6f598e4f498e1f399dff299ddf19adaf09ad8ef9b"
+        "d6ee9bd3ed9cd1ed9ccfec9dcdeb9dcaea9ec8e99ec6e89fc3e79fc1e6a0bfe5a0bce4a0bae3a1b8e2a1b5e1a2b3e0a2"
+        "b1dfa3aedea3acdda4aadca4a7dba4a4daa4a2d9a49fd8a49cd7a499d6a497d5a494d4a491d3a48fd2a48cd1a489d0a4"
+        "86cfa584cea581cda57ecca57ccaa579c9a576c8a574c7a571c6a56ec5a56bc4a569c3a566c2a564c0a662bda760bba8"
+        "5eb9a95cb7aa5ab4ab58b2ac56b0ad54aead52abae50a9af4ea7b04ba4b149a2b247a0b3459eb4439bb54199b63f97b7"
+        "3d95b83b92b93990ba378ebb358bbc3389bd3387bc3585bb3682ba3880b93a7eb83b7cb73d79b63f77b54175b44273b3"
+        "4471b2466eb1486cb0496aaf4b68ae4d65ad4e63ac5061aa525fa9545ca8555aa75758a65956a55b53a45c51a35e4fa2"
+    ),
+    "Spectral_r": (
+        "5e4fa25c51a35b53a45956a55758a6555aa7545ca8525fa95061aa4e63ac4d65ad4b68ae496aaf486cb0466eb14471b2"
+        "4273b34175b43f77b53d79b63b7cb73a7eb83880b93682ba3585bb3387bc3389bd358bbc378ebb3990ba3b92b93d95b8"
+        "3f97b74199b6439bb5459eb447a0b349a2b24ba4b14ea7b050a9af52abae54aead56b0ad58b2ac5ab4ab5cb7aa5eb9a9"
+        "60bba862bda764c0a666c2a569c3a56bc4a56ec5a571c6a574c7a576c8a579c9a57ccaa57ecca581cda584cea586cfa5"
+        "89d0a48cd1a48fd2a491d3a494d4a497d5a499d6a49cd7a49fd8a4a2d9a4a4daa4a7dba4aadca4acdda4aedea3b1dfa3"
+        "b3e0a2b5e1a2b8e2a1bae3a1bce4a0bfe5a0c1e6a0c3e79fc6e89fc8e99ecaea9ecdeb9dcfec9dd1ed9cd3ed9cd6ee9b"
+        "d8ef9bdaf09addf19adff299e1f399e4f498e6f598e7f59ae8f69be9f69deaf79eebf7a0ecf7a1edf8a3eef8a4eff9a6"
+        "f0f9a7f1f9a9f2faaaf3faacf4faadf5fbaff6fbb0f7fcb2f8fcb4f9fcb5fafdb7fbfdb8fcfebafdfebbfefebdffffbe"
+        "fffebefffdbcfffcbafffbb8fffab6fff8b4fff7b2fff6b0fff5aefff3acfff2aafff1a8fff0a6feefa3feeda1feec9f"
+        "feeb9dfeea9bfee999fee797fee695fee593fee491fee28ffee18dfee08bfede89fedc88feda86fed884fed683fed481"
+        "fed27ffed07efece7cfecc7bfeca79fec877fdc776fdc574fdc372fdc171fdbf6ffdbd6dfdbb6cfdb96afdb768fdb567"
+        "fdb365fdb163fdaf62fdad60fcaa5ffca85efca55dfba35cfba05bfb9d59fa9b58fa9857fa9656f99355f99153f98e52"
+        "f88c51f88950f8864ff7844ef7814cf67f4bf67c4af67a49f57748f57547f57245f47044f46d43f36b43f26944f06744"
+        "ef6645ee6445ed6246eb6046ea5e47e95c47e85b48e75948e55749e45549e3534ae2514ae1504bdf4e4bde4c4bdd4a4c"
+        "dc484cda464dd9444dd8434ed7414ed63f4fd43d4fd23a4ed0384ecd364dcb334dc9314cc72e4cc52c4bc32a4bc1274a"
+        "be254abc2249ba2049b81e48b61b48b41947b11747af1446ad1246ab0f45a90d45a70b44a40844a20643a003439e0142"
+    ),
+    "Wistia": (
+        "e4ff7ae4ff78e5fe77e5fe75e6fe74e6fd72e7fd71e7fc6fe7fc6ee8fc6ce8fb6be9fb69e9fb68eafa66eafa65eafa63"
+        "ebf962ebf960ecf95fecf85decf85cedf75aedf759eef757eef656eff654eff653eff551f0f550f0f54ef1f44df1f44b"
+        "f2f34af2f348f2f347f3f245f3f244f4f242f4f141f5f13ff5f13ef5f03cf6f03bf6ef39f7ef38f7ef36f7ee35f8ee33"
+        "f8ee32f9ed30f9ed2ffaed2dfaec2cfaec2afbec29fbeb27fceb26fcea24fdea23fdea21fde920fee91efee91dffe81b"
+        "ffe81affe719ffe619ffe619ffe518ffe418ffe417ffe317ffe217ffe216ffe116ffe015ffe015ffdf15ffde14ffde14"
+        "ffdd13ffdc13ffdc13ffdb12ffda12ffda11ffd911ffd811ffd810ffd710ffd60fffd60fffd50effd40effd40effd30d"
+        "ffd20dffd20cffd10cffd00cffd00bffcf0bffce0affce0affcd0affcc09ffcc09ffcb08ffca08ffc908ffc907ffc807"
+        "ffc706ffc706ffc606ffc505ffc505ffc404ffc304ffc303ffc203ffc103ffc102ffc002ffbf01ffbf01ffbe01ffbd00"
+        "ffbd00ffbc00ffbc00ffbb00ffbb00ffba00ffba00ffba00ffb900ffb900ffb800ffb800ffb700ffb700ffb600ffb600"
+        "ffb500ffb500ffb500ffb400ffb400ffb300ffb300ffb200ffb200ffb100ffb100ffb000ffb000ffb000ffaf00ffaf00"
+        "ffae00ffae00ffad00ffad00ffac00ffac00ffab00ffab00ffab00ffaa00ffaa00ffa900ffa900ffa800ffa800ffa700"
+        "ffa700ffa600ffa600ffa600ffa500ffa500ffa400ffa400ffa300ffa300ffa200ffa200ffa100ffa100ffa100ffa000"
+        "ffa000ff9f00ff9f00ff9e00ff9e00ff9d00ff9d00ff9c00ff9b00ff9b00fe9a00fe9a00fe9900fe9900fe9800fe9800"
+        "fe9700fe9700fe9600fe9600fe9500fe9500fe9400fe9400fe9300fe9300fe9200fe9200fe9100fe9100fe9000fe9000"
+        "fd8f00fd8f00fd8e00fd8d00fd8d00fd8c00fd8c00fd8b00fd8b00fd8a00fd8a00fd8900fd8900fd8800fd8800fd8700"
+        "fd8700fd8600fd8600fd8500fd8500fc8400fc8400fc8300fc8300fc8200fc8200fc8100fc8100fc8000fc8000fc7f00"
+    ),
+    "Wistia_r": (
+        "fc7f00fc8000fc8000fc8100fc8100fc8200fc8200fc8300fc8300fc8400fc8400fd8500fd8500fd8600fd8600fd8700"
+        "fd8700fd8800fd8800fd8900fd8900fd8a00fd8a00fd8b00fd8b00fd8c00fd8c00fd8d00fd8d00fd8e00fd8f00fd8f00"
+        "fe9000fe9000fe9100fe9100fe9200fe9200fe9300fe9300fe9400fe9400fe9500fe9500fe9600fe9600fe9700fe9700"
+        "fe9800fe9800fe9900fe9900fe9a00fe9a00ff9b00ff9b00ff9c00ff9d00ff9d00ff9e00ff9e00ff9f00ff9f00ffa000"
+        "ffa000ffa100ffa100ffa100ffa200ffa200ffa300ffa300ffa400ffa400ffa500ffa500ffa600ffa600ffa600ffa700"
+        "ffa700ffa800ffa800ffa900ffa900ffaa00ffaa00ffab00ffab00ffab00ffac00ffac00ffad00ffad00ffae00ffae00"
+        "ffaf00ffaf00ffb000ffb000ffb000ffb100ffb100ffb200ffb200ffb300ffb300ffb400ffb400ffb500ffb500ffb500"
+        "ffb600ffb600ffb700ffb700ffb800ffb800ffb900ffb900ffba00ffba00ffba00ffbb00ffbb00ffbc00ffbc00ffbd00"
+        "ffbd00ffbe01ffbf01ffbf01ffc002ffc102ffc103ffc203ffc303ffc304ffc404ffc505ffc505ffc606ffc706ffc706"
+        "ffc807ffc907ffc908ffca08ffcb08ffcc09ffcc09ffcd0affce0affce0affcf0bffd00bffd00cffd10cffd20cffd20d"
+        "ffd30dffd40effd40effd50effd60fffd60fffd710ffd810ffd811ffd911ffda11ffda12ffdb12ffdc13ffdc13ffdd13"
+        "ffde14ffde14ffdf15ffe015ffe015ffe116ffe216ffe217ffe317ffe417ffe418ffe518ffe619ffe619ffe719ffe81a"
+        "ffe81bfee91dfee91efde920fdea21fdea23fcea24fceb26fbeb27fbec29faec2afaec2cfaed2df9ed2ff9ed30f8ee32"
+        "f8ee33f7ee35f7ef36f7ef38f6ef39f6f03bf5f03cf5f13ef5f13ff4f141f4f242f3f244f3f245f2f347f2f348f2f34a"
+        "f1f44bf1f44df0f54ef0f550eff551eff653eff654eef656eef757edf759edf75aecf85cecf85decf95febf960ebf962"
+        "eafa63eafa65eafa66e9fb68e9fb69e8fb6be8fc6ce7fc6ee7fc6fe7fd71e6fd72e6fe74e5fe75e5fe77e4ff78e4ff7a"
+    ),
+    "YlGn": (
+        "ffffe5ffffe4feffe2feffe1feffdffeffdefdfeddfdfedbfdfedafdfed9fcfed7fcfed6fcfed4fcfed3fbfed2fbfed0"
+        "fbfdcffbfdcefafdccfafdcbfafdc9fafdc8f9fdc7f9fdc5f9fdc4f9fdc2f8fdc1f8fcc0f8fcbef8fcbdf7fcbcf7fcba"
+        "f7fcb9f6fcb8f5fbb8f4fbb7f3fab6f2fab5f1fab5f0f9b4eff9b3eef9b3edf8b2edf8b1ecf7b1ebf7b0eaf7afe9f6af"
+        "e8f6aee7f6ade6f5ace5f5ace4f4abe3f4aae2f4aae1f3a9e0f3a8dff3a8def2a7ddf2a6ddf1a6dcf1a5dbf1a4daf0a4"
+        "d9f0a3d7efa2d6efa2d5eea1d3eda0d2eda0d0ec9fcfec9eceeb9eccea9dcbea9cc9e99cc8e99bc7e89ac5e89ac4e799"
+        "c3e698c1e698c0e597bee596bde496bce395bae394b9e294b8e293b6e192b5e092b3e091b2df90b1df90afde8faedd8e"
+        "acdd8eabdc8da9db8ca7db8ca6da8ba4d98aa2d88aa1d8899fd7889dd6889cd6879ad58798d48697d38595d38593d284"
+        "92d18390d0838ed0828dcf818bce8189ce8088cd7f86cc7f84cb7e83cb7d81ca7d7fc97c7ec97b7cc87b7ac77a79c679"
+        "77c67975c57874c47772c37670c2756fc1746dc0736bc07269bf7268be7166bd7064bc6f62bb6e61bb6d5fba6c5db96b"
+        "5cb86b5ab76a58b66956b56855b56753b46651b3654fb2644eb1634cb0634ab06249af6147ae6045ad5f43ac5e42ab5d"
+        "40aa5c3fa95c3fa85b3ea75a3da5593ca4583ba3583aa25739a056389f55379e54369d54359c53349a52339951329850"
+        "31974f30954f2f944e2f934d2e924c2d914b2c8f4b2b8e4a2a8d49298c48288a47278946268846258745248644238443"
+        "2283432182422082421f81421e80411d7f411c7e401a7d40197c40187b3f177b3f167a3f15793e14783e13773d12763d"
+        "11753d10743c0e743c0d733c0c723b0b713b0a703a096f3a086e3a076d39066d39056c39036b38026a38016937006837"
+        "006737006636006536006435006335006234006034005f34005e33005d33005c32005b32005a31005931005830005730"
+        "00553000542f00532f00522e00512e00502d004f2d004e2d004d2c004c2c004a2b00492b00482a00472a004629004529"
+    ),
+    "YlGnBu": (
+        "ffffd9feffd8feffd6fdfed5fdfed4fcfed3fcfed1fbfdd0fafdcffafdcef9fdccf9fdcbf8fccaf8fcc9f7fcc7f7fcc6"
+        "f6fbc5f5fbc4f5fbc2f4fbc1f4fbc0f3fabff3fabdf2fabcf1fabbf1fabaf0f9b8f0f9b7eff9b6eff9b5eef8b3edf8b2"
+        "edf8b1ecf7b1eaf7b1e9f7b1e8f6b1e7f6b1e6f5b2e5f5b2e3f4b2e2f4b2e1f3b2e0f3b2dff2b2ddf2b2dcf1b2dbf1b2"
+        "daf0b3d9f0b3d7efb3d6efb3d5efb3d4eeb3d3eeb3d1edb3d0edb3cfecb3ceecb3cdebb4cbebb4caeab4c9eab4c8e9b4"
+        "c6e9b4c4e8b4c2e7b4c0e6b5bde5b5bbe4b5b9e4b5b7e3b6b4e2b6b2e1b6b0e0b6aedfb6abdeb7a9ddb7a7dcb7a5dcb7"
+        "a2dbb8a0dab89ed9b89cd8b899d7b897d6b995d5b992d5b990d4b98ed3ba8cd2ba89d1ba87d0ba85cfba83cebb80cebb"
+        "7ecdbb7cccbb7acbbc78cbbc76cabc75c9bd73c8bd71c8bd6fc7bd6dc6be6bc6be69c5be67c4be65c3bf63c3bf61c2bf"
+        "5fc1c05dc0c05bc0c059bfc057bec155bec153bdc152bcc250bbc24ebbc24cbac24ab9c348b9c346b8c344b7c442b6c4"
+        "40b5c43fb4c43eb3c43db2c43cb1c33bb0c33aaec339adc337acc336abc335aac334a9c333a7c232a6c231a5c22fa4c2"
+        "2ea3c22da2c22ca1c22b9fc22a9ec1299dc1289cc1269bc1259ac12498c12397c12296c12195c02094c01f93c01d91c0"
+        "1d90c01d8ebf1d8dbe1e8bbd1e8abd1e88bc1e86bb1e85ba1e83ba1f82b91f80b81f7eb71f7db61f7bb61f7ab51f78b4"
+        "2076b32075b32073b22072b12070b0206eb0216daf216bae216aad2168ad2166ac2165ab2163aa2262aa2260a9225ea8"
+        "225da8225ca7225aa62259a62258a52356a42355a42354a32352a32351a22350a1234fa1234da0234c9f234b9f23499e"
+        "24489d24479d24459c24449c24439b24419a24409a243f99243d98243c98253b97253997253896253795253595253494"
+        "24339223339022328f21318d21308b2030891f2f871e2e851d2e831c2d811b2c801a2b7e192b7c182a7a172978172976"
+        "16287415277214267013266f12256d11246b1023690f23670e22650d21630d21610c20600b1f5e0a1e5c091e5a081d58"
+    ),
+    "YlGnBu_r": (
+        "081d58091e5a0a1e5c0b1f5e0c20600d21610d21630e22650f236710236911246b12256d13266f142670152772162874"
+        "172976172978182a7a192b7c1a2b7e1b2c801c2d811d2e831e2e851f2f8720308921308b21318d22328f233390243392"
+        "253494253595253795253896253997253b97243c98243d98243f9924409a24419a24439b24449c24459c24479d24489d"
+        "23499e234b9f234c9f234da0234fa12350a12351a22352a32354a32355a42356a42258a52259a6225aa6225ca7225da8"
+        "225ea82260a92262aa2163aa2165ab2166ac2168ad216aad216bae216daf206eb02070b02072b12073b22075b32076b3"
+        "1f78b41f7ab51f7bb61f7db61f7eb71f80b81f82b91e83ba1e85ba1e86bb1e88bc1e8abd1e8bbd1d8dbe1d8ebf1d90c0"
+        "1d91c01f93c02094c02195c02296c12397c12498c1259ac1269bc1289cc1299dc12a9ec12b9fc22ca1c22da2c22ea3c2"
+        "2fa4c231a5c232a6c233a7c234a9c335aac336abc337acc339adc33aaec33bb0c33cb1c33db2c43eb3c43fb4c440b5c4"
+        "42b6c444b7c446b8c348b9c34ab9c34cbac24ebbc250bbc252bcc253bdc155bec157bec159bfc05bc0c05dc0c05fc1c0"
+        "61c2bf63c3bf65c3bf67c4be69c5be6bc6be6dc6be6fc7bd71c8bd73c8bd75c9bd76cabc78cbbc7acbbc7cccbb7ecdbb"
+        "80cebb83cebb85cfba87d0ba89d1ba8cd2ba8ed3ba90d4b992d5b995d5b997d6b999d7b89cd8b89ed9b8a0dab8a2dbb8"
+        "a5dcb7a7dcb7a9ddb7abdeb7aedfb6b0e0b6b2e1b6b4e2b6b7e3b6b9e4b5bbe4b5bde5b5c0e6b5c2e7b4c4e8b4c6e9b4"
+        "c8e9b4c9eab4caeab4cbebb4cdebb4ceecb3cfecb3d0edb3d1edb3d3eeb3d4eeb3d5efb3d6efb3d7efb3d9f0b3daf0b3"
+        "dbf1b2dcf1b2ddf2b2dff2b2e0f3b2e1f3b2e2f4b2e3f4b2e5f5b2e6f5b2e7f6b1e8f6b1e9f7b1eaf7b1ecf7b1edf8b1"
+        "edf8b2eef8b3eff9b5eff9b6f0f9b7f0f9b8f1fabaf1fabbf2fabcf3fabdf3fabff4fbc0f4fbc1f5fbc2f5fbc4f6fbc5"
+        "f7fcc6f7fcc7f8fcc9f8fccaf9fdcbf9fdccfafdcefafdcffbfdd0fcfed1fcfed3fdfed4fdfed5feffd6feffd8ffffd9"
+    ),
+    "YlGn_r": (
+        "00452900462900472a00482a00492b004a2b004c2c004d2c004e2d004f2d00502d00512e00522e00532f00542f005530"
+        "005730005830005931005a31005b32005c32005d33005e33005f34006034006234006335006435006536006636006737"
+        "006837016937026a38036b38056c39066d39076d39086e3a096f3a0a703a0b713b0c723b0d733c0e743c10743c11753d"
+        "12763d13773d14783e15793e167a3f177b3f187b3f197c401a7d401c7e401d7f411e80411f8142208242218242228343"
+        "238443248644258745268846278946288a47298c482a8d492b8e4a2c8f4b2d914b2e924c2f934d2f944e30954f31974f"
+        "329850339951349a52359c53369d54379e54389f5539a0563aa2573ba3583ca4583da5593ea75a3fa85b3fa95c40aa5c"
+        "42ab5d43ac5e45ad5f47ae6049af614ab0624cb0634eb1634fb26451b36553b46655b56756b56858b6695ab76a5cb86b"
+        "5db96b5fba6c61bb6d62bb6e64bc6f66bd7068be7169bf726bc0726dc0736fc17470c27572c37674c47775c57877c679"
+        "79c6797ac77a7cc87b7ec97b7fc97c81ca7d83cb7d84cb7e86cc7f88cd7f89ce808bce818dcf818ed08290d08392d183"
+        "93d28495d38597d38598d4869ad5879cd6879dd6889fd788a1d889a2d88aa4d98aa6da8ba7db8ca9db8cabdc8dacdd8e"
+        "aedd8eafde8fb1df90b2df90b3e091b5e092b6e192b8e293b9e294bae394bce395bde496bee596c0e597c1e698c3e698"
+        "c4e799c5e89ac7e89ac8e99bc9e99ccbea9cccea9dceeb9ecfec9ed0ec9fd2eda0d3eda0d5eea1d6efa2d7efa2d9f0a3"
+        "daf0a4dbf1a4dcf1a5ddf1a6ddf2a6def2a7dff3a8e0f3a8e1f3a9e2f4aae3f4aae4f4abe5f5ace6f5ace7f6ade8f6ae"
+        "e9f6afeaf7afebf7b0ecf7b1edf8b1edf8b2eef9b3eff9b3f0f9b4f1fab5f2fab5f3fab6f4fbb7f5fbb8f6fcb8f7fcb9"
+        "f7fcbaf7fcbcf8fcbdf8fcbef8fcc0f8fdc1f9fdc2f9fdc4f9fdc5f9fdc7fafdc8fafdc9fafdcbfafdccfbfdcefbfdcf"
+        "fbfed0fbfed2fcfed3fcfed4fcfed6fcfed7fdfed9fdfedafdfedbfdfeddfeffdefeffdffeffe1feffe2ffffe4ffffe5"
+    ),
+    "YlOrBr": (
+        "ffffe5ffffe4fffee2fffee1fffee0fffedffffdddfffddcfffddbfffdd9fffcd8fffcd7fffcd6fffcd4fffbd3fffbd2"
+        "fffbd0fffbcffffacefffacdfffacbfffacafff9c9fff9c7fff9c6fff9c5fff8c4fff8c2fff8c1fff8c0fff7befff7bd"
+        "fff7bcfff6bafff6b9fff5b8fff4b6fff4b5fff3b4fff3b2fff2b1fff1b0fff1aefff0adffefacffefaaffeea9ffeea8"
+        "feeda6feeca5feeca4feeba2feeaa1feeaa0fee99efee89dfee89bfee79afee799fee697fee596fee595fee493fee392"
+        "fee390fee28efee18cfee08afedf88fede86fedd84fedc82fedb80feda7efed97cfed87afed778fed676fed573fed471"
+        "fed36ffed26dfed16bfed069fecf67fece65fecd63fecc61fecb5ffeca5dfec95bfec859fec857fec754fec652fec550"
+        "fec34ffec24dfec14cfebf4bfebe4afebd49febb47feba46feb945feb744feb643feb541feb340feb23ffeb13efeaf3d"
+        "feae3bfead3afeab39feaa38fea937fea736fea634fea433fea332fea231fea030fe9f2efe9e2dfe9c2cfe9b2bfe9a2a"
+        "fe9829fd9728fd9627fc9427fb9326fb9225fa9125fa8f24f98e23f98d23f88b22f88a21f78921f68820f6861ff5851f"
+        "f5841ef4821df4811df3801cf27f1bf27d1bf17c1af17b1af07919f07818ef7718ee7617ee7416ed7316ed7215ec7014"
+        "eb6f14ea6e13e96d13e86c12e76b11e66a11e56910e46710e3660fe2650fe1640ee0630ddf620dde610cdd5f0cdc5e0b"
+        "db5d0bda5c0ad95b09d85a09d75908d65808d55607d45507d35406d25306d15205d05104cf5004ce4f03cd4d03cc4c02"
+        "cb4b02c94b02c84a02c64902c44802c34802c14702c04602be4503bc4503bb4403b94303b84203b64203b44103b34003"
+        "b13f03b03f03ae3e03ac3d03ab3c03a93c03a83b03a63a03a43904a33904a13804a037049e36049c36049b3504993404"
+        "9834049633049433049332049132049031048e31048c30048b3005892f05882f05862e05842e05832d05812d05802d05"
+        "7e2c057c2c057b2b05792b05782a05762a057429057329057128067028066e27066c27066b2606692606682506662506"
+    ),
+    "YlOrBr_r": (
+        "6625066825066926066b26066c27066e2706702806712806732905742905762a05782a05792b057b2b057c2c057e2c05"
+        "802d05812d05832d05842e05862e05882f05892f058b30058c30048e3104903104913204933204943304963304983404"
+        "9934049b35049c36049e3604a03704a13804a33904a43904a63a03a83b03a93c03ab3c03ac3d03ae3e03b03f03b13f03"
+        "b34003b44103b64203b84203b94303bb4403bc4503be4503c04602c14702c34802c44802c64902c84a02c94b02cb4b02"
+        "cc4c02cd4d03ce4f03cf5004d05104d15205d25306d35406d45507d55607d65808d75908d85a09d95b09da5c0adb5d0b"
+        "dc5e0bdd5f0cde610cdf620de0630de1640ee2650fe3660fe46710e56910e66a11e76b11e86c12e96d13ea6e13eb6f14"
+        "ec7014ed7215ed7316ee7416ee7617ef7718f07818f07919f17b1af17c1af27d1bf27f1bf3801cf4811df4821df5841e"
+        "f5851ff6861ff68820f78921f88a21f88b22f98d23f98e23fa8f24fa9125fb9225fb9326fc9427fd9627fd9728fe9829"
+        "fe9a2afe9b2bfe9c2cfe9e2dfe9f2efea030fea231fea332fea433fea634fea736fea937feaa38feab39fead3afeae3b"
+        "feaf3dfeb13efeb23ffeb340feb541feb643feb744feb945feba46febb47febd49febe4afebf4bfec14cfec24dfec34f"
+        "fec550fec652fec754fec857fec859fec95bfeca5dfecb5ffecc61fecd63fece65fecf67fed069fed16bfed26dfed36f"
+        "fed471fed573fed676fed778fed87afed97cfeda7efedb80fedc82fedd84fede86fedf88fee08afee18cfee28efee390"
+        "fee392fee493fee595fee596fee697fee799fee79afee89bfee89dfee99efeeaa0feeaa1feeba2feeca4feeca5feeda6"
+        "ffeea8ffeea9ffefaaffefacfff0adfff1aefff1b0fff2b1fff3b2fff3b4fff4b5fff4b6fff5b8fff6b9fff6bafff7bc"
+        "fff7bdfff7befff8c0fff8c1fff8c2fff8c4fff9c5fff9c6fff9c7fff9c9fffacafffacbfffacdfffacefffbcffffbd0"
+        "fffbd2fffbd3fffcd4fffcd6fffcd7fffcd8fffdd9fffddbfffddcfffdddfffedffffee0fffee1fffee2ffffe4ffffe5"
+    ),
+    "YlOrRd": (
+        "ffffccfffecbfffec9fffdc8fffdc6fffcc5fffcc4fffbc2fffac1fffac0fff9befff9bdfff8bbfff8bafff7b9fff7b7"
+        "fff6b6fff5b5fff5b3fff4b2fff4b0fff3affff3aefff2acfff1abfff1a9fff0a8fff0a7ffefa5ffefa4ffeea3ffeda1"
+        "ffeda0ffec9fffec9dffeb9cffea9bffea99ffe998ffe997ffe895ffe794ffe793ffe691ffe590ffe58fffe48dffe48c"
+        "fee38bfee289fee288fee187fee085fee084fedf83fede82fede80fedd7ffedd7efedc7cfedb7bfedb7afeda78fed977"
+        "fed976fed774fed673fed572fed470fed36ffed16efed06cfecf6bfece6afecc68fecb67feca66fec965fec863fec662"
+        "fec561fec45ffec35efec15dfec05bfebf5afebe59febd57febb56feba55feb953feb852feb651feb54ffeb44efeb34d"
+        "feb24cfeb04bfeaf4bfeae4afead4afeac49feab49fea948fea848fea747fea647fea546fea446fea245fea145fea044"
+        "fd9f44fd9e43fd9d43fd9c42fd9a42fd9941fd9841fd9740fd9640fd953ffd933ffd923efd913efd903dfd8f3dfd8e3c"
+        "fd8c3cfd8a3bfd883bfd863afd8439fd8239fd8038fd7e38fd7c37fd7a37fd7836fd7636fd7435fd7234fd7034fd6e33"
+        "fc6c33fc6a32fc6832fc6631fc6430fc6330fc612ffc5f2ffc5d2efc5b2efc592dfc572cfc552cfc532bfc512bfc4f2a"
+        "fc4d2afb4b29fa4a29f94828f84628f84528f74327f64227f54026f43e26f43d25f33b25f23924f13824f13624f03523"
+        "ef3323ee3122ed3022ed2e21ec2c21eb2b21ea2920e92720e9261fe8241fe7231ee6211ee61f1de51e1de41c1de31a1c"
+        "e2191ce1191de0181ddf171ddd161ddc151edb141eda141ed9131fd7121fd6111fd51020d41020d30f20d10e21d00d21"
+        "cf0c21ce0c22cd0b22cb0a22ca0923c90823c80723c70723c50624c40524c30424c20325c10325c00225be0126bd0026"
+        "bb0026b90026b70026b60026b40026b20026b00026ae0026ac0026aa0026a80026a60026a40026a20026a100269f0026"
+        "9d00269b00269900269700269500269300269100268f00268d00268b00268a0026880026860026840026820026800026"
+    ),
+    "YlOrRd_r": (
+        "8000268200268400268600268800268a00268b00268d00268f00269100269300269500269700269900269b00269d0026"
+        "9f0026a10026a20026a40026a60026a80026aa0026ac0026ae0026b00026b20026b40026b60026b70026b90026bb0026"
+        "bd0026be0126c00225c10325c20325c30424c40524c50624c70723c80723c90823ca0923cb0a22cd0b22ce0c22cf0c21"
+        "d00d21d10e21d30f20d41020d51020d6111fd7121fd9131fda141edb141edc151edd161ddf171de0181de1191de2191c"
+        "e31a1ce41c1de51e1de61f1de6211ee7231ee8241fe9261fe92720ea2920eb2b21ec2c21ed2e21ed3022ee3122ef3323"
+        "f03523f13624f13824f23924f33b25f43d25f43e26f54026f64227f74327f84528f84628f94828fa4a29fb4b29fc4d2a"
+        "fc4f2afc512bfc532bfc552cfc572cfc592dfc5b2efc5d2efc5f2ffc612ffc6330fc6430fc6631fc6832fc6a32fc6c33"
+        "fd6e33fd7034fd7234fd7435fd7636fd7836fd7a37fd7c37fd7e38fd8038fd8239fd8439fd863afd883bfd8a3bfd8c3c"
+        "fd8e3cfd8f3dfd903dfd913efd923efd933ffd953ffd9640fd9740fd9841fd9941fd9a42fd9c42fd9d43fd9e43fd9f44"
+        "fea044fea145fea245fea446fea546fea647fea747fea848fea948feab49feac49fead4afeae4afeaf4bfeb04bfeb24c"
+        "feb34dfeb44efeb54ffeb651feb852feb953feba55febb56febd57febe59febf5afec05bfec15dfec35efec45ffec561"
+        "fec662fec863fec965feca66fecb67fecc68fece6afecf6bfed06cfed16efed36ffed470fed572fed673fed774fed976"
+        "fed977feda78fedb7afedb7bfedc7cfedd7efedd7ffede80fede82fedf83fee084fee085fee187fee288fee289fee38b"
+        "ffe48cffe48dffe58fffe590ffe691ffe793ffe794ffe895ffe997ffe998ffea99ffea9bffeb9cffec9dffec9fffeda0"
+        "ffeda1ffeea3ffefa4ffefa5fff0a7fff0a8fff1a9fff1abfff2acfff3aefff3affff4b0fff4b2fff5b3fff5b5fff6b6"
+        "fff7b7fff7b9fff8bafff8bbfff9bdfff9befffac0fffac1fffbc2fffcc4fffcc5fffdc6fffdc8fffec9fffecbffffcc"
+    ),
+    "afmhot": (
+        "0000000200000400000600000800000a00000c00000e00001000001200001400001600001800001a00001c00001e0000"
+        "2000002200002400002600002800002a00002c00002e00003000003200003400003600003800003a00003c00003e0000"
+        "4000004200004400004600004800004a00004c00004e00005000005200005400005600005800005a00005c00005e0000"
+        "6000006200006400006600006800006a00006c00006e00007000007200007400007600007800007a00007c00007e0000"
+        "8000008202008404008607008808008a0a008c0d008e0f009010009212009414009617009818009a1a009c1d009e1f00"
+        "a02000a22200a42400a62700a82800aa2a00ac2d00ae2f00b03000b23200b43400b63700b83800ba3a00bc3d00be3f00"
+        "c04000c24200c44400c64600c84800ca4a00cc4d00ce4e00d05000d25200d45400d65600d85800da5a00dc5d00de5e00"
+        "e06000e26200e46400e66600e86800ea6a00ec6d00ee6e00f07000f27200f47400f67600f87800fa7a00fc7d00fe7e00"
+        "ff8001ff8203ff8405ff8607ff8809ff8b0bff8c0dff8e0fff9011ff9213ff9415ff9617ff9919ff9b1bff9c1dff9e1f"
+        "ffa021ffa223ffa425ffa627ffa829ffab2bffac2dffae2fffb031ffb233ffb435ffb637ffb939ffbb3bffbc3dffbe3f"
+        "ffc041ffc243ffc445ffc647ffc849ffcb4bffcc4dffce4fffd051ffd253ffd455ffd657ffd959ffdb5bffdc5dffde5f"
+        "ffe061ffe263ffe465ffe667ffe869ffeb6bffec6dffee6ffff071fff273fff475fff677fff979fffb7bfffc7dfffe7f"
+        "ffff81ffff83ffff85ffff87ffff89ffff8bffff8dffff8fffff91ffff93ffff95ffff97ffff99ffff9bffff9dffff9f"
+        "ffffa1ffffa3ffffa5ffffa7ffffa9ffffabffffadffffafffffb1ffffb3ffffb5ffffb7ffffb9ffffbbffffbdffffbf"
+        "ffffc1ffffc3ffffc5ffffc7ffffc9ffffcbffffcdffffcfffffd1ffffd3ffffd5ffffd7ffffd9ffffdbffffddffffdf"
+        "ffffe1ffffe3ffffe5ffffe7ffffe9ffffebffffedffffeffffff1fffff3fffff5fffff7fffff9fffffbfffffdffffff"
+    ),
+    "afmhot_r": (
+        "fffffffffffdfffffbfffff9fffff7fffff5fffff3fffff1ffffefffffedffffebffffe9ffffe7ffffe5ffffe3ffffe1"
+        "ffffdfffffddffffdbffffd9ffffd7ffffd5ffffd3ffffd1ffffcfffffcdffffcbffffc9ffffc7ffffc5ffffc3ffffc1"
+        "ffffbfffffbdffffbbffffb9ffffb7ffffb5ffffb3ffffb1ffffafffffadffffabffffa9ffffa7ffffa5ffffa3ffffa1"
+        "ffff9fffff9dffff9bffff99ffff97ffff95ffff93ffff91ffff8fffff8dffff8bffff89ffff87ffff85ffff83ffff81"
+        "fffe7ffffc7dfffb7bfff979fff777fff575fff273fff071ffee6fffec6dffeb6bffe869ffe667ffe465ffe263ffe061"
+        "ffde5fffdc5dffdb5bffd959ffd757ffd555ffd253ffd051ffce4fffcc4dffcb4bffc849ffc647ffc445ffc243ffc041"
+        "ffbe3fffbc3dffbb3bffb939ffb737ffb535ffb233ffb031ffae2fffac2dffab2bffa829ffa627ffa425ffa223ffa021"
+        "ff9e1fff9c1dff9b1bff9919ff9717ff9515ff9213ff9011ff8e0fff8c0dff8b0bff8809ff8607ff8405ff8203ff8001"
+        "fe7e00fc7d00fa7b00f87900f67700f47400f27200f07000ee6e00ec6d00ea6b00e86900e66600e46400e26200e06000"
+        "de5e00dc5d00da5b00d85900d65700d45400d25200d05000ce4e00cc4d00ca4b00c84900c64600c44400c24200c04000"
+        "be3f00bc3d00ba3b00b83900b63700b43400b23200b03000ae2f00ac2d00aa2b00a82900a62600a42400a22200a02000"
+        "9e1f009c1d009a1b009819009617009414009212009010008e0f008c0d008a0b00880900860600840400820200800000"
+        "7e00007c00007a00007800007600007400007200007000006e00006c00006a0000680000660000640000620000600000"
+        "5e00005c00005a00005800005600005400005200005000004e00004c00004a0000480000460000440000420000400000"
+        "3e00003c00003a00003800003600003400003200003000002e00002c00002a0000280000260000240000220000200000"
+        "1e00001c00001a00001800001600001400001200001000000e00000c00000a0000080000060000040000020000000000"
+    ),
+    "autumn": (
+        "ff0000ff0100ff0200ff0300ff0400ff0500ff0600ff0700ff0800ff0900ff0a00ff0b00ff0c00ff0d00ff0e00ff0f00"
+        "ff1000ff1100ff1200ff1300ff1400ff1500ff1600ff1700ff1800ff1900ff1a00ff1b00ff1c00ff1d00ff1e00ff1f00"
+        "ff2000ff2100ff2200ff2300ff2400ff2500ff2600ff2700ff2800ff2900ff2a00ff2b00ff2c00ff2d00ff2e00ff2f00"
+        "ff3000ff3100ff3200ff3300ff3400ff3500ff3600ff3700ff3800ff3900ff3a00ff3b00ff3c00ff3d00ff3e00ff3f00"
+        "ff4000ff4100ff4200ff4300ff4400ff4500ff4600ff4700ff4800ff4900ff4a00ff4b00ff4c00ff4d00ff4e00ff4f00"
+        "ff5000ff5100ff5200ff5300ff5400ff5500ff5600ff5700ff5800ff5900ff5a00ff5b00ff5c00ff5d00ff5e00ff5f00"
+        "ff6000ff6100ff6200ff6300ff6400ff6500ff6600ff6700ff6800ff6900ff6a00ff6b00ff6c00ff6d00ff6e00ff6f00"
+        "ff7000ff7100ff7200ff7300ff7400ff7500ff7600ff7700ff7800ff7900ff7a00ff7b00ff7c00ff7d00ff7e00ff7f00"
+        "ff8000ff8100ff8200ff8300ff8400ff8500ff8600ff8700ff8800ff8900ff8a00ff8b00ff8c00ff8d00ff8e00ff8f00"
+        "ff9000ff9100ff9200ff9300ff9400ff9500ff9600ff9700ff9800ff9900ff9a00ff9b00ff9c00ff9d00ff9e00ff9f00"
+        "ffa000ffa100ffa200ffa300ffa400ffa500ffa600ffa700ffa800ffa900ffaa00ffab00ffac00ffad00ffae00ffaf00"
+        "ffb000ffb100ffb200ffb300ffb400ffb500ffb600ffb700ffb800ffb900ffba00ffbb00ffbc00ffbd00ffbe00ffbf00"
+        "ffc000ffc100ffc200ffc300ffc400ffc500ffc600ffc700ffc800ffc900ffca00ffcb00ffcc00ffcd00ffce00ffcf00"
+        "ffd000ffd100ffd200ffd300ffd400ffd500ffd600ffd700ffd800ffd900ffda00ffdb00ffdc00ffdd00ffde00ffdf00"
+        "ffe000ffe100ffe200ffe300ffe400ffe500ffe600ffe700ffe800ffe900ffea00ffeb00ffec00ffed00ffee00ffef00"
+        "fff000fff100fff200fff300fff400fff500fff600fff700fff800fff900fffa00fffb00fffc00fffd00fffe00ffff00"
+    ),
+    "autumn_r": (
+        "ffff00fffe00fffd00fffc00fffb00fffa00fff900fff800fff700fff600fff500fff400fff300fff200fff100fff000"
+        "ffef00ffee00ffed00ffec00ffeb00ffea00ffe900ffe800ffe700ffe600ffe500ffe400ffe300ffe200ffe100ffe000"
+        "ffdf00ffde00ffdd00ffdc00ffdb00ffda00ffd900ffd800ffd700ffd600ffd500ffd400ffd300ffd200ffd100ffd000"
+        "ffcf00ffce00ffcd00ffcc00ffcb00ffca00ffc900ffc800ffc700ffc600ffc500ffc400ffc300ffc200ffc100ffc000"
+        "ffbf00ffbe00ffbd00ffbc00ffbb00ffba00ffb900ffb800ffb700ffb600ffb500ffb400ffb300ffb200ffb100ffb000"
+        "ffaf00ffae00ffad00ffac00ffab00ffaa00ffa900ffa800ffa700ffa600ffa500ffa400ffa300ffa200ffa100ffa000"
+        "ff9f00ff9e00ff9d00ff9c00ff9b00ff9a00ff9900ff9800ff9700ff9600ff9500ff9400ff9300ff9200ff9100ff9000"
+        "ff8f00ff8e00ff8d00ff8c00ff8b00ff8a00ff8900ff8800ff8700ff8600ff8500ff8400ff8300ff8200ff8100ff8000"
+        "ff7f00ff7e00ff7d00ff7c00ff7b00ff7a00ff7900ff7800ff7700ff7600ff7500ff7400ff7300ff7200ff7100ff7000"
+        "ff6f00ff6e00ff6d00ff6c00ff6b00ff6a00ff6900ff6800ff6700ff6600ff6500ff6400ff6300ff6200ff6100ff6000"
+        "ff5f00ff5e00ff5d00ff5c00ff5b00ff5a00ff5900ff5800ff5700ff5600ff5500ff5400ff5300ff5200ff5100ff5000"
+        "ff4f00ff4e00ff4d00ff4c00ff4b00ff4a00ff4900ff4800ff4700ff4600ff4500ff4400ff4300ff4200ff4100ff4000"
+        "ff3f00ff3e00ff3d00ff3c00ff3b00ff3a00ff3900ff3800ff3700ff3600ff3500ff3400ff3300ff3200ff3100ff3000"
+        "ff2f00ff2e00ff2d00ff2c00ff2b00ff2a00ff2900ff2800ff2700ff2600ff2500ff2400ff2300ff2200ff2100ff2000"
+        "ff1f00ff1e00ff1d00ff1c00ff1b00ff1a00ff1900ff1800ff1700ff1600ff1500ff1400ff1300ff1200ff1100ff1000"
+        "ff0f00ff0e00ff0d00ff0c00ff0b00ff0a00ff0900ff0800ff0700ff0600ff0500ff0400ff0300ff0200ff0100ff0000"
+    ),
+    "binary": (
+        "fffffffefefefdfdfdfcfcfcfbfbfbfafafaf9f9f9f8f8f8f7f7f7f6f6f6f5f5f5f4f4f4f3f3f3f2f2f2f1f1f1f0f0f0"
+        "efefefeeeeeeedededecececebebebeaeaeae9e9e9e8e8e8e7e7e7e6e6e6e5e5e5e4e4e4e3e3e3e2e2e2e1e1e1e0e0e0"
+        "dfdfdfdedededddddddcdcdcdbdbdbdadadad9d9d9d8d8d8d7d7d7d6d6d6d5d5d5d4d4d4d3d3d3d2d2d2d1d1d1d0d0d0"
+        "cfcfcfcecececdcdcdcccccccbcbcbcacacac9c9c9c8c8c8c7c7c7c6c6c6c5c5c5c4c4c4c3c3c3c2c2c2c1c1c1c0c0c0"
+        "bfbfbfbebebebdbdbdbcbcbcbbbbbbbababab9b9b9b8b8b8b7b7b7b6b6b6b5b5b5b4b4b4b3b3b3b2b2b2b1b1b1b0b0b0"
+        "afafafaeaeaeadadadacacacabababaaaaaaa9a9a9a8a8a8a7a7a7a6a6a6a5a5a5a4a4a4a3a3a3a2a2a2a1a1a1a0a0a0"
+        "9f9f9f9e9e9e9d9d9d9c9c9c9b9b9b9a9a9a999999989898979797969696959595949494939393929292919191909090"
+        "8f8f8f8e8e8e8d8d8d8c8c8c8b8b8b8a8a8a898989888888878787868686858585848484838383828282818181808080"
+        "7f7f7f7e7e7e7d7d7d7c7c7c7b7b7b7a7a7a797979787878777777767676757575747474737373727272717171707070"
+        "6f6f6f6e6e6e6d6d6d6c6c6c6b6b6b6a6a6a696969686868676767666666656565646464636363626262616161606060"
+        "5f5f5f5e5e5e5d5d5d5c5c5c5b5b5b5a5a5a595959585858575757565656555555545454535353525252515151505050"
+        "4f4f4f4e4e4e4d4d4d4c4c4c4b4b4b4a4a4a494949484848474747464646454545444444434343424242414141404040"
+        "3f3f3f3e3e3e3d3d3d3c3c3c3b3b3b3a3a3a393939383838373737363636353535343434333333323232313131303030"
+        "2f2f2f2e2e2e2d2d2d2c2c2c2b2b2b2a2a2a292929282828272727262626252525242424232323222222212121202020"
+        "1f1f1f1e1e1e1d1d1d1c1c1c1b1b1b1a1a1a191919181818171717161616151515141414131313121212111111101010"
+        "0f0f0f0e0e0e0d0d0d0c0c0c0b0b0b0a0a0a090909080808070707060606050505040404030303020202010101000000"
+    ),
+    "binary_r": (
+        "0000000101010202020303030404040505050606060707070808080909090a0a0a0b0b0b0c0c0c0d0d0d0e0e0e0f0f0f"
+        "1010101111111212121313131414141515151616161717171818181919191a1a1a1b1b1b1c1c1c1d1d1d1e1e1e1f1f1f"
+        "2020202121212222222323232424242525252626262727272828282929292a2a2a2b2b2b2c2c2c2d2d2d2e2e2e2f2f2f"
+        "3030303131313232323333333434343535353636363737373838383939393a3a3a3b3b3b3c3c3c3d3d3d3e3e3e3f3f3f"
+        "4040404141414242424343434444444545454646464747474848484949494a4a4a4b4b4b4c4c4c4d4d4d4e4e4e4f4f4f"
+        "5050505151515252525353535454545555555656565757575858585959595a5a5a5b5b5b5c5c5c5d5d5d5e5e5e5f5f5f"
+        "6060606161616262626363636464646565656666666767676868686969696a6a6a6b6b6b6c6c6c6d6d6d6e6e6e6f6f6f"
+        "7070707171717272727373737474747575757676767777777878787979797a7a7a7b7b7b7c7c7c7d7d7d7e7e7e7f7f7f"
+        "8080808181818282828383838484848585858686868787878888888989898a8a8a8b8b8b8c8c8c8d8d8d8e8e8e8f8f8f"
+        "9090909191919292929393939494949595959696969797979898989999999a9a9a9b9b9b9c9c9c9d9d9d9e9e9e9f9f9f"
+        "a0a0a0a1a1a1a2a2a2a3a3a3a4a4a4a5a5a5a6a6a6a7a7a7a8a8a8a9a9a9aaaaaaabababacacacadadadaeaeaeafafaf"
+        "b0b0b0b1b1b1b2b2b2b3b3b3b4b4b4b5b5b5b6b6b6b7b7b7b8b8b8b9b9b9babababbbbbbbcbcbcbdbdbdbebebebfbfbf"
+        "c0c0c0c1c1c1c2c2c2c3c3c3c4c4c4c5c5c5c6c6c6c7c7c7c8c8c8c9c9c9cacacacbcbcbcccccccdcdcdcecececfcfcf"
+        "d0d0d0d1d1d1d2d2d2d3d3d3d4d4d4d5d5d5d6d6d6d7d7d7d8d8d8d9d9d9dadadadbdbdbdcdcdcdddddddedededfdfdf"
+        "e0e0e0e1e1e1e2e2e2e3e3e3e4e4e4e5e5e5e6e6e6e7e7e7e8e8e8e9e9e9eaeaeaebebebecececedededeeeeeeefefef"
+        "f0f0f0f1f1f1f2f2f2f3f3f3f4f4f4f5f5f5f6f6f6f7f7f7f8f8f8f9f9f9fafafafbfbfbfcfcfcfdfdfdfefefeffffff"
+    ),
+    "bone": (
+        "00000001010102020203030404030504040605050706060907070a08080b09090c0a0a0d0a0a0f0b0b100c0c110d0d12"
+        "0e0e130f0f1510101611111712111812121a13131b14141c15151d16161e1717201818211818221919231a1a251b1b26"
+        "1c1c271d1d281e1e291f1f2b201f2c20202d21212e22222f232331242432252533262634262636272737282838292939"
+        "2a2a3a2b2b3c2c2c3d2d2d3e2e2d3f2e2e412f2f4230304331314432324533334734344834344935354a36364b37374d"
+        "38384e39394f3a3a503b3b523c3b533c3c543d3d553e3e563f3f5840405941415a42425b42425d43435e44445f454560"
+        "4646614747634848644949654a49664a4a674b4b694c4c6a4d4d6b4e4e6c4f4f6e50506f505070515171525372535473"
+        "545574555675565776575976575a77585b78595c795a5d7a5b5f7b5c607c5d617d5e627d5e637e5f657f606680616781"
+        "626882636983646b84656c84666d85666e86676f876871886972896a738a6b748b6c758b6c778c6d788d6e798e6f7a8f"
+        "707b90717d91727e92737f927380937481947583957684967785977886987987997a89997a8a9a7b8b9b7c8c9c7d8d9d"
+        "7e8f9e7f909f8091a08192a08194a18295a28396a38497a48598a5869aa6879ba7889ca7889da8899ea98aa0aa8ba1ab"
+        "8ca2ac8da3ad8ea4ae8fa6ae8fa7af90a8b091a9b192aab293acb394adb495aeb596afb596b0b697b2b798b3b899b4b9"
+        "9ab5ba9bb6bb9cb8bc9db9bc9dbabd9ebbbe9fbcbfa0bec0a1bfc1a2c0c2a3c1c3a4c2c3a4c4c4a5c5c5a6c6c6a7c7c7"
+        "a9c8c8aac9c9accacaadcacaaecbcbb0ccccb1cdcdb2ceceb4cfcfb5d0d0b7d1d1b8d2d1b9d2d2bbd3d3bcd4d4bdd5d5"
+        "bfd6d6c0d7d7c1d8d8c3d8d8c4d9d9c6dadac7dbdbc8dcdccaddddcbdedeccdfdfcee0dfcfe0e0d1e1e1d2e2e2d3e3e3"
+        "d5e4e4d6e5e5d7e6e6d9e6e6dae7e7dbe8e8dde9e9deeaeae0ebebe1ecece2edede4eeede5eeeee6efefe8f0f0e9f1f1"
+        "eaf2f2ecf3f3edf4f4eff4f4f0f5f5f1f6f6f3f7f7f4f8f8f5f9f9f7fafaf8fbfbfafcfbfbfcfcfcfdfdfefefeffffff"
+    ),
+    "bone_r": (
+        "fffffffefefefcfdfdfbfcfcfafcfbf8fbfbf7fafaf5f9f9f4f8f8f3f7f7f1f6f6f0f5f5eff4f4edf4f4ecf3f3eaf2f2"
+        "e9f1f1e8f0f0e6efefe5eeeee4eeede2edede1ecece0ebebdeeaeadde9e9dbe8e8dae7e7d9e6e6d7e6e6d6e5e5d5e4e4"
+        "d3e3e3d2e2e2d1e1e1cfe0e0cee0dfccdfdfcbdedecaddddc8dcdcc7dbdbc6dadac4d9d9c3d8d8c1d8d8c0d7d7bfd6d6"
+        "bdd5d5bcd4d4bbd3d3b9d2d2b8d2d1b7d1d1b5d0d0b4cfcfb2ceceb1cdcdb0ccccaecbcbadcacaaccacaaac9c9a9c8c8"
+        "a7c7c7a6c6c6a5c5c5a4c4c4a4c2c3a3c1c3a2c0c2a1bfc1a0bec09fbcbf9ebbbe9dbabd9db9bc9cb8bc9bb6bb9ab5ba"
+        "99b4b998b3b897b2b796b0b696afb595aeb594adb493acb392aab291a9b190a8b090a7af8fa6ae8ea4ae8da3ad8ca2ac"
+        "8ba1ab8aa0aa899ea9889da8889ca7879ba7869aa68598a58497a48396a38295a28294a18192a08091a07f909f7e8f9e"
+        "7d8d9d7c8c9c7b8b9b7a8a9a7a8999798799788698778597768496758395748194738093737f92727e92717d91707b90"
+        "6f7a8f6e798e6d788d6c778c6c758b6b748b6a738a697289687188676f87666e86666d85656c84646b84636983626882"
+        "6167816066805f657f5e637e5e627d5d617d5c607c5b5f7b5a5d7a595c79585b78575a77575976565776555675545574"
+        "53547352537251517150507050506f4f4f6e4e4e6c4d4d6b4c4c6a4b4b694a4a67494966494965484864474763464661"
+        "45456044445f43435e42425d42425b41415a4040593f3f583e3e563d3d553c3c543b3b533b3b523a3a5039394f38384e"
+        "37374d36364b35354a3434493434483333473232453131443030432f2f422e2e412d2d3f2d2d3e2c2c3d2b2b3c2a2a3a"
+        "29293928283827273727263626263425253324243223233122222f21212e20202d201f2c1f1f2b1e1e291d1d281c1c27"
+        "1b1b261a1a2519192318182218182117172016161e15151d14141c13131b12121a1111181111171010160f0f150e0e13"
+        "0d0d120c0c110b0b100a0a0f0a0a0d09090c08080b07070a060609050507040406030305030304020202010101000000"
+    ),
+    "brg": (
+        "0000ff0200fd0400fb0600f90800f70a00f50c00f30e00f11000ef1200ed1400eb1600e91800e71a00e51c00e31e00e1"
+        "2000df2200dd2400db2600d92800d72a00d52c00d32e00d13000cf3200cd3400cb3600c93800c73a00c53c00c33e00c1"
+        "4000bf4200bd4400bb4600b94800b74a00b54c00b34e00b15000af5200ad5400ab5600a95800a75a00a55c00a35e00a1"
+        "60009f62009d64009b6600996800976a00956c00936e009170008f72008d74008b7600897800877a00857c00837e0081"
+        "80007f82007d84007b8600798800778a00758c00738e007190006f92006d94006b9600699800679a00659c00639e0061"
+        "a0005fa2005da4005ba60059a80057aa0055ac0053ae0051b0004fb2004db4004bb60049b80047ba0045bc0043be0041"
+        "c0003fc2003dc4003bc60039c80037ca0035cc0033ce0031d0002fd2002dd4002bd60029d80027da0025dc0023de0021"
+        "e0001fe2001de4001be60019e80017ea0015ec0013ee0011f0000ff2000df4000bf60009f80007fa0005fc0003fe0001"
+        "fe0100fc0300fa0500f80700f60900f40b00f20d00f00f00ee1100ec1300ea1500e81700e61900e41b00e21d00e01f00"
+        "de2100dc2300da2500d82700d62900d42b00d22d00d02f00ce3100cc3300ca3500c83700c63900c43b00c23d00c03f00"
+        "be4100bc4300ba4500b84700b64900b44b00b24d00b04f00ae5100ac5300aa5500a85700a65900a45b00a25d00a05f00"
+        "9e61009c63009a6500986700966900946b00926d00906f008e71008c73008a7500887700867900847b00827d00807f00"
+        "7e81007c83007a8500788700768900748b00728d00708f006e91006c93006a9500689700669900649b00629d00609f00"
+        "5ea1005ca3005aa50058a70056a90054ab0052ad0050af004eb1004cb3004ab50048b70046b90044bb0042bd0040bf00"
+        "3ec1003cc3003ac50038c70036c90034cb0032cd0030cf002ed1002cd3002ad50028d70026d90024db0022dd0020df00"
+        "1ee1001ce3001ae50018e70016e90014eb0012ed0010ef000ef1000cf3000af50008f70006f90004fb0002fd0000ff00"
+    ),
+    "brg_r": (
+        "00ff0002fd0004fb0006f90008f7000af5000cf3000ef10010ef0012ed0014eb0016e90018e7001ae5001ce3001ee100"
+        "20df0022dd0024db0026d90028d7002ad5002cd3002ed10030cf0032cd0034cb0036c90038c7003ac5003cc3003ec100"
+        "40bf0042bd0044bb0046b90048b7004ab5004cb3004eb10050af0052ad0054ab0056a90058a7005aa5005ca3005ea100"
+        "609f00629d00649b006699006897006a95006c93006e9100708f00728d00748b007689007887007a85007c83007e8100"
+        "807f00827d00847b008679008877008a75008c73008e7100906f00926d00946b009669009867009a65009c63009e6100"
+        "a05f00a25d00a45b00a65900a85700aa5500ac5300ae5100b04f00b24d00b44b00b64900b84700ba4500bc4300be4100"
+        "c03f00c23d00c43b00c63900c83700ca3500cc3300ce3100d02f00d22d00d42b00d62900d82700da2500dc2300de2100"
+        "e01f00e21d00e41b00e61900e81700ea1500ec1300ee1100f00f00f20d00f40b00f60900f80700fa0500fc0300fe0100"
+        "fe0001fc0003fa0005f80007f60009f4000bf2000df0000fee0011ec0013ea0015e80017e60019e4001be2001de0001f"
+        "de0021dc0023da0025d80027d60029d4002bd2002dd0002fce0031cc0033ca0035c80037c60039c4003bc2003dc0003f"
+        "be0041bc0043ba0045b80047b60049b4004bb2004db0004fae0051ac0053aa0055a80057a60059a4005ba2005da0005f"
+        "9e00619c00639a006598006796006994006b92006d90006f8e00718c00738a007588007786007984007b82007d80007f"
+        "7e00817c00837a008578008776008974008b72008d70008f6e00916c00936a009568009766009964009b62009d60009f"
+        "5e00a15c00a35a00a55800a75600a95400ab5200ad5000af4e00b14c00b34a00b54800b74600b94400bb4200bd4000bf"
+        "3e00c13c00c33a00c53800c73600c93400cb3200cd3000cf2e00d12c00d32a00d52800d72600d92400db2200dd2000df"
+        "1e00e11c00e31a00e51800e71600e91400eb1200ed1000ef0e00f10c00f30a00f50800f70600f90400fb0200fd0000ff"
+    ),
+    "bwr": (
+        "0000ff0202ff0404ff0606ff0808ff0a0aff0c0cff0e0eff1010ff1212ff1414ff1616ff1818ff1a1aff1c1cff1e1eff"
+        "2020ff2222ff2424ff2626ff2828ff2a2aff2c2cff2e2eff3030ff3232ff3434ff3636ff3838ff3a3aff3c3cff3e3eff"
+        "4040ff4242ff4444ff4646ff4848ff4a4aff4c4cff4e4eff5050ff5252ff5454ff5656ff5858ff5a5aff5c5cff5e5eff"
+        "6060ff6262ff6464ff6666ff6868ff6a6aff6c6cff6e6eff7070ff7272ff7474ff7676ff7878ff7a7aff7c7cff7e7eff"
+        "8080ff8282ff8484ff8686ff8888ff8a8aff8c8cff8e8eff9090ff9292ff9494ff9696ff9898ff9a9aff9c9cff9e9eff"
+        "a0a0ffa2a2ffa4a4ffa6a6ffa8a8ffaaaaffacacffaeaeffb0b0ffb2b2ffb4b4ffb6b6ffb8b8ffbabaffbcbcffbebeff"
+        "c0c0ffc2c2ffc4c4ffc6c6ffc8c8ffcacaffccccffceceffd0d0ffd2d2ffd4d4ffd6d6ffd8d8ffdadaffdcdcffdedeff"
+        "e0e0ffe2e2ffe4e4ffe6e6ffe8e8ffeaeaffececffeeeefff0f0fff2f2fff4f4fff6f6fff8f8fffafafffcfcfffefeff"
+        "fffefefffcfcfffafafff8f8fff6f6fff4f4fff2f2fff0f0ffeeeeffececffeaeaffe8e8ffe6e6ffe4e4ffe2e2ffe0e0"
+        "ffdedeffdcdcffdadaffd8d8ffd6d6ffd4d4ffd2d2ffd0d0ffceceffccccffcacaffc8c8ffc6c6ffc4c4ffc2c2ffc0c0"
+        "ffbebeffbcbcffbabaffb8b8ffb6b6ffb4b4ffb2b2ffb0b0ffaeaeffacacffaaaaffa8a8ffa6a6ffa4a4ffa2a2ffa0a0"
+        "ff9e9eff9c9cff9a9aff9898ff9696ff9494ff9292ff9090ff8e8eff8c8cff8a8aff8888ff8686ff8484ff8282ff8080"
+        "ff7e7eff7c7cff7a7aff7878ff7676ff7474ff7272ff7070ff6e6eff6c6cff6a6aff6868ff6666ff6464ff6262ff6060"
+        "ff5e5eff5c5cff5a5aff5858ff5656ff5454ff5252ff5050ff4e4eff4c4cff4a4aff4848ff4646ff4444ff4242ff4040"
+        "ff3e3eff3c3cff3a3aff3838ff3636ff3434ff3232ff3030ff2e2eff2c2cff2a2aff2828ff2626ff2424ff2222ff2020"
+        "ff1e1eff1c1cff1a1aff1818ff1616ff1414ff1212ff1010ff0e0eff0c0cff0a0aff0808ff0606ff0404ff0202ff0000"
+    ),
+    "bwr_r": (
+        "ff0000ff0202ff0404ff0606ff0808ff0a0aff0c0cff0e0eff1010ff1212ff1414ff1616ff1818ff1a1aff1c1cff1e1e"
+        "ff2020ff2222ff2424ff2626ff2828ff2a2aff2c2cff2e2eff3030ff3232ff3434ff3636ff3838ff3a3aff3c3cff3e3e"
+        "ff4040ff4242ff4444ff4646ff4848ff4a4aff4c4cff4e4eff5050ff5252ff5454ff5656ff5858ff5a5aff5c5cff5e5e"
+        "ff6060ff6262ff6464ff6666ff6868ff6a6aff6c6cff6e6eff7070ff7272ff7474ff7676ff7878ff7a7aff7c7cff7e7e"
+        "ff8080ff8282ff8484ff8686ff8888ff8a8aff8c8cff8e8eff9090ff9292ff9494ff9696ff9898ff9a9aff9c9cff9e9e"
+        "ffa0a0ffa2a2ffa4a4ffa6a6ffa8a8ffaaaaffacacffaeaeffb0b0ffb2b2ffb4b4ffb6b6ffb8b8ffbabaffbcbcffbebe"
+        "ffc0c0ffc2c2ffc4c4ffc6c6ffc8c8ffcacaffccccffceceffd0d0ffd2d2ffd4d4ffd6d6ffd8d8ffdadaffdcdcffdede"
+        "ffe0e0ffe2e2ffe4e4ffe6e6ffe8e8ffeaeaffececffeeeefff0f0fff2f2fff4f4fff6f6fff8f8fffafafffcfcfffefe"
+        "fefefffcfcfffafafff8f8fff6f6fff4f4fff2f2fff0f0ffeeeeffececffeaeaffe8e8ffe6e6ffe4e4ffe2e2ffe0e0ff"
+        "dedeffdcdcffdadaffd8d8ffd6d6ffd4d4ffd2d2ffd0d0ffceceffccccffcacaffc8c8ffc6c6ffc4c4ffc2c2ffc0c0ff"
+        "bebeffbcbcffbabaffb8b8ffb6b6ffb4b4ffb2b2ffb0b0ffaeaeffacacffaaaaffa8a8ffa6a6ffa4a4ffa2a2ffa0a0ff"
+        "9e9eff9c9cff9a9aff9898ff9696ff9494ff9292ff9090ff8e8eff8c8cff8a8aff8888ff8686ff8484ff8282ff8080ff"
+        "7e7eff7c7cff7a7aff7878ff7676ff7474ff7272ff7070ff6e6eff6c6cff6a6aff6868ff6666ff6464ff6262ff6060ff"
+        "5e5eff5c5cff5a5aff5858ff5656ff5454ff5252ff5050ff4e4eff4c4cff4a4aff4848ff4646ff4444ff4242ff4040ff"
+        "3e3eff3c3cff3a3aff3838ff3636ff3434ff3232ff3030ff2e2eff2c2cff2a2aff2828ff2626ff2424ff2222ff2020ff"
+        "1e1eff1c1cff1a1aff1818ff1616ff1414ff1212ff1010ff0e0eff0c0cff0a0aff0808ff0606ff0404ff0202ff0000ff"
+    ),
+    "cividis": (
+        "00224e00234f00245100255300255400265600275800285900285b00295d002a5f002a61002b62002c64002c66002d68"
+        "002e6a002e6c002f6d00306f0030700031700031710132710533710833700c34700f357012357014367016377018376f"
+        "1a386f1c396f1e3a6f203a6f213b6e233c6e243c6e263d6e273e6e293f6e2a3f6d2b406d2d416d2e416d2f426d31436d"
+        "32436d33446d34456c35456c36466c38476c39486c3a486c3b496c3c4a6c3d4a6c3e4b6c3f4c6c404c6c414d6c424e6c"
+        "434e6c444f6c45506c46516c47516c48526c49536c4a536c4b546c4c556c4d556c4e566c4f576c50576c51586d52596d"
+        "535a6d545a6d555b6d555c6d565c6d575d6d585e6d595e6e5a5f6e5b606e5c616e5d616e5e626e5e636f5f636f60646f"
+        "61656f62656f636670646770656870656870666970676a71686a71696b716a6c716b6d726c6d726c6e726d6f726e6f73"
+        "6f70737071737172747272747273747374757474757575757676767777767777777878777979777a7a787b7a787c7b78"
+        "7d7c787e7c787e7d787f7e78807f78817f788280798381798482798582798683798784788885788985788a86788b8778"
+        "8c88788d88788e89788f8a78908b78918b78928c78928d78938e78948e77958f779690779791779892779992779a9376"
+        "9b94769c95769d95769e96769f9775a09875a19975a29975a39a74a49b74a59c74a69c74a79d73a89e73a99f73aaa073"
+        "aba072aca172ada272aea371afa471b0a571b1a570b3a670b4a76fb5a86fb6a96fb7a96eb8aa6eb9ab6dbaac6dbbad6d"
+        "bcae6cbdae6cbeaf6bbfb06bc0b16ac1b26ac2b369c3b369c4b468c5b568c6b667c7b767c8b866c9b965cbb965ccba64"
+        "cdbb63cebc63cfbd62d0be62d1bf61d2c060d3c05fd4c15fd5c25ed6c35dd7c45cd9c55cdac65bdbc75adcc859ddc858"
+        "dec958dfca57e0cb56e1cc55e2cd54e4ce53e5cf52e6d051e7d150e8d24fe9d34eead34cebd44bedd54aeed649efd748"
+        "f0d846f1d945f2da44f3db42f5dc41f6dd3ff7de3ef8df3cf9e03afbe138fce236fde334fee434fee535fee636fee838"
+    ),
+    "cividis_r": (
+        "fee838fee636fee535fee434fde334fce236fbe138f9e03af8df3cf7de3ef6dd3ff5dc41f3db42f2da44f1d945f0d846"
+        "efd748eed649edd54aebd44bead34ce9d34ee8d24fe7d150e6d051e5cf52e4ce53e2cd54e1cc55e0cb56dfca57dec958"
+        "ddc858dcc859dbc75adac65bd9c55cd7c45cd6c35dd5c25ed4c15fd3c05fd2c060d1bf61d0be62cfbd62cebc63cdbb63"
+        "ccba64cbb965c9b965c8b866c7b767c6b667c5b568c4b468c3b369c2b369c1b26ac0b16abfb06bbeaf6bbdae6cbcae6c"
+        "bbad6dbaac6db9ab6db8aa6eb7a96eb6a96fb5a86fb4a76fb3a670b1a570b0a571afa471aea371ada272aca172aba072"
+        "aaa073a99f73a89e73a79d73a69c74a59c74a49b74a39a74a29975a19975a098759f97759e96769d95769c95769b9476"
+        "9a9376999277989277979177969077958f77948e77938e78928d78928c78918b78908b788f8a788e89788d88788c8878"
+        "8b87788a8678898578888578878478868379858279848279838179828079817f78807f787f7e787e7d787e7c787d7c78"
+        "7c7b787b7a787a7a787979777878777777777777767676767575757474757374757273747272747172747071736f7073"
+        "6e6f736d6f726c6e726c6d726b6d726a6c71696b71686a71676a7166697065687065687064677063667062656f61656f"
+        "60646f5f636f5e636f5e626e5d616e5c616e5b606e5a5f6e595e6e585e6d575d6d565c6d555c6d555b6d545a6d535a6d"
+        "52596d51586d50576c4f576c4e566c4d556c4c556c4b546c4a536c49536c48526c47516c46516c45506c444f6c434e6c"
+        "424e6c414d6c404c6c3f4c6c3e4b6c3d4a6c3c4a6c3b496c3a486c39486c38476c36466c35456c34456c33446d32436d"
+        "31436d2f426d2e416d2d416d2b406d2a3f6d293f6e273e6e263d6e243c6e233c6e213b6e203a6f1e3a6f1c396f1a386f"
+        "18376f1637701436701235700f35700c347008337005337101327100317100317000307000306f002f6d002e6c002e6a"
+        "002d68002c66002c64002b62002a61002a5f00295d00285b00285900275800265600255400255300245100234f00224e"
+    ),
+    "cool": (
+        "00ffff01feff02fdff03fcff04fbff05faff06f9ff07f8ff08f7ff09f6ff0af5ff0bf4ff0cf3ff0df2ff0ef1ff0ff0ff"
+        "10efff11eeff12edff13ecff14ebff15eaff16e9ff17e8ff18e7ff19e6ff1ae5ff1be4ff1ce3ff1de2ff1ee1ff1fe0ff"
+        "20dfff21deff22ddff23dcff24dbff25daff26d9ff27d8ff28d7ff29d6ff2ad5ff2bd4ff2cd3ff2dd2ff2ed1ff2fd0ff"
+        "30cfff31ceff32cdff33ccff34cbff35caff36c9ff37c8ff38c7ff39c6ff3ac5ff3bc4ff3cc3ff3dc2ff3ec1ff3fc0ff"
+        "40bfff41beff42bdff43bcff44bbff45baff46b9ff47b8ff48b7ff49b6ff4ab5ff4bb4ff4cb3ff4db2ff4eb1ff4fb0ff"
+        "50afff51aeff52adff53acff54abff55aaff56a9ff57a8ff58a7ff59a6ff5aa5ff5ba4ff5ca3ff5da2ff5ea1ff5fa0ff"
+        "609fff619eff629dff639cff649bff659aff6699ff6798ff6897ff6996ff6a95ff6b94ff6c93ff6d92ff6e91ff6f90ff"
+        "708fff718eff728dff738cff748bff758aff7689ff7788ff7887ff7986ff7a85ff7b84ff7c83ff7d82ff7e81ff7f80ff"
+        "807fff817eff827dff837cff847bff857aff8679ff8778ff8877ff8976ff8a75ff8b74ff8c73ff8d72ff8e71ff8f70ff"
+        "906fff916eff926dff936cff946bff956aff9669ff9768ff9867ff9966ff9a65ff9b64ff9c63ff9d62ff9e61ff9f60ff"
+        "a05fffa15effa25dffa35cffa45bffa55affa659ffa758ffa857ffa956ffaa55ffab54ffac53ffad52ffae51ffaf50ff"
+        "b04fffb14effb24dffb34cffb44bffb54affb649ffb748ffb847ffb946ffba45ffbb44ffbc43ffbd42ffbe41ffbf40ff"
+        "c03fffc13effc23dffc33cffc43bffc53affc639ffc738ffc837ffc936ffca35ffcb34ffcc33ffcd32ffce31ffcf30ff"
+        "d02fffd12effd22dffd32cffd42bffd52affd629ffd728ffd827ffd926ffda25ffdb24ffdc23ffdd22ffde21ffdf20ff"
+        "e01fffe11effe21dffe31cffe41bffe51affe619ffe718ffe817ffe916ffea15ffeb14ffec13ffed12ffee11ffef10ff"
+        "f00ffff10efff20dfff30cfff40bfff50afff609fff708fff807fff906fffa05fffb04fffc03fffd02fffe01ffff00ff"
+    ),
+    "cool_r": (
+        "ff00fffe01fffd02fffc03fffb04fffa05fff906fff807fff708fff609fff50afff40bfff30cfff20dfff10efff00fff"
+        "ef10ffee11ffed12ffec13ffeb14ffea15ffe916ffe817ffe718ffe619ffe51affe41bffe31cffe21dffe11effe01fff"
+        "df20ffde21ffdd22ffdc23ffdb24ffda25ffd926ffd827ffd728ffd629ffd52affd42bffd32cffd22dffd12effd02fff"
+        "cf30ffce31ffcd32ffcc33ffcb34ffca35ffc936ffc837ffc738ffc639ffc53affc43bffc33cffc23dffc13effc03fff"
+        "bf40ffbe41ffbd42ffbc43ffbb44ffba45ffb946ffb847ffb748ffb649ffb54affb44bffb34cffb24dffb14effb04fff"
+        "af50ffae51ffad52ffac53ffab54ffaa55ffa956ffa857ffa758ffa659ffa55affa45bffa35cffa25dffa15effa05fff"
+        "9f60ff9e61ff9d62ff9c63ff9b64ff9a65ff9966ff9867ff9768ff9669ff956aff946bff936cff926dff916eff906fff"
+        "8f70ff8e71ff8d72ff8c73ff8b74ff8a75ff8976ff8877ff8778ff8679ff857aff847bff837cff827dff817eff807fff"
+        "7f80ff7e81ff7d82ff7c83ff7b84ff7a85ff7986ff7887ff7788ff7689ff758aff748bff738cff728dff718eff708fff"
+        "6f90ff6e91ff6d92ff6c93ff6b94ff6a95ff6996ff6897ff6798ff6699ff659aff649bff639cff629dff619eff609fff"
+        "5fa0ff5ea1ff5da2ff5ca3ff5ba4ff5aa5ff59a6ff58a7ff57a8ff56a9ff55aaff54abff53acff52adff51aeff50afff"
+        "4fb0ff4eb1ff4db2ff4cb3ff4bb4ff4ab5ff49b6ff48b7ff47b8ff46b9ff45baff44bbff43bcff42bdff41beff40bfff"
+        "3fc0ff3ec1ff3dc2ff3cc3ff3bc4ff3ac5ff39c6ff38c7ff37c8ff36c9ff35caff34cbff33ccff32cdff31ceff30cfff"
+        "2fd0ff2ed1ff2dd2ff2cd3ff2bd4ff2ad5ff29d6ff28d7ff27d8ff26d9ff25daff24dbff23dcff22ddff21deff20dfff"
+        "1fe0ff1ee1ff1de2ff1ce3ff1be4ff1ae5ff19e6ff18e7ff17e8ff16e9ff15eaff14ebff13ecff12edff11eeff10efff"
+        "0ff0ff0ef1ff0df2ff0cf3ff0bf4ff0af5ff09f6ff08f7ff07f8ff06f9ff05faff04fbff03fcff02fdff01feff00ffff"
+    ),
+    "coolwarm": (
+        "3b4cc03c4ec23d50c33e51c53f53c64055c84257c94358cb445acc455cce465ecf485fd14961d24a63d34b64d54c66d6"
+        "4e68d84f69d9506bda516ddb536edd5470de5572df5673e05875e15977e35a78e45b7ae55d7ce65e7de75f7fe86180e9"
+        "6282ea6384eb6485ec6687ed6788ee688aef6a8bef6b8df06c8ff16e90f26f92f37093f37295f47396f57597f67699f6"
+        "779af7799cf87a9df87b9ff97da0f97ea1fa80a3fa81a4fb82a6fb84a7fc85a8fc86a9fc88abfd89acfd8badfd8caffe"
+        "8db0fe8fb1fe90b2fe92b4fe93b5fe94b6ff96b7ff97b8ff98b9ff9abbff9bbcff9dbdff9ebeff9fbfffa1c0ffa2c1ff"
+        "a3c2fea5c3fea6c4fea7c5fea9c6fdaac7fdabc8fdadc9fdaec9fcafcafcb1cbfcb2ccfbb3cdfbb5cdfab6cefab7cff9"
+        "b9d0f9bad0f8bbd1f8bcd2f7bed2f6bfd3f6c0d4f5c1d4f4c3d5f4c4d5f3c5d6f2c6d6f1c7d7f0c9d7f0cad8efcbd8ee"
+        "ccd9edcdd9eccedaebcfdaead1dae9d2dbe8d3dbe7d4dbe6d5dbe5d6dce4d7dce3d8dce2d9dce1dadce0dbdcdedcdddd"
+        "dddcdcdedcdbdfdbd9e0dbd8e1dad6e2dad5e3d9d3e4d9d2e5d8d1e6d7cfe7d7cee8d6cce9d5cbead5c9ead4c8ebd3c6"
+        "ecd3c5edd2c3edd1c2eed0c0efcfbfefcebdf0cdbbf1cdbaf1ccb8f2cbb7f2cab5f2c9b4f3c8b2f3c7b1f4c6aff4c5ad"
+        "f5c4acf5c2aaf5c1a9f5c0a7f6bfa6f6bea4f6bda2f7bca1f7ba9ff7b99ef7b89cf7b79bf7b599f7b497f7b396f7b194"
+        "f7b093f7af91f7ad90f7ac8ef7aa8cf7a98bf7a889f7a688f6a586f6a385f6a283f5a081f59f80f59d7ef59c7df49a7b"
+        "f4987af39778f39577f39475f29274f29072f18f71f18d6ff08b6ef08a6cef886bee8669ee8468ed8366ec8165ec7f63"
+        "eb7d62ea7b60e97a5fe9785de8765ce7745be67259e57058e46e56e36c55e36b54e26952e16751e0654fdf634ede614d"
+        "dd5f4bdc5d4ada5a49d95847d85646d75445d65244d55042d44e41d24b40d1493fd0473dcf453ccd423bcc403acb3e38"
+        "ca3b37c83836c73635c53334c43032c32e31c12b30c0282fbe242ebd1f2dbb1b2cba162bb8122ab70d28b50927b40426"
+    ),
+    "coolwarm_r": (
+        "b40426b50927b70d28b8122aba162bbb1b2cbd1f2dbe242ec0282fc12b30c32e31c43032c53334c73635c83836ca3b37"
+        "cb3e38cc403acd423bcf453cd0473dd1493fd24b40d44e41d55042d65244d75445d85646d95847da5a49dc5d4add5f4b"
+        "de614ddf634ee0654fe16751e26952e36b54e36c55e46e56e57058e67259e7745be8765ce9785de97a5fea7b60eb7d62"
+        "ec7f63ec8165ed8366ee8468ee8669ef886bf08a6cf08b6ef18d6ff18f71f29072f29274f39475f39577f39778f4987a"
+        "f49a7bf59c7df59d7ef59f80f5a081f6a283f6a385f6a586f7a688f7a889f7a98bf7aa8cf7ac8ef7ad90f7af91f7b093"
+        "f7b194f7b396f7b497f7b599f7b79bf7b89cf7b99ef7ba9ff7bca1f6bda2f6bea4f6bfa6f5c0a7f5c1a9f5c2aaf5c4ac"
+        "f4c5adf4c6aff3c7b1f3c8b2f2c9b4f2cab5f2cbb7f1ccb8f1cdbaf0cdbbefcebdefcfbfeed0c0edd1c2edd2c3ecd3c5"
+        "ebd3c6ead4c8ead5c9e9d5cbe8d6cce7d7cee6d7cfe5d8d1e4d9d2e3d9d3e2dad5e1dad6e0dbd8dfdbd9dedcdbdddcdc"
+        "dcdddddbdcdedadce0d9dce1d8dce2d7dce3d6dce4d5dbe5d4dbe6d3dbe7d2dbe8d1dae9cfdaeacedaebcdd9ecccd9ed"
+        "cbd8eecad8efc9d7f0c7d7f0c6d6f1c5d6f2c4d5f3c3d5f4c1d4f4c0d4f5bfd3f6bed2f6bcd2f7bbd1f8bad0f8b9d0f9"
+        "b7cff9b6cefab5cdfab3cdfbb2ccfbb1cbfcafcafcaec9fcadc9fdabc8fdaac7fda9c6fda7c5fea6c4fea5c3fea3c2fe"
+        "a2c1ffa1c0ff9fbfff9ebeff9dbdff9bbcff9abbff98b9ff97b8ff96b7ff94b6ff93b5fe92b4fe90b2fe8fb1fe8db0fe"
+        "8caffe8badfd89acfd88abfd86a9fc85a8fc84a7fc82a6fb81a4fb80a3fa7ea1fa7da0f97b9ff97a9df8799cf8779af7"
+        "7699f67597f67396f57295f47093f36f92f36e90f26c8ff16b8df06a8bef688aef6788ee6687ed6485ec6384eb6282ea"
+        "6180e95f7fe85e7de75d7ce65b7ae55a78e45977e35875e15673e05572df5470de536edd516ddb506bda4f69d94e68d8"
+        "4c66d64b64d54a63d34961d2485fd1465ecf455cce445acc4358cb4257c94055c83f53c63e51c53d50c33c4ec23b4cc0"
+    ),
+    "copper": (
+        "0000000101000202010402010503020604020705030905030a06040b07040c08050e09050f0906100a06110b07130c07"
+        "140c08150d08160e09170f0919100a1a100a1b110b1c120b1e130c1f140c20140d21150d23160e24170e25170f26180f"
+        "281910291a102a1b112b1b112c1c122e1d122f1e13301e13311f143320143421153522153622163823163924173a2517"
+        "3b25183d26183e27193f281940291a41291a432a1b442b1b452c1c462d1c482d1d492e1d4a2f1e4b301e4d301f4e311f"
+        "4f32205033205234215334215435225536225637235837235938245a39245b3a255d3b255e3b265f3c26603d27623e27"
+        "633e28643f2865402967412968422a69422a6a432b6b442b6d452c6e462c6f462d70472d72482e73492e74492f754a2f"
+        "774b30784c30794d317a4d317c4e327d4f327e50337f5033805134825234835335845435855436875536885637895737"
+        "8a57388c58388d59398e5a398f5b3a915b3a925c3b935d3b945e3c955f3c975f3d98603d99613e9a623e9c623f9d633f"
+        "9e64409f6540a16641a26641a36742a46842a66943a76943a86a44a96b44aa6c45ac6d45ad6d46ae6e46af6f47b17047"
+        "b27048b37148b47249b67349b7744ab8744ab9754bbb764bbc774cbd784cbe784dbf794dc17a4ec27b4ec37b4fc47c4f"
+        "c67d50c77e50c87f51c97f51cb8052cc8152cd8253ce8253d08354d18454d28555d38655d48656d68756d78857d88957"
+        "d98958db8a58dc8b59dd8c59de8d5ae08d5ae18e5be28f5be3905ce5915ce6915de7925de8935ee9945eeb945fec955f"
+        "ed9660ee9760f09861f19861f29962f39a62f59b63f69b63f79c64f89d64fa9e64fb9f65fc9f65fda066fea166ffa267"
+        "ffa267ffa368ffa468ffa569ffa669ffa66affa76affa86bffa96bffaa6cffaa6cffab6dffac6dffad6effad6effae6f"
+        "ffaf6fffb070ffb170ffb171ffb271ffb372ffb472ffb473ffb573ffb674ffb774ffb875ffb875ffb976ffba76ffbb77"
+        "ffbb77ffbc78ffbd78ffbe79ffbf79ffbf7affc07affc17bffc27bffc37cffc37cffc47dffc57dffc67effc67effc77f"
+    ),
+    "copper_r": (
+        "ffc77fffc67effc67effc57dffc47dffc37cffc37cffc27bffc17bffc07affbf7affbf79ffbe79ffbd78ffbc78ffbb77"
+        "ffbb77ffba76ffb976ffb875ffb875ffb774ffb674ffb573ffb473ffb472ffb372ffb271ffb171ffb170ffb070ffaf6f"
+        "ffae6fffad6effad6effac6dffab6dffaa6cffaa6cffa96bffa86bffa76affa66affa669ffa569ffa468ffa368ffa267"
+        "ffa267fea166fda066fc9f65fb9f65fa9e64f89d64f79c64f69b63f59b63f39a62f29962f19861f09861ee9760ed9660"
+        "ec955feb945fe9945ee8935ee7925de6915de5915ce3905ce28f5be18e5be08d5ade8d5add8c59dc8b59db8a58d98958"
+        "d88957d78857d68756d48656d38655d28555d18454d08354ce8253cd8253cc8152cb8052c97f51c87f51c77e50c67d50"
+        "c47c4fc37b4fc27b4ec17a4ebf794dbe784dbd784cbc774cbb764bb9754bb8744ab7744ab67349b47249b37148b27048"
+        "b17047af6f47ae6e46ad6d46ac6d45aa6c45a96b44a86a44a76943a66943a46842a36742a26641a166419f65409e6440"
+        "9d633f9c623f9a623e99613e98603d975f3d955f3c945e3c935d3b925c3b915b3a8f5b3a8e5a398d59398c58388a5738"
+        "8957378856378755368554368454358353358252348051347f50337e50337d4f327c4e327a4d31794d31784c30774b30"
+        "754a2f74492f73492e72482e70472d6f462d6e462c6d452c6b442b6a432b69422a68422a674129654029643f28633e28"
+        "623e27603d275f3c265e3b265d3b255b3a255a39245938245837235637235536225435225334215234215033204f3220"
+        "4e311f4d301f4b301e4a2f1e492e1d482d1d462d1c452c1c442b1b432a1b41291a40291a3f28193e27193d26183b2518"
+        "3a2517392417382316362216352215342115332014311f14301e132f1e132e1d122c1c122b1b112a1b11291a10281910"
+        "26180f25170f24170e23160e21150d20140d1f140c1e130c1c120b1b110b1a100a19100a170f09160e09150d08140c08"
+        "130c07110b07100a060f09060e09050c08050b07040a0604090503070503060402050302040201020201010100000000"
+    ),
+    "cubehelix": (
+        "0000000201020301030502050702060803080a030a0b040c0c050e0e050f0f0611100713110815120817130919140a1b"
+        "150b1d160c1f160d21170e23180f2518102719112919122b19132d1a142f1a16311a17331a18351b1a361b1b381b1c3a"
+        "1b1e3b1b1f3d1a213e1a22401a24411a25431a2744192845192a46192c47192d48182f4918314a18324b17344c17364c"
+        "17374d16394d163b4e163d4e163f4e16404e15424e15444f15464e15474e15494e154b4e154d4e154e4d15504d15524c"
+        "16534c16554b16574b17584a175a49185b48195d48195e471a60461b61451c63441d64431e65421f674120684022693f"
+        "236a3e256b3d266c3c286d3b2a6e3a2b6f392d70382f71373172363373353574353874343a75333c76323f7632417731"
+        "4477314678304978304c792f4e792f51792f54792f577a2f5a7a2f5d7a2f607a2f637a2f667a30697b306c7b316f7b31"
+        "727b32757b33787b347b7a357e7a36817a37847a38877a3a8a7a3b8d7a3d907a3e937a40967a429979449c79469f7948"
+        "a1794aa4794ca7794fa97951ac7954ae7956b17959b3795bb5795eb77961b97964bc7967be796abf796dc17a70c37a73"
+        "c57a76c67a79c87b7cc97b7fca7c83cc7c86cd7d89ce7d8ccf7e8fd07e93d17f96d18099d2809cd381a0d382a3d383a6"
+        "d484a9d485acd486afd487b2d588b5d589b8d48abbd48cbed48dc1d48ec3d490c6d391c9d392cbd294ced295d0d297d2"
+        "d198d4d09ad7d09cd9cf9ddbcf9fddcea1dfcda2e0cca4e2cca6e4cba8e5caa9e7caabe8c9ade9c8afeac8b1ecc7b2ed"
+        "c6b4eec6b6eec5b8efc5baf0c4bcf1c4bdf1c3bff2c3c1f2c2c3f2c2c5f3c2c6f3c2c8f3c1caf3c1ccf3c1cdf3c1cff3"
+        "c1d1f3c2d2f3c2d4f3c2d6f3c2d7f3c3d9f3c3daf2c4dcf2c4ddf2c5dff2c6e0f1c6e1f1c7e3f1c8e4f0c9e5f0cae7f0"
+        "cbe8f0cce9efcdeaefcfebefd0ecefd1edefd3eeefd4efefd6f0efd7f1efd9f2efdbf3efdcf3efdef4efe0f5f0e2f6f0"
+        "e3f6f0e5f7f1e7f8f1e9f8f2ebf9f3edfaf4effaf4f0fbf5f2fbf6f4fcf7f6fcf8f8fdfafafdfbfbfefcfdfefeffffff"
+    ),
+    "cubehelix_r": (
+        "fffffffdfefefbfefcfafdfbf8fdfaf6fcf8f4fcf7f2fbf6f0fbf5effaf4edfaf4ebf9f3e9f8f2e7f8f1e5f7f1e3f6f0"
+        "e2f6f0e0f5f0def4efdcf3efdbf3efd9f2efd7f1efd6f0efd4efefd3eeefd1edefd0ecefcfebefcdeaefcce9efcbe8f0"
+        "cae7f0c9e5f0c8e4f0c7e3f1c6e1f1c6e0f1c5dff2c4ddf2c4dcf2c3daf2c3d9f3c2d7f3c2d6f3c2d4f3c2d2f3c1d1f3"
+        "c1cff3c1cdf3c1ccf3c1caf3c2c8f3c2c6f3c2c5f3c2c3f2c3c1f2c3bff2c4bdf1c4bcf1c5baf0c5b8efc6b6eec6b4ee"
+        "c7b2edc8b1ecc8afeac9ade9caabe8caa9e7cba8e5cca6e4cca4e2cda2e0cea1dfcf9fddcf9ddbd09cd9d09ad7d198d4"
+        "d297d2d295d0d294ced392cbd391c9d490c6d48ec3d48dc1d48cbed48abbd589b8d588b5d487b2d486afd485acd484a9"
+        "d383a6d382a3d381a0d2809cd18099d17f96d07e93cf7e8fce7d8ccd7d89cc7c86ca7c83c97b7fc87b7cc67a79c57a76"
+        "c37a73c17a70bf796dbe796abc7967b97964b77961b5795eb3795bb17959ae7956ac7954a97951a7794fa4794ca1794a"
+        "9f79489c7946997944967a42937a40907a3e8d7a3d8a7a3b877a3a847a38817a377e7a367b7a35787b34757b33727b32"
+        "6f7b316c7b31697b30667a30637a2f607a2f5d7a2f5a7a2f577a2f54792f51792f4e792f4c792f497830467830447731"
+        "4177313f76323c76323a75333874343574353373353172362f71372d70382b6f392a6e3a286d3b266c3c256b3d236a3e"
+        "22693f2068401f67411e65421d64431c63441b61451a6046195e47195d48185b48175a4917584a16574b16554b16534c"
+        "15524c15504d154e4d154d4e154b4e15494e15474e15464e15444f15424e16404e163f4e163d4e163b4e16394d17374d"
+        "17364c17344c18324b18314a182f49192d48192c47192a461928451a27441a25431a24411a22401a213e1b1f3d1b1e3b"
+        "1b1c3a1b1b381b1a361a18351a17331a16311a142f19132d19122b191129181027180f25170e23160d21160c1f150b1d"
+        "140a1b1309191208171108151007130f06110e050f0c050e0b040c0a030a080308070206050205030103020102000000"
+    ),
+    "flag": (
+        "ff0000ff6035ffb37effeac6ffffffcdeeff85b9ff3c69ff0009ff0000d000008800003f0000002c0000730000bc0000"
+        "fc0000ff4f29ffa570ffe2b9fffefad9f4ff93c6ff497aff081cff0000dd00009600004d00000b1f0000650000af0000"
+        "f10000ff3d1cff9662ffd9abfffbeee6f9ffa1d1ff578aff132fff0000e90000a400005b000016130000570000a10000"
+        "e60000ff2a11ff8654ffce9dfff8e3f1fcffafdbff659aff1f41ff0000f40000b2000069000022080000490000930000"
+        "d90000ff1805ff7646ffc38ffff3d6fcfeffbce4ff73a8ff2c53ff0000ff0000c000007700002f0000003c0000850000"
+        "cd0000ff0500ff6539ffb681ffeccaffffffcaecff81b6ff3965ff0005ff0000cd00008500003c0000002f0000770000"
+        "c00000ff0000ff532cffa873ffe4bcfffefcd6f3ff8fc3ff4676ff0518ff0000d9000093000049000008220000690000"
+        "b20000f40000ff411fff9a65ffdbaffffcf1e3f8ff9dceff5486ff112aff0000e60000a10000570000131600005b0000"
+        "a40000e90000ff2f13ff8a57ffd1a1fff9e6eefbffabd9ff6296ff1c3dff0000f10000af00006500001f0b00004d0000"
+        "960000dd0000ff1c08ff7a49ffc693fff4d9fafeffb9e2ff70a5ff294fff0000fc0000bc00007300002c0000003f0000"
+        "880000d00000ff0900ff693cffb985ffeecdffffffc6eaff7eb3ff3560ff0000ff0000ca000081000039000000320000"
+        "7a0000c30000ff0000ff582fffac77ffe6c0ffffffd3f1ff8cc0ff4372ff0313ff0000d600008f000046000005260000"
+        "6c0000b60000f70000ff4622ff9d69ffdeb2fffdf4e0f7ff9acbff5082ff0e26ff0000e300009d000054000011190000"
+        "5e0000a80000ec0000ff3316ff8e5bffd4a4fffae9ecfbffa8d6ff5e92ff1938ff0000ee0000ab00006200001c0e0000"
+        "5000009a0000e00000ff210bff7e4dffc996fff5ddf7fdffb6e0ff6ca1ff264aff0000fa0000b9000070000029030000"
+        "4300008c0000d30000ff0e00ff6d3fffbc88ffefd0ffffffc3e8ff7aafff325cff0000ff0000c600007e000035000000"
+    ),
+    "flag_r": (
+        "00000000003500007e0000c60000ff325cff7aafffc3e8ffffffffffefd0ffbc88ff6d3fff0e00d300008c0000430000"
+        "0300000000290000700000b90000fa264aff6ca1ffb6e0fff7fdfffff5ddffc996ff7e4dff210be000009a0000500000"
+        "0e000000001c0000620000ab0000ee1938ff5e92ffa8d6ffecfbfffffae9ffd4a4ff8e5bff3316ec0000a800005e0000"
+        "19000000001100005400009d0000e30e26ff5082ff9acbffe0f7fffffdf4ffdeb2ff9d69ff4622f70000b600006c0000"
+        "26000000000500004600008f0000d60313ff4372ff8cc0ffd3f1ffffffffffe6c0ffac77ff582fff0000c300007a0000"
+        "3200000000000000390000810000ca0000ff3560ff7eb3ffc6eaffffffffffeecdffb985ff693cff0900d00000880000"
+        "3f000000000000002c0000730000bc0000fc294fff70a5ffb9e2fffafefffff4d9ffc693ff7a49ff1c08dd0000960000"
+        "4d00000b000000001f0000650000af0000f11c3dff6296ffabd9ffeefbfffff9e6ffd1a1ff8a57ff2f13e90000a40000"
+        "5b00001600000000130000570000a10000e6112aff5486ff9dceffe3f8fffffcf1ffdbafff9a65ff411ff40000b20000"
+        "6900002200000000080000490000930000d90518ff4676ff8fc3ffd6f3fffffefcffe4bcffa873ff532cff0000c00000"
+        "7700002f000000000000003c0000850000cd0005ff3965ff81b6ffcaecffffffffffeccaffb681ff6539ff0500cd0000"
+        "8500003c000000000000002f0000770000c00000ff2c53ff73a8ffbce4fffcfefffff3d6ffc38fff7646ff1805d90000"
+        "9300004900000800000000220000690000b20000f41f41ff659affafdbfff1fcfffff8e3ffce9dff8654ff2a11e60000"
+        "a1000057000013000000001600005b0000a40000e9132fff578affa1d1ffe6f9fffffbeeffd9abff9662ff3d1cf10000"
+        "af00006500001f000000000b00004d0000960000dd081cff497aff93c6ffd9f4fffffefaffe2b9ffa570ff4f29fc0000"
+        "bc00007300002c000000000000003f0000880000d00009ff3c69ff85b9ffcdeeffffffffffeac6ffb37eff6035ff0000"
+    ),
+    "gist_earth": (
+        "00000001002b01003902004303004e03005904006405006e050274060574070774070975080b75090e750910750a1275"
+        "0b15750b17760c19760d1c760d1e760e20760f22770f2577102777112977112c77122e77133078133278143478153778"
+        "153978163b79173d79173f791841791943791945791a477a1b497a1b4b7a1c4d7a1d4f7a1d517b1e537b1f557b1f577b"
+        "20597b215a7b215c7c225e7c23607c23627c24647c25657d25677d26687d276a7d276b7d286d7d296f7e29707e2a727e"
+        "2b737e2b757e2c777f2d787f2d7a7f2e7b7f2f7d7f2f7e7f30808030817e31817d31827c32827b328379338378338477"
+        "34857634857535867335867236877136877037886e37896d38896c388a6b388a6a398b68398c673a8c663a8d653b8d63"
+        "3b8e623c8e613c8f603d905f3d905d3e915c3e915b3f925a3f9258409357409456409455419554419552429651429650"
+        "43974f43984d44984c44994b45994a459a49479a474a9b464c9c474e9c47509d48539d48559e49579f4a599f4a5ba04b"
+        "5ea04b60a14c62a14c64a24d67a34e69a34e6ba44f6da44f6fa45072a55174a55176a65278a6527aa7527ca7537da853"
+        "7fa85381a85482a95484a95486aa5587aa5589ab558aab568cab568eac568fac5691ad5793ad5794ae5796ae5898af58"
+        "99af589baf599db0599eb059a0b15aa2b15aa3b25aa5b25ba7b25ba8b35baab35cabb45cadb45cafb55cb0b55db2b65d"
+        "b4b65db5b65eb7b75eb7b65eb8b55fb8b45fb9b35fb9b360b9b260bab160bab061bbaf61bbae61bcad62bcac62bcac62"
+        "bdab62bdaa63bea963bea863bfa764bfa664bfa664c0a565c0a465c1a367c2a46ac3a46cc4a46fc5a571c6a574c7a676"
+        "c8a779caa87bcba97eccaa80cdaa82ceab85cfac87d0ad8ad1ae8cd3af8fd4b091d5b194d6b196d7b298d8b49bd9b59d"
+        "dab7a0dbb8a2ddb9a5debba7dfbcaae0bdade1bfb0e2c1b3e3c3b6e4c5b9e6c7bce7c9bfe8cbc2e9cdc5eacfc8ebd1cb"
+        "ecd3ceedd5d1eed8d4f0dad7f1dcdaf2deddf3e1e0f4e4e3f5e7e6f6eae9f7ececf9efeffaf2f2fbf5f5fcf8f8fdfbfb"
+    ),
+    "gist_earth_r": (
+        "fdfbfbfcf8f8fbf5f5faf2f2f9efeff7ececf6eae9f5e7e6f4e4e3f3e1e0f2deddf1dcdaf0dad7eed8d4edd5d1ecd3ce"
+        "ebd1cbeacfc8e9cdc5e8cbc2e7c9bfe6c7bce4c5b9e3c3b6e2c1b3e1bfb0e0bdaddfbcaadebba7ddb9a5dbb8a2dab7a0"
+        "d9b59dd8b49bd7b298d6b196d5b194d4b091d3af8fd1ae8cd0ad8acfac87ceab85cdaa82ccaa80cba97ecaa87bc8a779"
+        "c7a676c6a574c5a571c4a46fc3a46cc2a46ac1a367c0a465c0a565bfa664bfa664bfa764bea863bea963bdaa63bdab62"
+        "bcac62bcac62bcad62bbae61bbaf61bab061bab160b9b260b9b360b9b35fb8b45fb8b55fb7b65eb7b75eb5b65eb4b65d"
+        "b2b65db0b55dafb55cadb45cabb45caab35ca8b35ba7b25ba5b25ba3b25aa2b15aa0b15a9eb0599db0599baf5999af58"
+        "98af5896ae5894ae5793ad5791ad578fac568eac568cab568aab5689ab5587aa5586aa5584a95482a95481a8547fa853"
+        "7da8537ca7537aa75278a65276a65274a55172a5516fa4506da44f6ba44f69a34e67a34e64a24d62a14c60a14c5ea04b"
+        "5ba04b599f4a579f4a559e49539d48509d484e9c474c9c474a9b46479a47459a4945994a44994b44984c43984d43974f"
+        "4296504296514195524195544094554094564093573f92583f925a3e915b3e915c3d905d3d905f3c8f603c8e613b8e62"
+        "3b8d633a8d653a8c66398c67398b68388a6a388a6b38896c37896d37886e368770368771358672358673348575348576"
+        "33847733837832837932827b31827c31817d30817e3080802f7e7f2f7d7f2e7b7f2d7a7f2d787f2c777f2b757e2b737e"
+        "2a727e29707e296f7e286d7d276b7d276a7d26687d25677d25657d24647c23627c23607c225e7c215c7c215a7b20597b"
+        "1f577b1f557b1e537b1d517b1d4f7a1c4d7a1b4b7a1b497a1a477a194579194379184179173f79173d79163b79153978"
+        "153778143478133278133078122e77112c771129771027770f25770f22770e20760d1e760d1c760c19760b17760b1575"
+        "0a1275091075090e75080b7507097507077406057405027405006e04006403005903004e02004301003901002b000000"
+    ),
+    "gist_gray": (
+        "0000000101010202020303030404040505050606060707070808080909090a0a0a0b0b0b0c0c0c0d0d0d0e0e0e0f0f0f"
+        "1010101111111212121313131414141515151616161717171818181919191a1a1a1b1b1b1c1c1c1d1d1d1e1e1e1f1f1f"
+        "2020202121212222222323232424242525252626262727272828282929292a2a2a2b2b2b2c2c2c2d2d2d2e2e2e2f2f2f"
+        "3030303131313232323333333434343535353636363737373838383939393a3a3a3b3b3b3c3c3c3d3d3d3e3e3e3f3f3f"
+        "4040404141414242424343434444444545454646464747474848484949494a4a4a4b4b4b4c4c4c4d4d4d4e4e4e4f4f4f"
+        "5050505151515252525353535454545555555656565757575858585959595a5a5a5b5b5b5c5c5c5d5d5d5e5e5e5f5f5f"
+        "6060606161616262626363636464646565656666666767676868686969696a6a6a6b6b6b6c6c6c6d6d6d6e6e6e6f6f6f"
+        "7070707171717272727373737474747575757676767777777878787979797a7a7a7b7b7b7c7c7c7d7d7d7e7e7e7f7f7f"
+        "8080808181818282828383838484848585858686868787878888888989898a8a8a8b8b8b8c8c8c8d8d8d8e8e8e8f8f8f"
+        "9090909191919292929393939494949595959696969797979898989999999a9a9a9b9b9b9c9c9c9d9d9d9e9e9e9f9f9f"
+        "a0a0a0a1a1a1a2a2a2a3a3a3a4a4a4a5a5a5a6a6a6a7a7a7a8a8a8a9a9a9aaaaaaabababacacacadadadaeaeaeafafaf"
+        "b0b0b0b1b1b1b2b2b2b3b3b3b4b4b4b5b5b5b6b6b6b7b7b7b8b8b8b9b9b9babababbbbbbbcbcbcbdbdbdbebebebfbfbf"
+        "c0c0c0c1c1c1c2c2c2c3c3c3c4c4c4c5c5c5c6c6c6c7c7c7c8c8c8c9c9c9cacacacbcbcbcccccccdcdcdcecececfcfcf"
+        "d0d0d0d1d1d1d2d2d2d3d3d3d4d4d4d5d5d5d6d6d6d7d7d7d8d8d8d9d9d9dadadadbdbdbdcdcdcdddddddedededfdfdf"
+        "e0e0e0e1e1e1e2e2e2e3e3e3e4e4e4e5e5e5e6e6e6e7e7e7e8e8e8e9e9e9eaeaeaebebebecececedededeeeeeeefefef"
+        "f0f0f0f1f1f1f2f2f2f3f3f3f4f4f4f5f5f5f6f6f6f7f7f7f8f8f8f9f9f9fafafafbfbfbfcfcfcfdfdfdfefefeffffff"
+    ),
+    "gist_gray_r": (
+        "fffffffefefefdfdfdfcfcfcfbfbfbfafafaf9f9f9f8f8f8f7f7f7f6f6f6f5f5f5f4f4f4f3f3f3f2f2f2f1f1f1f0f0f0"
+        "efefefeeeeeeedededecececebebebeaeaeae9e9e9e8e8e8e7e7e7e6e6e6e5e5e5e4e4e4e3e3e3e2e2e2e1e1e1e0e0e0"
+        "dfdfdfdedededddddddcdcdcdbdbdbdadadad9d9d9d8d8d8d7d7d7d6d6d6d5d5d5d4d4d4d3d3d3d2d2d2d1d1d1d0d0d0"
+        "cfcfcfcecececdcdcdcccccccbcbcbcacacac9c9c9c8c8c8c7c7c7c6c6c6c5c5c5c4c4c4c3c3c3c2c2c2c1c1c1c0c0c0"
+        "bfbfbfbebebebdbdbdbcbcbcbbbbbbbababab9b9b9b8b8b8b7b7b7b6b6b6b5b5b5b4b4b4b3b3b3b2b2b2b1b1b1b0b0b0"
+        "afafafaeaeaeadadadacacacabababaaaaaaa9a9a9a8a8a8a7a7a7a6a6a6a5a5a5a4a4a4a3a3a3a2a2a2a1a1a1a0a0a0"
+        "9f9f9f9e9e9e9d9d9d9c9c9c9b9b9b9a9a9a999999989898979797969696959595949494939393929292919191909090"
+        "8f8f8f8e8e8e8d8d8d8c8c8c8b8b8b8a8a8a898989888888878787868686858585848484838383828282818181808080"
+        "7f7f7f7e7e7e7d7d7d7c7c7c7b7b7b7a7a7a797979787878777777767676757575747474737373727272717171707070"
+        "6f6f6f6e6e6e6d6d6d6c6c6c6b6b6b6a6a6a696969686868676767666666656565646464636363626262616161606060"
+        "5f5f5f5e5e5e5d5d5d5c5c5c5b5b5b5a5a5a595959585858575757565656555555545454535353525252515151505050"
+        "4f4f4f4e4e4e4d4d4d4c4c4c4b4b4b4a4a4a494949484848474747464646454545444444434343424242414141404040"
+        "3f3f3f3e3e3e3d3d3d3c3c3c3b3b3b3a3a3a393939383838373737363636353535343434333333323232313131303030"
+        "2f2f2f2e2e2e2d2d2d2c2c2c2b2b2b2a2a2a292929282828272727262626252525242424232323222222212121202020"
+        "1f1f1f1e1e1e1d1d1d1c1c1c1b1b1b1a1a1a191919181818171717161616151515141414131313121212111111101010"
+        "0f0f0f0e0e0e0d0d0d0c0c0c0b0b0b0a0a0a090909080808070707060606050505040404030303020202010101000000"
+    ),
+    "gist_grey": (
+        "0000000101010202020303030404040505050606060707070808080909090a0a0a0b0b0b0c0c0c0d0d0d0e0e0e0f0f0f"
+        "1010101111111212121313131414141515151616161717171818181919191a1a1a1b1b1b1c1c1c1d1d1d1e1e1e1f1f1f"
+        "2020202121212222222323232424242525252626262727272828282929292a2a2a2b2b2b2c2c2c2d2d2d2e2e2e2f2f2f"
+        "3030303131313232323333333434343535353636363737373838383939393a3a3a3b3b3b3c3c3c3d3d3d3e3e3e3f3f3f"
+        "4040404141414242424343434444444545454646464747474848484949494a4a4a4b4b4b4c4c4c4d4d4d4e4e4e4f4f4f"
+        "5050505151515252525353535454545555555656565757575858585959595a5a5a5b5b5b5c5c5c5d5d5d5e5e5e5f5f5f"
+        "6060606161616262626363636464646565656666666767676868686969696a6a6a6b6b6b6c6c6c6d6d6d6e6e6e6f6f6f"
+        "7070707171717272727373737474747575757676767777777878787979797a7a7a7b7b7b7c7c7c7d7d7d7e7e7e7f7f7f"
+        "8080808181818282828383838484848585858686868787878888888989898a8a8a8b8b8b8c8c8c8d8d8d8e8e8e8f8f8f"
+        "9090909191919292929393939494949595959696969797979898989999999a9a9a9b9b9b9c9c9c9d9d9d9e9e9e9f9f9f"
+        "a0a0a0a1a1a1a2a2a2a3a3a3a4a4a4a5a5a5a6a6a6a7a7a7a8a8a8a9a9a9aaaaaaabababacacacadadadaeaeaeafafaf"
+        "b0b0b0b1b1b1b2b2b2b3b3b3b4b4b4b5b5b5b6b6b6b7b7b7b8b8b8b9b9b9babababbbbbbbcbcbcbdbdbdbebebebfbfbf"
+        "c0c0c0c1c1c1c2c2c2c3c3c3c4c4c4c5c5c5c6c6c6c7c7c7c8c8c8c9c9c9cacacacbcbcbcccccccdcdcdcecececfcfcf"
+        "d0d0d0d1d1d1d2d2d2d3d3d3d4d4d4d5d5d5d6d6d6d7d7d7d8d8d8d9d9d9dadadadbdbdbdcdcdcdddddddedededfdfdf"
+        "e0e0e0e1e1e1e2e2e2e3e3e3e4e4e4e5e5e5e6e6e6e7e7e7e8e8e8e9e9e9eaeaeaebebebecececedededeeeeeeefefef"
+        "f0f0f0f1f1f1f2f2f2f3f3f3f4f4f4f5f5f5f6f6f6f7f7f7f8f8f8f9f9f9fafafafbfbfbfcfcfcfdfdfdfefefeffffff"
+    ),
+    "gist_heat": (
+        "0000000200000300000400000600000800000900000a00000c00000e00000f0000100000120000140000150000160000"
+        "1800001a00001b00001c00001e00002000002100002200002400002600002700002800002a00002c00002d00002e0000"
+        "3000003100003300003500003600003700003900003b00003c00003d00003f0000400000420000430000450000460000"
+        "4800004a00004b00004d00004e00005000005100005200005400005600005700005800005a00005b00005d00005e0000"
+        "6000006200006300006500006600006800006900006a00006c00006e00006f0000700000720000730000750000760000"
+        "7800007a00007b00007d00007e00008000008100008200008400008500008700008800008a00008b00008d00008e0000"
+        "9000009200009300009400009600009800009900009b00009c00009e00009f0000a00000a20000a30000a50000a60000"
+        "a80000aa0000ab0000ac0000ae0000b00000b10000b20000b40000b50000b70000b80000ba0000bb0000bd0000be0000"
+        "c00100c20300c30500c40700c60900c80b00c90d00cb0f00cc1100ce1300cf1500d01700d21900d41b00d51d00d61f00"
+        "d82100da2300db2500dc2700de2900e02b00e12d00e22f00e43100e53300e73500e83700ea3900ec3b00ed3d00ee3f00"
+        "f04100f24300f34500f44700f64900f84b00f94d00fb4f00fc5100fe5300ff5500ff5700ff5900ff5b00ff5d00ff5f00"
+        "ff6100ff6300ff6500ff6700ff6900ff6b00ff6d00ff6f00ff7100ff7300ff7500ff7700ff7900ff7b00ff7d00ff7f00"
+        "ff8103ff8307ff850bff870fff8913ff8b17ff8d1bff8f1fff9123ff9327ff952bff972fff9933ff9b37ff9d3bff9f3f"
+        "ffa143ffa347ffa54bffa74fffa953ffab57ffad5bffaf5fffb163ffb367ffb56bffb76fffb973ffbb77ffbd7bffbf7f"
+        "ffc183ffc387ffc58bffc78fffc993ffcb97ffcd9bffcf9fffd1a3ffd3a7ffd5abffd7afffd9b3ffdbb7ffddbbffdfbf"
+        "ffe1c3ffe3c7ffe5cbffe7cfffe9d3ffebd7ffeddbffefdffff1e3fff3e7fff5ebfff7effff9f3fffbf7fffdfbffffff"
+    ),
+    "gist_heat_r": (
+        "fffffffffdfbfffbf7fff9f3fff7effff5ebfff3e7fff1e3ffefdfffeddbffebd7ffe9d3ffe7cfffe5cbffe3c7ffe1c3"
+        "ffdfbfffddbbffdbb7ffd9b3ffd7afffd5abffd3a7ffd1a3ffcf9fffcd9bffcb97ffc993ffc78fffc58bffc387ffc183"
+        "ffbf7fffbd7bffbb77ffb973ffb76fffb56bffb367ffb163ffaf5fffad5bffab57ffa953ffa74fffa54bffa347ffa143"
+        "ff9f3fff9d3bff9b37ff9933ff972fff952bff9327ff9123ff8f1fff8d1bff8b17ff8913ff870fff850bff8307ff8103"
+        "ff7f00ff7d00ff7b00ff7900ff7700ff7500ff7300ff7100ff6f00ff6d00ff6b00ff6900ff6700ff6500ff6300ff6100"
+        "ff5f00ff5d00ff5b00ff5900ff5700ff5500fe5300fc5100fb4f00f94d00f84b00f64900f44700f34500f24300f04100"
+        "ee3f00ed3d00ec3b00ea3900e93700e73500e53300e43100e22f00e12d00e02b00de2900dc2700db2500da2300d82100"
+        "d61f00d51d00d41b00d21900d11700cf1500ce1300cc1100cb0f00c90d00c80b00c60900c40700c30500c20300c00100"
+        "be0000bd0000bc0000ba0000b90000b70000b50000b40000b20000b10000b00000ae0000ac0000ab0000aa0000a80000"
+        "a60000a50000a40000a20000a100009f00009e00009c00009b0000990000980000960000940000930000920000900000"
+        "8e00008d00008c00008a00008900008700008500008400008200008100008000007e00007c00007b00007a0000780000"
+        "7600007500007400007200007100006f00006e00006c00006a0000690000680000660000640000630000620000600000"
+        "5e00005d00005c00005a00005900005700005600005400005200005100005000004e00004c00004b00004a0000480000"
+        "4600004500004400004200004100003f00003d00003c00003b0000390000380000360000340000330000310000300000"
+        "2f00002d00002c00002a00002900002700002500002400002300002100002000001e00001c00001b0000190000180000"
+        "1700001500001400001200001100000f00000d00000c00000b0000090000080000060000040000030000010000000000"
+    ),
+    "gist_ncar": (
+        "000080000777000f6d001664001d5a002451002c4800333e003a3500422b00492200501900580f005f06005816005127"
+        "004b37004448003d59003669002f7a00298b00229b001bac0014bc000ecd0007de0000ee000eff001cff002aff0038ff"
+        "0047ff0055ff0063ff0071ff007fff008dff009bff00a9ff00b8ff00c0ff00c6ff00caff00ceff00d3ff00d7ff00dcff"
+        "00e0ff00e5ff00e9ff00edff00f2ff00f6f800fbf200ffeb00ffe500fede00fed800fdd100fdcb00fcc400fcbd00fbb7"
+        "00fbb000faaa00faa300fa9d00fa9200fa8800fa7d00fb7300fb6800fc5e00fc5400fd4900fd3f00fd3400fe2a00fe1f"
+        "06ff150dff0b13fb0019f70020f40026f0002dec0033e80039e50040e10046dd004cd90053d60059d20060ce0066d100"
+        "68d5006ad8006cdb006ede0070e20072e50074e80076eb0078ef007af2007cf5007ef80480fc0884ff0c89ff108dff14"
+        "92ff1896ff1c9bff209fff24a4ff28a9ff2cadff30b2ff34b6ff38bbff3cbfff38c4ff34c8ff30cdff2cd2ff28d6ff24"
+        "dbff20dfff1ce4ff18e8ff14edff10f1ff0cf6fd08fafa04fff800fff500fff300fff000ffee00ffeb00ffe900ffe600"
+        "ffe400ffe100ffdf00ffdc00ffda00ffd801ffd502ffd303ffd004ffce05ffcb06ffc908ffc609ffc40affc10bffbf0c"
+        "ffbc0dffba0effb20dffaa0cffa10bff990aff9109ff8908ff8107ff7807ff7006ff6805ff6004ff5803ff5002ff4701"
+        "ff4300ff3e00ff3900ff3400ff3000ff2b00ff2600ff2100ff1d00ff1800ff1300ff0e00ff0a00ff0512ff0023ff0035"
+        "ff0047ff0058ff006aff007cff008eff009fff00b1ff00c3ff00d5ff00e6ff00f8f803fcf107ffea0affe40effdd11ff"
+        "d615ffcf18ffc81cffc11fffba22ffb326ffac29ffa62dff9f33fea439fdaa3ffbb044fab64af9bc50f8c256f7c85cf5"
+        "ce62f4d468f3da6ef2e074f1e67aefeb80eeec84efed89efee8df0ee92f1ef97f1f09bf2f0a0f2f1a5f3f2a9f4f3aef4"
+        "f3b3f5f4b7f5f5bcf6f5c0f7f6c5f7f7caf8f8cef9f8d3f9f9d8fafadcfafae1fbfbe5fcfceafcfdeffdfdf3fdfef8fe"
+    ),
+    "gist_ncar_r": (
+        "fef8fefdf3fdfdeffdfceafcfbe5fcfae1fbfadcfaf9d8faf8d3f9f8cef9f7caf8f6c5f7f5c0f7f5bcf6f4b7f5f3b3f5"
+        "f3aef4f2a9f4f1a5f3f0a0f2f09bf2ef97f1ee92f1ee8df0ed89efec84efeb80eee67aefe074f1da6ef2d468f3ce62f4"
+        "c85cf5c256f7bc50f8b64af9b044faaa3ffba439fd9f33fea62dffac29ffb326ffba22ffc11fffc81cffcf18ffd615ff"
+        "dd11ffe40effea0afff107fff803fcff00f8ff00e6ff00d5ff00c3ff00b1ff009fff008eff007cff006aff0058ff0047"
+        "ff0035ff0023ff0512ff0a00ff0e00ff1300ff1800ff1d00ff2100ff2600ff2b00ff3000ff3400ff3900ff3e00ff4300"
+        "ff4701ff5002ff5803ff6004ff6805ff7006ff7807ff8107ff8908ff9109ff990affa10bffaa0cffb20dffba0effbc0d"
+        "ffbf0cffc10bffc40affc609ffc908ffcb06ffce05ffd004ffd303ffd502ffd801ffda00ffdc00ffdf00ffe100ffe400"
+        "ffe600ffe900ffeb00ffee00fff000fff300fff500fff800fafa04f6fd08f1ff0cedff10e8ff14e4ff18dfff1cdbff20"
+        "d6ff24d2ff28cdff2cc8ff30c4ff34bfff38bbff3cb6ff38b2ff34adff30a9ff2ca4ff289fff249bff2096ff1c92ff18"
+        "8dff1489ff1084ff0c80fc087ef8047cf5007af20078ef0076eb0074e80072e50070e2006ede006cdb006ad80068d500"
+        "66d10060ce0059d20053d6004cd90046dd0040e10039e50033e8002dec0026f00020f40019f70013fb000dff0b06ff15"
+        "00fe1f00fe2a00fd3400fd3f00fd4900fc5400fc5e00fb6800fb7300fa7d00fa8800fa9200fa9d00faa300faaa00fbb0"
+        "00fbb700fcbd00fcc400fdcb00fdd100fed800fede00ffe500ffeb00fbf200f6f800f2ff00edff00e9ff00e5ff00e0ff"
+        "00dcff00d7ff00d3ff00ceff00caff00c6ff00c0ff00b8ff00a9ff009bff008dff007fff0071ff0063ff0055ff0047ff"
+        "0038ff002aff001cff000eff0000ee0007de000ecd0014bc001bac00229b00298b002f7a003669003d59004448004b37"
+        "005127005816005f0600580f00501900492200422b003a3500333e002c48002451001d5a001664000f6d000777000080"
+    ),
+    "gist_rainbow": (
+        "ff0029ff0023ff001eff0019ff0013ff000eff0009ff0003ff0200ff0700ff0d00ff1200ff1800ff1d00ff2200ff2800"
+        "ff2d00ff3300ff3800ff3d00ff4300ff4800ff4e00ff5300ff5800ff5e00ff6300ff6900ff6e00ff7300ff7900ff7e00"
+        "ff8400ff8900ff8e00ff9400ff9900ff9f00ffa400ffa900ffaf00ffb400ffba00ffbf00ffc400ffca00ffcf00ffd500"
+        "ffda00ffe000ffe500ffea00fff000fff500fffb00feff00f9ff00f3ff00eeff00e8ff00e3ff00deff00d8ff00d3ff00"
+        "cdff00c8ff00c3ff00bdff00b8ff00b2ff00adff00a8ff00a2ff009dff0097ff0092ff008dff0087ff0082ff007cff00"
+        "77ff0072ff006cff0067ff0061ff005cff0056ff0051ff004cff0046ff0041ff003bff0036ff0031ff002bff0026ff00"
+        "20ff001bff0016ff0010ff000bff0005ff0000ff0000ff0500ff0b00ff1000ff1600ff1b00ff2000ff2600ff2b00ff30"
+        "00ff3600ff3b00ff4100ff4600ff4b00ff5100ff5600ff5b00ff6100ff6600ff6c00ff7100ff7600ff7c00ff8100ff86"
+        "00ff8c00ff9100ff9700ff9c00ffa100ffa700ffac00ffb100ffb700ffbc00ffc200ffc700ffcc00ffd200ffd700ffdc"
+        "00ffe200ffe700ffed00fff200fff700fffd00fcff00f6ff00f1ff00ecff00e6ff00e1ff00dbff00d6ff00d0ff00cbff"
+        "00c6ff00c0ff00bbff00b5ff00b0ff00aaff00a5ff00a0ff009aff0095ff008fff008aff0084ff007fff0079ff0074ff"
+        "006fff0069ff0064ff005eff0059ff0053ff004eff0049ff0043ff003eff0038ff0033ff002dff0028ff0023ff001dff"
+        "0018ff0012ff000dff0007ff0002ff0400ff0900ff0e00ff1400ff1900ff1f00ff2400ff2a00ff2f00ff3400ff3a00ff"
+        "3f00ff4500ff4a00ff5000ff5500ff5a00ff6000ff6500ff6b00ff7000ff7600ff7b00ff8100ff8600ff8b00ff9100ff"
+        "9600ff9c00ffa100ffa700ffac00ffb100ffb700ffbc00ffc200ffc700ffcd00ffd200ffd700ffdd00ffe200ffe800ff"
+        "ed00fff300fff800fffe00ffff00fbff00f6ff00f0ff00ebff00e5ff00e0ff00daff00d5ff00d0ff00caff00c5ff00bf"
+    ),
+    "gist_rainbow_r": (
+        "ff00bfff00c5ff00caff00d0ff00d5ff00daff00e0ff00e5ff00ebff00f0ff00f6ff00fbfe00fff800fff300ffed00ff"
+        "e800ffe200ffdd00ffd700ffd200ffcd00ffc700ffc200ffbc00ffb700ffb100ffac00ffa700ffa100ff9c00ff9600ff"
+        "9100ff8b00ff8600ff8100ff7b00ff7600ff7000ff6b00ff6500ff6000ff5a00ff5500ff5000ff4a00ff4500ff3f00ff"
+        "3a00ff3400ff2f00ff2a00ff2400ff1f00ff1900ff1400ff0e00ff0900ff0400ff0002ff0007ff000dff0012ff0018ff"
+        "001dff0023ff0028ff002dff0033ff0038ff003eff0043ff0049ff004eff0053ff0059ff005eff0064ff0069ff006fff"
+        "0074ff0079ff007fff0084ff008aff008fff0095ff009aff00a0ff00a5ff00aaff00b0ff00b5ff00bbff00c0ff00c6ff"
+        "00cbff00d0ff00d6ff00dbff00e1ff00e6ff00ecff00f1ff00f6ff00fcff00fffd00fff700fff200ffed00ffe700ffe2"
+        "00ffdc00ffd700ffd200ffcc00ffc700ffc200ffbc00ffb700ffb100ffac00ffa700ffa100ff9c00ff9700ff9100ff8c"
+        "00ff8600ff8100ff7c00ff7600ff7100ff6c00ff6600ff6100ff5b00ff5600ff5100ff4b00ff4600ff4100ff3b00ff36"
+        "00ff3000ff2b00ff2600ff2000ff1b00ff1600ff1000ff0b00ff0500ff0005ff000bff0010ff0016ff001bff0020ff00"
+        "26ff002bff0031ff0036ff003bff0041ff0046ff004cff0051ff0056ff005cff0061ff0067ff006cff0072ff0077ff00"
+        "7cff0082ff0087ff008dff0092ff0097ff009dff00a2ff00a8ff00adff00b2ff00b8ff00bdff00c3ff00c8ff00cdff00"
+        "d3ff00d8ff00deff00e3ff00e8ff00eeff00f3ff00f9ff00feff00fffb00fff500fff000ffea00ffe500ffe000ffda00"
+        "ffd500ffcf00ffca00ffc400ffbf00ffba00ffb400ffaf00ffa900ffa400ff9f00ff9900ff9400ff8e00ff8900ff8400"
+        "ff7e00ff7900ff7300ff6e00ff6900ff6300ff5e00ff5800ff5300ff4e00ff4800ff4300ff3d00ff3800ff3300ff2d00"
+        "ff2800ff2200ff1d00ff1800ff1200ff0d00ff0700ff0200ff0003ff0009ff000eff0013ff0019ff001eff0023ff0029"
+    ),
+    "gist_stern": (
+        "0000001201022502043703064904085b050a6e060c80070e920810a50912b70a14c90b16db0c18ee0d1aff0e1cfa0f1e"
+        "f51020f01122eb1224e61326e11428dc152ad7162cd2172ecd1830c81932c31a34be1b36b91c38b41d3aaf1e3caa1f3e"
+        "a52040a021429b22449623469124488c254a87264c82274e7d2850782952732a546e2b56692c58642d5a5f2e5c5a2f5e"
+        "5530605031624b32644633664134683c356a37366c32376e2d3870293972243a741f3b761a3c78153d7a103e7c0b3f7e"
+        "40408041418242428443438644448845458a46468c47478e4848904949924a4a944b4b964c4c984d4d9a4e4e9c4f4f9e"
+        "5050a05151a25252a45353a65454a85555aa5656ac5757ae5858b05959b25a5ab45b5bb65c5cb85d5dba5e5ebc5f5fbe"
+        "6060c06161c26262c46363c66464c86565ca6666cc6767ce6868d06969d26a6ad46b6bd66c6cd86d6dda6e6edc6f6fde"
+        "7070e07171e27272e47373e67474e87575ea7676ec7777ee7878f07979f27a7af47b7bf67c7cf87d7dfa7e7efc7f7ffe"
+        "8080fd8181f98282f48383f08484ec8585e88686e38787df8888db8989d78a8ad28b8bce8c8cca8d8dc68e8ec18f8fbd"
+        "9090b99191b59292b09393ac9494a89595a496969f97979b9898979999929a9a8e9b9b8a9c9c869d9d819e9e7d9f9f79"
+        "a0a075a1a170a2a26ca3a368a4a464a5a55fa6a65ba7a757a8a853a9a94eaaaa4aabab46acac42adad3daeae39afaf35"
+        "b0b031b1b12cb2b228b3b324b4b420b5b51bb6b617b7b713b8b80fb9b90ababa06bbbb02bcbc02bdbd06bebe0abfbf0d"
+        "c0c011c1c115c2c219c3c31dc4c420c5c524c6c628c7c72cc8c82fc9c933caca37cbcb3bcccc3fcdcd42cece46cfcf4a"
+        "d0d04ed1d151d2d255d3d359d4d45dd5d561d6d664d7d768d8d86cd9d970dada73dbdb77dcdc7bdddd7fdede82dfdf86"
+        "e0e08ae1e18ee2e292e3e395e4e499e5e59de6e6a1e7e7a4e8e8a8e9e9aceaeab0ebebb4ececb7ededbbeeeebfefefc3"
+        "f0f0c6f1f1caf2f2cef3f3d2f4f4d5f5f5d9f6f6ddf7f7e1f8f8e5f9f9e8fafaecfbfbf0fcfcf4fdfdf7fefefbffffff"
+    ),
+    "gist_stern_r": (
+        "fffffffefefbfdfdf7fcfcf4fbfbf0fafaecf9f9e8f8f8e5f7f7e1f6f6ddf5f5d9f4f4d5f3f3d2f2f2cef1f1caf0f0c6"
+        "efefc3eeeebfededbbececb7ebebb4eaeab0e9e9ace8e8a8e7e7a4e6e6a1e5e59de4e499e3e395e2e292e1e18ee0e08a"
+        "dfdf86dede82dddd7fdcdc7bdbdb77dada73d9d970d8d86cd7d768d6d664d5d561d4d45dd3d359d2d255d1d151d0d04e"
+        "cfcf4acece46cdcd42cccc3fcbcb3bcaca37c9c933c8c82fc7c72cc6c628c5c524c4c420c3c31dc2c219c1c115c0c011"
+        "bfbf0dbebe0abdbd06bcbc02bbbb02baba06b9b90ab8b80fb7b713b6b617b5b51bb4b420b3b324b2b228b1b12cb0b031"
+        "afaf35aeae39adad3dacac42abab46aaaa4aa9a94ea8a853a7a757a6a65ba5a55fa4a464a3a368a2a26ca1a170a0a075"
+        "9f9f799e9e7d9d9d819c9c869b9b8a9a9a8e99999298989797979b96969f9595a49494a89393ac9292b09191b59090b9"
+        "8f8fbd8e8ec18d8dc68c8cca8b8bce8a8ad28989d78888db8787df8686e38585e88484ec8383f08282f48181f98080fd"
+        "7f7ffe7e7efc7d7dfa7c7cf87b7bf67a7af47979f27878f07777ee7676ec7575ea7474e87373e67272e47171e27070e0"
+        "6f6fde6e6edc6d6dda6c6cd86b6bd66a6ad46969d26868d06767ce6666cc6565ca6464c86363c66262c46161c26060c0"
+        "5f5fbe5e5ebc5d5dba5c5cb85b5bb65a5ab45959b25858b05757ae5656ac5555aa5454a85353a65252a45151a25050a0"
+        "4f4f9e4e4e9c4d4d9a4c4c984b4b964a4a9449499248489047478e46468c45458a444488434386424284414182404080"
+        "0b3f7e103e7c153d7a1a3c781f3b76243a742939722d387032376e37366c3c356a4134684633664b3264503162553060"
+        "5a2f5e5f2e5c642d5a692c586e2b56732a547829527d285082274e87264c8c254a9124489623469b2244a02142a52040"
+        "aa1f3eaf1e3cb41d3ab91c38be1b36c31a34c81932cd1830d2172ed7162cdc152ae11428e61326eb1224f01122f51020"
+        "fa0f1eff0e1cee0d1adb0c18c90b16b70a14a5091292081080070e6e060c5b050a490408370306250204120102000000"
+    ),
+    "gist_yarg": (
+        "fffffffefefefdfdfdfcfcfcfbfbfbfafafaf9f9f9f8f8f8f7f7f7f6f6f6f5f5f5f4f4f4f3f3f3f2f2f2f1f1f1f0f0f0"
+        "efefefeeeeeeedededecececebebebeaeaeae9e9e9e8e8e8e7e7e7e6e6e6e5e5e5e4e4e4e3e3e3e2e2e2e1e1e1e0e0e0"
+        "dfdfdfdedededddddddcdcdcdbdbdbdadadad9d9d9d8d8d8d7d7d7d6d6d6d5d5d5d4d4d4d3d3d3d2d2d2d1d1d1d0d0d0"
+        "cfcfcfcecececdcdcdcccccccbcbcbcacacac9c9c9c8c8c8c7c7c7c6c6c6c5c5c5c4c4c4c3c3c3c2c2c2c1c1c1c0c0c0"
+        "bfbfbfbebebebdbdbdbcbcbcbbbbbbbababab9b9b9b8b8b8b7b7b7b6b6b6b5b5b5b4b4b4b3b3b3b2b2b2b1b1b1b0b0b0"
+        "afafafaeaeaeadadadacacacabababaaaaaaa9a9a9a8a8a8a7a7a7a6a6a6a5a5a5a4a4a4a3a3a3a2a2a2a1a1a1a0a0a0"
+        "9f9f9f9e9e9e9d9d9d9c9c9c9b9b9b9a9a9a999999989898979797969696959595949494939393929292919191909090"
+        "8f8f8f8e8e8e8d8d8d8c8c8c8b8b8b8a8a8a898989888888878787868686858585848484838383828282818181808080"
+        "7f7f7f7e7e7e7d7d7d7c7c7c7b7b7b7a7a7a797979787878777777767676757575747474737373727272717171707070"
+        "6f6f6f6e6e6e6d6d6d6c6c6c6b6b6b6a6a6a696969686868676767666666656565646464636363626262616161606060"
+        "5f5f5f5e5e5e5d5d5d5c5c5c5b5b5b5a5a5a595959585858575757565656555555545454535353525252515151505050"
+        "4f4f4f4e4e4e4d4d4d4c4c4c4b4b4b4a4a4a494949484848474747464646454545444444434343424242414141404040"
+        "3f3f3f3e3e3e3d3d3d3c3c3c3b3b3b3a3a3a393939383838373737363636353535343434333333323232313131303030"
+        "2f2f2f2e2e2e2d2d2d2c2c2c2b2b2b2a2a2a292929282828272727262626252525242424232323222222212121202020"
+        "1f1f1f1e1e1e1d1d1d1c1c1c1b1b1b1a1a1a191919181818171717161616151515141414131313121212111111101010"
+        "0f0f0f0e0e0e0d0d0d0c0c0c0b0b0b0a0a0a090909080808070707060606050505040404030303020202010101000000"
+    ),
+    "gist_yarg_r": (
+        "0000000101010202020303030404040505050606060707070808080909090a0a0a0b0b0b0c0c0c0d0d0d0e0e0e0f0f0f"
+        "1010101111111212121313131414141515151616161717171818181919191a1a1a1b1b1b1c1c1c1d1d1d1e1e1e1f1f1f"
+        "2020202121212222222323232424242525252626262727272828282929292a2a2a2b2b2b2c2c2c2d2d2d2e2e2e2f2f2f"
+        "3030303131313232323333333434343535353636363737373838383939393a3a3a3b3b3b3c3c3c3d3d3d3e3e3e3f3f3f"
+        "4040404141414242424343434444444545454646464747474848484949494a4a4a4b4b4b4c4c4c4d4d4d4e4e4e4f4f4f"
+        "5050505151515252525353535454545555555656565757575858585959595a5a5a5b5b5b5c5c5c5d5d5d5e5e5e5f5f5f"
+        "6060606161616262626363636464646565656666666767676868686969696a6a6a6b6b6b6c6c6c6d6d6d6e6e6e6f6f6f"
+        "7070707171717272727373737474747575757676767777777878787979797a7a7a7b7b7b7c7c7c7d7d7d7e7e7e7f7f7f"
+        "8080808181818282828383838484848585858686868787878888888989898a8a8a8b8b8b8c8c8c8d8d8d8e8e8e8f8f8f"
+        "9090909191919292929393939494949595959696969797979898989999999a9a9a9b9b9b9c9c9c9d9d9d9e9e9e9f9f9f"
+        "a0a0a0a1a1a1a2a2a2a3a3a3a4a4a4a5a5a5a6a6a6a7a7a7a8a8a8a9a9a9aaaaaaabababacacacadadadaeaeaeafafaf"
+        "b0b0b0b1b1b1b2b2b2b3b3b3b4b4b4b5b5b5b6b6b6b7b7b7b8b8b8b9b9b9babababbbbbbbcbcbcbdbdbdbebebebfbfbf"
+        "c0c0c0c1c1c1c2c2c2c3c3c3c4c4c4c5c5c5c6c6c6c7c7c7c8c8c8c9c9c9cacacacbcbcbcccccccdcdcdcecececfcfcf"
+        "d0d0d0d1d1d1d2d2d2d3d3d3d4d4d4d5d5d5d6d6d6d7d7d7d8d8d8d9d9d9dadadadbdbdbdcdcdcdddddddedededfdfdf"
+        "e0e0e0e1e1e1e2e2e2e3e3e3e4e4e4e5e5e5e6e6e6e7e7e7e8e8e8e9e9e9eaeaeaebebebecececedededeeeeeeefefef"
+        "f0f0f0f1f1f1f2f2f2f3f3f3f4f4f4f5f5f5f6f6f6f7f7f7f8f8f8f9f9f9fafafafbfbfbfcfcfcfdfdfdfefefeffffff"
+    ),
+    "gist_yerg": (
+        "fffffffefefefdfdfdfcfcfcfbfbfbfafafaf9f9f9f8f8f8f7f7f7f6f6f6f5f5f5f4f4f4f3f3f3f2f2f2f1f1f1f0f0f0"
+        "efefefeeeeeeedededecececebebebeaeaeae9e9e9e8e8e8e7e7e7e6e6e6e5e5e5e4e4e4e3e3e3e2e2e2e1e1e1e0e0e0"
+        "dfdfdfdedededddddddcdcdcdbdbdbdadadad9d9d9d8d8d8d7d7d7d6d6d6d5d5d5d4d4d4d3d3d3d2d2d2d1d1d1d0d0d0"
+        "cfcfcfcecececdcdcdcccccccbcbcbcacacac9c9c9c8c8c8c7c7c7c6c6c6c5c5c5c4c4c4c3c3c3c2c2c2c1c1c1c0c0c0"
+        "bfbfbfbebebebdbdbdbcbcbcbbbbbbbababab9b9b9b8b8b8b7b7b7b6b6b6b5b5b5b4b4b4b3b3b3b2b2b2b1b1b1b0b0b0"
+        "afafafaeaeaeadadadacacacabababaaaaaaa9a9a9a8a8a8a7a7a7a6a6a6a5a5a5a4a4a4a3a3a3a2a2a2a1a1a1a0a0a0"
+        "9f9f9f9e9e9e9d9d9d9c9c9c9b9b9b9a9a9a999999989898979797969696959595949494939393929292919191909090"
+        "8f8f8f8e8e8e8d8d8d8c8c8c8b8b8b8a8a8a898989888888878787868686858585848484838383828282818181808080"
+        "7f7f7f7e7e7e7d7d7d7c7c7c7b7b7b7a7a7a797979787878777777767676757575747474737373727272717171707070"
+        "6f6f6f6e6e6e6d6d6d6c6c6c6b6b6b6a6a6a696969686868676767666666656565646464636363626262616161606060"
+        "5f5f5f5e5e5e5d5d5d5c5c5c5b5b5b5a5a5a595959585858575757565656555555545454535353525252515151505050"
+        "4f4f4f4e4e4e4d4d4d4c4c4c4b4b4b4a4a4a494949484848474747464646454545444444434343424242414141404040"
+        "3f3f3f3e3e3e3d3d3d3c3c3c3b3b3b3a3a3a393939383838373737363636353535343434333333323232313131303030"
+        "2f2f2f2e2e2e2d2d2d2c2c2c2b2b2b2a2a2a292929282828272727262626252525242424232323222222212121202020"
+        "1f1f1f1e1e1e1d1d1d1c1c1c1b1b1b1a1a1a191919181818171717161616151515141414131313121212111111101010"
+        "0f0f0f0e0e0e0d0d0d0c0c0c0b0b0b0a0a0a090909080808070707060606050505040404030303020202010101000000"
+    ),
+    "gnuplot": (
+        "00000010000617000d1c001320001924001f2700262a002c2d003230003832003e35004437004a3a00503c00563e005c"
+        "40006242006844006d46007347007949007e4b00844d00894e008e50009351009853009d5400a25600a75700ac5900b0"
+        "5a01b55c01b95d01be5e01c26001c66101ca6201cd6401d16501d56601d86701db6901de6a01e16b01e46c01e76d02ea"
+        "6f02ec7002ee7102f17202f37302f47402f67502f87603f97703fa7903fb7a03fc7b03fd7c03fe7d03fe7e04ff7f04ff"
+        "8004ff8104ff8204ff8305fe8405fe8505fd8605fc8706fb8706fa8806f88906f78a06f58b07f38c07f28d07ef8e08ed"
+        "8f08eb9008e89108e69109e39209e09309dd940ada950ad6960ad3970bcf970bcb980cc8990cc49a0cc09b0dbb9c0db7"
+        "9c0eb39d0eae9e0ea99f0fa5a00fa0a0109ba11096a21191a3118ca41286a41281a5137ba61376a71470a7146ba81565"
+        "a9165faa1659aa1753ab174dac1847ad1941ad193bae1a35af1b2fb01b29b01c22b11d1cb21d16b31e10b31f09b42003"
+        "b52000b52100b62200b72300b72300b82400b92500ba2600ba2700bb2800bc2800bc2900bd2a00be2b00be2c00bf2d00"
+        "c02e00c02f00c13000c23100c23200c33300c43400c43500c53600c63700c63800c73900c73a00c83c00c93d00c93e00"
+        "ca3f00cb4000cb4100cc4300cc4400cd4500ce4600ce4800cf4900d04a00d04c00d14d00d14e00d25000d35100d35200"
+        "d45400d45500d55700d65800d65a00d75b00d75d00d85e00d96000d96100da6300da6500db6600dc6800dc6900dd6b00"
+        "dd6d00de6f00de7000df7200e07400e07600e17700e17900e27b00e27d00e37f00e48100e48300e58400e58600e68800"
+        "e68a00e78c00e78e00e89000e99300e99500ea9700ea9900eb9b00eb9d00ec9f00eca200eda400eda600eea800eeab00"
+        "efad00f0af00f0b200f1b400f1b600f2b900f2bb00f3be00f3c000f4c300f4c500f5c800f5ca00f6cd00f6cf00f7d200"
+        "f7d500f8d700f8da00f9dd00f9df00fae200fae500fbe800fbeb00fced00fcf000fdf300fdf600fef900fefc00ffff00"
+    ),
+    "gnuplot2": (
+        "00000000000400000800000c00001000001400001800001c00002000002400002800002c00003000003400003800003c"
+        "00004000004400004800004c00005000005400005800005c00006000006400006800006c00007000007400007800007c"
+        "00008000008400008800008c00009000009400009800009c0000a00000a40000a80000ac0000b00000b40000b80000bc"
+        "0000c00000c40000c80000cc0000d00000d40000d80000dc0000e00000e40000e80000ec0000f00000f40000f80000fc"
+        "0100ff0400ff0700ff0a00ff0d00ff1000ff1400ff1700ff1a00ff1d00ff2000ff2300ff2600ff2900ff2d00ff3000ff"
+        "3300ff3600ff3900ff3c00ff3f00ff4200ff4600ff4900ff4c00ff4f00ff5200ff5500ff5800ff5b00ff5f00ff6200ff"
+        "6500ff6800ff6b00ff6e00ff7100ff7400ff7800ff7b00ff7e00ff8100ff8400ff8700ff8a02fd8d04fb9106f99408f7"
+        "970af59a0cf39d0ef1a010efa312eda614ebaa16e9ad18e7b01ae5b31ce3b61ee1b920dfbc22ddbf24dbc326d9c628d7"
+        "c92ad5cc2cd3cf2ed1d230cfd532cdd834cbdc36c9df38c7e23ac5e53cc3e83ec1eb40bfee42bdf144bbf546b9f848b7"
+        "fb4ab5fe4cb3ff4eb1ff50afff52adff54abff56a9ff58a7ff5aa5ff5ca3ff5ea1ff609fff629dff649bff6699ff6897"
+        "ff6a95ff6c93ff6e91ff708fff728dff748bff7689ff7887ff7a85ff7c83ff7e81ff807fff827dff847bff8679ff8877"
+        "ff8a75ff8c73ff8e71ff906fff926dff946bff9669ff9867ff9a65ff9c63ff9e61ffa05fffa25dffa45bffa659ffa857"
+        "ffaa55ffac53ffae51ffb04fffb24dffb44bffb649ffb847ffba45ffbc43ffbe41ffc03fffc23dffc43bffc639ffc837"
+        "ffca35ffcc33ffce31ffd02fffd22dffd42bffd629ffd827ffda25ffdc23ffde21ffe01fffe21dffe41bffe619ffe817"
+        "ffea15ffec13ffee11fff00ffff20dfff40bfff609fff807fffa05fffc03fffe01ffff05ffff11ffff1effff2affff37"
+        "ffff43ffff50ffff5cffff69ffff75ffff82ffff8effff9bffffa7ffffb4ffffc0ffffcdffffdaffffe6fffff3ffffff"
+    ),
+    "gnuplot2_r": (
+        "fffffffffff3ffffe6ffffdaffffcdffffc0ffffb4ffffa7ffff9bffff8effff82ffff76ffff69ffff5cffff50ffff43"
+        "ffff37ffff2affff1effff11ffff05fffe01fffc03fffa05fff807fff609fff40bfff20dfff00fffee11ffec13ffea15"
+        "ffe817ffe619ffe41bffe21dffe01fffde21ffdc23ffda25ffd827ffd629ffd42bffd22dffd02fffce31ffcc33ffca35"
+        "ffc837ffc639ffc43bffc23dffc03fffbe41ffbc43ffba45ffb847ffb649ffb44bffb24dffb04fffae51ffac53ffaa55"
+        "ffa857ffa659ffa45bffa25dffa05fff9e61ff9c63ff9a65ff9867ff9669ff946bff926dff906fff8e71ff8c73ff8a75"
+        "ff8877ff8679ff847bff827dff807fff7e81ff7c83ff7a85ff7887ff7689ff748bff728dff708fff6e91ff6c93ff6a95"
+        "ff6897ff6699ff649bff629dff609fff5ea1ff5ca3ff5aa5ff58a7ff56a9ff54abff52adff50afff4eb1fe4cb3fb4ab5"
+        "f848b7f546b9f144bbee42bdeb40bfe83ec1e53cc3e23ac5df38c7dc36c9d834cbd532cdd230cfcf2ed1cc2cd3c92ad5"
+        "c628d7c326d9bf24dbbc22ddb920dfb61ee1b31ce3b01ae5ad18e7aa16e9a614eba312eda010ef9d0ef19a0cf3970af5"
+        "9408f79106f98d04fb8a02fd8700ff8400ff8100ff7e00ff7b00ff7800ff7400ff7100ff6e00ff6b00ff6800ff6500ff"
+        "6200ff5f00ff5b00ff5800ff5500ff5200ff4f00ff4c00ff4900ff4600ff4200ff3f00ff3c00ff3900ff3600ff3300ff"
+        "3000ff2d00ff2900ff2600ff2300ff2000ff1d00ff1a00ff1700ff1400ff1000ff0d00ff0a00ff0700ff0400ff0100ff"
+        "0000fc0000f80000f40000f00000ec0000e80000e40000e00000dc0000d80000d40000d00000cc0000c80000c40000c0"
+        "0000bc0000b80000b40000b00000ac0000a80000a40000a000009c00009800009400009000008c000088000084000080"
+        "00007c00007800007400007000006c00006800006400006000005c00005800005400005000004c000048000044000040"
+        "00003c00003800003400003000002c00002800002400002000001c00001800001400001000000c000008000004000000"
+    ),
+    "gnuplot_r": (
+        "ffff00fefc00fef900fdf600fdf300fcf000fced00fbeb00fbe800fae500fae200f9df00f9dd00f8da00f8d700f7d500"
+        "f7d200f6cf00f6cd00f5ca00f5c800f4c500f4c300f3c000f3be00f2bb00f2b900f1b600f1b400f0b200f0af00efad00"
+        "eeab00eea800eda600eda400eca200ec9f00eb9d00eb9b00ea9900ea9700e99500e99300e89000e78e00e78c00e68a00"
+        "e68800e58600e58400e48300e48100e37f00e27d00e27b00e17900e17700e07600e07400df7200de7000de6f00dd6d00"
+        "dd6b00dc6900dc6800db6600da6500da6300d96100d96000d85e00d75d00d75b00d65a00d65800d55700d45500d45400"
+        "d35200d35100d25000d14e00d14d00d04c00d04a00cf4900ce4800ce4600cd4500cc4400cc4300cb4100cb4000ca3f00"
+        "c93e00c93d00c83c00c73a00c73900c63800c63700c53600c43500c43400c33300c23200c23100c13000c02f00c02e00"
+        "bf2d00be2c00be2b00bd2a00bc2900bc2800bb2800ba2700ba2600b92500b82400b72300b72300b62200b52100b52000"
+        "b42003b31f09b31e10b21d16b11d1cb01c22b01b29af1b2fae1a35ad193bad1941ac1847ab174daa1753aa1659a9165f"
+        "a81565a7146ba71470a61376a5137ba41281a41286a3118ca21191a11096a0109ba00fa09f0fa59e0ea99d0eae9c0eb3"
+        "9c0db79b0dbb9a0cc0990cc4980cc8970bcb970bcf960ad3950ad6940ada9309dd9209e09109e39108e69008e88f08eb"
+        "8e08ed8d07ef8c07f28b07f38a06f58906f78806f88706fa8706fb8605fc8505fd8405fe8305fe8204ff8104ff8004ff"
+        "7f04ff7e04ff7d03fe7c03fe7b03fd7a03fc7903fb7703fa7603f97502f87402f67302f47202f37102f17002ee6f02ec"
+        "6d02ea6c01e76b01e46a01e16901de6701db6601d86501d56401d16201cd6101ca6001c65e01c25d01be5c01b95a01b5"
+        "5900b05700ac5600a75400a253009d5100985000934e008e4d00894b008449007e47007946007344006d420068400062"
+        "3e005c3c00563a005037004a35004432003e3000382d00322a002c27002624001f2000191c001317000d100006000000"
+    ),
+    "gray": (
+        "0000000101010202020303030404040505050606060707070808080909090a0a0a0b0b0b0c0c0c0d0d0d0e0e0e0f0f0f"
+        "1010101111111212121313131414141515151616161717171818181919191a1a1a1b1b1b1c1c1c1d1d1d1e1e1e1f1f1f"
+        "2020202121212222222323232424242525252626262727272828282929292a2a2a2b2b2b2c2c2c2d2d2d2e2e2e2f2f2f"
+        "3030303131313232323333333434343535353636363737373838383939393a3a3a3b3b3b3c3c3c3d3d3d3e3e3e3f3f3f"
+        "4040404141414242424343434444444545454646464747474848484949494a4a4a4b4b4b4c4c4c4d4d4d4e4e4e4f4f4f"
+        "5050505151515252525353535454545555555656565757575858585959595a5a5a5b5b5b5c5c5c5d5d5d5e5e5e5f5f5f"
+        "6060606161616262626363636464646565656666666767676868686969696a6a6a6b6b6b6c6c6c6d6d6d6e6e6e6f6f6f"
+        "7070707171717272727373737474747575757676767777777878787979797a7a7a7b7b7b7c7c7c7d7d7d7e7e7e7f7f7f"
+        "8080808181818282828383838484848585858686868787878888888989898a8a8a8b8b8b8c8c8c8d8d8d8e8e8e8f8f8f"
+        "9090909191919292929393939494949595959696969797979898989999999a9a9a9b9b9b9c9c9c9d9d9d9e9e9e9f9f9f"
+        "a0a0a0a1a1a1a2a2a2a3a3a3a4a4a4a5a5a5a6a6a6a7a7a7a8a8a8a9a9a9aaaaaaabababacacacadadadaeaeaeafafaf"
+        "b0b0b0b1b1b1b2b2b2b3b3b3b4b4b4b5b5b5b6b6b6b7b7b7b8b8b8b9b9b9babababbbbbbbcbcbcbdbdbdbebebebfbfbf"
+        "c0c0c0c1c1c1c2c2c2c3c3c3c4c4c4c5c5c5c6c6c6c7c7c7c8c8c8c9c9c9cacacacbcbcbcccccccdcdcdcecececfcfcf"
+        "d0d0d0d1d1d1d2d2d2d3d3d3d4d4d4d5d5d5d6d6d6d7d7d7d8d8d8d9d9d9dadadadbdbdbdcdcdcdddddddedededfdfdf"
+        "e0e0e0e1e1e1e2e2e2e3e3e3e4e4e4e5e5e5e6e6e6e7e7e7e8e8e8e9e9e9eaeaeaebebebecececedededeeeeeeefefef"
+        "f0f0f0f1f1f1f2f2f2f3f3f3f4f4f4f5f5f5f6f6f6f7f7f7f8f8f8f9f9f9fafafafbfbfbfcfcfcfdfdfdfefefeffffff"
+    ),
+    "gray_r": (
+        "fffffffefefefdfdfdfcfcfcfbfbfbfafafaf9f9f9f8f8f8f7f7f7f6f6f6f5f5f5f4f4f4f3f3f3f2f2f2f1f1f1f0f0f0"
+        "efefefeeeeeeedededecececebebebeaeaeae9e9e9e8e8e8e7e7e7e6e6e6e5e5e5e4e4e4e3e3e3e2e2e2e1e1e1e0e0e0"
+        "dfdfdfdedededddddddcdcdcdbdbdbdadadad9d9d9d8d8d8d7d7d7d6d6d6d5d5d5d4d4d4d3d3d3d2d2d2d1d1d1d0d0d0"
+        "cfcfcfcecececdcdcdcccccccbcbcbcacacac9c9c9c8c8c8c7c7c7c6c6c6c5c5c5c4c4c4c3c3c3c2c2c2c1c1c1c0c0c0"
+        "bfbfbfbebebebdbdbdbcbcbcbbbbbbbababab9b9b9b8b8b8b7b7b7b6b6b6b5b5b5b4b4b4b3b3b3b2b2b2b1b1b1b0b0b0"
+        "afafafaeaeaeadadadacacacabababaaaaaaa9a9a9a8a8a8a7a7a7a6a6a6a5a5a5a4a4a4a3a3a3a2a2a2a1a1a1a0a0a0"
+        "9f9f9f9e9e9e9d9d9d9c9c9c9b9b9b9a9a9a999999989898979797969696959595949494939393929292919191909090"
+        "8f8f8f8e8e8e8d8d8d8c8c8c8b8b8b8a8a8a898989888888878787868686858585848484838383828282818181808080"
+        "7f7f7f7e7e7e7d7d7d7c7c7c7b7b7b7a7a7a797979787878777777767676757575747474737373727272717171707070"
+        "6f6f6f6e6e6e6d6d6d6c6c6c6b6b6b6a6a6a696969686868676767666666656565646464636363626262616161606060"
+        "5f5f5f5e5e5e5d5d5d5c5c5c5b5b5b5a5a5a595959585858575757565656555555545454535353525252515151505050"
+        "4f4f4f4e4e4e4d4d4d4c4c4c4b4b4b4a4a4a494949484848474747464646454545444444434343424242414141404040"
+        "3f3f3f3e3e3e3d3d3d3c3c3c3b3b3b3a3a3a393939383838373737363636353535343434333333323232313131303030"
+        "2f2f2f2e2e2e2d2d2d2c2c2c2b2b2b2a2a2a292929282828272727262626252525242424232323222222212121202020"
+        "1f1f1f1e1e1e1d1d1d1c1c1c1b1b1b1a1a1a191919181818171717161616151515141414131313121212111111101010"
+        "0f0f0f0e0e0e0d0d0d0c0c0c0b0b0b0a0a0a090909080808070707060606050505040404030303020202010101000000"
+    ),
+    "grey": (
+        "0000000101010202020303030404040505050606060707070808080909090a0a0a0b0b0b0c0c0c0d0d0d0e0e0e0f0f0f"
+        "1010101111111212121313131414141515151616161717171818181919191a1a1a1b1b1b1c1c1c1d1d1d1e1e1e1f1f1f"
+        "2020202121212222222323232424242525252626262727272828282929292a2a2a2b2b2b2c2c2c2d2d2d2e2e2e2f2f2f"
+        "3030303131313232323333333434343535353636363737373838383939393a3a3a3b3b3b3c3c3c3d3d3d3e3e3e3f3f3f"
+        "4040404141414242424343434444444545454646464747474848484949494a4a4a4b4b4b4c4c4c4d4d4d4e4e4e4f4f4f"
+        "5050505151515252525353535454545555555656565757575858585959595a5a5a5b5b5b5c5c5c5d5d5d5e5e5e5f5f5f"
+        "6060606161616262626363636464646565656666666767676868686969696a6a6a6b6b6b6c6c6c6d6d6d6e6e6e6f6f6f"
+        "7070707171717272727373737474747575757676767777777878787979797a7a7a7b7b7b7c7c7c7d7d7d7e7e7e7f7f7f"
+        "8080808181818282828383838484848585858686868787878888888989898a8a8a8b8b8b8c8c8c8d8d8d8e8e8e8f8f8f"
+        "9090909191919292929393939494949595959696969797979898989999999a9a9a9b9b9b9c9c9c9d9d9d9e9e9e9f9f9f"
+        "a0a0a0a1a1a1a2a2a2a3a3a3a4a4a4a5a5a5a6a6a6a7a7a7a8a8a8a9a9a9aaaaaaabababacacacadadadaeaeaeafafaf"
+        "b0b0b0b1b1b1b2b2b2b3b3b3b4b4b4b5b5b5b6b6b6b7b7b7b8b8b8b9b9b9babababbbbbbbcbcbcbdbdbdbebebebfbfbf"
+        "c0c0c0c1c1c1c2c2c2c3c3c3c4c4c4c5c5c5c6c6c6c7c7c7c8c8c8c9c9c9cacacacbcbcbcccccccdcdcdcecececfcfcf"
+        "d0d0d0d1d1d1d2d2d2d3d3d3d4d4d4d5d5d5d6d6d6d7d7d7d8d8d8d9d9d9dadadadbdbdbdcdcdcdddddddedededfdfdf"
+        "e0e0e0e1e1e1e2e2e2e3e3e3e4e4e4e5e5e5e6e6e6e7e7e7e8e8e8e9e9e9eaeaeaebebebecececedededeeeeeeefefef"
+        "f0f0f0f1f1f1f2f2f2f3f3f3f4f4f4f5f5f5f6f6f6f7f7f7f8f8f8f9f9f9fafafafbfbfbfcfcfcfdfdfdfefefeffffff"
+    ),
+    "hot": (
+        "0b00000d00001000001200001500001800001a00001d00002000002200002500002700002a00002d00002f0000320000"
+        "3500003700003a00003c00003f00004200004400004700004a00004c00004f00005100005400005700005900005c0000"
+        "5f00006100006400006600006900006c00006e00007100007400007600007900007b00007e0000810000830000860000"
+        "8900008b00008e00009000009300009600009800009b00009e0000a00000a30000a50000a80000ab0000ad0000b00000"
+        "b30000b50000b80000ba0000bd0000c00000c20000c50000c80000ca0000cd0000cf0000d20000d50000d70000da0000"
+        "dd0000df0000e20000e40000e70000ea0000ec0000ef0000f20000f40000f70000f90000fc0000ff0000ff0200ff0500"
+        "ff0800ff0a00ff0d00ff1000ff1200ff1500ff1700ff1a00ff1d00ff1f00ff2200ff2500ff2700ff2a00ff2c00ff2f00"
+        "ff3200ff3400ff3700ff3a00ff3c00ff3f00ff4100ff4400ff4700ff4900ff4c00ff4f00ff5100ff5400ff5600ff5900"
+        "ff5c00ff5e00ff6100ff6400ff6600ff6900ff6b00ff6e00ff7100ff7300ff7600ff7900ff7b00ff7e00ff8000ff8300"
+        "ff8600ff8800ff8b00ff8e00ff9000ff9300ff9500ff9800ff9b00ff9d00ffa000ffa200ffa500ffa800ffaa00ffad00"
+        "ffb000ffb200ffb500ffb700ffba00ffbd00ffbf00ffc200ffc500ffc700ffca00ffcc00ffcf00ffd200ffd400ffd700"
+        "ffda00ffdc00ffdf00ffe100ffe400ffe700ffe900ffec00ffef00fff100fff400fff600fff900fffc00fffe00ffff03"
+        "ffff07ffff0bffff0fffff13ffff17ffff1bffff1fffff22ffff26ffff2affff2effff32ffff36ffff3affff3effff42"
+        "ffff46ffff4affff4effff52ffff56ffff5affff5effff61ffff65ffff69ffff6dffff71ffff75ffff79ffff7dffff81"
+        "ffff85ffff89ffff8dffff91ffff95ffff99ffff9dffffa0ffffa4ffffa8ffffacffffb0ffffb4ffffb8ffffbcffffc0"
+        "ffffc4ffffc8ffffccffffd0ffffd4ffffd8ffffdcffffdfffffe3ffffe7ffffebffffeffffff3fffff7fffffbffffff"
+    ),
+    "hot_r": (
+        "fffffffffffbfffff7fffff3ffffefffffebffffe7ffffe3ffffdfffffdcffffd8ffffd4ffffd0ffffccffffc8ffffc4"
+        "ffffc0ffffbcffffb8ffffb4ffffb0ffffacffffa8ffffa4ffffa0ffff9dffff99ffff95ffff91ffff8dffff89ffff85"
+        "ffff81ffff7dffff79ffff75ffff71ffff6dffff69ffff65ffff61ffff5effff5affff56ffff52ffff4effff4affff46"
+        "ffff42ffff3effff3affff36ffff32ffff2effff2affff26ffff22ffff1fffff1bffff17ffff13ffff0fffff0bffff07"
+        "ffff03fffe00fffc00fff900fff600fff400fff100ffef00ffec00ffe900ffe700ffe400ffe100ffdf00ffdc00ffda00"
+        "ffd700ffd400ffd200ffcf00ffcc00ffca00ffc700ffc500ffc200ffbf00ffbd00ffba00ffb700ffb500ffb200ffb000"
+        "ffad00ffaa00ffa800ffa500ffa200ffa000ff9d00ff9b00ff9800ff9500ff9300ff9000ff8e00ff8b00ff8800ff8600"
+        "ff8300ff8000ff7e00ff7b00ff7900ff7600ff7300ff7100ff6e00ff6b00ff6900ff6600ff6400ff6100ff5e00ff5c00"
+        "ff5900ff5600ff5400ff5100ff4f00ff4c00ff4900ff4700ff4400ff4100ff3f00ff3c00ff3a00ff3700ff3400ff3200"
+        "ff2f00ff2c00ff2a00ff2700ff2500ff2200ff1f00ff1d00ff1a00ff1700ff1500ff1200ff1000ff0d00ff0a00ff0800"
+        "ff0500ff0200ff0000fc0000f90000f70000f40000f20000ef0000ec0000ea0000e70000e40000e20000df0000dd0000"
+        "da0000d70000d50000d20000cf0000cd0000ca0000c80000c50000c20000c00000bd0000ba0000b80000b50000b30000"
+        "b00000ad0000ab0000a80000a50000a30000a000009e00009b00009800009600009300009000008e00008b0000890000"
+        "8600008300008100007e00007b00007900007600007400007100006e00006c00006900006600006400006100005f0000"
+        "5c00005900005700005400005100004f00004c00004a00004700004400004200003f00003c00003a0000370000350000"
+        "3200002f00002d00002a00002700002500002200002000001d00001a00001800001500001200001000000d00000b0000"
+    ),
+    "hsv": (
+        "ff0000ff0600ff0c00ff1200ff1800ff1e00ff2300ff2900ff2f00ff3500ff3b00ff4100ff4700ff4d00ff5300ff5900"
+        "ff5f00ff6400ff6a00ff7000ff7600ff7c00ff8200ff8800ff8e00ff9400ff9a00ff9f00ffa500ffab00ffb100ffb700"
+        "ffbd00ffc300ffc900ffcf00ffd500ffdb00ffe000ffe600ffec00fef100fcf500faf900f8fd00f4ff00eeff00e8ff00"
+        "e2ff00ddff00d7ff00d1ff00cbff00c5ff00bfff00b9ff00b3ff00adff00a7ff00a2ff009cff0096ff0090ff008aff00"
+        "84ff007eff0078ff0072ff006cff0066ff0061ff005bff0055ff004fff0049ff0043ff003dff0037ff0031ff002bff00"
+        "25ff0020ff001aff0014ff000eff0008ff0006ff0404ff0802ff0c00ff1000ff1600ff1b00ff2100ff2700ff2d00ff33"
+        "00ff3900ff3f00ff4500ff4b00ff5100ff5700ff5c00ff6200ff6800ff6e00ff7400ff7a00ff8000ff8600ff8c00ff92"
+        "00ff9700ff9d00ffa300ffa900ffaf00ffb500ffbb00ffc100ffc700ffcd00ffd300ffd800ffde00ffe400ffea00fff0"
+        "00fff600fffc00fcff00f6ff00f0ff00eaff00e5ff00dfff00d9ff00d3ff00cdff00c7ff00c1ff00bbff00b5ff00afff"
+        "00aaff00a4ff009eff0098ff0092ff008cff0086ff0080ff007aff0074ff006eff0069ff0063ff005dff0057ff0051ff"
+        "004bff0045ff003fff0039ff0033ff002dff0028ff0022ff001cff0016ff0010ff020cff0408ff0604ff0800ff0e00ff"
+        "1300ff1900ff1f00ff2500ff2b00ff3100ff3700ff3d00ff4300ff4900ff4f00ff5400ff5a00ff6000ff6600ff6c00ff"
+        "7200ff7800ff7e00ff8400ff8a00ff9000ff9500ff9b00ffa100ffa700ffad00ffb300ffb900ffbf00ffc500ffcb00ff"
+        "d000ffd600ffdc00ffe200ffe800ffee00fff400fff800fdfa00f9fc00f5fe00f1ff00edff00e7ff00e1ff00dbff00d5"
+        "ff00cfff00c9ff00c3ff00bdff00b7ff00b1ff00acff00a6ff00a0ff009aff0094ff008eff0088ff0082ff007cff0076"
+        "ff0071ff006bff0065ff005fff0059ff0053ff004dff0047ff0041ff003bff0035ff0030ff002aff0024ff001eff0018"
+    ),
+    "hsv_r": (
+        "ff0018ff001eff0024ff002aff0030ff0035ff003bff0041ff0047ff004dff0053ff0059ff005fff0065ff006bff0071"
+        "ff0076ff007cff0082ff0088ff008eff0094ff009aff00a0ff00a6ff00acff00b1ff00b7ff00bdff00c3ff00c9ff00cf"
+        "ff00d5ff00dbff00e1ff00e7ff00edfe00f1fc00f5fa00f9f800fdf400ffee00ffe800ffe200ffdc00ffd600ffd000ff"
+        "cb00ffc500ffbf00ffb900ffb300ffad00ffa700ffa100ff9b00ff9500ff9000ff8a00ff8400ff7e00ff7800ff7200ff"
+        "6c00ff6600ff6000ff5a00ff5400ff4f00ff4900ff4300ff3d00ff3700ff3100ff2b00ff2500ff1f00ff1900ff1300ff"
+        "0e00ff0800ff0604ff0408ff020cff0010ff0016ff001cff0022ff0028ff002dff0033ff0039ff003fff0045ff004bff"
+        "0051ff0057ff005dff0063ff0069ff006eff0074ff007aff0080ff0086ff008cff0092ff0098ff009eff00a4ff00aaff"
+        "00afff00b5ff00bbff00c1ff00c7ff00cdff00d3ff00d9ff00dfff00e5ff00eaff00f0ff00f6ff00fcff00fffc00fff6"
+        "00fff000ffea00ffe400ffde00ffd800ffd300ffcd00ffc700ffc100ffbb00ffb500ffaf00ffa900ffa300ff9d00ff97"
+        "00ff9200ff8c00ff8600ff8000ff7a00ff7400ff6e00ff6800ff6200ff5c00ff5700ff5100ff4b00ff4500ff3f00ff39"
+        "00ff3300ff2d00ff2700ff2100ff1b00ff1600ff1002ff0c04ff0806ff0408ff000eff0014ff001aff0020ff0025ff00"
+        "2bff0031ff0037ff003dff0043ff0049ff004fff0055ff005bff0061ff0066ff006cff0072ff0078ff007eff0084ff00"
+        "8aff0090ff0096ff009cff00a2ff00a7ff00adff00b3ff00b9ff00bfff00c5ff00cbff00d1ff00d7ff00ddff00e2ff00"
+        "e8ff00eeff00f4ff00f8fd00faf900fcf500fef100ffec00ffe600ffe000ffdb00ffd500ffcf00ffc900ffc300ffbd00"
+        "ffb700ffb100ffab00ffa500ff9f00ff9a00ff9400ff8e00ff8800ff8200ff7c00ff7600ff7000ff6a00ff6400ff5f00"
+        "ff5900ff5300ff4d00ff4700ff4100ff3b00ff3500ff2f00ff2900ff2300ff1e00ff1800ff1200ff0c00ff0600ff0000"
+    ),
+    "inferno": (
+        "00000401000501010601010802010a02020c02020e03021004031204031405041706041907051b08051d09061f0a0722"
+        "0b07240c08260d08290e092b10092d110a30120a32140b34150b37160b39180c3c190c3e1b0c411c0c431e0c451f0c48"
+        "210c4a230c4c240c4f260c51280b53290b552b0b572d0b592f0a5b310a5c320a5e340a5f3609613809623909633b0964"
+        "3d09653e0966400a67420a68440a68450a69470b6a490b6a4a0c6b4c0c6b4d0d6c4f0d6c510e6c520e6d540f6d550f6d"
+        "57106e59106e5a116e5c126e5d126e5f136e61136e62146e64156e65156e67166e69166e6a176e6c186e6d186e6f196e"
+        "71196e721a6e741a6e751b6e771c6d781c6d7a1d6d7c1d6d7d1e6d7f1e6c801f6c82206c84206b85216b87216b88226a"
+        "8a226a8c23698d23698f24699025689225689326679526679727669827669a28659b29649d29649f2a63a02a63a22b62"
+        "a32c61a52c60a62d60a82e5fa92e5eab2f5ead305dae305cb0315bb1325ab3325ab43359b63458b73557b93556ba3655"
+        "bc3754bd3853bf3952c03a51c13a50c33b4fc43c4ec63d4dc73e4cc83f4bca404acb4149cc4248ce4347cf4446d04545"
+        "d24644d34743d44842d54a41d74b3fd84c3ed94d3dda4e3cdb503bdd513ade5238df5337e05536e15635e25734e35933"
+        "e45a31e55c30e65d2fe75e2ee8602de9612bea632aeb6429eb6628ec6726ed6925ee6a24ef6c23ef6e21f06f20f1711f"
+        "f1731df2741cf3761bf37819f47918f57b17f57d15f67e14f68013f78212f78410f8850ff8870ef8890cf98b0bf98c0a"
+        "f98e09fa9008fa9207fa9407fb9606fb9706fb9906fb9b06fb9d07fc9f07fca108fca309fca50afca60cfca80dfcaa0f"
+        "fcac11fcae12fcb014fcb216fcb418fbb61afbb81dfbba1ffbbc21fbbe23fac026fac228fac42afac62df9c72ff9c932"
+        "f9cb35f8cd37f8cf3af7d13df7d340f6d543f6d746f5d949f5db4cf4dd4ff4df53f4e156f3e35af3e55df2e661f2e865"
+        "f2ea69f1ec6df1ed71f1ef75f1f179f2f27df2f482f3f586f3f68af4f88ef5f992f6fa96f8fb9af9fc9dfafda1fcffa4"
+    ),
+    "inferno_r": (
+        "fcffa4fafda1f9fc9df8fb9af6fa96f5f992f4f88ef3f68af3f586f2f482f2f27df1f179f1ef75f1ed71f1ec6df2ea69"
+        "f2e865f2e661f3e55df3e35af4e156f4df53f4dd4ff5db4cf5d949f6d746f6d543f7d340f7d13df8cf3af8cd37f9cb35"
+        "f9c932f9c72ffac62dfac42afac228fac026fbbe23fbbc21fbba1ffbb81dfbb61afcb418fcb216fcb014fcae12fcac11"
+        "fcaa0ffca80dfca60cfca50afca309fca108fc9f07fb9d07fb9b06fb9906fb9706fb9606fa9407fa9207fa9008f98e09"
+        "f98c0af98b0bf8890cf8870ef8850ff78410f78212f68013f67e14f57d15f57b17f47918f37819f3761bf2741cf1731d"
+        "f1711ff06f20ef6e21ef6c23ee6a24ed6925ec6726eb6628eb6429ea632ae9612be8602de75e2ee65d2fe55c30e45a31"
+        "e35933e25734e15635e05536df5337de5238dd513adb503bda4e3cd94d3dd84c3ed74b3fd54a41d44842d34743d24644"
+        "d04545cf4446ce4347cc4248cb4149ca404ac83f4bc73e4cc63d4dc43c4ec33b4fc13a50c03a51bf3952bd3853bc3754"
+        "ba3655b93556b73557b63458b43359b3325ab1325ab0315bae305cad305dab2f5ea92e5ea82e5fa62d60a52c60a32c61"
+        "a22b62a02a639f2a639d29649b29649a28659827669727669526679326679225689025688f24698d23698c23698a226a"
+        "88226a87216b85216b84206b82206c801f6c7f1e6c7d1e6d7c1d6d7a1d6d781c6d771c6d751b6e741a6e721a6e71196e"
+        "6f196e6d186e6c186e6a176e69166e67166e65156e64156e62146e61136e5f136e5d126e5c126e5a116e59106e57106e"
+        "550f6d540f6d520e6d510e6c4f0d6c4d0d6c4c0c6b4a0c6b490b6a470b6a450a69440a68420a68400a673e09663d0965"
+        "3b0964390963380962360961340a5f320a5e310a5c2f0a5b2d0b592b0b57290b55280b53260c51240c4f230c4c210c4a"
+        "1f0c481e0c451c0c431b0c41190c3e180c3c160b39150b37140b34120a32110a3010092d0e092b0d08290c08260b0724"
+        "0a072209061f08051d07051b06041905041704031404031203021002020e02020c02010a010108010106010005000004"
+    ),
+    "jet": (
+        "00008000008400008900008d00009200009600009b00009f0000a40000a80000ad0000b20000b60000bb0000bf0000c4"
+        "0000c80000cd0000d10000d60000da0000df0000e30000e80000ed0000f10000f60000fa0000ff0000ff0000ff0000ff"
+        "0000ff0004ff0008ff000cff0010ff0014ff0018ff001cff0020ff0024ff0028ff002cff0030ff0034ff0038ff003cff"
+        "0040ff0044ff0048ff004cff0050ff0054ff0058ff005cff0060ff0064ff0068ff006cff0070ff0074ff0078ff007cff"
+        "0080ff0084ff0088ff008cff0090ff0094ff0098ff009cff00a0ff00a4ff00a8ff00acff00b0ff00b4ff00b8ff00bcff"
+        "00c0ff00c4ff00c8ff00ccff00d0ff00d4ff00d8ff00dcfe00e0fb00e4f802e8f406ecf109f0ee0cf4eb0ff8e713fce4"
+        "16ffe119ffde1cffdb1fffd723ffd426ffd129ffce2cffca30ffc733ffc436ffc139ffbe3cffba40ffb743ffb446ffb1"
+        "49ffad4dffaa50ffa753ffa456ffa05aff9d5dff9a60ff9763ff9466ff906aff8d6dff8a70ff8773ff8377ff807aff7d"
+        "7dff7a80ff7783ff7387ff708aff6d8dff6a90ff6694ff6397ff609aff5d9dff5aa0ff56a4ff53a7ff50aaff4dadff49"
+        "b1ff46b4ff43b7ff40baff3cbeff39c1ff36c4ff33c7ff30caff2cceff29d1ff26d4ff23d7ff1fdbff1cdeff19e1ff16"
+        "e4ff13e7ff0febff0ceeff09f1fc06f4f802f8f500fbf100feed00ffea00ffe600ffe200ffde00ffdb00ffd700ffd300"
+        "ffd000ffcc00ffc800ffc400ffc100ffbd00ffb900ffb600ffb200ffae00ffab00ffa700ffa300ff9f00ff9c00ff9800"
+        "ff9400ff9100ff8d00ff8900ff8600ff8200ff7e00ff7a00ff7700ff7300ff6f00ff6c00ff6800ff6400ff6000ff5d00"
+        "ff5900ff5500ff5200ff4e00ff4a00ff4700ff4300ff3f00ff3b00ff3800ff3400ff3000ff2d00ff2900ff2500ff2200"
+        "ff1e00ff1a00ff1600ff1300fa0f00f60b00f10800ed0400e80000e40000df0000da0000d60000d10000cd0000c80000"
+        "c40000bf0000bb0000b60000b20000ad0000a80000a400009f00009b00009600009200008d0000890000840000800000"
+    ),
+    "jet_r": (
+        "8000008400008900008d00009200009600009b00009f0000a40000a80000ad0000b20000b60000bb0000bf0000c40000"
+        "c80000cd0000d10000d60000da0000df0000e40000e80000ed0400f10800f60b00fa0f00ff1300ff1600ff1a00ff1e00"
+        "ff2200ff2500ff2900ff2d00ff3000ff3400ff3800ff3b00ff3f00ff4300ff4700ff4a00ff4e00ff5200ff5500ff5900"
+        "ff5d00ff6000ff6400ff6800ff6c00ff6f00ff7300ff7700ff7a00ff7e00ff8200ff8600ff8900ff8d00ff9100ff9400"
+        "ff9800ff9c00ff9f00ffa300ffa700ffab00ffae00ffb200ffb600ffb900ffbd00ffc100ffc400ffc800ffcc00ffd000"
+        "ffd300ffd700ffdb00ffde00ffe200ffe600ffea00feed00fbf100f8f500f4f802f1fc06eeff09ebff0ce7ff0fe4ff13"
+        "e1ff16deff19dbff1cd7ff1fd4ff23d1ff26ceff29caff2cc7ff30c4ff33c1ff36beff39baff3cb7ff40b4ff43b1ff46"
+        "adff49aaff4da7ff50a4ff53a0ff569dff5a9aff5d97ff6094ff6390ff668dff6a8aff6d87ff7083ff7380ff777dff7a"
+        "7aff7d77ff8073ff8370ff876dff8a6aff8d66ff9063ff9460ff975dff9a5aff9d56ffa053ffa450ffa74dffaa49ffad"
+        "46ffb143ffb440ffb73cffba39ffbe36ffc133ffc430ffc72cffca29ffce26ffd123ffd41fffd71cffdb19ffde16ffe1"
+        "13fce40ff8e70cf4eb09f0ee06edf102e8f400e4f800e0fb00dcfe00d8ff00d4ff00d0ff00ccff00c8ff00c4ff00c0ff"
+        "00bcff00b8ff00b4ff00b0ff00adff00a8ff00a4ff00a0ff009cff0098ff0094ff0090ff008cff0088ff0084ff0080ff"
+        "007dff0078ff0075ff0070ff006dff0068ff0065ff0060ff005dff0058ff0055ff0050ff004dff0048ff0045ff0040ff"
+        "003dff0038ff0035ff0030ff002dff0028ff0025ff0020ff001dff0018ff0015ff0010ff000dff0008ff0005ff0000ff"
+        "0000ff0000ff0000ff0000ff0000fa0000f60000f10000ed0000e80000e40000df0000da0000d60000d10000cd0000c8"
+        "0000c40000bf0000bb0000b60000b20000ad0000a80000a400009f00009b00009600009200008d000089000084000080"
+    ),
+    "magma": (
+        "00000401000501010601010802010902020b02020d03030f03031204041405041606051806051a07061c08071e090720"
+        "0a08220b09240c09260d0a290e0b2b100b2d110c2f120d31130d34140e36150e38160f3b180f3d19103f1a10421c1044"
+        "1d11471e114920114b21114e22115024125325125527125829115a2a115c2c115f2d11612f1163311165331067341069"
+        "36106b38106c390f6e3b0f703d0f713f0f72400f74420f75440f764510774710784910784a10794c117a4e117b4f127b"
+        "51127c52137c54137d56147d57157e59157e5a167e5c167f5d177f5f187f601880621980641a80651a80671b80681c81"
+        "6a1c816b1d816d1d816e1e81701f81721f817320817521817621817822817922827b23827c23827e2482802582812581"
+        "8326818426818627818827818928818b29818c29818e2a81902a81912b81932b80942c80962c80982d80992d809b2e7f"
+        "9c2e7f9e2f7fa02f7fa1307ea3307ea5317ea6317da8327daa337dab337cad347cae347bb0357bb2357bb3367ab5367a"
+        "b73779b83779ba3878bc3978bd3977bf3a77c03a76c23b75c43c75c53c74c73d73c83e73ca3e72cc3f71cd4071cf4070"
+        "d0416fd2426fd3436ed5446dd6456cd8456cd9466bdb476adc4869de4968df4a68e04c67e24d66e34e65e44f64e55064"
+        "e75263e85362e95462ea5661eb5760ec5860ed5a5fee5b5eef5d5ef05f5ef1605df2625df2645cf3655cf4675cf4695c"
+        "f56b5cf66c5cf66e5cf7705cf7725cf8745cf8765cf9785df9795df97b5dfa7d5efa7f5efa815ffb835ffb8560fb8761"
+        "fc8961fc8a62fc8c63fc8e64fc9065fd9266fd9467fd9668fd9869fd9a6afd9b6bfe9d6cfe9f6dfea16efea36ffea571"
+        "fea772fea973feaa74feac76feae77feb078feb27afeb47bfeb67cfeb77efeb97ffebb81febd82febf84fec185fec287"
+        "fec488fec68afec88cfeca8dfecc8ffecd90fecf92fed194fed395fed597fed799fed89afdda9cfddc9efddea0fde0a1"
+        "fde2a3fde3a5fde5a7fde7a9fde9aafdebacfcecaefceeb0fcf0b2fcf2b4fcf4b6fcf6b8fcf7b9fcf9bbfcfbbdfcfdbf"
+    ),
+    "magma_r": (
+        "fcfdbffcfbbdfcf9bbfcf7b9fcf6b8fcf4b6fcf2b4fcf0b2fceeb0fcecaefdebacfde9aafde7a9fde5a7fde3a5fde2a3"
+        "fde0a1fddea0fddc9efdda9cfed89afed799fed597fed395fed194fecf92fecd90fecc8ffeca8dfec88cfec68afec488"
+        "fec287fec185febf84febd82febb81feb97ffeb77efeb67cfeb47bfeb27afeb078feae77feac76feaa74fea973fea772"
+        "fea571fea36ffea16efe9f6dfe9d6cfd9b6bfd9a6afd9869fd9668fd9467fd9266fc9065fc8e64fc8c63fc8a62fc8961"
+        "fb8761fb8560fb835ffa815ffa7f5efa7d5ef97b5df9795df9785df8765cf8745cf7725cf7705cf66e5cf66c5cf56b5c"
+        "f4695cf4675cf3655cf2645cf2625df1605df05f5eef5d5eee5b5eed5a5fec5860eb5760ea5661e95462e85362e75263"
+        "e55064e44f64e34e65e24d66e04c67df4a68de4968dc4869db476ad9466bd8456cd6456cd5446dd3436ed2426fd0416f"
+        "cf4070cd4071cc3f71ca3e72c83e73c73d73c53c74c43c75c23b75c03a76bf3a77bd3977bc3978ba3878b83779b73779"
+        "b5367ab3367ab2357bb0357bae347bad347cab337caa337da8327da6317da5317ea3307ea1307ea02f7f9e2f7f9c2e7f"
+        "9b2e7f992d80982d80962c80942c80932b80912b81902a818e2a818c29818b2981892881882781862781842681832681"
+        "8125818025827e24827c23827b2382792282782281762181752181732081721f81701f816e1e816d1d816b1d816a1c81"
+        "681c81671b80651a80641a806219806018805f187f5d177f5c167f5a167e59157e57157e56147d54137d52137c51127c"
+        "4f127b4e117b4c117a4a1079491078471078451077440f76420f75400f743f0f723d0f713b0f70390f6e38106c36106b"
+        "3410693310673111652f11632d11612c115f2a115c29115a27125825125524125322115021114e20114b1e11491d1147"
+        "1c10441a104219103f180f3d160f3b150e38140e36130d34120d31110c2f100b2d0e0b2b0d0a290c09260b09240a0822"
+        "09072008071e07061c06051a06051805041604041403031203030f02020d02020b020109010108010106010005000004"
+    ),
+    "nipy_spectral": (
+        "00000009000b1300151c002025002b2f003538004041004b4b00555400605d006b67007570008077008879008a7a008b"
+        "7b008c7d008e7e008f7f009081009282009383009485009686009787009883009a78009b6d009c63009e58009f4d00a0"
+        "4300a23800a32d00a42300a61800a70d00a80300aa0000ad0000b10000b50000b90000bd0000c10000c50000c90000cd"
+        "0000d10000d50000d90000dd0009dd0013dd001cdd0025dd002fdd0038dd0041dd004bdd0054dd005ddd0067dd0070dd"
+        "0078dd007add007ddd0080dd0082dd0085dd0088dd008add008ddd0090dd0092dd0095dd0098dd009adb009bd7009cd3"
+        "009ecf009fcb00a0c700a2c300a3bf00a4bb00a6b700a7b300a8af00aaab00aaa800aaa500aaa300aaa000aa9d00aa9b"
+        "00aa9800aa9500aa9300aa9000aa8d00aa8b00aa8800a97d00a77300a66800a55d00a35300a24800a13d009f33009e28"
+        "009d1d009b13009a08009a00009c00009f0000a20000a40000a70000aa0000ac0000af0000b20000b40000b70000ba00"
+        "00bc0000bf0000c20000c40000c70000ca0000cc0000cf0000d20000d40000d70000da0000dc0000df0000e20000e400"
+        "00e70000ea0000ec0000ef0000f20000f40000f70000fa0000fc0000ff000fff001dff002cff003bff0049ff0058ff00"
+        "67ff0075ff0084ff0093ff00a1ff00b0ff00bcff00c0fd00c4fc00c8fb00ccf900d0f800d4f700d8f500dcf400e0f300"
+        "e4f100e8f000ecef00efed00f0ea00f1e700f3e500f4e200f5df00f7dd00f8da00f9d700fbd500fcd200fdcf00ffcd00"
+        "ffc900ffc500ffc100ffbd00ffb900ffb500ffb100ffad00ffa900ffa500ffa100ff9d00ff9900ff8d00ff8100ff7500"
+        "ff6900ff5d00ff5100ff4500ff3900ff2d00ff2100ff1500ff0900fe0000fc0000f90000f60000f40000f10000ee0000"
+        "ec0000e90000e60000e40000e10000de0000dc0000db0000da0000d80000d70000d60000d40000d30000d20000d00000"
+        "cf0000ce0000cc0000cc0c0ccc1c1ccc2c2ccc3c3ccc4c4ccc5c5ccc6c6ccc7c7ccc8c8ccc9c9cccacacccbcbccccccc"
+    ),
+    "nipy_spectral_r": (
+        "ccccccccbcbcccacaccc9c9ccc8c8ccc7c7ccc6c6ccc5c5ccc4c4ccc3c3ccc2c2ccc1c1ccc0c0ccc0000ce0000cf0000"
+        "d00000d20000d30000d40000d60000d70000d80000da0000db0000dc0000de0000e10000e40000e60000e90000ec0000"
+        "ee0000f10000f40000f60000f90000fc0000fe0000ff0900ff1500ff2100ff2d00ff3900ff4500ff5100ff5d00ff6900"
+        "ff7500ff8100ff8d00ff9900ff9d00ffa100ffa500ffa900ffad00ffb100ffb500ffb900ffbd00ffc100ffc500ffc900"
+        "ffcd00fdcf00fcd200fbd500f9d700f8da00f7dd00f5df00f4e200f3e500f1e700f0ea00efed00ecef00e8f000e4f100"
+        "e0f300dcf400d8f500d4f700d0f800ccf900c8fb00c4fc00c0fd00bcff00b0ff00a1ff0093ff0084ff0075ff0067ff00"
+        "58ff0049ff003bff002cff001dff000fff0000ff0000fc0000fa0000f70000f40000f20000ef0000ec0000ea0000e700"
+        "00e40000e20000df0000dc0000da0000d70000d40000d20000cf0000cc0000ca0000c70000c40000c20000bf0000bc00"
+        "00ba0000b70000b40000b20000af0000ac0000aa0000a70000a40000a200009f00009c00009a00009a08009b13009d1d"
+        "009e28009f3300a13d00a24800a35300a55d00a66800a77300a97d00aa8800aa8b00aa8d00aa9000aa9300aa9500aa98"
+        "00aa9b00aa9d00aaa000aaa300aaa500aaa800aaab00a8af00a7b300a6b700a4bb00a3bf00a2c300a0c7009fcb009ecf"
+        "009cd3009bd7009adb0098dd0095dd0092dd0090dd008ddd008add0088dd0085dd0082dd0080dd007ddd007add0078dd"
+        "0070dd0067dd005ddd0054dd004bdd0041dd0038dd002fdd0025dd001cdd0013dd0009dd0000dd0000d90000d50000d1"
+        "0000cd0000c90000c50000c10000bd0000b90000b50000b10000ad0300aa0d00a81800a72300a62d00a43800a34300a2"
+        "4d00a058009f63009e6d009c78009b83009a8700988600978500968300948200938100927f00907e008f7d008e7b008c"
+        "7a008b79008a7700887000806700755d006b5400604b005541004b3800402f003525002b1c002013001509000b000000"
+    ),
+    "ocean": (
+        "008000007e01007c02007b03007a0400780500760600750700740800720900700a006f0b006e0c006c0d006a0e00690f"
+        "006810006611006412006313006214006015005e16005d17005c18005a1900581a00571b00561c00541d00521e00511f"
+        "005020004e21004c22004b23004a2400482500462600452700442800422900402a003f2b003e2c003c2d003b2e00392f"
+        "003830003631003432003333003134003035002f36002d37002c38002a3900283a00273b00263c00243d00233e00213f"
+        "002040001e41001d42001b4300194400184500164600154700144800124900114a000f4b000e4c000c4d000a4e00094f"
+        "00085000065100055200035300015400005500015600035700045800065900075a00095b000a5c000c5d000e5e000f5f"
+        "001060001261001362001563001764001865001a66001b67001d68001e6900206a00216b00226c00246d00266e00276f"
+        "002870002a71002b72002d73002f7400307500317600337700347800367900377a00397b003a7c003c7d003e7e003f7f"
+        "004080004281004382004583004684004885004a86004b87004d88004e8900508a00518b00538c00548d00568e00578f"
+        "005890005a91005b92005d93005e9400609500629600639700649800669900679a00699b006b9c006c9d006e9e006f9f"
+        "0070a00072a10073a20075a30076a40078a5007aa6007ba7007da8007ea90080aa0381ab0682ac0984ad0c85ae0f87af"
+        "1288b0158ab1188bb21b8db31e8eb42190b52492b62793b72a94b82d96b93097ba3399bb369bbc399cbd3c9ebe3f9fbf"
+        "42a0c045a2c148a3c24ba5c34ea6c451a8c554aac657abc75aacc85daec960b0ca63b1cb66b3cc69b4cd6cb6ce6fb7cf"
+        "72b9d075bad178bcd27bbdd37ebed481c0d584c2d687c3d78ac4d88dc6d990c7da93c9db96cbdc99ccdd9ccede9fcfdf"
+        "a2d0e0a5d2e1a8d3e2abd5e3aed6e4b1d8e5b4dae6b7dbe7badce8bddee9c0e0eac3e1ebc6e2ecc9e4edcce5eecfe7ef"
+        "d2e8f0d5eaf1d8ebf2dbedf3deeef4e1f0f5e4f2f6e7f3f7eaf4f8edf6f9f0f7faf3f9fbf6fbfcf9fcfdfcfefeffffff"
+    ),
+    "ocean_r": (
+        "fffffffcfefef9fcfdf6fbfcf3f9fbf0f7faedf6f9eaf4f8e7f3f7e4f2f6e1f0f5deeef4dbedf3d8ebf2d5eaf1d2e8f0"
+        "cfe7efcce5eec9e4edc6e2ecc3e1ebc0e0eabddee9badce8b7dbe7b4dae6b1d8e5aed7e4abd5e3a8d3e2a5d2e1a2d0e0"
+        "9fcfdf9ccede99ccdd96cbdc93c9db90c8da8dc6d98ac4d887c3d784c2d681c0d57ebed47bbdd378bcd275bad172b9d0"
+        "6fb7cf6cb6ce69b4cd66b3cc63b1cb60b0ca5daec95aacc857abc754aac651a8c54ea6c44ba5c348a3c245a2c142a0c0"
+        "3f9fbf3c9ebe399cbd369bbc3399bb3098ba2d96b92a94b82793b72492b62190b51e8eb41b8db3188bb2158ab11288b0"
+        "0f87af0c85ae0984ad0682ac0381ab0080aa007ea9007da8007ba7007aa60078a50076a40075a30073a20072a10070a0"
+        "006f9f006e9e006c9d006b9c00699b00689a006699006498006397006296006095005e94005d93005b92005a91005890"
+        "00578f00568e00548d00538c00518b00508a004e89004d88004b87004a86004885004684004583004382004281004080"
+        "003f7f003e7e003c7d003b7c00397b00377a003679003478003377003176003075002f74002d73002b72002a71002870"
+        "00276f00266e00246d00236c00216b00206a001e69001d68001b67001a66001865001764001563001362001261001060"
+        "000f5f000e5e000c5d000b5c00095b00075a000659000458000357000156000055000154000353000552000651000850"
+        "00094f000a4e000c4d000d4c000f4b00114a001249001448001547001646001845001944001b43001d42001e41002040"
+        "00213f00223e00243d00253c00273b00293a002a39002c38002d37002e36003035003134003333003532003631003830"
+        "00392f003a2e003c2d003d2c003f2b00412a004229004428004527004626004825004924004b23004d22004e21005020"
+        "00511f00521e00541d00551c00571b00591a005a19005c18005d17005e16006015006114006313006512006611006810"
+        "00690f006a0e006c0d006d0c006f0b00710a007209007408007507007606007805007904007b03007d02007e01008000"
+    ),
+    "pink": (
+        "1e0000230606280d0d2d1313321a1a351d1d391f1f3c2222402525422727452929482b2b4b2d2d4d2f2f503131523232"
+        "5534345736365937375b39395e3a3a603c3c623d3d643e3e6640406841416942426b44446d45456f4646714747724949"
+        "744a4a764b4b774c4c794d4d7b4e4e7c4f4f7e50507f51518152528253538454548555558756568857578a58588b5959"
+        "8d5a5a8e5b5b8f5c5c915d5d925e5e935f5f9560609661619762629962629a63639b64649c65659e66669f6767a06767"
+        "a16868a36969a46a6aa56b6ba66c6ca76c6ca96d6daa6e6eab6f6fac6f6fad7070ae7171af7272b17272b27373b37474"
+        "b47575b57575b67676b77777b87777b97878ba7979bb7a7abc7a7abd7b7bbe7c7cc07c7cc17d7dc27e7ec27f7ec2817f"
+        "c38280c38480c48581c48782c58882c58a83c68b84c68c84c68e85c78f86c79186c89287c89387c99588c99689c99789"
+        "ca988aca9a8bcb9b8bcb9c8ccb9e8ccc9f8dcca08ecda18ecda28fcea48fcea590cea691cfa791cfa892d0aa92d0ab93"
+        "d0ac94d1ad94d1ae95d2af95d2b096d2b296d3b397d3b497d4b598d4b699d4b799d5b89ad5b99ad6ba9bd6bb9bd6bc9c"
+        "d7bd9cd7be9dd8bf9ed8c09ed8c19fd9c29fd9c3a0dac4a0dac5a1dac6a1dbc7a2dbc8a2dcc9a3dccaa3dccba4ddcca4"
+        "ddcda5ddcea5decfa6ded0a6dfd1a7dfd2a7dfd3a8e0d4a8e0d5a9e1d6a9e1d7aae1d8aae2d8abe2d9abe2daace3dbac"
+        "e3dcade4ddade4deaee4dfaee5e0afe5e0afe5e1b0e6e2b0e6e3b1e6e4b1e7e5b2e7e6b2e8e7b3e8e7b3e8e8b4e9e9b5"
+        "e9e9b6e9e9b8eaeab9eaeabaebebbcebebbdebebbeececc0ececc1ececc2ededc4ededc5ededc6eeeec7eeeec9eeeeca"
+        "efefcbefefccf0f0cef0f0cff0f0d0f1f1d1f1f1d3f1f1d4f2f2d5f2f2d6f2f2d7f3f3d8f3f3daf3f3dbf4f4dcf4f4dd"
+        "f4f4def5f5dff5f5e0f5f5e2f6f6e3f6f6e4f7f7e5f7f7e6f7f7e7f8f8e8f8f8e9f8f8eaf9f9ebf9f9edf9f9eefafaef"
+        "fafaf0fafaf1fbfbf2fbfbf3fbfbf4fcfcf5fcfcf6fcfcf7fdfdf8fdfdf9fdfdfafefefbfefefcfefefdfffffeffffff"
+    ),
+    "pink_r": (
+        "fffffffffffefefefdfefefcfefefbfdfdfafdfdf9fdfdf8fcfcf7fcfcf6fcfcf5fbfbf4fbfbf3fbfbf2fafaf1fafaf0"
+        "fafaeff9f9eef9f9edf9f9ebf8f8eaf8f8e9f8f8e8f7f7e7f7f7e6f7f7e5f6f6e4f6f6e3f5f5e2f5f5e0f5f5dff4f4de"
+        "f4f4ddf4f4dcf3f3dbf3f3daf3f3d8f2f2d7f2f2d6f2f2d5f1f1d4f1f1d3f1f1d1f0f0d0f0f0cff0f0ceefefccefefcb"
+        "eeeecaeeeec9eeeec7ededc6ededc5ededc4ececc2ececc1ececc0ebebbeebebbdebebbceaeabaeaeab9e9e9b8e9e9b6"
+        "e9e9b5e8e8b4e8e7b3e8e7b3e7e6b2e7e5b2e6e4b1e6e3b1e6e2b0e5e1b0e5e0afe5e0afe4dfaee4deaee4ddade3dcad"
+        "e3dbace2daace2d9abe2d8abe1d8aae1d7aae1d6a9e0d5a9e0d4a8dfd3a8dfd2a7dfd1a7ded0a6decfa6ddcea5ddcda5"
+        "ddcca4dccba4dccaa3dcc9a3dbc8a2dbc7a2dac6a1dac5a1dac4a0d9c3a0d9c29fd8c19fd8c09ed8bf9ed7be9dd7bd9c"
+        "d6bc9cd6bb9bd6ba9bd5b99ad5b89ad4b799d4b699d4b598d3b497d3b397d2b296d2b096d2af95d1ae95d1ad94d0ac94"
+        "d0ab93d0aa92cfa892cfa791cea691cea590cea48fcda28fcda18ecca08ecc9f8dcb9e8ccb9c8ccb9b8bca9a8bca988a"
+        "c99789c99689c99588c89387c89287c79186c78f86c68e85c68c84c68b84c58a83c58882c48782c48581c38480c38280"
+        "c2817fc27f7ec27e7ec17d7dc07c7cbe7c7cbd7b7bbc7a7abb7a7aba7979b97878b87777b77777b67676b57575b47575"
+        "b37474b27373b17272af7272ae7171ad7070ac6f6fab6f6faa6e6ea96d6da76c6ca66c6ca56b6ba46a6aa36969a16868"
+        "a067679f67679e66669c65659b64649a6363996262976262966161956060935f5f925e5e915d5d8f5c5c8e5b5b8d5a5a"
+        "8b59598a58588857578756568555558454548253538152527f51517e50507c4f4f7b4e4e794d4d774c4c764b4b744a4a"
+        "7249497147476f46466d45456b4444694242684141664040643e3e623d3d603c3c5e3a3a5b3939593737573636553434"
+        "5232325031314d2f2f4b2d2d482b2b4529294227274025253c2222391f1f351d1d321a1a2d1313280d0d2306061e0000"
+    ),
+    "plasma": (
+        "0d088710078813078916078a19068c1b068d1d068e20068f2206902406912605912805922a05932c05942e05952f0596"
+        "31059733059735049837049938049a3a049a3c049b3e049c3f049c41049d43039e44039e46039f48039f4903a04b03a1"
+        "4c02a14e02a25002a25102a35302a35502a45601a45801a45901a55b01a55c01a65e01a66001a66100a76300a76400a7"
+        "6600a76700a86900a86a00a86c00a86e00a86f00a87100a87201a87401a87501a87701a87801a87a02a87b02a87d03a8"
+        "7e03a88004a88104a78305a78405a78606a68707a68808a68a09a58b0aa58d0ba58e0ca48f0da4910ea3920fa39410a2"
+        "9511a19613a19814a099159f9a169f9c179e9d189d9e199da01a9ca11b9ba21d9aa31e9aa51f99a62098a72197a82296"
+        "aa2395ab2494ac2694ad2793ae2892b02991b12a90b22b8fb32c8eb42e8db52f8cb6308bb7318ab83289ba3388bb3488"
+        "bc3587bd3786be3885bf3984c03a83c13b82c23c81c33d80c43e7fc5407ec6417dc7427cc8437bc9447aca457acb4679"
+        "cc4778cc4977cd4a76ce4b75cf4c74d04d73d14e72d24f71d35171d45270d5536fd5546ed6556dd7566cd8576bd9586a"
+        "da5a6ada5b69db5c68dc5d67dd5e66de5f65de6164df6263e06363e16462e26561e26660e3685fe4695ee56a5de56b5d"
+        "e66c5ce76e5be76f5ae87059e97158e97257ea7457eb7556eb7655ec7754ed7953ed7a52ee7b51ef7c51ef7e50f07f4f"
+        "f0804ef1814df1834cf2844bf3854bf3874af48849f48948f58b47f58c46f68d45f68f44f79044f79143f79342f89441"
+        "f89540f9973ff9983ef99a3efa9b3dfa9c3cfa9e3bfb9f3afba139fba238fca338fca537fca636fca835fca934fdab33"
+        "fdac33fdae32fdaf31fdb130fdb22ffdb42ffdb52efeb72dfeb82cfeba2cfebb2bfebd2afebe2afec029fdc229fdc328"
+        "fdc527fdc627fdc827fdca26fdcb26fccd25fcce25fcd025fcd225fbd324fbd524fbd724fad824fada24f9dc24f9dd25"
+        "f8df25f8e125f7e225f7e425f6e626f6e826f5e926f5eb27f4ed27f3ee27f3f027f2f227f1f426f1f525f0f724f0f921"
+    ),
+    "plasma_r": (
+        "f0f921f0f724f1f525f1f426f2f227f3f027f3ee27f4ed27f5eb27f5e926f6e826f6e626f7e425f7e225f8e125f8df25"
+        "f9dd25f9dc24fada24fad824fbd724fbd524fbd324fcd225fcd025fcce25fccd25fdcb26fdca26fdc827fdc627fdc527"
+        "fdc328fdc229fec029febe2afebd2afebb2bfeba2cfeb82cfeb72dfdb52efdb42ffdb22ffdb130fdaf31fdae32fdac33"
+        "fdab33fca934fca835fca636fca537fca338fba238fba139fb9f3afa9e3bfa9c3cfa9b3df99a3ef9983ef9973ff89540"
+        "f89441f79342f79143f79044f68f44f68d45f58c46f58b47f48948f48849f3874af3854bf2844bf1834cf1814df0804e"
+        "f07f4fef7e50ef7c51ee7b51ed7a52ed7953ec7754eb7655eb7556ea7457e97257e97158e87059e76f5ae76e5be66c5c"
+        "e56b5de56a5de4695ee3685fe26660e26561e16462e06363df6263de6164de5f65dd5e66dc5d67db5c68da5b69da5a6a"
+        "d9586ad8576bd7566cd6556dd5546ed5536fd45270d35171d24f71d14e72d04d73cf4c74ce4b75cd4a76cc4977cc4778"
+        "cb4679ca457ac9447ac8437bc7427cc6417dc5407ec43e7fc33d80c23c81c13b82c03a83bf3984be3885bd3786bc3587"
+        "bb3488ba3388b83289b7318ab6308bb52f8cb42e8db32c8eb22b8fb12a90b02991ae2892ad2793ac2694ab2494aa2395"
+        "a82296a72197a62098a51f99a31e9aa21d9aa11b9ba01a9c9e199d9d189d9c179e9a169f99159f9814a09613a19511a1"
+        "9410a2920fa3910ea38f0da48e0ca48d0ba58b0aa58a09a58808a68707a68606a68405a78305a78104a78004a87e03a8"
+        "7d03a87b02a87a02a87801a87701a87501a87401a87201a87100a86f00a86e00a86c00a86a00a86900a86700a86600a7"
+        "6400a76300a76100a76001a65e01a65c01a65b01a55901a55801a45601a45502a45302a35102a35002a24e02a24c02a1"
+        "4b03a14903a048039f46039f44039e43039e41049d3f049c3e049c3c049b3a049a38049a370499350498330597310597"
+        "2f05962e05952c05942a059328059226059124069122069020068f1d068e1b068d19068c16078a1307891007880d0887"
+    ),
+    "prism": (
+        "ff0000ff0000ff2100ff5200ff8200ffb000ffd800fff700e3ff00b2ff0081ff0053fe002be2000bbd3900917d0061b9"
+        "0030e90001ff1a00ff3e00ff6a00fe9a00d7cb00a3fa0063ff001dff0000ff0e00ff3e00ff6f00ff9e00ffc900ffec00"
+        "f5ff00c6ff0095ff0065ff003aef0017cd1d00a3630074a20043d70013fe0d00ff2e00ff5700ff8600e9b700b9e7007e"
+        "ff003aff0000ff0000ff2a00ff5b00ff8c00ffb900ffdf00fffc00d9ff00a9ff0078ff004bf90024dc0006b54700878a"
+        "0057c40026f00300ff2000ff4600ff7300f8a300ced40097ff0056ff000fff0000ff1700ff4800ff7900ffa700ffd000"
+        "fff100ecff00bcff008bff005cff0032e90011c52b009a70006bae0039e0000aff1300ff3600ff6000ff8f00e1c100af"
+        "f00071ff002cff0000ff0500ff3400ff6500ff9500ffc100ffe500ffff00d0ff009fff006fff0042f4001dd50e01ac55"
+        "007e96004dcd001df70800ff2700ff4e00ff7c00f1ad00c4dd008bff0048ff0001ff0000ff2100ff5100ff8200ffb000"
+        "ffd700fff700e3ff00b3ff0082ff0054fe002be3000bbd3900917d0061b90030e80001ff1900ff3e00ff6900fe9900d8"
+        "ca00a3f90064ff001eff0000ff0e00ff3d00ff6f00ff9e00ffc800ffeb00f6ff00c6ff0095ff0066ff003bef0017cd1c"
+        "00a4620075a20044d70014fe0d00ff2e00ff5700ff8600e9b700bae7007eff003aff0000ff0000ff2a00ff5b00ff8b00"
+        "ffb800ffde00fffb00daff00a9ff0078ff004bfa0024dc0006b5460088890057c30027f00300ff2000ff4600ff7200f8"
+        "a300cfd40097ff0056ff0010ff0000ff1700ff4700ff7800ffa700ffd000fff100edff00bdff008cff005dff0033e900"
+        "11c62a009b6f006bad003ae0000bff1300ff3500ff6000ff8f00e1c000aff00071ff002cff0000ff0500ff3300ff6500"
+        "ff9400ffc000ffe500ffff00d0ff009fff006fff0043f5001dd50d01ad54007f95004ecd001df70800ff2600ff4e00ff"
+        "7c00f1ac00c5dd008bff0049ff0001ff0000ff2000ff5100ff8200ffaf00ffd700fff600e4ff00b3ff0082ff0054ff00"
+    ),
+    "prism_r": (
+        "54ff0082ff00b3ff00e4ff00fff600ffd700ffaf00ff8200ff5100ff2000ff0000ff0001ff0049dd008bac00c57c00f1"
+        "4e00ff2600ff0800ff001df7004ecd007f9501ad541dd50d43f5006fff009fff00d0ff00ffff00ffe500ffc000ff9400"
+        "ff6500ff3300ff0500ff0000ff002cf00071c000af8f00e16000ff3500ff1300ff000bff003ae0006bad009b6f11c62a"
+        "33e9005dff008cff00bdff00edff00fff100ffd000ffa700ff7800ff4700ff1700ff0000ff0010ff0056d40097a300cf"
+        "7200f84600ff2000ff0300ff0027f00057c300888906b54624dc004bfa0078ff00a9ff00daff00fffb00ffde00ffb800"
+        "ff8b00ff5b00ff2a00ff0000ff0000ff003ae7007eb700ba8600e95700ff2e00ff0d00ff0014fe0044d70075a200a462"
+        "17cd1c3bef0066ff0095ff00c6ff00f6ff00ffeb00ffc800ff9e00ff6f00ff3d00ff0e00ff0000ff001ef90064ca00a3"
+        "9900d86900fe3e00ff1900ff0001ff0030e80061b900917d0bbd392be30054fe0082ff00b3ff00e3ff00fff700ffd700"
+        "ffb000ff8200ff5100ff2100ff0000ff0001ff0048dd008bad00c47c00f14e00ff2700ff0800ff001df7004dcd007e96"
+        "01ac551dd50e42f4006fff009fff00d0ff00ffff00ffe500ffc100ff9500ff6500ff3400ff0500ff0000ff002cf00071"
+        "c100af8f00e16000ff3600ff1300ff000aff0039e0006bae009a7011c52b32e9005cff008bff00bcff00ecff00fff100"
+        "ffd000ffa700ff7900ff4800ff1700ff0000ff000fff0056d40097a300ce7300f84600ff2000ff0300ff0026f00057c4"
+        "00878a06b54724dc004bf90078ff00a9ff00d9ff00fffc00ffdf00ffb900ff8c00ff5b00ff2a00ff0000ff0000ff003a"
+        "e7007eb700b98600e95700ff2e00ff0d00ff0013fe0043d70074a200a36317cd1d3aef0065ff0095ff00c6ff00f5ff00"
+        "ffec00ffc900ff9e00ff6f00ff3e00ff0e00ff0000ff001dfa0063cb00a39a00d76a00fe3e00ff1a00ff0001ff0030e9"
+        "0061b900917d0bbd392be20053fe0081ff00b2ff00e3ff00fff700ffd800ffb000ff8200ff5200ff2100ff0000ff0000"
+    ),
+    "rainbow": (
+        "8000ff7e03ff7c06ff7a09ff780dff7610ff7413ff7216ff7019ff6e1cff6c1fff6a22fe6826fe6629fe642cfe622ffe"
+        "6032fe5e35fe5c38fd5a3bfd583efd5641fd5444fd5247fc504afc4e4dfc4c50fc4a53fb4856fb4659fb445cfb425ffa"
+        "4062fa3e65fa3c68f9396bf9386df93670f83473f83176f83079f72e7bf72c7ef72981f62884f62686f52489f5218cf4"
+        "208ef41e91f31c93f31996f31898f2169bf2149df111a0f110a2f00ea5ef0ca7ef09a9ee08acee06aeed04b0ed01b3ec"
+        "00b5eb02b7eb04b9ea07bbea08bee90ac0e80dc2e80fc4e710c6e612c8e614cae517cbe418cde41acfe31dd1e21fd3e1"
+        "20d5e122d6e024d8df27dade28dbde2adddd2ddedc2fe0db30e1da32e3da34e4d937e6d838e7d73ae8d63dead53febd5"
+        "40ecd442edd344eed246efd148f1d04af2cf4df3ce4ef3cd50f4cc52f5cb54f6cb56f7ca58f8c95af8c85df9c75efac6"
+        "60fac562fbc464fbc366fcc268fcc16afdc06dfdbf6efebe70febc72febb74feba76ffb978ffb87affb77dffb67effb5"
+        "80ffb482ffb384ffb286ffb088ffaf8bfeae8cfead8efeac90feab92fda994fda896fca799fca69bfba59cfba49efaa2"
+        "a0faa1a2f9a0a4f89fa6f89da8f79cabf69bacf59aaef498b0f397b2f396b4f295b6f193b9ef92bbee91bced8fbeec8e"
+        "c0eb8dc2ea8cc4e88ac6e789c8e688cbe486cce385cee184d0e082d2de81d4dd80d6db7ed9da7ddbd87bdcd67aded579"
+        "e0d377e2d176e4cf74e6cd73e8cb72ebca70ecc86feec66df0c46cf2c26bf4c069f6be68f9bb66fbb965fcb763feb562"
+        "ffb360ffb05fffae5effac5cffa95bffa759ffa558ffa256ffa055ff9d53ff9b52ff9850ff964fff934dff914cff8e4a"
+        "ff8c49ff8947ff8646ff8444ff8143ff7e41ff7b40ff793eff763dff733bff703aff6d38ff6b37ff6835ff6533ff6232"
+        "ff5f30ff5c2fff592dff562cff532aff5029ff4d27ff4a26ff4724ff4422ff4121ff3e1fff3b1eff381cff351bff3219"
+        "ff2f18ff2c16ff2914ff2613ff2211ff1f10ff1c0eff190dff160bff1309ff1008ff0d06ff0905ff0603ff0302ff0000"
+    ),
+    "rainbow_r": (
+        "ff0000ff0302ff0603ff0905ff0d06ff1008ff1309ff160bff190dff1c0eff1f10ff2211ff2613ff2914ff2c16ff2f18"
+        "ff3219ff351bff381cff3b1eff3e1fff4121ff4422ff4724ff4a26ff4d27ff5029ff532aff562cff592dff5c2fff5f30"
+        "ff6232ff6533ff6835ff6b37ff6d38ff703aff733bff763dff793eff7b40ff7e41ff8143ff8444ff8646ff8947ff8c49"
+        "ff8e4aff914cff934dff964fff9850ff9b52ff9d53ffa055ffa256ffa558ffa759ffa95bffac5cffae5effb05fffb360"
+        "feb562fcb763fbb965f9bb66f7be68f5c069f2c26bf0c46ceec66decc86febca70e8cb72e6cd73e4cf74e2d176e0d377"
+        "ded579dcd67adbd87bd9da7dd7db7ed5dd7fd2de81d0e082cee184cce385cbe486c8e688c6e789c4e88ac2ea8cc0eb8d"
+        "beec8ebced8fbbee91b9ef92b7f193b5f295b2f396b0f397aef498acf59aabf69ba8f79ca6f89da4f89fa2f9a0a0faa1"
+        "9efaa29cfba49bfba599fca697fca795fda892fda990feab8efeac8cfead8bfeae88ffaf86ffb084ffb282ffb380ffb4"
+        "7effb57dffb67bffb779ffb877ffb974feba72febb70febc6efebe6dfdbf6bfdc069fcc166fcc264fbc362fbc460fac5"
+        "5efac65df9c75bf8c859f8c957f7ca54f6cb52f5cb50f4cc4ef3cd4df3ce4bf2cf49f1d046efd144eed242edd340ecd4"
+        "3febd53dead53be8d639e7d737e6d834e4d932e3da30e1da2fe0db2ddedc2bdddd29dbde26dade24d8df22d6e020d5e1"
+        "1fd3e11dd1e21bcfe319cde417cbe414cae512c8e610c6e60fc4e70dc2e80bc0e809bee906bbea04b9ea02b7eb00b5eb"
+        "01b3ec03b0ed05aeed07acee09a9ee0ca7ef0ea5ef10a2f011a0f1139df1159bf21798f21a96f31c93f31e91f3208ef4"
+        "218cf42389f52586f52784f62981f62c7ef72e7bf73079f73176f83373f83570f8376df93a6bf93c68f93e65fa4062fa"
+        "425ffa435cfb4559fb4756fb4953fb4c50fc4e4dfc504afc5247fc5344fd5541fd573efd5a3bfd5c38fd5e35fe6032fe"
+        "622ffe632cfe6529fe6726fe6922fe6c1fff6e1cff7019ff7216ff7313ff7510ff770dff7a09ff7c06ff7e03ff8000ff"
+    ),
+    "seismic": (
+        "00004c00004f00005200005500005800005a00005d00006000006300006600006800006b00006e000071000074000076"
+        "00007900007c00007f00008200008400008700008a00008d00009000009200009500009800009b00009e0000a00000a3"
+        "0000a60000a90000ac0000ae0000b10000b40000b70000ba0000bc0000bf0000c20000c50000c80000ca0000cd0000d0"
+        "0000d30000d60000d80000db0000de0000e10000e40000e60000e90000ec0000ef0000f20000f40000f70000fa0000fd"
+        "0101ff0505ff0909ff0d0dff1111ff1515ff1919ff1d1dff2121ff2525ff2929ff2d2dff3131ff3535ff3939ff3d3dff"
+        "4141ff4545ff4949ff4d4dff5151ff5555ff5959ff5d5dff6161ff6565ff6969ff6d6dff7171ff7575ff7979ff7d7dff"
+        "8181ff8585ff8989ff8d8dff9191ff9595ff9999ff9d9dffa1a1ffa5a5ffa9a9ffadadffb1b1ffb5b5ffb9b9ffbdbdff"
+        "c1c1ffc5c5ffc9c9ffcdcdffd1d1ffd5d5ffd9d9ffddddffe1e1ffe5e5ffe9e9ffededfff1f1fff5f5fff9f9fffdfdff"
+        "fffdfdfff9f9fff5f5fff1f1ffededffe9e9ffe5e5ffe1e1ffddddffd9d9ffd5d5ffd1d1ffcdcdffc9c9ffc5c5ffc1c1"
+        "ffbdbdffb9b9ffb5b5ffb1b1ffadadffa9a9ffa5a5ffa1a1ff9d9dff9999ff9595ff9191ff8d8dff8989ff8585ff8181"
+        "ff7d7dff7979ff7575ff7171ff6d6dff6969ff6565ff6161ff5d5dff5959ff5555ff5151ff4d4dff4949ff4545ff4141"
+        "ff3d3dff3939ff3535ff3131ff2d2dff2929ff2525ff2121ff1d1dff1919ff1515ff1111ff0d0dff0909ff0505ff0101"
+        "fe0000fc0000fa0000f80000f60000f40000f20000f00000ee0000ec0000ea0000e80000e60000e30000e20000e00000"
+        "de0000dc0000da0000d80000d60000d30000d20000d00000ce0000cc0000ca0000c80000c60000c30000c20000c00000"
+        "be0000bc0000ba0000b80000b60000b30000b20000b00000ae0000ac0000aa0000a80000a60000a30000a20000a00000"
+        "9e00009c00009a00009800009600009300009200009000008e00008c00008a0000880000860000840000820000800000"
+    ),
+    "seismic_r": (
+        "8000008200008400008600008800008a00008c00008e00009000009200009300009600009800009a00009c00009e0000"
+        "a00000a20000a30000a60000a80000aa0000ac0000ae0000b00000b20000b30000b60000b80000ba0000bc0000be0000"
+        "c00000c20000c30000c60000c80000ca0000cc0000ce0000d00000d20000d30000d60000d80000da0000dc0000de0000"
+        "e00000e20000e30000e60000e80000ea0000ec0000ee0000f00000f20000f30000f60000f80000fa0000fc0000fe0000"
+        "ff0101ff0505ff0909ff0d0dff1111ff1515ff1919ff1d1dff2121ff2525ff2929ff2d2dff3131ff3535ff3939ff3d3d"
+        "ff4141ff4545ff4949ff4d4dff5151ff5555ff5959ff5d5dff6161ff6565ff6969ff6d6dff7171ff7575ff7979ff7d7d"
+        "ff8181ff8585ff8989ff8d8dff9191ff9595ff9999ff9d9dffa1a1ffa5a5ffa9a9ffadadffb1b1ffb5b5ffb9b9ffbdbd"
+        "ffc1c1ffc5c5ffc9c9ffcdcdffd1d1ffd5d5ffd9d9ffddddffe1e1ffe5e5ffe9e9ffededfff1f1fff5f5fff9f9fffdfd"
+        "fdfdfff9f9fff5f5fff1f1ffededffe9e9ffe5e5ffe1e1ffddddffd9d9ffd5d5ffd1d1ffcdcdffc9c9ffc5c5ffc1c1ff"
+        "bdbdffb9b9ffb5b5ffb1b1ffadadffa9a9ffa5a5ffa1a1ff9d9dff9999ff9595ff9191ff8d8dff8989ff8585ff8181ff"
+        "7d7dff7979ff7575ff7171ff6d6dff6969ff6565ff6161ff5d5dff5959ff5555ff5151ff4d4dff4949ff4545ff4141ff"
+        "3d3dff3939ff3535ff3131ff2d2dff2929ff2525ff2121ff1d1dff1919ff1515ff1111ff0d0dff0909ff0505ff0101ff"
+        "0000fd0000fa0000f70000f40000f20000ef0000ec0000e90000e60000e40000e10000de0000db0000d80000d60000d3"
+        "0000d00000cd0000cb0000c80000c50000c20000bf0000bc0000ba0000b70000b40000b10000ae0000ac0000a90000a6"
+        "0000a30000a000009e00009b00009800009500009300009000008d00008a00008700008400008200007f00007c000079"
+        "00007700007400007100006e00006b00006800006600006300006000005d00005b00005800005500005200004f00004c"
+    ),
+    "spring": (
+        "ff00ffff01feff02fdff03fcff04fbff05faff06f9ff07f8ff08f7ff09f6ff0af5ff0bf4ff0cf3ff0df2ff0ef1ff0ff0"
+        "ff10efff11eeff12edff13ecff14ebff15eaff16e9ff17e8ff18e7ff19e6ff1ae5ff1be4ff1ce3ff1de2ff1ee1ff1fe0"
+        "ff20dfff21deff22ddff23dcff24dbff25daff26d9ff27d8ff28d7ff29d6ff2ad5ff2bd4ff2cd3ff2dd2ff2ed1ff2fd0"
+        "ff30cfff31ceff32cdff33ccff34cbff35caff36c9ff37c8ff38c7ff39c6ff3ac5ff3bc4ff3cc3ff3dc2ff3ec1ff3fc0"
+        "ff40bfff41beff42bdff43bcff44bbff45baff46b9ff47b8ff48b7ff49b6ff4ab5ff4bb4ff4cb3ff4db2ff4eb1ff4fb0"
+        "ff50afff51aeff52adff53acff54abff55aaff56a9ff57a8ff58a7ff59a6ff5aa5ff5ba4ff5ca3ff5da2ff5ea1ff5fa0"
+        "ff609fff619eff629dff639cff649bff659aff6699ff6798ff6897ff6996ff6a95ff6b94ff6c93ff6d92ff6e91ff6f90"
+        "ff708fff718eff728dff738cff748bff758aff7689ff7788ff7887ff7986ff7a85ff7b84ff7c83ff7d82ff7e81ff7f80"
+        "ff807fff817eff827dff837cff847bff857aff8679ff8778ff8877ff8976ff8a75ff8b74ff8c73ff8d72ff8e71ff8f70"
+        "ff906fff916eff926dff936cff946bff956aff9669ff9768ff9867ff9966ff9a65ff9b64ff9c63ff9d62ff9e61ff9f60"
+        "ffa05fffa15effa25dffa35cffa45bffa55affa659ffa758ffa857ffa956ffaa55ffab54ffac53ffad52ffae51ffaf50"
+        "ffb04fffb14effb24dffb34cffb44bffb54affb649ffb748ffb847ffb946ffba45ffbb44ffbc43ffbd42ffbe41ffbf40"
+        "ffc03fffc13effc23dffc33cffc43bffc53affc639ffc738ffc837ffc936ffca35ffcb34ffcc33ffcd32ffce31ffcf30"
+        "ffd02fffd12effd22dffd32cffd42bffd52affd629ffd728ffd827ffd926ffda25ffdb24ffdc23ffdd22ffde21ffdf20"
+        "ffe01fffe11effe21dffe31cffe41bffe51affe619ffe718ffe817ffe916ffea15ffeb14ffec13ffed12ffee11ffef10"
+        "fff00ffff10efff20dfff30cfff40bfff50afff609fff708fff807fff906fffa05fffb04fffc03fffd02fffe01ffff00"
+    ),
+    "spring_r": (
+        "ffff00fffe01fffd02fffc03fffb04fffa05fff906fff807fff708fff609fff50afff40bfff30cfff20dfff10efff00f"
+        "ffef10ffee11ffed12ffec13ffeb14ffea15ffe916ffe817ffe718ffe619ffe51affe41bffe31cffe21dffe11effe01f"
+        "ffdf20ffde21ffdd22ffdc23ffdb24ffda25ffd926ffd827ffd728ffd629ffd52affd42bffd32cffd22dffd12effd02f"
+        "ffcf30ffce31ffcd32ffcc33ffcb34ffca35ffc936ffc837ffc738ffc639ffc53affc43bffc33cffc23dffc13effc03f"
+        "ffbf40ffbe41ffbd42ffbc43ffbb44ffba45ffb946ffb847ffb748ffb649ffb54affb44bffb34cffb24dffb14effb04f"
+        "ffaf50ffae51ffad52ffac53ffab54ffaa55ffa956ffa857ffa758ffa659ffa55affa45bffa35cffa25dffa15effa05f"
+        "ff9f60ff9e61ff9d62ff9c63ff9b64ff9a65ff9966ff9867ff9768ff9669ff956aff946bff936cff926dff916eff906f"
+        "ff8f70ff8e71ff8d72ff8c73ff8b74ff8a75ff8976ff8877ff8778ff8679ff857aff847bff837cff827dff817eff807f"
+        "ff7f80ff7e81ff7d82ff7c83ff7b84ff7a85ff7986ff7887ff7788ff7689ff758aff748bff738cff728dff718eff708f"
+        "ff6f90ff6e91ff6d92ff6c93ff6b94ff6a95ff6996ff6897ff6798ff6699ff659aff649bff639cff629dff619eff609f"
+        "ff5fa0ff5ea1ff5da2ff5ca3ff5ba4ff5aa5ff59a6ff58a7ff57a8ff56a9ff55aaff54abff53acff52adff51aeff50af"
+        "ff4fb0ff4eb1ff4db2ff4cb3ff4bb4ff4ab5ff49b6ff48b7ff47b8ff46b9ff45baff44bbff43bcff42bdff41beff40bf"
+        "ff3fc0ff3ec1ff3dc2ff3cc3ff3bc4ff3ac5ff39c6ff38c7ff37c8ff36c9ff35caff34cbff33ccff32cdff31ceff30cf"
+        "ff2fd0ff2ed1ff2dd2ff2cd3ff2bd4ff2ad5ff29d6ff28d7ff27d8ff26d9ff25daff24dbff23dcff22ddff21deff20df"
+        "ff1fe0ff1ee1ff1de2ff1ce3ff1be4ff1ae5ff19e6ff18e7ff17e8ff16e9ff15eaff14ebff13ecff12edff11eeff10ef"
+        "ff0ff0ff0ef1ff0df2ff0cf3ff0bf4ff0af5ff09f6ff08f7ff07f8ff06f9ff05faff04fbff03fcff02fdff01feff00ff"
+    ),
+    "summer": (
+        "0080660180660280660381660482660582660682660783660884660984660a84660b85660c86660d86660e86660f8766"
+        "108866118866128866138966148a66158a66168a66178b66188c66198c661a8c661b8d661c8e661d8e661e8e661f8f66"
+        "2090662190662290662391662492662592662692662793662893662994662a94662b95662c96662d96662e96662f9766"
+        "309866319866329866339966349a66359a66369a66379b66389c66399c663a9c663b9d663c9e663d9e663e9e663f9f66"
+        "40a06641a06642a06643a16644a26645a26646a26647a36648a36649a4664aa4664ba5664ca6664da6664ea6664fa766"
+        "50a86651a86652a86653a96654aa6655aa6656ab6657ab6658ac6659ac665aac665bad665cae665dae665eae665faf66"
+        "60b06661b06662b06663b16664b26665b26666b26667b36668b36669b4666ab4666bb5666cb6666db6666eb6666fb766"
+        "70b86671b86672b86673b96674ba6675ba6676bb6677bb6678bc6679bc667abc667bbd667cbe667dbe667ebe667fbf66"
+        "80c06681c06682c06683c16684c26685c26686c26687c36688c36689c4668ac4668bc5668cc6668dc6668ec6668fc766"
+        "90c86691c86692c86693c96694ca6695ca6696cb6697cb6698cc6699cc669acc669bcd669cce669dce669ece669fcf66"
+        "a0d066a1d066a2d066a3d166a4d266a5d266a6d266a7d366a8d366a9d466aad466abd566acd666add666aed666afd766"
+        "b0d866b1d866b2d866b3d966b4da66b5da66b6db66b7db66b8dc66b9dc66badc66bbdd66bcde66bdde66bede66bfdf66"
+        "c0e066c1e066c2e066c3e166c4e266c5e266c6e266c7e366c8e366c9e466cae466cbe566cce666cde666cee666cfe766"
+        "d0e866d1e866d2e866d3e966d4ea66d5ea66d6eb66d7eb66d8ec66d9ec66daec66dbed66dcee66ddee66deee66dfef66"
+        "e0f066e1f066e2f066e3f166e4f266e5f266e6f266e7f366e8f366e9f466eaf466ebf566ecf666edf666eef666eff766"
+        "f0f866f1f866f2f866f3f966f4fa66f5fa66f6fb66f7fb66f8fc66f9fc66fafc66fbfd66fcfe66fdfe66fefe66ffff66"
+    ),
+    "summer_r": (
+        "ffff66fefe66fdfe66fcfe66fbfd66fafc66f9fc66f8fc66f7fb66f6fa66f5fa66f4fa66f3f966f2f866f1f866f0f866"
+        "eff766eef666edf666ecf666ebf566eaf466e9f466e8f466e7f366e6f266e5f266e4f266e3f166e2f066e1f066e0f066"
+        "dfef66deee66ddee66dcee66dbed66daec66d9ec66d8ec66d7eb66d6eb66d5ea66d4ea66d3e966d2e866d1e866d0e866"
+        "cfe766cee666cde666cce666cbe566cae466c9e466c8e366c7e366c6e266c5e266c4e266c3e166c2e066c1e066c0e066"
+        "bfdf66bede66bdde66bcde66bbdd66badc66b9dc66b8dc66b7db66b6db66b5da66b4da66b3d966b2d866b1d866b0d866"
+        "afd766aed666add666acd666abd566aad466a9d466a8d366a7d366a6d266a5d266a4d266a3d166a2d066a1d066a0d066"
+        "9fcf669ece669dce669cce669bcd669acc6699cc6698cc6697cb6696cb6695ca6694ca6693c96692c86691c86690c866"
+        "8fc7668ec6668dc6668cc6668bc5668ac46689c46688c36687c36686c26685c26684c26683c16682c06681c06680c066"
+        "7fbf667ebe667dbe667cbe667bbd667abc6679bc6678bc6677bb6676bb6675ba6674ba6673b96672b86671b86670b866"
+        "6fb7666eb6666db6666cb6666bb5666ab46669b46668b36667b36666b26665b26664b26663b16662b06661b06660b066"
+        "5faf665eae665dae665cae665bad665aac6659ac6658ac6657ab6656ab6655aa6654aa6653a96652a86651a86650a866"
+        "4fa7664ea6664da6664ca6664ba5664aa46649a46648a36647a36646a26645a26644a26643a16642a06641a06640a066"
+        "3f9f663e9e663d9e663c9e663b9d663a9c66399c66389c66379b66369b66359a66349a66339966329866319866309866"
+        "2f97662e96662d96662c96662b95662a9466299466289366279366269266259266249266239166229066219066209066"
+        "1f8f661e8e661d8e661c8e661b8d661a8c66198c66188c66178b66168b66158a66148a66138966128866118866108866"
+        "0f87660e86660d86660c86660b85660a8466098466088466078366068266058266048266038166028066018066008066"
+    ),
+    "tab10": (
+        "1f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b4"
+        "1f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b4ff7f0eff7f0eff7f0eff7f0eff7f0eff7f0e"
+        "ff7f0eff7f0eff7f0eff7f0eff7f0eff7f0eff7f0eff7f0eff7f0eff7f0eff7f0eff7f0eff7f0eff7f0eff7f0eff7f0e"
+        "ff7f0eff7f0eff7f0e2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c"
+        "2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02cd62728d62728d62728"
+        "d62728d62728d62728d62728d62728d62728d62728d62728d62728d62728d62728d62728d62728d62728d62728d62728"
+        "d62728d62728d62728d62728d62728d627289467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd"
+        "9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd"
+        "8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b"
+        "8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564be377c2e377c2e377c2e377c2e377c2e377c2e377c2"
+        "e377c2e377c2e377c2e377c2e377c2e377c2e377c2e377c2e377c2e377c2e377c2e377c2e377c2e377c2e377c2e377c2"
+        "e377c2e377c2e377c27f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f"
+        "7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7fbcbd22bcbd22bcbd22bcbd22"
+        "bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22"
+        "bcbd22bcbd22bcbd22bcbd22bcbd22bcbd2217becf17becf17becf17becf17becf17becf17becf17becf17becf17becf"
+        "17becf17becf17becf17becf17becf17becf17becf17becf17becf17becf17becf17becf17becf17becf17becf17becf"
+    ),
+    "tab10_r": (
+        "17becf17becf17becf17becf17becf17becf17becf17becf17becf17becf17becf17becf17becf17becf17becf17becf"
+        "17becf17becf17becf17becf17becf17becf17becf17becf17becf17becfbcbd22bcbd22bcbd22bcbd22bcbd22bcbd22"
+        "bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22"
+        "bcbd22bcbd22bcbd227f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f"
+        "7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7fe377c2e377c2e377c2"
+        "e377c2e377c2e377c2e377c2e377c2e377c2e377c2e377c2e377c2e377c2e377c2e377c2e377c2e377c2e377c2e377c2"
+        "e377c2e377c2e377c2e377c2e377c2e377c28c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b"
+        "8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b"
+        "9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd"
+        "9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bdd62728d62728d62728d62728d62728d62728d62728"
+        "d62728d62728d62728d62728d62728d62728d62728d62728d62728d62728d62728d62728d62728d62728d62728d62728"
+        "d62728d62728d627282ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c"
+        "2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02cff7f0eff7f0eff7f0eff7f0e"
+        "ff7f0eff7f0eff7f0eff7f0eff7f0eff7f0eff7f0eff7f0eff7f0eff7f0eff7f0eff7f0eff7f0eff7f0eff7f0eff7f0e"
+        "ff7f0eff7f0eff7f0eff7f0eff7f0eff7f0e1f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b4"
+        "1f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b4"
+    ),
+    "tab20": (
+        "1f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b4aec7e8aec7e8aec7e8"
+        "aec7e8aec7e8aec7e8aec7e8aec7e8aec7e8aec7e8aec7e8aec7e8aec7e8ff7f0eff7f0eff7f0eff7f0eff7f0eff7f0e"
+        "ff7f0eff7f0eff7f0eff7f0eff7f0eff7f0eff7f0effbb78ffbb78ffbb78ffbb78ffbb78ffbb78ffbb78ffbb78ffbb78"
+        "ffbb78ffbb78ffbb782ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c"
+        "98df8a98df8a98df8a98df8a98df8a98df8a98df8a98df8a98df8a98df8a98df8a98df8a98df8ad62728d62728d62728"
+        "d62728d62728d62728d62728d62728d62728d62728d62728d62728d62728ff9896ff9896ff9896ff9896ff9896ff9896"
+        "ff9896ff9896ff9896ff9896ff9896ff98969467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd"
+        "9467bd9467bd9467bdc5b0d5c5b0d5c5b0d5c5b0d5c5b0d5c5b0d5c5b0d5c5b0d5c5b0d5c5b0d5c5b0d5c5b0d5c5b0d5"
+        "8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564bc49c94c49c94c49c94"
+        "c49c94c49c94c49c94c49c94c49c94c49c94c49c94c49c94c49c94e377c2e377c2e377c2e377c2e377c2e377c2e377c2"
+        "e377c2e377c2e377c2e377c2e377c2e377c2f7b6d2f7b6d2f7b6d2f7b6d2f7b6d2f7b6d2f7b6d2f7b6d2f7b6d2f7b6d2"
+        "f7b6d2f7b6d2f7b6d27f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f"
+        "c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7bcbd22bcbd22bcbd22bcbd22"
+        "bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22dbdb8ddbdb8ddbdb8ddbdb8ddbdb8ddbdb8ddbdb8d"
+        "dbdb8ddbdb8ddbdb8ddbdb8ddbdb8ddbdb8d17becf17becf17becf17becf17becf17becf17becf17becf17becf17becf"
+        "17becf17becf17becf9edae59edae59edae59edae59edae59edae59edae59edae59edae59edae59edae59edae59edae5"
+    ),
+    "tab20_r": (
+        "9edae59edae59edae59edae59edae59edae59edae59edae59edae59edae59edae59edae59edae517becf17becf17becf"
+        "17becf17becf17becf17becf17becf17becf17becf17becf17becf17becfdbdb8ddbdb8ddbdb8ddbdb8ddbdb8ddbdb8d"
+        "dbdb8ddbdb8ddbdb8ddbdb8ddbdb8ddbdb8ddbdb8dbcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22bcbd22"
+        "bcbd22bcbd22bcbd22c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7c7"
+        "7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7ff7b6d2f7b6d2f7b6d2"
+        "f7b6d2f7b6d2f7b6d2f7b6d2f7b6d2f7b6d2f7b6d2f7b6d2f7b6d2f7b6d2e377c2e377c2e377c2e377c2e377c2e377c2"
+        "e377c2e377c2e377c2e377c2e377c2e377c2c49c94c49c94c49c94c49c94c49c94c49c94c49c94c49c94c49c94c49c94"
+        "c49c94c49c94c49c948c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b8c564b"
+        "c5b0d5c5b0d5c5b0d5c5b0d5c5b0d5c5b0d5c5b0d5c5b0d5c5b0d5c5b0d5c5b0d5c5b0d5c5b0d59467bd9467bd9467bd"
+        "9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bd9467bdff9896ff9896ff9896ff9896ff9896ff9896ff9896"
+        "ff9896ff9896ff9896ff9896ff9896ff9896d62728d62728d62728d62728d62728d62728d62728d62728d62728d62728"
+        "d62728d62728d6272898df8a98df8a98df8a98df8a98df8a98df8a98df8a98df8a98df8a98df8a98df8a98df8a98df8a"
+        "2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02c2ca02cffbb78ffbb78ffbb78ffbb78"
+        "ffbb78ffbb78ffbb78ffbb78ffbb78ffbb78ffbb78ffbb78ffbb78ff7f0eff7f0eff7f0eff7f0eff7f0eff7f0eff7f0e"
+        "ff7f0eff7f0eff7f0eff7f0eff7f0eff7f0eaec7e8aec7e8aec7e8aec7e8aec7e8aec7e8aec7e8aec7e8aec7e8aec7e8"
+        "aec7e8aec7e8aec7e81f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b41f77b4"
+    ),
+    "tab20b": (
+        "393b79393b79393b79393b79393b79393b79393b79393b79393b79393b79393b79393b79393b795254a35254a35254a3"
+        "5254a35254a35254a35254a35254a35254a35254a35254a35254a35254a36b6ecf6b6ecf6b6ecf6b6ecf6b6ecf6b6ecf"
+        "6b6ecf6b6ecf6b6ecf6b6ecf6b6ecf6b6ecf6b6ecf9c9ede9c9ede9c9ede9c9ede9c9ede9c9ede9c9ede9c9ede9c9ede"
+        "9c9ede9c9ede9c9ede637939637939637939637939637939637939637939637939637939637939637939637939637939"
+        "8ca2528ca2528ca2528ca2528ca2528ca2528ca2528ca2528ca2528ca2528ca2528ca2528ca252b5cf6bb5cf6bb5cf6b"
+        "b5cf6bb5cf6bb5cf6bb5cf6bb5cf6bb5cf6bb5cf6bb5cf6bb5cf6bb5cf6bcedb9ccedb9ccedb9ccedb9ccedb9ccedb9c"
+        "cedb9ccedb9ccedb9ccedb9ccedb9ccedb9c8c6d318c6d318c6d318c6d318c6d318c6d318c6d318c6d318c6d318c6d31"
+        "8c6d318c6d318c6d31bd9e39bd9e39bd9e39bd9e39bd9e39bd9e39bd9e39bd9e39bd9e39bd9e39bd9e39bd9e39bd9e39"
+        "e7ba52e7ba52e7ba52e7ba52e7ba52e7ba52e7ba52e7ba52e7ba52e7ba52e7ba52e7ba52e7ba52e7cb94e7cb94e7cb94"
+        "e7cb94e7cb94e7cb94e7cb94e7cb94e7cb94e7cb94e7cb94e7cb94843c39843c39843c39843c39843c39843c39843c39"
+        "843c39843c39843c39843c39843c39843c39ad494aad494aad494aad494aad494aad494aad494aad494aad494aad494a"
+        "ad494aad494aad494ad6616bd6616bd6616bd6616bd6616bd6616bd6616bd6616bd6616bd6616bd6616bd6616bd6616b"
+        "e7969ce7969ce7969ce7969ce7969ce7969ce7969ce7969ce7969ce7969ce7969ce7969c7b41737b41737b41737b4173"
+        "7b41737b41737b41737b41737b41737b41737b41737b41737b4173a55194a55194a55194a55194a55194a55194a55194"
+        "a55194a55194a55194a55194a55194a55194ce6dbdce6dbdce6dbdce6dbdce6dbdce6dbdce6dbdce6dbdce6dbdce6dbd"
+        "ce6dbdce6dbdce6dbdde9ed6de9ed6de9ed6de9ed6de9ed6de9ed6de9ed6de9ed6de9ed6de9ed6de9ed6de9ed6de9ed6"
+    ),
+    "tab20b_r": (
+        "de9ed6de9ed6de9ed6de9ed6de9ed6de9ed6de9ed6de9ed6de9ed6de9ed6de9ed6de9ed6de9ed6ce6dbdce6dbdce6dbd"
+        "ce6dbdce6dbdce6dbdce6dbdce6dbdce6dbdce6dbdce6dbdce6dbdce6dbda55194a55194a55194a55194a55194a55194"
+        "a55194a55194a55194a55194a55194a55194a551947b41737b41737b41737b41737b41737b41737b41737b41737b4173"
+        "7b41737b41737b4173e7969ce7969ce7969ce7969ce7969ce7969ce7969ce7969ce7969ce7969ce7969ce7969ce7969c"
+        "d6616bd6616bd6616bd6616bd6616bd6616bd6616bd6616bd6616bd6616bd6616bd6616bd6616bad494aad494aad494a"
+        "ad494aad494aad494aad494aad494aad494aad494aad494aad494aad494a843c39843c39843c39843c39843c39843c39"
+        "843c39843c39843c39843c39843c39843c39e7cb94e7cb94e7cb94e7cb94e7cb94e7cb94e7cb94e7cb94e7cb94e7cb94"
+        "e7cb94e7cb94e7cb94e7ba52e7ba52e7ba52e7ba52e7ba52e7ba52e7ba52e7ba52e7ba52e7ba52e7ba52e7ba52e7ba52"
+        "bd9e39bd9e39bd9e39bd9e39bd9e39bd9e39bd9e39bd9e39bd9e39bd9e39bd9e39bd9e39bd9e398c6d318c6d318c6d31"
+        "8c6d318c6d318c6d318c6d318c6d318c6d318c6d318c6d318c6d31cedb9ccedb9ccedb9ccedb9ccedb9ccedb9ccedb9c"
+        "cedb9ccedb9ccedb9ccedb9ccedb9ccedb9cb5cf6bb5cf6bb5cf6bb5cf6bb5cf6bb5cf6bb5cf6bb5cf6bb5cf6bb5cf6b"
+        "b5cf6bb5cf6bb5cf6b8ca2528ca2528ca2528ca2528ca2528ca2528ca2528ca2528ca2528ca2528ca2528ca2528ca252"
+        "6379396379396379396379396379396379396379396379396379396379396379396379399c9ede9c9ede9c9ede9c9ede"
+        "9c9ede9c9ede9c9ede9c9ede9c9ede9c9ede9c9ede9c9ede9c9ede6b6ecf6b6ecf6b6ecf6b6ecf6b6ecf6b6ecf6b6ecf"
+        "6b6ecf6b6ecf6b6ecf6b6ecf6b6ecf6b6ecf5254a35254a35254a35254a35254a35254a35254a35254a35254a35254a3"
+        "5254a35254a35254a3393b79393b79393b79393b79393b79393b79393b79393b79393b79393b79393b79393b79393b79"
+    ),
+    "tab20c": (
+        "3182bd3182bd3182bd3182bd3182bd3182bd3182bd3182bd3182bd3182bd3182bd3182bd3182bd6baed66baed66baed6"
+        "6baed66baed66baed66baed66baed66baed66baed66baed66baed66baed69ecae19ecae19ecae19ecae19ecae19ecae1"
+        "9ecae19ecae19ecae19ecae19ecae19ecae19ecae1c6dbefc6dbefc6dbefc6dbefc6dbefc6dbefc6dbefc6dbefc6dbef"
+        "c6dbefc6dbefc6dbefe6550de6550de6550de6550de6550de6550de6550de6550de6550de6550de6550de6550de6550d"
+        "fd8d3cfd8d3cfd8d3cfd8d3cfd8d3cfd8d3cfd8d3cfd8d3cfd8d3cfd8d3cfd8d3cfd8d3cfd8d3cfdae6bfdae6bfdae6b"
+        "fdae6bfdae6bfdae6bfdae6bfdae6bfdae6bfdae6bfdae6bfdae6bfdae6bfdd0a2fdd0a2fdd0a2fdd0a2fdd0a2fdd0a2"
+        "fdd0a2fdd0a2fdd0a2fdd0a2fdd0a2fdd0a231a35431a35431a35431a35431a35431a35431a35431a35431a35431a354"
+        "31a35431a35431a35474c47674c47674c47674c47674c47674c47674c47674c47674c47674c47674c47674c47674c476"
+        "a1d99ba1d99ba1d99ba1d99ba1d99ba1d99ba1d99ba1d99ba1d99ba1d99ba1d99ba1d99ba1d99bc7e9c0c7e9c0c7e9c0"
+        "c7e9c0c7e9c0c7e9c0c7e9c0c7e9c0c7e9c0c7e9c0c7e9c0c7e9c0756bb1756bb1756bb1756bb1756bb1756bb1756bb1"
+        "756bb1756bb1756bb1756bb1756bb1756bb19e9ac89e9ac89e9ac89e9ac89e9ac89e9ac89e9ac89e9ac89e9ac89e9ac8"
+        "9e9ac89e9ac89e9ac8bcbddcbcbddcbcbddcbcbddcbcbddcbcbddcbcbddcbcbddcbcbddcbcbddcbcbddcbcbddcbcbddc"
+        "dadaebdadaebdadaebdadaebdadaebdadaebdadaebdadaebdadaebdadaebdadaebdadaeb636363636363636363636363"
+        "636363636363636363636363636363636363636363636363636363969696969696969696969696969696969696969696"
+        "969696969696969696969696969696969696bdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbd"
+        "bdbdbdbdbdbdbdbdbdd9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9"
+    ),
+    "tab20c_r": (
+        "d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9d9bdbdbdbdbdbdbdbdbd"
+        "bdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbdbd969696969696969696969696969696969696"
+        "969696969696969696969696969696969696969696636363636363636363636363636363636363636363636363636363"
+        "636363636363636363dadaebdadaebdadaebdadaebdadaebdadaebdadaebdadaebdadaebdadaebdadaebdadaebdadaeb"
+        "bcbddcbcbddcbcbddcbcbddcbcbddcbcbddcbcbddcbcbddcbcbddcbcbddcbcbddcbcbddcbcbddc9e9ac89e9ac89e9ac8"
+        "9e9ac89e9ac89e9ac89e9ac89e9ac89e9ac89e9ac89e9ac89e9ac89e9ac8756bb1756bb1756bb1756bb1756bb1756bb1"
+        "756bb1756bb1756bb1756bb1756bb1756bb1c7e9c0c7e9c0c7e9c0c7e9c0c7e9c0c7e9c0c7e9c0c7e9c0c7e9c0c7e9c0"
+        "c7e9c0c7e9c0c7e9c0a1d99ba1d99ba1d99ba1d99ba1d99ba1d99ba1d99ba1d99ba1d99ba1d99ba1d99ba1d99ba1d99b"
+        "74c47674c47674c47674c47674c47674c47674c47674c47674c47674c47674c47674c47674c47631a35431a35431a354"
+        "31a35431a35431a35431a35431a35431a35431a35431a35431a354fdd0a2fdd0a2fdd0a2fdd0a2fdd0a2fdd0a2fdd0a2"
+        "fdd0a2fdd0a2fdd0a2fdd0a2fdd0a2fdd0a2fdae6bfdae6bfdae6bfdae6bfdae6bfdae6bfdae6bfdae6bfdae6bfdae6b"
+        "fdae6bfdae6bfdae6bfd8d3cfd8d3cfd8d3cfd8d3cfd8d3cfd8d3cfd8d3cfd8d3cfd8d3cfd8d3cfd8d3cfd8d3cfd8d3c"
+        "e6550de6550de6550de6550de6550de6550de6550de6550de6550de6550de6550de6550dc6dbefc6dbefc6dbefc6dbef"
+        "c6dbefc6dbefc6dbefc6dbefc6dbefc6dbefc6dbefc6dbefc6dbef9ecae19ecae19ecae19ecae19ecae19ecae19ecae1"
+        "9ecae19ecae19ecae19ecae19ecae19ecae16baed66baed66baed66baed66baed66baed66baed66baed66baed66baed6"
+        "6baed66baed66baed63182bd3182bd3182bd3182bd3182bd3182bd3182bd3182bd3182bd3182bd3182bd3182bd3182bd"
+    ),
+    "terrain": (
+        "33339932369c30389e2f3ba12e3ea42c40a62b43a92a46ac2848ae274bb1264eb42450b62353b92256bc2058be1f5bc1"
+        "1e5ec41c60c61b63c91a66cc1868ce176bd1166ed41470d61373d91276dc1078de0f7be10e7ee40c80e60b83e90a86ec"
+        "0888ee078bf1068ef40490f60393f90296fc0098fe009afa009cf4009eef00a0e800a2e200a4dc00a6d700a8d000aacb"
+        "00acc400aebf00b0b900b2b200b4ac00b6a700b8a000bb9b00bc9400be8f00c08800c38200c47d00c67700c97000cb6b"
+        "01cc6605cd6709ce680dcf6911cf6915d06a19d16b1dd26c21d36d25d36d29d46e2dd56f31d67035d77139d7713dd872"
+        "41d97345da7449db754ddb7551dc7655dd7759de785ddf7961df7965e07a69e17b6de27c71e37d75e37d79e47e7de57f"
+        "81e68085e78189e7818de88291e98395ea8499eb859deb85a1ec86a5ed87a9ee88adef89b1ef89b5f08ab9f18bbdf28c"
+        "c1f38dc5f38dc9f48ecdf58fd1f690d5f791d9f791ddf892e1f993e5fa94e9fb95edfb95f1fc96f5fd97f9fe98fdff99"
+        "fefe98fcfb97faf996f8f695f6f394f4f193f2ee92f0ec91eee990ece78feae48ee8e28de6df8be4dc8ae2da89e0d788"
+        "ded587dcd286dad085d8cd84d6cb83d4c882d2c581d0c380cec07fccbe7dcabb7cc8b97bc6b67ac4b379c2b178c0ae77"
+        "beac76bca975baa774b8a473b6a272b49f70b29c6fb09a6eae976dac956caa926ba8906aa68d69a48b68a28867a08566"
+        "9e83659c80649a7e62987b6196796094765f92735e90715d8e6e5c8c6c5b8a695a886759866458846257825f56805c54"
+        "815e5683605985635c87655e8968618b6b648d6d668f706991726c93756e957771977a74997c769b7f799d827c9f847e"
+        "a18781a38984a58c86a78e89a9918cab938ead9691af9994b19b96b39e99b5a09cb7a39fb9a5a1bba8a4bdaba7bfada9"
+        "c1b0acc3b2afc5b5b1c7b7b4c9bab7cbbcb9cdbfbccfc2bfd1c4c1d3c7c4d5c9c7d7ccc9d9ceccdbd1cfddd3d1dfd6d4"
+        "e1d9d7e3dbd9e5dedce7e0dfe9e3e2ebe5e4ede8e7efebeaf1edecf3f0eff5f2f2f7f5f4f9f7f7fbfafafdfcfcffffff"
+    ),
+    "terrain_r": (
+        "fffffffdfcfcfbfafaf9f7f7f7f5f4f5f2f2f3f0eff1edecefebeaede8e7ebe5e4e9e3e2e7e0dfe5dedce3dbd9e1d9d7"
+        "dfd6d4ddd3d1dbd1cfd9ceccd7ccc9d5c9c7d3c7c4d1c4c1cfc2bfcdbfbccbbcb9c9bab7c7b7b4c5b5b1c3b2afc1b0ac"
+        "bfada9bdaba7bba8a4b9a5a1b7a39fb5a09cb39e99b19b96af9994ad9691ab938ea9918ca78e89a58c86a38984a18781"
+        "9f847e9d827c9b7f79997c76977a7495777193756e91726c8f70698d6d668b6b6489686187655e85635c836059815e56"
+        "805c54825f568462578664588867598a695a8c6c5b8e6e5c90715d92735e94765f967960987b619a7e629c80649e8365"
+        "a08566a28867a48b68a68d69a8906aaa926bac956cae976db09a6eb29c6fb49f70b6a272b8a473baa774bca975beac76"
+        "c0ae77c2b178c4b379c6b67ac8b97bcabb7cccbe7dcec07fd0c380d2c581d4c882d6cb83d8cd84dad085dcd286ded587"
+        "e0d788e2da89e4dc8ae6df8ce8e28deae48eece78feee990f0ec91f2ee92f4f193f6f394f8f695faf996fcfb97fefe98"
+        "fdff99f9fe98f5fd97f1fc96edfb95e9fb95e5fa94e1f993ddf892d9f791d5f791d1f690cdf58fc9f48ec5f38dc1f38d"
+        "bdf28cb9f18bb5f08ab1ef89adef89a9ee88a5ed87a1ec869deb8599eb8595ea8491e9838de88289e78185e78181e680"
+        "7de57f79e47e75e37d71e37d6de27c69e17b65e07a61df795ddf7959de7855dd7751dc764ddb7549db7545da7441d973"
+        "3dd87239d77135d77131d6702dd56f29d46e25d36d21d36d1dd26c19d16b15d06a11cf690dcf6909ce6805cd6701cc66"
+        "00cb6a00c97100c67600c47d00c38200c08800be8e00bc9400bb9b00b8a000b6a600b4ac00b2b200b0b800aebe00acc4"
+        "00abcb00a8d000a6d700a4dc00a3e200a0e8009eee009cf4009afa0098fe0296fc0393f90490f6068ef4078bf10888ee"
+        "0a86ec0b83e90c80e60e7ee40f7be11078de1276dc1373d91470d6166ed4176bd11868ce1a66cc1b63c91c60c61e5ec4"
+        "1f5bc12058be2256bc2353b92450b6264eb4274bb12848ae2a46ac2b43a92c40a62e3ea42f3ba130389e32369c333399"
+    ),
+    "turbo": (
+        "30123b32154333184a341b51351e5836215f37246638276d392a733a2d793b2f803c32863d358b3e38913f3b973f3e9c"
+        "4040a24143a74146ac4249b1424bb5434eba4451bf4454c34456c74559cb455ccf455ed34661d64664da4666dd4669e0"
+        "466be3476ee64771e94773eb4776ee4778f0477bf2467df44680f64682f84685fa4687fb458afc458cfd448ffe4391fe"
+        "4294ff4196ff4099ff3e9bfe3d9efe3ba0fd3aa3fc38a5fb37a8fa35abf833adf731aff52fb2f42eb4f22cb7f02ab9ee"
+        "28bceb27bee925c0e723c3e422c5e220c7df1fc9dd1ecbda1ccdd81bd0d51ad2d21ad4d019d5cd18d7ca18d9c818dbc5"
+        "18ddc218dec018e0bd19e2bb19e3b91ae4b61ce6b41de7b21fe9af20eaac22ebaa25eca727eea42aefa12cf09e2ff19b"
+        "32f29835f39438f4913cf58e3ff68a43f78746f8844af8804ef97d52fa7a55fa7659fb735dfc6f61fc6c65fd6969fd66"
+        "6dfe6271fe5f75fe5c79fe597dff5680ff5384ff5188ff4e8bff4b8fff4992ff4796fe4499fe429cfe409ffd3fa1fd3d"
+        "a4fc3ca7fc3aa9fb39acfb38affa37b1f936b4f836b7f735b9f635bcf534bef434c1f334c3f134c6f034c8ef34cbed34"
+        "cdec34d0ea34d2e935d4e735d7e535d9e436dbe236dde037dfdf37e1dd37e3db38e5d938e7d739e9d539ebd339ecd13a"
+        "eecf3aefcd3af1cb3af2c93af4c73af5c53af6c33af7c13af8be39f9bc39faba39fbb838fbb637fcb336fcb136fdae35"
+        "fdac34fea933fea732fea431fea130fe9e2ffe9b2dfe992cfe962bfe932afe9029fd8d27fd8a26fc8725fc8423fb8122"
+        "fb7e21fa7b1ff9781ef9751df8721cf76f1af66c19f56918f46617f36315f26014f15d13f05b12ef5811ed5510ec530f"
+        "eb500eea4e0de84b0ce7490ce5470be4450ae2430ae14109df3f08dd3d08dc3b07da3907d83706d63506d43305d23105"
+        "d02f05ce2d04cc2b04ca2a04c82803c52603c32503c12302be2102bc2002b91e02b71d02b41b01b21a01af1801ac1701"
+        "a91601a71401a41301a112019e10019b0f01980e01950d01920b018e0a018b09028808028507028106027e05027a0403"
+    ),
+    "turbo_r": (
+        "7a04037e05028106028507028808028b09028e0a01920b01950d01980e019b0f019e1001a11201a41301a71401a91601"
+        "ac1701af1801b21a01b41b01b71d02b91e02bc2002be2102c12302c32503c52603c82803ca2a04cc2b04ce2d04d02f05"
+        "d23105d43305d63506d83706da3907dc3b07dd3d08df3f08e14109e2430ae4450ae5470be7490ce84b0cea4e0deb500e"
+        "ec530fed5510ef5811f05b12f15d13f26014f36315f46617f56918f66c19f76f1af8721cf9751df9781efa7b1ffb7e21"
+        "fb8122fc8423fc8725fd8a26fd8d27fe9029fe932afe962bfe992cfe9b2dfe9e2ffea130fea431fea732fea933fdac34"
+        "fdae35fcb136fcb336fbb637fbb838faba39f9bc39f8be39f7c13af6c33af5c53af4c73af2c93af1cb3aefcd3aeecf3a"
+        "ecd13aebd339e9d539e7d739e5d938e3db38e1dd37dfdf37dde037dbe236d9e436d7e535d4e735d2e935d0ea34cdec34"
+        "cbed34c8ef34c6f034c3f134c1f334bef434bcf534b9f635b7f735b4f836b1f936affa37acfb38a9fb39a7fc3aa4fc3c"
+        "a1fd3d9ffd3f9cfe4099fe4296fe4492ff478fff498bff4b88ff4e84ff5180ff537dff5679fe5975fe5c71fe5f6dfe62"
+        "69fd6665fd6961fc6c5dfc6f59fb7355fa7652fa7a4ef97d4af88046f88443f7873ff68a3cf58e38f49135f39432f298"
+        "2ff19b2cf09e2aefa127eea425eca722ebaa20eaac1fe9af1de7b21ce6b41ae4b619e3b919e2bb18e0bd18dec018ddc2"
+        "18dbc518d9c818d7ca19d5cd1ad4d01ad2d21bd0d51ccdd81ecbda1fc9dd20c7df22c5e223c3e425c0e727bee928bceb"
+        "2ab9ee2cb7f02eb4f22fb2f431aff533adf735abf837a8fa38a5fb3aa3fc3ba0fd3d9efe3e9bfe4099ff4196ff4294ff"
+        "4391fe448ffe458cfd458afc4687fb4685fa4682f84680f6467df4477bf24778f04776ee4773eb4771e9476ee6466be3"
+        "4669e04666dd4664da4661d6455ed3455ccf4559cb4456c74454c34451bf434eba424bb54249b14146ac4143a74040a2"
+        "3f3e9c3f3b973e38913d358b3c32863b2f803a2d79392a7338276d37246636215f351e58341b5133184a32154330123b"
+    ),
+    "twilight": (
+        "e2d9e2e1d9e2e0d9e2ded9e1ddd9e0dcd9dfdad8dfd8d8ded6d7ddd4d6dcd2d5dbd0d4d9cdd3d8cbd2d7c8d0d6c5cfd5"
+        "c2ced4bfccd3bccbd1b9c9d0b6c8cfb3c6ceb0c5cdadc3cdaac2cca7c0cba4becaa1bdc99ebbc99cb9c899b8c896b6c7"
+        "93b4c692b3c68eb1c58cafc589adc588acc485a9c482a7c380a5c37fa5c37ca2c27aa0c2789ec2779dc2759ac17398c1"
+        "7196c17195c06e92c06d90c06c8ebf6b8dbf698abf6888be6786be6785be6682bd657fbd647dbc647cbc6379bb6277bb"
+        "6275ba6172ba6171b9606eb8606cb86069b76067b65f65b55f62b45f60b45f5fb35f5bb25f59b15f57b05e54ae5e52ad"
+        "5e4fac5e4dab5e4caa5e48a85e46a65e43a55d41a35d3ea15d3ca05d3a9e5c389d5c359a5b32985b30955a2e935a2b90"
+        "59298e58278b58268a572385562182551f7f531e7c521c79511a754f19724f19704c176b4b166849156447146146145e"
+        "44135a4212574112563f12513d114e3c114b3a114939114637114436114236114134113e33113c32123a311339301437"
+        "3014373113373312373412383412383611393811393a113a3b113b3d113c3f123d41123d43123e4612404813414a1342"
+        "4d14434f14445215455415465615465916485c17495f174a61184b64194b67194c691a4d6c1b4e6f1c4e711d4f741e4f"
+        "761f4f7920507b21507e22507f23508325508526508727508a29508c2a508e2c50902e50922f50943150963350983550"
+        "9a37509c39509e3b50a03d50a03e50a34150a54350a64550a84750a94950ab4b50ac4d51ae5051af5251b15452b25652"
+        "b35953b55b53b65d54b75f55b86155b96456ba6657bb6958bc6b59bd6e5abe705bbf725dc0755ec1775fc27a61c27c63"
+        "c37f64c48166c58468c5866ac6876bc68b6ec78e71c89073c89275c99578c9977bca9a7dca9c80cb9f83cca186cca389"
+        "cda68ccda88fceab92cfad96cfae97d0b29cd1b4a0d1b6a3d2b8a7d3baaad4bdadd5bfb1d6c1b4d7c3b8d8c5bbd8c7be"
+        "d9c9c2dacbc5dbccc8dccecbdccfcdddd1d1ded3d3dfd4d6dfd5d8e0d6dae0d7dbe1d8dde1d8dfe2d9e0e2d9e1e2d9e2"
+    ),
+    "twilight_r": (
+        "e2d9e2e2d9e1e2d8dfe1d8dee1d7dce0d7dae0d6d9dfd4d7ded3d4ded2d2ddd0cfdccfcddccdcadbcbc6dacac3d9c8c0"
+        "d8c6bdd7c4b9d6c2b6d5c0b3d4beafd4bcacd3b9a8d2b7a5d1b5a1d0b39ed0b09bcfae97ceac94cea991cda78ecca58b"
+        "cca287cca186cb9d82ca9b7fca997cc9977bc89477c89174c78f72c78e71c68a6dc6876bc58569c58468c48065c37d63"
+        "c27b62c27a61c0765fc0745dbf715cbe705bbd6c5abc6a58bb6857ba6657b96356b86155b65e54b65d54b45a53b35752"
+        "b15552b05351af5251ad4e51ac4c50aa4a50a94850a74650a54450a44250a34150a03e509f3c509d3a509b3850993650"
+        "973450953250943150912f508f2d508d2b508b2a508828508627508425508325507f23507d21507a2050781f4f751e4f"
+        "721d4f701c4e6f1c4e6b1b4d681a4d65194c63184b60184a5d17495b16485916485615465315455014444e14434b1342"
+        "49134147134046124042123e40123d3e113c3c113b3a113a39113a3711393611393412383312373212373113372f1436"
+        "30133831123a32123b33113d34113e3611413711433811453a11483b114a3d114d3e115040125341125643135945135c"
+        "47145f4815634a15664c16694c176b4f1970501a74511b77531d7a541e7e55208156228457248758268a59288d592a8f"
+        "5a2d925b2f945b31965c34995c359a5c389d5d3b9f5d3da15d40a25d42a45e45a65e47a75e49a95e4caa5e4eab5e51ad"
+        "5e53ae5f55af5f58b05f5ab15f5bb25f5fb35f61b45f64b56066b66068b6606ab7606db8616fb96171b96173ba6276ba"
+        "6278bb637abb647cbc647ebc657fbd6683bd6785be6887be6989be6a8bbf6b8dbf6c8fbf6e91c06f93c07195c07297c1"
+        "7499c1769bc1779dc2799fc27aa0c27da3c37fa5c381a6c384a8c486aac488acc48aaec58db0c58fb1c692b3c695b5c7"
+        "97b7c79ab8c89dbac8a0bcc9a1bdc9a6bfcaa9c1cbacc2ccafc4cdb2c6ceb5c7cfb8c9d0bbcad1beccd2c1cdd3c4ced4"
+        "c7d0d5c9d1d7ccd2d8ced3d9d0d4d9d3d6dbd5d6dcd7d7ddd9d8dedbd8dfdcd9e0ded9e1dfd9e1e0d9e2e1d9e2e2d9e2"
+    ),
+    "twilight_shifted": (
+        "30143731133932123a33113c34113e3511403611423711443911463a11493c114b3d114e3f125141125442125744135a"
+        "46145e4714614915644b16684c176b4e186f4f1972511a75521c79531e7c551f7f56218257238557258858278b59298e"
+        "5a2b905a2d925b30955b32985c359a5c369b5d3a9e5d3ca05d3ea15d40a25e43a55e46a65e48a85e49a95e4dab5e4fac"
+        "5e52ad5e53ae5f57b05f59b15f5bb25f5db25f60b45f62b45f65b56066b66069b7606cb8606eb8616fb96172ba6275ba"
+        "6277bb6379bb637abb647dbc657fbd6682bd6684bd6786be6888be698abf6a8bbf6c8ebf6d90c06e92c07094c07196c1"
+        "7398c1759ac1769bc1789ec27aa0c27ca2c27ea4c380a5c382a7c385a9c486aac489adc58cafc58eb1c591b2c693b4c6"
+        "96b6c799b8c89ab8c89ebbc9a1bdc9a4becaa7c0cbaac2ccadc3cdb0c5cdb2c6ceb6c8cfb9c9d0bccbd1bfccd3c2ced4"
+        "c5cfd5c8d0d6c9d1d7cdd3d8d0d4d9d2d5dbd4d6dcd6d7ddd8d8dedad8dfdbd8dfddd9e0ded9e1e0d9e2e1d9e2e2d9e2"
+        "e2d9e1e2d9e0e1d8dfe1d8dde1d7dce0d6dadfd5d8dfd4d6ded3d3ddd1d1ddd0cedccecbdbccc8dacbc5d9c9c2d8c7be"
+        "d8c5bbd7c3b8d6c1b4d5bfb1d4beafd3baaad2b8a7d1b6a3d1b4a0d0b29ccfaf99cfad96ceab92cda88fcda68ccca389"
+        "cca186cb9f83ca9c80ca9a7dca997cc99578c89275c89073c78e71c68b6ec6896cc5866ac58468c48166c37f64c27c63"
+        "c27a61c1775fc0755ebf725dbf715cbd6e5abc6b59bb6958ba6657b96456b86255b75f55b65d54b55b53b35953b25652"
+        "b15452af5251ae5051ac4d51ac4c50a94950a84750a64550a54350a34150a13f50a03d509e3b509c39509a3750983550"
+        "963350943150922f50902e508f2d508c2a508a29508727508526508325508023507e22507b2150792050761f4f741e4f"
+        "711d4f6f1c4e6c1b4e691a4d681a4d64194b61184b5f174a5c17495916485716475415465215454f14444d14434a1342"
+        "48134146124043123e41123d40123d3d113c3b113b3a113a3811393611393511383412383312373113373014372f1436"
+    ),
+    "twilight_shifted_r": (
+        "2f143631133732123733123734123836113837113939113a3a113a3c113b3e113c40123d42123e44123f471340491341"
+        "4b13424e14435014445315455615465816475b16485d174960184a63184b65194c681a4d6b1b4d6d1b4e701c4e721d4f"
+        "751e4f761f4f7a20507d21507f23508023508425508627508828508a29508d2b508f2d50912f50922f50953250973450"
+        "9936509a37509d3a509f3c50a03e50a13f50a44250a54450a74650a84750aa4a50ac4c50ad4e51ae5051b05351b15552"
+        "b35752b45a53b55b53b65e54b86155b96356ba6557bb6857bc6a58bd6c5abd6e5abf715cc0745dc0765fc17960c27b62"
+        "c37d63c48065c48166c58569c6876bc68a6dc78c6fc78f72c89174c89477c99578ca997cca9b7fcb9d82cba085cca287"
+        "cca58bcda78ecda88fceac94cfae97d0b09bd0b39ed1b5a1d2b7a5d3b9a8d3baaad4beafd5c0b3d6c2b6d7c4b9d8c6bd"
+        "d9c8c0dacac3dacbc5dccdcadccfcdddd0cfded2d2ded3d4dfd4d7e0d6d9e0d6dae1d7dce1d8dee2d8dfe2d9e1e2d9e2"
+        "e1d9e2e0d9e2dfd9e1ded9e1ddd9e0dbd8dfd9d8ded7d7ddd5d6dcd3d6dbd1d5daced3d9ccd2d8c9d1d7c7d0d5c4ced4"
+        "c1cdd3beccd2bbcad1b8c9d0b6c8cfb2c6ceafc4cdacc2cca9c1cba6bfcaa3becaa0bcc99dbac89ab8c897b7c795b5c7"
+        "92b3c68fb1c68db0c58aaec589adc586aac484a8c481a6c37fa5c37da3c37ba1c2799fc2779dc2769bc17499c17297c1"
+        "7195c06f93c06e91c06c8fbf6c8ebf6a8bbf6989be6887be6785be6683bd6580bd647ebc647cbc637abb6278bb6276ba"
+        "6173ba6171b9616fb9606db8606cb86068b66066b65f64b55f61b45f5fb35f5db25f5ab15f58b05f55af5e53ae5e51ad"
+        "5e4eab5e4caa5e49a95e47a75e46a65d42a45d40a25d3da15d3b9f5c389d5c369b5c34995b31965b2f945a2d92592a8f"
+        "59288d58268a572487562284562182541e7e531d7a511b77501a744f19704d176d4c16694a156648156347145f45135c"
+        "4313594112564012533e11503d114e3b114a3a114838114537114336114134113f33113d32123b31123a301338301437"
+    ),
+    "viridis": (
+        "44015444025645045745055946075a46085c460a5d460b5e470d60470e61471063471164471365481467481668481769"
+        "48186a481a6c481b6d481c6e481d6f481f70482071482173482374482475482576482677482878482979472a7a472c7a"
+        "472d7b472e7c472f7d46307e46327e46337f463480453581453781453882443983443a83443b84433d84433e85423f85"
+        "4240864241864142874144874045884046883f47883f48893e49893e4a893e4c8a3d4d8a3d4e8a3c4f8a3c508b3b518b"
+        "3b528b3a538b3a548c39558c39568c38588c38598c375a8c375b8d365c8d365d8d355e8d355f8d34608d34618d33628d"
+        "33638d32648e32658e31668e31678e31688e30698e306a8e2f6b8e2f6c8e2e6d8e2e6e8e2e6f8e2d708e2d718e2c718e"
+        "2c728e2c738e2b748e2b758e2a768e2a778e2a788e29798e297a8e297b8e287c8e287d8e277e8e277f8e27808e26818e"
+        "26828e26828e25838e25848e25858e24868e24878e23888e23898e238a8d228b8d228c8d228d8d218e8d218f8d21908d"
+        "21918c20928c20928c20938c1f948c1f958b1f968b1f978b1f988b1f998a1f9a8a1e9b8a1e9c891e9d891f9e891f9f88"
+        "1fa0881fa1881fa1871fa28720a38620a48621a58521a68522a78522a88423a98324aa8325ab8225ac8226ad8127ad81"
+        "28ae8029af7f2ab07f2cb17e2db27d2eb37c2fb47c31b57b32b67a34b67935b77937b87838b9773aba763bbb753dbc74"
+        "3fbc7340bd7242be7144bf7046c06f48c16e4ac16d4cc26c4ec36b50c46a52c56954c56856c66758c7655ac8645cc863"
+        "5ec96260ca6063cb5f65cb5e67cc5c69cd5b6ccd5a6ece5870cf5773d05675d05477d1537ad1517cd2507fd34e81d34d"
+        "84d44b86d54989d5488bd6468ed64590d74393d74195d84098d83e9bd93c9dd93ba0da39a2da37a5db36a8db34aadc32"
+        "addc30b0dd2fb2dd2db5de2bb8de29bade28bddf26c0df25c2df23c5e021c8e020cae11fcde11dd0e11cd2e21bd5e21a"
+        "d8e219dae319dde318dfe318e2e418e5e419e7e419eae51aece51befe51cf1e51df4e61ef6e620f8e621fbe723fde725"
+    ),
+    "viridis_r": (
+        "fde725fbe723f8e621f6e620f4e61ef1e51defe51cece51beae51ae7e419e5e419e2e418dfe318dde318dae319d8e219"
+        "d5e21ad2e21bd0e11ccde11dcae11fc8e020c5e021c2df23c0df25bddf26bade28b8de29b5de2bb2dd2db0dd2faddc30"
+        "aadc32a8db34a5db36a2da37a0da399dd93b9bd93c98d83e95d84093d74190d7438ed6458bd64689d54886d54984d44b"
+        "81d34d7fd34e7cd2507ad15177d15375d05473d05670cf576ece586ccd5a69cd5b67cc5c65cb5e63cb5f60ca605ec962"
+        "5cc8635ac86458c76556c66754c56852c56950c46a4ec36b4cc26c4ac16d48c16e46c06f44bf7042be7140bd723fbc73"
+        "3dbc743bbb753aba7638b97737b87835b77934b67932b67a31b57b2fb47c2eb37c2db27d2cb17e2ab07f29af7f28ae80"
+        "27ad8126ad8125ac8225ab8224aa8323a98322a88422a78521a68521a58520a48620a3861fa2871fa1871fa1881fa088"
+        "1f9f881f9e891e9d891e9c891e9b8a1f9a8a1f998a1f988b1f978b1f968b1f958b1f948c20938c20928c20928c21918c"
+        "21908d218f8d218e8d228d8d228c8d228b8d238a8d23898e23888e24878e24868e25858e25848e25838e26828e26828e"
+        "26818e27808e277f8e277e8e287d8e287c8e297b8e297a8e29798e2a788e2a778e2a768e2b758e2b748e2c738e2c728e"
+        "2c718e2d718e2d708e2e6f8e2e6e8e2e6d8e2f6c8e2f6b8e306a8e30698e31688e31678e31668e32658e32648e33638d"
+        "33628d34618d34608d355f8d355e8d365d8d365c8d375b8d375a8c38598c38588c39568c39558c3a548c3a538b3b528b"
+        "3b518b3c508b3c4f8a3d4e8a3d4d8a3e4c8a3e4a893e49893f48893f4788404688404588414487414287424186424086"
+        "423f85433e85433d84443b84443a8344398345388245378145358146348046337f46327e46307e472f7d472e7c472d7b"
+        "472c7a472a7a482979482878482677482576482475482374482173482071481f70481d6f481c6e481b6d481a6c48186a"
+        "481769481668481467471365471164471063470e61470d60460b5e460a5d46085c46075a450559450457440256440154"
+    ),
+    "winter": (
+        "0000ff0001fe0002fe0003fe0004fd0005fc0006fc0007fc0008fb0009fa000afa000bfa000cf9000df8000ef8000ff8"
+        "0010f70011f60012f60013f60014f50015f40016f40017f40018f30019f2001af2001bf2001cf1001df0001ef0001ff0"
+        "0020ef0021ee0022ee0023ee0024ed0025ec0026ec0027ec0028eb0029eb002aea002bea002ce9002de8002ee8002fe8"
+        "0030e70031e60032e60033e60034e50035e40036e40037e30038e30039e2003ae2003be2003ce1003de0003ee0003fe0"
+        "0040df0041de0042de0043de0044dd0045dc0046dc0047dc0048db0049db004ada004bda004cd9004dd8004ed8004fd8"
+        "0050d70051d60052d60053d60054d50055d40056d40057d30058d30059d2005ad2005bd2005cd1005dd0005ed0005fd0"
+        "0060cf0061ce0062ce0063ce0064cd0065cc0066cc0067cc0068cb0069cb006aca006bca006cc9006dc8006ec8006fc8"
+        "0070c70071c60072c60073c60074c50075c40076c40077c30078c30079c2007ac2007bc2007cc1007dc0007ec0007fc0"
+        "0080bf0081be0082be0083be0084bd0085bc0086bc0087bc0088bb0089bb008aba008bba008cb9008db8008eb8008fb8"
+        "0090b70091b60092b60093b60094b50095b40096b40097b30098b30099b2009ab2009bb2009cb1009db0009eb0009fb0"
+        "00a0af00a1ae00a2ae00a3ae00a4ad00a5ac00a6ac00a7ac00a8ab00a9ab00aaaa00abaa00aca900ada800aea800afa8"
+        "00b0a700b1a600b2a600b3a600b4a500b5a400b6a400b7a300b8a300b9a200baa200bba200bca100bda000bea000bfa0"
+        "00c09f00c19e00c29e00c39e00c49d00c59c00c69c00c79c00c89b00c99b00ca9a00cb9a00cc9900cd9800ce9800cf98"
+        "00d09700d19600d29600d39600d49500d59400d69400d79300d89300d99200da9200db9200dc9100dd9000de9000df90"
+        "00e08f00e18e00e28e00e38e00e48d00e58c00e68c00e78c00e88b00e98b00ea8a00eb8a00ec8900ed8800ee8800ef88"
+        "00f08700f18600f28600f38600f48500f58400f68400f78400f88300f98200fa8200fb8200fc8100fd8000fe8000ff80"
+    ),
+    "winter_r": (
+        "00ff8000fe8000fd8000fc8100fb8200fa8200f98200f88300f78400f68400f58400f48500f38600f28600f18600f087"
+        "00ef8800ee8800ed8800ec8900eb8a00ea8a00e98a00e88b00e78c00e68c00e58c00e48d00e38e00e28e00e18e00e08f"
+        "00df9000de9000dd9000dc9100db9200da9200d99200d89300d79300d69400d59400d49500d39600d29600d19600d097"
+        "00cf9800ce9800cd9800cc9900cb9a00ca9a00c99a00c89b00c79c00c69c00c59c00c49d00c39e00c29e00c19e00c09f"
+        "00bfa000bea000bda000bca100bba200baa200b9a200b8a300b7a300b6a400b5a400b4a500b3a600b2a600b1a600b0a7"
+        "00afa800aea800ada800aca900abaa00aaaa00a9ab00a8ab00a7ac00a6ac00a5ac00a4ad00a3ae00a2ae00a1ae00a0af"
+        "009fb0009eb0009db0009cb1009bb2009ab20099b20098b30097b30096b40095b40094b50093b60092b60091b60090b7"
+        "008fb8008eb8008db8008cb9008bba008aba0089bb0088bb0087bc0086bc0085bc0084bd0083be0082be0081be0080bf"
+        "007fc0007ec0007dc0007cc1007bc2007ac20079c20078c30077c30076c40075c40074c50073c60072c60071c60070c7"
+        "006fc8006ec8006dc8006cc9006bca006aca0069cb0068cb0067cc0066cc0065cc0064cd0063ce0062ce0061ce0060cf"
+        "005fd0005ed0005dd0005cd1005bd2005ad20059d20058d30057d30056d40055d40054d50053d60052d60051d60050d7"
+        "004fd8004ed8004dd8004cd9004bda004ada0049db0048db0047dc0046dc0045dc0044dd0043de0042de0041de0040df"
+        "003fe0003ee0003de0003ce1003be2003ae20039e20038e30037e30036e40035e40034e50033e60032e60031e60030e7"
+        "002fe8002ee8002de8002ce9002bea002aea0029eb0028eb0027ec0026ec0025ec0024ed0023ee0022ee0021ee0020ef"
+        "001ff0001ef0001df0001cf1001bf2001af20019f20018f30017f30016f40015f40014f50013f60012f60011f60010f7"
+        "000ff8000ef8000df8000cf9000bfa000afa0009fb0008fb0007fc0006fc0005fc0004fd0003fe0002fe0001fe0000ff"
+    ),
+}
@@ -1,26 +1,203 @@
 
-from bokeh.core.properties import Int, Float, String, List, Bool
+import logging
+
+import numpy as np
+from bokeh.core.properties import Int, Float, String, Bool, Array, Enum, Dict, List, Bytes, Instance, Nullable, Readonly, Struct
+from bokeh.model import Model
 from bokeh.models import LayoutDOM
 
+from surface3d_lod import build_pyramid, choose_level, IDLE_PIXELS_PER_CELL, INTERACTIVE_PIXELS_PER_CELL
+from surface3d_palettes import pack_palette
+from surface3d_bundle import install_bundle
+from surface3d_tiles import TileSource, TileProvider
+from surface3d_mesh import simplify_grid
+
+log = logging.getLogger(__name__)
+
+
+class FloatArray(Array):
+    """
+    A flat array of floats that is shipped to the browser as a binary buffer.
+
+    Accepts NumPy arrays (float32 is kept as float32, everything else becomes
+    float64) as well as plain Python sequences. Arrays are validated by dtype
+    instead of element by element, and are flattened in row-major order.
+    """
+
+    def __init__(self, *, help=None):
+        super().__init__(Float, default=[], help=help)
+
+    @classmethod
+    def _is_seq(cls, value):
+        return isinstance(value, (np.ndarray, list, tuple))
+
+    def validate(self, value, detail=True):
+        if isinstance(value, np.ndarray):
+            if value.dtype.kind not in "fiu":
+                msg = "" if not detail else f"expected a numeric array, got dtype {value.dtype}"
+                raise ValueError(msg)
+            return
+        super().validate(value, detail)
+
+    def transform(self, value):
+        array = np.asarray(value)
+        if array.dtype != np.float32:
+            array = array.astype(np.float64, copy=False)
+        array = np.ascontiguousarray(array).ravel()
+        # Surface3D.patch writes into the model's array, so it must never be
+        # the caller's (or an xarray's) buffer
+        if not isinstance(value, (list, tuple)) and np.may_share_memory(array, np.asarray(value)):
+            array = array.copy()
+        return array
+
+
+class IndexArray(Array):
+    """
+    A flat array of vertex indices that is shipped to the browser as a binary
+    uint32 buffer. Accepts integer NumPy arrays and plain Python sequences.
+    """
+
+    def __init__(self, *, help=None):
+        super().__init__(Int, default=[], help=help)
+
+    @classmethod
+    def _is_seq(cls, value):
+        return isinstance(value, (np.ndarray, list, tuple))
+
+    def validate(self, value, detail=True):
+        if isinstance(value, np.ndarray):
+            if value.dtype.kind not in "iu":
+                msg = "" if not detail else f"expected an integer array, got dtype {value.dtype}"
+                raise ValueError(msg)
+            return
+        super().validate(value, detail)
+
+    def transform(self, value):
+        return np.ascontiguousarray(value, dtype=np.uint32).ravel()
+
+
+class SurfaceGrid(Model):
+    """
+    Grid coordinates shared by several Surface3D models.
+
+    Surfaces on the same grid (small multiples, or several fields of one
+    model run) can reference one ``SurfaceGrid`` through their ``grid``
+    property instead of each carrying its own ``lons``/``lats`` or ``x``/``y``:
+    the coordinates are then serialized once per document, and the browser
+    builds the vertex positions once and shares them between the views.
+
+    Pass 1-D ``x``/``y`` axes or 2-D ``lons``/``lats`` arrays; n_lat and n_lon
+    are taken from their shapes. The browser side is registered by the
+    Surface3D extension, so a grid is only usable together with Surface3D.
+    """
+
+    # The browser registers the model under this module (see grid.ts), so it
+    # is fixed rather than taken from however this file was imported
+    __view_module__ = "surface3d_py"
+
+    lons = FloatArray(help="X-coordinates (longitude) of the grid points")
+    lats = FloatArray(help="Y-coordinates (latitude) of the grid points")
+    x = FloatArray(help="1-D x axis of a rectilinear grid (n_lon values); overrides lons when set")
+    y = FloatArray(help="1-D y axis of a rectilinear grid (n_lat values); overrides lats when set")
+    n_lat = Int(0, help="Number of latitude grid points")
+    n_lon = Int(0, help="Number of longitude grid points")
+
+    def __init__(self, *args, **kwargs):
+        x, y = kwargs.get("x"), kwargs.get("y")
+        lons = kwargs.get("lons")
+        if x is not None and y is not None and len(x) > 0:
+            kwargs.setdefault("n_lat", len(y))
+            kwargs.setdefault("n_lon", len(x))
+        elif isinstance(lons, np.ndarray) and lons.ndim == 2:
+            kwargs.setdefault("n_lat", lons.shape[0])
+            kwargs.setdefault("n_lon", lons.shape[1])
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def from_arrays(cls, x, y, float32=False, **kwargs):
+        """
+        Create a grid from 1-D axes or 2-D coordinate arrays, as taken by
+        ``Surface3D.from_arrays``.
+        """
+        dtype = np.float32 if float32 else None
+        x = np.asarray(x, dtype=dtype)
+        y = np.asarray(y, dtype=dtype)
+        if x.ndim == 2:
+            return cls(lons=x, lats=y, **kwargs)
+        return cls(x=x, y=y, **kwargs)
+
+
 class Surface3D(LayoutDOM):
     """
     A 3D surface visualization component with interactive rotation, colorbar, and tooltips.
     
     This component renders a 3D surface plot from gridded data (lons, lats, values) with
     customizable viewing angles, zoom, palette coloring, and an optional colorbar.
+    
+    For regular grids, pass 1-D ``x``/``y`` axes and a 2-D ``values`` array of shape
+    (n_lat, n_lon) instead of full meshgrids; n_lat and n_lon are then taken from
+    the array shape and the browser rebuilds vertex positions from the axes.
+    ``Surface3D.from_arrays`` and ``Surface3D.from_dataarray`` build a surface from
+    NumPy arrays or an xarray DataArray this way, without flattening to lists.
+    Surfaces on the same grid can share one ``SurfaceGrid`` via ``grid``, so the
+    coordinates are sent and held in the browser once.
+    
+    Only the palettes named by ``palette`` and ``preload_palettes`` are embedded in
+    the document; list every palette a CustomJS callback may switch to in
+    ``preload_palettes``.
+    
+    To update part of the grid, e.g. one time step of model output at a time, use
+    ``patch`` (or ``patch_values`` from CustomJS) instead of reassigning ``values``.
+    
+    For time series, pass a 3-D (time, lat, lon) ``values`` cube or a sequence of 2-D
+    ``frames``: all frames are sent once in a single buffer and played back in the
+    browser by stepping ``frame``, reusing the grid and only recoloring each step.
+    
+    For grids too large to draw interactively, use ``Surface3D.from_pyramid`` with the
+    full-resolution array: it builds a level-of-detail pyramid and sends a level sized
+    for the canvas plus a coarse level that is drawn while dragging or autorotating.
+    For grids that do not fit in memory, use ``Surface3D.from_tiles`` in a Bokeh server
+    app to send only the tiles the current view needs.
+    
+    For height fields that are flat in places, ``Surface3D.from_simplified`` sends an
+    adaptive triangle mesh within a vertical error tolerance instead of the full grid.
+    
+    Global lon/lat data can be drawn as a globe with ``globe=True``: values become
+    radial relief (scaled by ``globe_relief``) and only the near hemisphere is drawn.
+    
+    To find where frame time goes, set ``profile=True`` (and ``show_fps=True`` for an
+    on-canvas readout): per-stage timings appear in the browser's performance panel
+    and a rolling summary in ``render_stats``.
     """
     
     __implementation__ = "surface3d.ts"
     
     # Data properties
-    lons = List(Float, help="X-coordinates (longitude) of the surface grid points")
-    lats = List(Float, help="Y-coordinates (latitude) of the surface grid points")
-    values = List(Float, help="Z-values at each grid point")
+    lons = FloatArray(help="X-coordinates (longitude) of the surface grid points")
+    lats = FloatArray(help="Y-coordinates (latitude) of the surface grid points")
+    values = FloatArray(help="Z-values at each grid point")
+    values_patch = Nullable(Struct(row=Int, col=Int, n_rows=Int, n_cols=Int, values=FloatArray(), seq=Int), help="Last tile sent by patch(); the browser writes it into values. seq counts patches, so that sending the same tile again is still a change")
+    x = FloatArray(help="1-D x axis of a rectilinear grid (n_lon values); overrides lons when set")
+    y = FloatArray(help="1-D y axis of a rectilinear grid (n_lat values); overrides lats when set")
     n_lat = Int(30, help="Number of latitude grid points")
     n_lon = Int(60, help="Number of longitude grid points")
+    grid = Nullable(Instance(SurfaceGrid), help="Shared grid coordinates; when set, they are used instead of lons/lats and x/y (n_lat and n_lon must match the grid)")
+    triangles = IndexArray(help="Vertex index triples of an irregular triangle mesh; when set, lons/lats/values hold one entry per vertex and n_lat/n_lon are not used (see from_simplified)")
+    data_extent = FloatArray(help="Optional [lon_min, lon_max, lat_min, lat_max, z_min, z_max] used for scaling and centering instead of the bounds of the data sent, e.g. when only a window of a larger grid is shown")
+    
+    # Level-of-detail properties (coarse grid drawn while interacting)
+    coarse_lons = FloatArray(help="Coarse-level lons, shaped like coarse_values")
+    coarse_lats = FloatArray(help="Coarse-level lats, shaped like coarse_values")
+    coarse_x = FloatArray(help="Coarse-level 1-D x axis (coarse_n_lon values)")
+    coarse_y = FloatArray(help="Coarse-level 1-D y axis (coarse_n_lat values)")
+    coarse_values = FloatArray(help="Coarse-level Z-values; empty disables the interactive level")
+    coarse_n_lat = Int(0, help="Number of latitude points of the coarse level")
+    coarse_n_lon = Int(0, help="Number of longitude points of the coarse level")
     
     # Color properties
     palette = String("Turbo256", help="Color palette name for value mapping")
+    preload_palettes = List(String, help="Additional palettes to embed so that ``palette`` can be switched in the browser, e.g. from CustomJS")
+    palette_data = Dict(String, Bytes, help="Packed RGB colors (3 bytes per color) of the embedded palettes, keyed by name; filled in from palette and preload_palettes")
     vmin = Float(float('nan'), help="Minimum value for color scaling (auto if NaN)")
     vmax = Float(float('nan'), help="Maximum value for color scaling (auto if NaN)")
     nan_color = String("#808080", help="Color for NaN/missing values")
@@ -29,6 +206,8 @@ class Surface3D(LayoutDOM):
     azimuth = Float(45, help="Horizontal rotation angle in degrees (0-360)")
     elevation = Float(-30, help="Vertical tilt angle in degrees (-90 to 90)")
     zoom = Float(1.0, help="Zoom level (0.5 to 8.0)")
+    globe = Bool(False, help="Wrap the grid onto a globe, taking lons/lats (or x/y) as degrees and values as radial relief; quads on the far hemisphere are culled before sorting and drawing")
+    globe_relief = Float(0.05, help="Height of the value range above the globe's surface in globe mode, as a fraction of its radius")
     
     # Animation properties
     autorotate = Bool(False, help="Enable automatic rotation")
@@ -36,6 +215,8 @@ class Surface3D(LayoutDOM):
     
     # Interaction properties
     enable_hover = Bool(True, help="Show tooltips on hover")
+    x_label = String("x", help="Name of the x coordinate in hover tooltips, e.g. 'Lon'")
+    y_label = String("y", help="Name of the y coordinate in hover tooltips, e.g. 'Lat'")
     
     # Colorbar properties
     show_colorbar = Bool(True, help="Display the colorbar")
@@ -43,4 +224,262 @@ class Surface3D(LayoutDOM):
     
     # Appearance properties
     background_color = String("#0a0a0a", help="Background color of the visualization")
-    colorbar_text_color = String("#ffffff", help="Text color for colorbar labels and title")
\ No newline at end of file
+    colorbar_text_color = String("#ffffff", help="Text color for colorbar labels and title")
+    
+    # Time-series properties
+    frames = FloatArray(help="Time-series frames stacked as (n_frames, n_lat, n_lon), all on the grid given by lons/lats or x/y; used instead of values while n_frames > 0")
+    n_frames = Int(0, help="Number of frames in frames")
+    frame = Int(0, help="Index of the frame shown; link a Slider to it to scrub through time")
+    playing = Bool(False, help="Step through the frames in the browser")
+    frame_interval = Float(100.0, help="Milliseconds between frames while playing")
+    loop = Bool(True, help="Restart from the first frame after the last one while playing")
+    
+    # Rendering properties
+    backend = Enum("canvas", "webgl", "worker", default="canvas", help="Renderer: 'canvas' (Canvas2D, depth-sorted quads), 'webgl' (GPU buffers with a hardware depth test) or 'worker' (Canvas2D on an OffscreenCanvas in a Web Worker, keeping the page responsive); 'webgl' and 'worker' fall back to canvas when unsupported")
+    adaptive_quality = Bool(True, help="While dragging, zooming or autorotating, draw a reduced grid (the coarse level and/or every n-th row and column) sized to frame_budget, then redraw at full resolution once input stops (canvas backend)")
+    frame_budget = Float(16.0, help="Target time per interactive frame in milliseconds")
+    idle_delay = Int(200, help="Milliseconds without input before redrawing at full resolution")
+    
+    # Profiling properties
+    profile = Bool(False, help="Time the render stages of every frame, recorded as 'Surface3D <stage>' performance measures in the browser, and publish a rolling summary in render_stats")
+    show_fps = Bool(False, help="Overlay frames per second and frame time on the canvas")
+    render_stats = Readonly(Dict(String, Float), default={}, help="Rolling summary of recent frames while profile is on, updated about once a second by the browser: mean milliseconds per stage (geometry_ms, colors_ms, project_ms, order_ms, draw_ms, upload_ms), frame_ms, frame_p95_ms, frame_max_ms, fps, frames and n_quads; watch it from Bokeh server code with on_change")
+
+    def __init__(self, *args, **kwargs):
+        values = kwargs.get("values")
+        if isinstance(values, np.ndarray) and values.ndim == 3:
+            # A (time, lat, lon) cube is played back as frames
+            kwargs["frames"] = kwargs.pop("values")
+        frames = kwargs.get("frames")
+        if frames is not None and not isinstance(frames, np.ndarray) and len(frames) > 0:
+            frames = kwargs["frames"] = np.asarray(frames)
+        if isinstance(frames, np.ndarray) and frames.ndim == 3:
+            kwargs.setdefault("n_frames", frames.shape[0])
+            values = frames[0]
+        if isinstance(values, np.ndarray) and values.ndim == 2:
+            kwargs.setdefault("n_lat", values.shape[0])
+            kwargs.setdefault("n_lon", values.shape[1])
+        grid = kwargs.get("grid")
+        if grid is not None:
+            kwargs.setdefault("n_lat", grid.n_lat)
+            kwargs.setdefault("n_lon", grid.n_lon)
+        super().__init__(*args, **kwargs)
+        self._embed_palettes()
+
+    def trigger(self, attr, old, new, hint=None, setter=None):
+        # Every property change passes through here, whether set in Python or
+        # synced from the browser (e.g. a CustomJS palette switch in a server
+        # app), without an on_change callback, which would make standalone
+        # output warn about Python callbacks. The palette is embedded before
+        # the change is sent on, so the browser has it when it redraws.
+        if attr in ("palette", "preload_palettes"):
+            self._embed_palettes()
+        super().trigger(attr, old, new, hint=hint, setter=setter)
+
+    def _attach_document(self, doc):
+        # A surface joins a document right before its HTML or JSON is
+        # generated, which is when the extension bundle is first needed
+        Surface3D._install_bundle()
+        super()._attach_document(doc)
+
+    _bundle_installed = False
+
+    @classmethod
+    def _install_bundle(cls):
+        """Use the compiled bundle from the disk cache, once per process."""
+        if Surface3D._bundle_installed:
+            return
+        Surface3D._bundle_installed = True
+        try:
+            install_bundle(Surface3D)
+        except Exception:
+            # Bokeh compiles again, and reports compile errors, at render time
+            log.warning("Surface3D: could not install the cached extension bundle", exc_info=True)
+
+    def _embed_palettes(self):
+        """Add the palettes named by palette and preload_palettes to palette_data."""
+        names = [self.palette, *self.preload_palettes]
+        missing = [name for name in names if name not in self.palette_data]
+        if missing:
+            self.palette_data = {**self.palette_data, **{name: pack_palette(name) for name in missing}}
+
+    @classmethod
+    def from_arrays(cls, values, x=None, y=None, float32=False, compute_range=True, **kwargs):
+        """
+        Create a surface from NumPy arrays without Python-level loops or lists.
+
+        ``values`` is a 2-D (n_lat, n_lon) grid or a 3-D (time, n_lat, n_lon)
+        cube. ``x``/``y`` are 1-D axes (n_lon and n_lat values) or 2-D
+        coordinate arrays shaped like one grid, e.g. from ``np.meshgrid`` or a
+        parametric surface, or are left out when a shared ``grid`` is given.
+        With ``float32`` every array is downcast, halving the payload. With
+        ``compute_range`` the NaN-aware value range is computed here and sent
+        as ``vmin``/``vmax`` unless they are given, so the browser does not
+        scan the values for it.
+        """
+        dtype = np.float32 if float32 else None
+        values = np.asarray(values, dtype=dtype)
+        if values.ndim not in (2, 3):
+            raise ValueError(f"expected a 2-D grid or 3-D cube of values, got shape {values.shape}")
+        if x is None or y is None:
+            if kwargs.get("grid") is None:
+                raise ValueError("expected x and y axes or a shared grid")
+        else:
+            x = np.asarray(x, dtype=dtype)
+            y = np.asarray(y, dtype=dtype)
+            if x.ndim == 2:
+                kwargs.update(lons=x, lats=y)
+            else:
+                kwargs.update(x=x, y=y)
+        if compute_range:
+            finite = np.isfinite(values)
+            if finite.any():
+                kwargs.setdefault("vmin", float(values.min(where=finite, initial=np.inf)))
+                kwargs.setdefault("vmax", float(values.max(where=finite, initial=-np.inf)))
+        return cls(values=values, **kwargs)
+
+    @classmethod
+    def from_dataarray(cls, array, float32=False, compute_range=True, **kwargs):
+        """
+        Create a surface from an xarray DataArray.
+
+        The last two dimensions are the rows (y) and columns (x), with their
+        1-D coordinates as axes (or the indices if a dimension has none); a
+        leading third dimension, e.g. time, becomes the frames. The colorbar
+        title defaults to the ``long_name`` attribute or the array name, and
+        the tooltip's coordinate labels to the dimension names. Other
+        arguments are as for ``from_arrays``.
+        """
+        if array.ndim not in (2, 3):
+            raise ValueError(f"expected a 2-D or 3-D DataArray, got dims {array.dims}")
+        dim_y, dim_x = array.dims[-2:]
+        x = array[dim_x].values if dim_x in array.coords else np.arange(array.sizes[dim_x])
+        y = array[dim_y].values if dim_y in array.coords else np.arange(array.sizes[dim_y])
+        title = array.attrs.get("long_name", array.name)
+        if title is not None:
+            kwargs.setdefault("colorbar_title", str(title))
+        kwargs.setdefault("x_label", str(dim_x))
+        kwargs.setdefault("y_label", str(dim_y))
+        return cls.from_arrays(array.values, x, y, float32=float32, compute_range=compute_range, **kwargs)
+
+    @classmethod
+    def from_pyramid(cls, values, x, y, min_size=16, **kwargs):
+        """
+        Create a surface from a full-resolution grid via a level-of-detail pyramid.
+
+        ``values`` is a 2-D (n_lat, n_lon) array; ``x``/``y`` are 1-D axes or 2-D
+        coordinate arrays. The levels sent to the browser are picked from ``width``,
+        ``height`` and ``zoom`` (see ``update_lod``).
+        """
+        surface = cls(**kwargs)
+        surface.set_pyramid(values, x, y, min_size=min_size)
+        return surface
+
+    @classmethod
+    def from_tiles(cls, source, **kwargs):
+        """
+        Create a surface fed from an out-of-core ``TileSource`` (or a path to a
+        NetCDF file or Zarr store) in a Bokeh server app.
+
+        The windows and levels sent follow the view (see ``TileProvider``).
+        """
+        if not isinstance(source, TileSource):
+            source = TileSource.open(source)
+        surface = cls(**kwargs)
+        surface._tile_provider = TileProvider(source, surface)
+        return surface
+
+    @classmethod
+    def from_simplified(cls, values, x, y, tolerance, max_block=None, float32=False, **kwargs):
+        """
+        Create a surface drawn as an adaptive triangle mesh of a height field.
+
+        ``values`` is a 2-D (n_lat, n_lon) array; ``x``/``y`` are 1-D axes or 2-D
+        coordinate arrays. Flat regions are covered by a few large triangles and
+        rough ones by many small ones, such that the mesh stays within
+        ``tolerance`` (in units of ``values``) of every grid value; see
+        ``surface3d_mesh.simplify_grid``. Cells with a NaN corner are left out.
+        Unless given, ``vmin``/``vmax`` are the range of the full grid.
+        """
+        values = np.asarray(values)
+        x = np.asarray(x)
+        y = np.asarray(y)
+        if values.ndim != 2:
+            raise ValueError(f"expected a 2-D values array, got shape {values.shape}")
+        rows, cols, triangles = simplify_grid(values, tolerance, max_block=max_block)
+        if x.ndim == 2:
+            lons, lats = x[rows, cols], y[rows, cols]
+        else:
+            lons, lats = x[cols], y[rows]
+        dtype = np.float32 if float32 else None
+        vertex_values = values[rows, cols]
+        finite = np.isfinite(values)
+        if finite.any():
+            kwargs.setdefault("vmin", float(values.min(where=finite, initial=np.inf)))
+            kwargs.setdefault("vmax", float(values.max(where=finite, initial=-np.inf)))
+        return cls(
+            lons=np.asarray(lons, dtype=dtype), lats=np.asarray(lats, dtype=dtype),
+            values=np.asarray(vertex_values, dtype=dtype), triangles=triangles, **kwargs,
+        )
+
+    def patch(self, values, row=0, col=0):
+        """
+        Replace a tile of ``values`` and send only that tile to the browser.
+
+        ``values`` is a 2-D (n_rows, n_cols) array, or 1-D for a single row,
+        whose first element goes to grid position (``row``, ``col``). The
+        array held by the model is updated in place, so unlike assigning
+        ``values`` the whole grid is not resent; the browser recolors and
+        redraws only the quads the tile touches, much like
+        ``ColumnDataSource.patch``. Arrays passed to the model are copied, so
+        patching never changes the caller's data. Time series in ``frames``
+        cannot be patched.
+        """
+        if len(self.triangles) > 0:
+            raise ValueError("patch() needs a grid, not a triangle mesh")
+        if self.n_frames > 0:
+            raise ValueError("patch() updates values, which a time series in frames does not draw")
+        tile = np.atleast_2d(np.asarray(values))
+        n_rows, n_cols = tile.shape
+        if row < 0 or col < 0 or row + n_rows > self.n_lat or col + n_cols > self.n_lon:
+            raise ValueError(f"a {n_rows}x{n_cols} patch at ({row}, {col}) does not fit the {self.n_lat}x{self.n_lon} grid")
+        grid = self.values.reshape(self.n_lat, self.n_lon)
+        grid[row:row + n_rows, col:col + n_cols] = tile
+        tile = np.ascontiguousarray(tile, dtype=grid.dtype).ravel()
+        seq = 0 if self.values_patch is None else self.values_patch["seq"] + 1
+        self.values_patch = dict(row=row, col=col, n_rows=n_rows, n_cols=n_cols, values=tile, seq=seq)
+
+    def set_pyramid(self, values, x, y, min_size=16):
+        """Build the level-of-detail pyramid for a new full-resolution grid and send its levels."""
+        self._pyramid = build_pyramid(values, x, y, min_size=min_size)
+        self.update_lod()
+
+    def update_lod(self):
+        """
+        Send the pyramid levels that match the current ``width``, ``height`` and ``zoom``.
+
+        In a Bokeh server app, finer levels can follow the zoom with
+        ``surface.on_change('zoom', lambda attr, old, new: surface.update_lod())``.
+        """
+        pyramid = getattr(self, "_pyramid", None)
+        if pyramid is None:
+            return
+        width = self.width or 800
+        height = self.height or 800
+        fine = choose_level(pyramid, width, height, self.zoom, IDLE_PIXELS_PER_CELL)
+        coarse = choose_level(pyramid, width, height, self.zoom, INTERACTIVE_PIXELS_PER_CELL)
+
+        values, x, y = pyramid[fine]
+        self.update(n_lat=values.shape[0], n_lon=values.shape[1], values=values, **self._lod_coords(x, y, ""))
+        if coarse == fine:
+            self.update(coarse_values=[], coarse_n_lat=0, coarse_n_lon=0)
+        else:
+            values, x, y = pyramid[coarse]
+            self.update(coarse_n_lat=values.shape[0], coarse_n_lon=values.shape[1], coarse_values=values,
+                        **self._lod_coords(x, y, "coarse_"))
+
+    @staticmethod
+    def _lod_coords(x, y, prefix):
+        if x.ndim == 1:
+            return {f"{prefix}x": x, f"{prefix}y": y, f"{prefix}lons": [], f"{prefix}lats": []}
+        return {f"{prefix}lons": x, f"{prefix}lats": y, f"{prefix}x": [], f"{prefix}y": []}
\ No newline at end of file
@@ -0,0 +1,282 @@
+
+"""
+Out-of-core tiles for Surface3D in a Bokeh server app.
+
+``TileSource`` wraps a 2-D grid that stays on disk: a NetCDF or Zarr variable
+opened lazily through xarray (dask-chunked when dask is installed), a NumPy
+memmap, or any array supporting strided slicing. Level ``k`` of the source is
+every ``2**k``-th row and column of the full grid, cut into square tiles
+that are read on first use and kept in a bounded LRU cache, so memory stays
+at ``cache_tiles * tile_size**2`` values however large the grid is.
+
+``TileProvider`` keeps a Surface3D showing only the tiles the current view
+needs: from ``width``, ``height`` and ``zoom`` it works out which part of the
+grid can be on screen and the level whose cells are about
+``pixels_per_cell`` pixels wide there, and sends that window (plus a coarser
+one for interaction) once the zoom settles and the set of tiles changed.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+from surface3d_lod import IDLE_PIXELS_PER_CELL, INTERACTIVE_PIXELS_PER_CELL
+
+
+class TileSource:
+    """
+    Lazily read tiles of a 2-D (n_lat, n_lon) grid at power-of-two strides.
+
+    ``values`` is a 2-D xarray DataArray (its last two dimensions are the
+    rows and columns, and their coordinates the axes unless ``x``/``y`` are
+    given) or an array-like with 1-D ``x`` (n_lon) and ``y`` (n_lat) axes.
+    Only the axes are loaded up front. ``transform``, if given, is applied to
+    every tile as it is read, e.g. to scale elevations to the axis units.
+    """
+
+    def __init__(self, values, x=None, y=None, tile_size=256, cache_tiles=256, transform=None):
+        if hasattr(values, "dims"):
+            if values.ndim != 2:
+                raise ValueError(f"expected a 2-D DataArray, got dims {values.dims}")
+            dim_y, dim_x = values.dims
+            x = values[dim_x].values if x is None else x
+            y = values[dim_y].values if y is None else y
+        elif x is None or y is None:
+            raise ValueError("x and y axes are required unless values is a DataArray")
+        self.values = values
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        if values.shape != (len(self.y), len(self.x)):
+            raise ValueError(f"values of shape {values.shape} do not match axes of {len(self.y)} and {len(self.x)} values")
+        self.tile_size = tile_size
+        self.cache_tiles = cache_tiles
+        self.transform = transform
+        self._tiles = OrderedDict()
+        self._value_range = None
+        self.hits = 0
+        self.misses = 0
+        # Coarsest level fits in one tile
+        self.n_levels = 1
+        while max(values.shape) > tile_size * 2 ** (self.n_levels - 1):
+            self.n_levels += 1
+
+    @classmethod
+    def open(cls, path, variable=None, chunks="auto", **kwargs):
+        """
+        Open a variable of a NetCDF file or Zarr store without loading it.
+
+        ``variable`` defaults to the largest 2-D data variable (skipping
+        e.g. coordinate bounds). With dask installed
+        the variable is opened with ``chunks``; without dask, xarray's lazy
+        backend indexing still reads only the requested slices. Other keyword
+        arguments go to ``TileSource``.
+        """
+        import xarray as xr
+
+        try:
+            import dask  # noqa: F401
+        except ImportError:
+            chunks = None
+        if str(path).rstrip("/").endswith(".zarr"):
+            dataset = xr.open_zarr(path, chunks=chunks)
+        else:
+            dataset = xr.open_dataset(path, chunks=chunks)
+        if variable is None:
+            grids = {name: array.size for name, array in dataset.data_vars.items() if array.ndim == 2}
+            variable = max(grids, key=grids.get)
+        return cls(dataset[variable], **kwargs)
+
+    def level_shape(self, level):
+        """(n_lat, n_lon) of a level."""
+        step = 2 ** level
+        n_lat, n_lon = self.values.shape
+        return -(-n_lat // step), -(-n_lon // step)
+
+    def level_axes(self, level):
+        """1-D x and y axes of a level."""
+        step = 2 ** level
+        return self.x[::step], self.y[::step]
+
+    def tile(self, level, row, col):
+        """Values of tile (``row``, ``col``) of a level, read on a cache miss."""
+        key = (level, row, col)
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+            self.hits += 1
+            return tile
+        self.misses += 1
+        tile = self._read(level, row, col)
+        self._tiles[key] = tile
+        while len(self._tiles) > self.cache_tiles:
+            self._tiles.popitem(last=False)
+        return tile
+
+    def _read(self, level, row, col):
+        """Read and transform a tile, bypassing the cache."""
+        step = 2 ** level
+        size = self.tile_size * step
+        rows = slice(row * size, (row + 1) * size, step)
+        cols = slice(col * size, (col + 1) * size, step)
+        if hasattr(self.values, "isel"):
+            dim_y, dim_x = self.values.dims
+            tile = self.values.isel({dim_y: rows, dim_x: cols}).values
+        else:
+            tile = np.asarray(self.values[rows, cols])
+        if tile.dtype.kind != "f":
+            tile = tile.astype(np.float32)
+        if self.transform is not None:
+            tile = self.transform(tile)
+        return tile
+
+    def read(self, level, rows, cols):
+        """
+        Values of a level over the half-open row and column ranges
+        ``rows``/``cols`` (in tiles), with the matching x and y axes.
+        """
+        blocks = [[self.tile(level, i, j) for j in range(*cols)] for i in range(*rows)]
+        values = np.block(blocks)
+        x, y = self.level_axes(level)
+        size = self.tile_size
+        return values, x[cols[0] * size:cols[1] * size], y[rows[0] * size:rows[1] * size]
+
+    def value_range(self):
+        """
+        NaN-aware (min, max) of the full-resolution grid, or (nan, nan) if
+        every value is NaN. The first call reads the whole grid tile by tile,
+        without filling the cache; the result is kept.
+        """
+        if self._value_range is None:
+            low = high = np.nan
+            n_rows, n_cols = self.level_shape(0)
+            for row in range(-(-n_rows // self.tile_size)):
+                for col in range(-(-n_cols // self.tile_size)):
+                    tile = self._read(0, row, col)
+                    # fmin/fmax skip NaN without warning on all-NaN tiles
+                    low = np.fmin(low, np.fmin.reduce(tile, axis=None))
+                    high = np.fmax(high, np.fmax.reduce(tile, axis=None))
+            self._value_range = (float(low), float(high))
+        return self._value_range
+
+    def extent(self):
+        """
+        (lon_min, lon_max, lat_min, lat_max, z_min, z_max) of the grid, with
+        the value range of the full-resolution grid, so that no peak sticks
+        out of it (see ``value_range``).
+        """
+        z_min, z_max = self.value_range()
+        return np.nanmin(self.x), np.nanmax(self.x), np.nanmin(self.y), np.nanmax(self.y), z_min, z_max
+
+    def cache_info(self):
+        """Cache hits, misses and the number of tiles held."""
+        return {"hits": self.hits, "misses": self.misses, "tiles": len(self._tiles)}
+
+
+class TileProvider:
+    """
+    Keep a Surface3D showing the tiles of a ``TileSource`` its view needs.
+
+    The surface's ``data_extent`` is set to the full grid, so scaling and
+    centering do not change when a window is sent, and an automatic color
+    range is fixed from the full-resolution values. Windows follow ``zoom``
+    (and the canvas size) only, not the rotation, and are recomputed once
+    the zoom has not changed for ``delay`` milliseconds, so a wheel gesture
+    or a drag does not read tiles at every step. ``max_cells`` caps the
+    cells sent at once; the level is coarsened further when a window would
+    exceed it.
+    """
+
+    def __init__(self, source, surface, pixels_per_cell=IDLE_PIXELS_PER_CELL,
+                 coarse_pixels_per_cell=INTERACTIVE_PIXELS_PER_CELL, max_cells=2_000_000, delay=300):
+        self.source = source
+        self.surface = surface
+        self.pixels_per_cell = pixels_per_cell
+        self.coarse_pixels_per_cell = coarse_pixels_per_cell
+        self.max_cells = max_cells
+        self.delay = delay
+        self._sent = None
+        self._timeout = None
+
+        lon_min, lon_max, lat_min, lat_max, z_min, z_max = self.extent = source.extent()
+        updates = {"data_extent": np.array(self.extent)}
+        if np.isnan(surface.vmin):
+            updates["vmin"] = z_min
+        if np.isnan(surface.vmax):
+            updates["vmax"] = z_max
+        surface.update(**updates)
+        self.update()
+        for attr in ("width", "height", "zoom"):
+            surface.on_change(attr, lambda attr, old, new: self.schedule_update())
+
+    def schedule_update(self):
+        """Update once the view has not changed for ``delay`` milliseconds."""
+        document = self.surface.document
+        if document is None:
+            self.update()
+            return
+        if self._timeout is not None:
+            document.remove_timeout_callback(self._timeout)
+        self._timeout = document.add_timeout_callback(self._scheduled_update, self.delay)
+
+    def _scheduled_update(self):
+        self._timeout = None
+        self.update()
+
+    def window(self, pixels_per_cell):
+        """Level and tile row/column ranges needed at the current zoom."""
+        surface = self.surface
+        width = surface.width or 800
+        height = surface.height or 800
+        lon_min, lon_max, lat_min, lat_max, z_min, z_max = self.extent
+        data_range = max(lon_max - lon_min, lat_max - lat_min, z_max - z_min)
+        scale = 0.6 * min(width, height) * surface.zoom / data_range
+
+        # The view rotates about the data center, which stays at the center
+        # of the canvas, so at any azimuth the screen shows at most the data
+        # within its half-diagonal of the center (at grazing elevations the
+        # far side can reach beyond that and ends at the window's edge)
+        half_lon = half_lat = np.hypot(width, height) / 2 / scale
+        center_lon = (lon_min + lon_max) / 2
+        center_lat = (lat_min + lat_max) / 2
+
+        source = self.source
+        cell = min(np.abs(np.diff(source.x)).mean(), np.abs(np.diff(source.y)).mean())
+        level = 0
+        while level < source.n_levels - 1 and 2 ** (level + 1) * cell * scale <= pixels_per_cell:
+            level += 1
+        while True:
+            rows = self._tile_range(source.level_axes(level)[1], center_lat - half_lat, center_lat + half_lat)
+            cols = self._tile_range(source.level_axes(level)[0], center_lon - half_lon, center_lon + half_lon)
+            cells = (rows[1] - rows[0]) * (cols[1] - cols[0]) * source.tile_size ** 2
+            if cells <= self.max_cells or level == source.n_levels - 1:
+                return level, rows, cols
+            level += 1
+
+    def _tile_range(self, axis, low, high):
+        """Half-open range of tiles holding the axis values within [low, high]."""
+        inside = np.flatnonzero((axis >= low) & (axis <= high))
+        if len(inside) == 0:
+            return 0, 1
+        size = self.source.tile_size
+        # One more point on each side so the window covers the screen edges
+        first = max(inside[0] - 1, 0) // size
+        last = min(inside[-1] + 1, len(axis) - 1) // size
+        return first, last + 1
+
+    def update(self):
+        """Send the fine and coarse windows for the current view, if they changed."""
+        fine = self.window(self.pixels_per_cell)
+        coarse = self.window(self.coarse_pixels_per_cell)
+        if (fine, coarse) == self._sent:
+            return
+        self._sent = (fine, coarse)
+
+        values, x, y = self.source.read(*fine)
+        updates = dict(values=values, x=x, y=y, lons=[], lats=[], n_lat=values.shape[0], n_lon=values.shape[1])
+        if coarse == fine:
+            updates.update(coarse_values=[], coarse_n_lat=0, coarse_n_lon=0)
+        else:
+            values, x, y = self.source.read(*coarse)
+            updates.update(coarse_values=values, coarse_x=x, coarse_y=y, coarse_lons=[], coarse_lats=[],
+                           coarse_n_lat=values.shape[0], coarse_n_lon=values.shape[1])
+        self.surface.update(**updates)
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from surface3d_lod import build_pyramid, choose_level, coarsen2d
+
+
+def test_levels_halve_until_min_size():
+    values = np.random.default_rng(0).random((100, 70))
+    pyramid = build_pyramid(values, np.arange(70.0), np.arange(100.0), min_size=16)
+    assert [level[0].shape for level in pyramid] == [(100, 70), (50, 35), (25, 17)]
+    for values, x, y in pyramid:
+        assert (len(y), len(x)) == values.shape
+
+
+def test_levels_average_blocks_and_axes():
+    values = np.arange(16.0).reshape(4, 4)
+    [_, (coarse, x, y)] = build_pyramid(values, np.arange(4.0), np.arange(4.0) * 10, min_size=2)
+    assert coarse.tolist() == [[2.5, 4.5], [10.5, 12.5]]
+    assert x.tolist() == [0.5, 2.5]
+    assert y.tolist() == [5, 25]
+
+
+def test_coordinate_arrays_are_coarsened_like_values():
+    x, y = np.meshgrid(np.arange(8.0), np.arange(6.0))
+    [_, (_, cx, cy)] = build_pyramid(np.zeros((6, 8)), x, y, min_size=3)
+    assert cx.shape == cy.shape == (3, 4)
+    assert cx[0].tolist() == [0.5, 2.5, 4.5, 6.5]
+
+
+def test_coarsening_ignores_nan():
+    values = np.array([[1.0, np.nan], [3.0, np.nan]])
+    assert coarsen2d(values).tolist() == [[2.0]]
+    assert np.isnan(coarsen2d(np.full((2, 2), np.nan))).all()
+
+
+def test_integer_values_become_floats():
+    pyramid = build_pyramid(np.ones((4, 4), dtype=np.int32), np.arange(4), np.arange(4), min_size=2)
+    assert all(level[0].dtype.kind == "f" for level in pyramid)
+
+
+def test_only_grids_are_accepted():
+    with pytest.raises(ValueError, match="2-D values"):
+        build_pyramid(np.zeros(10), np.arange(10), np.arange(1))
+
+
+def test_choose_level_matches_the_canvas():
+    pyramid = build_pyramid(np.zeros((1024, 1024)), np.arange(1024.0), np.arange(1024.0), min_size=16)
+    # 0.6 * 800 px across at 1.5 px per cell wants at least 320 cells
+    assert pyramid[choose_level(pyramid, 800, 800, 1.0, 1.5)][0].shape == (512, 512)
+    # Zooming in needs more cells, up to the full grid
+    assert choose_level(pyramid, 800, 800, 2.0, 1.5) == 0
+    assert choose_level(pyramid, 800, 800, 8.0, 1.5) == 0
+    # Coarser cells while interacting, bounded by the coarsest level
+    assert pyramid[choose_level(pyramid, 800, 800, 1.0, 6.0)][0].shape == (128, 128)
+    assert choose_level(pyramid, 10, 10, 1.0, 6.0) == len(pyramid) - 1
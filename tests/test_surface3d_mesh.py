@@ -0,0 +1,55 @@
+from math import gcd
+
+import numpy as np
+import pytest
+
+from surface3d_mesh import mesh_error, simplify_grid
+
+
+def bump(n_lat, n_lon):
+    y, x = np.mgrid[0:n_lat, 0:n_lon]
+    return 10 * np.exp(-(((x - 0.7 * n_lon) / 15) ** 2 + ((y - 0.3 * n_lat) / 12) ** 2))
+
+
+def t_junctions(rows, cols, triangles):
+    """Triangle edges with another mesh vertex partway along them."""
+    vertices = set(zip(rows.tolist(), cols.tolist()))
+    edges = {tuple(sorted(edge)) for k in range(3) for edge in zip(triangles[:, k], triangles[:, (k + 1) % 3])}
+    found = []
+    for a, b in edges:
+        r0, c0, r1, c1 = int(rows[a]), int(cols[a]), int(rows[b]), int(cols[b])
+        steps = gcd(abs(r1 - r0), abs(c1 - c0))
+        for k in range(1, steps):
+            point = (r0 + (r1 - r0) * k // steps, c0 + (c1 - c0) * k // steps)
+            if point in vertices:
+                found.append(((r0, c0), (r1, c1), point))
+    return found
+
+
+def areas(rows, cols, triangles):
+    r = rows[triangles].astype(float)
+    c = cols[triangles].astype(float)
+    return 0.5 * ((r[:, 1] - r[:, 0]) * (c[:, 2] - c[:, 0]) - (r[:, 2] - r[:, 0]) * (c[:, 1] - c[:, 0]))
+
+
+# Sizes that are not a power of two plus one leave blocks clipped to one
+# cell at the far edges of the grid
+@pytest.mark.parametrize("shape", [(100, 130), (37, 200), (50, 51), (65, 65)])
+@pytest.mark.parametrize("tolerance", [0.1, 0.5, 2.0])
+def test_mesh_is_conforming_and_within_tolerance(shape, tolerance):
+    values = bump(*shape)
+    rows, cols, triangles = simplify_grid(values, tolerance)
+    assert t_junctions(rows, cols, triangles) == []
+    assert mesh_error(values, rows, cols, triangles) <= tolerance
+    area = np.abs(areas(rows, cols, triangles))
+    assert area.min() > 0
+    assert area.sum() == pytest.approx((shape[0] - 1) * (shape[1] - 1))
+
+
+def test_nan_cells_are_dropped_without_cracks():
+    values = bump(70, 90)
+    values[10:20, 30:45] = np.nan
+    rows, cols, triangles = simplify_grid(values, 0.25, max_block=16)
+    assert t_junctions(rows, cols, triangles) == []
+    assert not np.isnan(values[rows, cols]).any()
+    assert mesh_error(values, rows, cols, triangles) <= 0.25
@@ -0,0 +1,40 @@
+import numpy as np
+
+from surface3d_palettes import DEFAULT_PALETTE, PALETTES, get_palette, pack_palette, palette_names
+from surface3d_py import Surface3D
+
+
+def test_names_are_sorted_and_include_the_default():
+    names = palette_names()
+    assert names == sorted(PALETTES)
+    assert DEFAULT_PALETTE == "Turbo256"
+    assert {"Turbo256", "viridis", "viridis_r"} <= set(names)
+
+
+def test_lookup_by_name():
+    viridis = get_palette("viridis")
+    assert len(viridis) == 256
+    assert viridis[0] == "#440154"
+    assert viridis[-1] == "#fde725"
+    assert get_palette("viridis_r") == viridis[::-1]
+
+
+def test_packed_palette_matches_the_colors():
+    packed = pack_palette("viridis")
+    assert len(packed) == 3 * 256
+    assert packed[:3] == bytes([0x44, 0x01, 0x54])
+    assert ["#" + packed[i:i + 3].hex() for i in range(0, len(packed), 3)] == get_palette("viridis")
+
+
+def test_unknown_names_fall_back_to_turbo():
+    assert get_palette("no such palette") == get_palette("Turbo256")
+    assert pack_palette("no such palette") == pack_palette("Turbo256")
+
+
+def test_only_used_palettes_are_embedded():
+    surface = Surface3D.from_arrays(np.zeros((2, 2)), np.arange(2), np.arange(2), palette="viridis",
+                                    preload_palettes=["winter"])
+    assert set(surface.palette_data) == {"viridis", "winter"}
+    assert surface.palette_data["viridis"] == pack_palette("viridis")
+    surface.palette = "viridis_r"
+    assert set(surface.palette_data) == {"viridis", "winter", "viridis_r"}
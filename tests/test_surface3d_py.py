@@ -0,0 +1,155 @@
+import numpy as np
+import pytest
+
+from surface3d_py import FloatArray, Surface3D
+
+
+def grid_surface(n_lat=4, n_lon=5, dtype=np.float64):
+    values = np.arange(n_lat * n_lon, dtype=dtype).reshape(n_lat, n_lon)
+    return Surface3D.from_arrays(values, np.arange(n_lon, dtype=dtype), np.arange(n_lat, dtype=dtype))
+
+
+@pytest.mark.parametrize("dtype, expected", [
+    (np.float32, np.float32),
+    (np.float64, np.float64),
+    (np.int16, np.float64),
+    (np.uint8, np.float64),
+])
+def test_float_array_keeps_float32_and_widens_the_rest(dtype, expected):
+    array = FloatArray().transform(np.arange(6, dtype=dtype).reshape(2, 3))
+    assert array.dtype == expected
+    assert array.tolist() == [0, 1, 2, 3, 4, 5]
+
+
+def test_float_array_copies_rather_than_aliasing():
+    values = np.arange(6.0).reshape(2, 3)
+    array = FloatArray().transform(values)
+    assert not np.may_share_memory(array, values)
+    # Transposed input is flattened in row-major order of the view
+    assert FloatArray().transform(values.T).tolist() == [0, 3, 1, 4, 2, 5]
+    assert FloatArray().transform([1, 2.5]).dtype == np.float64
+
+
+def test_from_arrays_with_axes():
+    values = np.arange(12.0).reshape(3, 4)
+    surface = Surface3D.from_arrays(values, np.arange(4), np.arange(3))
+    assert (surface.n_lat, surface.n_lon) == (3, 4)
+    assert surface.x.tolist() == [0, 1, 2, 3]
+    assert surface.y.tolist() == [0, 1, 2]
+    assert len(surface.lons) == 0
+
+
+def test_from_arrays_with_coordinate_arrays():
+    x, y = np.meshgrid(np.arange(4.0), np.arange(3.0))
+    surface = Surface3D.from_arrays(np.zeros((3, 4)), x, y, float32=True)
+    assert (surface.n_lat, surface.n_lon) == (3, 4)
+    assert len(surface.x) == 0
+    assert surface.lons.dtype == surface.values.dtype == np.float32
+    assert surface.lons.tolist() == x.ravel().tolist()
+
+
+def test_from_arrays_with_a_cube_plays_frames():
+    cube = np.arange(24.0).reshape(2, 3, 4)
+    surface = Surface3D.from_arrays(cube, np.arange(4), np.arange(3))
+    assert (surface.n_frames, surface.n_lat, surface.n_lon) == (2, 3, 4)
+    assert len(surface.frames) == 24
+    assert (surface.vmin, surface.vmax) == (0, 23)
+
+
+@pytest.mark.parametrize("values", [np.zeros(5), np.zeros((2, 2, 2, 2))])
+def test_from_arrays_rejects_other_shapes(values):
+    with pytest.raises(ValueError, match="expected a 2-D grid or 3-D cube"):
+        Surface3D.from_arrays(values, np.arange(2), np.arange(2))
+
+
+def test_from_arrays_needs_axes_or_a_grid():
+    with pytest.raises(ValueError, match="x and y axes or a shared grid"):
+        Surface3D.from_arrays(np.zeros((2, 2)))
+
+
+def test_from_arrays_range_skips_non_finite_values():
+    values = np.array([[np.nan, -2.0], [np.inf, 5.0]])
+    surface = Surface3D.from_arrays(values, np.arange(2), np.arange(2))
+    assert (surface.vmin, surface.vmax) == (-2, 5)
+
+
+def test_from_arrays_keeps_a_given_range():
+    values = np.arange(4.0).reshape(2, 2)
+    surface = Surface3D.from_arrays(values, np.arange(2), np.arange(2), vmin=-10)
+    assert (surface.vmin, surface.vmax) == (-10, 3)
+    surface = Surface3D.from_arrays(values, np.arange(2), np.arange(2), compute_range=False)
+    assert np.isnan(surface.vmin) and np.isnan(surface.vmax)
+    surface = Surface3D.from_arrays(np.full((2, 2), np.nan), np.arange(2), np.arange(2))
+    assert np.isnan(surface.vmin) and np.isnan(surface.vmax)
+
+
+def test_from_dataarray():
+    xr = pytest.importorskip("xarray")
+    array = xr.DataArray(
+        np.arange(24.0).reshape(2, 3, 4), dims=("time", "lat", "lon"),
+        coords={"lat": [10.0, 20.0, 30.0]}, name="t2m", attrs={"long_name": "Temperature"},
+    )
+    surface = Surface3D.from_dataarray(array)
+    assert (surface.n_frames, surface.n_lat, surface.n_lon) == (2, 3, 4)
+    assert surface.y.tolist() == [10, 20, 30]
+    # A dimension without coordinates is indexed
+    assert surface.x.tolist() == [0, 1, 2, 3]
+    assert surface.colorbar_title == "Temperature"
+    assert (surface.x_label, surface.y_label) == ("lon", "lat")
+    assert (surface.vmin, surface.vmax) == (0, 23)
+    assert Surface3D.from_dataarray(array[0].drop_attrs()).colorbar_title == "t2m"
+    with pytest.raises(ValueError, match="2-D or 3-D DataArray"):
+        Surface3D.from_dataarray(array[0, 0])
+
+
+def test_patch_writes_the_tile_and_sends_only_it():
+    surface = grid_surface()
+    surface.patch([[-1, -2], [-3, -4]], row=1, col=2)
+    grid = surface.values.reshape(4, 5)
+    assert grid[1:3, 2:4].tolist() == [[-1, -2], [-3, -4]]
+    assert grid[0].tolist() == [0, 1, 2, 3, 4]
+    patch = surface.values_patch
+    assert (patch["row"], patch["col"], patch["n_rows"], patch["n_cols"]) == (1, 2, 2, 2)
+    assert patch["values"].tolist() == [-1, -2, -3, -4]
+
+
+@pytest.mark.parametrize("tile, row, col", [
+    (np.zeros((2, 2)), 3, 0),
+    (np.zeros((2, 2)), 0, 4),
+    (np.zeros((1, 6)), 0, 0),
+    (np.zeros((1, 1)), -1, 0),
+])
+def test_patch_outside_the_grid_is_rejected(tile, row, col):
+    surface = grid_surface()
+    before = surface.values.copy()
+    with pytest.raises(ValueError, match="does not fit"):
+        surface.patch(tile, row=row, col=col)
+    assert np.array_equal(surface.values, before)
+    assert surface.values_patch is None
+
+
+def test_patch_keeps_float32_values():
+    surface = grid_surface(dtype=np.float32)
+    surface.patch(np.full((2, 2), 0.5), row=0, col=0)
+    assert surface.values.dtype == np.float32
+    assert surface.values_patch["values"].dtype == np.float32
+
+
+def test_patch_does_not_write_into_the_callers_array():
+    values = np.zeros((4, 5))
+    surface = Surface3D.from_arrays(values, np.arange(5.0), np.arange(4.0))
+    surface.patch([[1.0]], row=2, col=2)
+    assert not values.any()
+    tile = np.array([[7.0, 8.0]])
+    surface.patch(tile, row=0, col=0)
+    surface.patch([[9.0, 9.0]], row=0, col=0)
+    assert tile.tolist() == [[7.0, 8.0]]
+
+
+def test_repeating_a_patch_is_still_a_change():
+    surface = grid_surface()
+    seen = []
+    surface.on_change("values_patch", lambda attr, old, new: seen.append(new["seq"]))
+    surface.patch([[1.0, 1.0]], row=0, col=0)
+    surface.patch([[1.0, 1.0]], row=0, col=0)
+    assert seen == [0, 1]
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from surface3d_py import Surface3D
+from surface3d_tiles import TileProvider, TileSource
+
+
+def source(n_lat=300, n_lon=500, **kwargs):
+    values = np.arange(n_lat * n_lon, dtype=np.float64).reshape(n_lat, n_lon)
+    return TileSource(values, np.arange(n_lon) * 0.1, np.arange(n_lat) * 0.1, **kwargs)
+
+
+def test_levels_and_shapes():
+    tiles = source(tile_size=64)
+    # The coarsest level fits in one tile
+    assert tiles.n_levels == 4
+    assert tiles.level_shape(0) == (300, 500)
+    assert tiles.level_shape(2) == (75, 125)
+    assert max(tiles.level_shape(tiles.n_levels - 1)) <= 64
+
+
+def test_tiles_are_strided_windows():
+    tiles = source(tile_size=64)
+    full = tiles.values
+    assert np.array_equal(tiles.tile(0, 1, 2), full[64:128, 128:192])
+    assert np.array_equal(tiles.tile(1, 0, 1), full[0:128:2, 128:256:2])
+    # Edge tiles are clipped to the grid
+    assert tiles.tile(0, 4, 7).shape == (300 - 256, 500 - 448)
+
+
+def test_read_joins_tiles_with_their_axes():
+    tiles = source(tile_size=64)
+    values, x, y = tiles.read(1, (0, 2), (1, 3))
+    assert np.array_equal(values, tiles.values[0:256:2, 128:384:2])
+    assert np.array_equal(x, tiles.x[128:384:2])
+    assert np.array_equal(y, tiles.y[0:256:2])
+
+
+def test_cache_evicts_least_recently_used():
+    tiles = source(tile_size=64, cache_tiles=2)
+    tiles.tile(0, 0, 0)
+    tiles.tile(0, 0, 1)
+    tiles.tile(0, 0, 0)
+    tiles.tile(0, 0, 2)
+    assert tiles.cache_info() == {"hits": 1, "misses": 3, "tiles": 2}
+    # (0, 0, 1) was the least recently used and is read again
+    tiles.tile(0, 0, 1)
+    assert tiles.cache_info()["misses"] == 4
+    tiles.tile(0, 0, 2)
+    assert tiles.cache_info()["hits"] == 2
+
+
+def test_transform_and_integer_tiles():
+    values = np.arange(16, dtype=np.int16).reshape(4, 4)
+    tiles = TileSource(values, np.arange(4), np.arange(4), tile_size=2, transform=lambda tile: tile / 2)
+    assert tiles.tile(0, 1, 1).tolist() == [[5.0, 5.5], [7.0, 7.5]]
+    assert TileSource(values, np.arange(4), np.arange(4)).tile(0, 0, 0).dtype == np.float32
+
+
+def test_extent_covers_full_resolution_peaks():
+    values = np.zeros((300, 500))
+    # A peak that no coarse level samples, next to a NaN hole
+    values[101, 203] = 99.0
+    values[:50, :50] = np.nan
+    tiles = TileSource(values, np.arange(500.0), np.arange(300.0), tile_size=64, cache_tiles=4)
+    assert tiles.extent() == (0, 499, 0, 299, 0, 99)
+    # Reading the range leaves the cache alone
+    assert tiles.cache_info()["tiles"] == 0
+
+
+def test_shapes_must_match_the_axes():
+    with pytest.raises(ValueError, match="do not match axes"):
+        TileSource(np.zeros((3, 4)), np.arange(3), np.arange(4))
+    with pytest.raises(ValueError, match="x and y axes are required"):
+        TileSource(np.zeros((3, 4)))
+
+
+def flat(n, **kwargs):
+    return TileSource(np.zeros((n, n)), np.arange(n) * 0.1, np.arange(n) * 0.1, **kwargs)
+
+
+def test_window_narrows_with_zoom():
+    tiles = flat(2000, tile_size=128)
+    surface = Surface3D(width=400, height=400)
+    provider = TileProvider(tiles, surface)
+    level, rows, cols = provider.window(provider.pixels_per_cell)
+    # The whole grid is on screen at zoom 1, at a level matched to the canvas
+    n_tiles = -(-tiles.level_shape(level)[0] // 128)
+    assert (rows, cols) == ((0, n_tiles), (0, n_tiles))
+    assert level > 0
+    surface.zoom = 8
+    fine, fine_rows, fine_cols = provider.window(provider.pixels_per_cell)
+    assert fine < level
+    assert fine_rows[1] - fine_rows[0] < tiles.level_shape(fine)[0] / 128
+    # The view sent follows, with a coarser level for interaction
+    assert (surface.n_lat, surface.n_lon) == (len(surface.y), len(surface.x))
+    assert surface.coarse_n_lat < surface.n_lat
+
+
+def test_window_ignores_rotation():
+    surface = Surface3D(width=400, height=400, zoom=4)
+    provider = TileProvider(flat(2000, tile_size=128), surface)
+    window = provider.window(provider.pixels_per_cell)
+    surface.update(azimuth=130, elevation=-10)
+    assert provider.window(provider.pixels_per_cell) == window
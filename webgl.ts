@@ -0,0 +1,170 @@
+/**
+ * WebGL renderer for Surface3D
+ *
+ * Vertices and per-vertex colors are uploaded once as GPU buffers; each frame
+ * only updates the view matrix uniform and relies on the hardware depth test
+ * instead of sorting quads.
+ */
+
+const VERTEX_SHADER = `
+attribute vec3 a_position;
+attribute vec4 a_color;
+uniform mat4 u_matrix;
+varying vec4 v_color;
+
+void main() {
+  gl_Position = u_matrix * vec4(a_position, 1.0);
+  v_color = a_color;
+}
+`
+
+const FRAGMENT_SHADER = `
+precision mediump float;
+varying vec4 v_color;
+
+void main() {
+  gl_FragColor = v_color;
+}
+`
+
+type GL = WebGLRenderingContext | WebGL2RenderingContext
+
+function compileShader(gl: GL, type: number, source: string): WebGLShader {
+  const shader = gl.createShader(type)!
+  gl.shaderSource(shader, source)
+  gl.compileShader(shader)
+  if (!gl.getShaderParameter(shader, gl.COMPILE_STATUS)) {
+    const log = gl.getShaderInfoLog(shader)
+    gl.deleteShader(shader)
+    throw new Error(`Surface3D: shader compilation failed: ${log}`)
+  }
+  return shader
+}
+
+export class WebGLSurfaceRenderer {
+  private readonly program: WebGLProgram
+  private readonly position_buffer: WebGLBuffer
+  private readonly color_buffer: WebGLBuffer
+  private readonly index_buffer: WebGLBuffer
+  private readonly a_position: number
+  private readonly a_color: number
+  private readonly u_matrix: WebGLUniformLocation
+  private n_indices: number = 0
+
+  /**
+   * Create a renderer on the canvas, or return null if WebGL is unavailable
+   * (the caller then falls back to Canvas2D on a new canvas, as this one
+   * may already be bound to a WebGL context)
+   */
+  static create(canvas: HTMLCanvasElement): WebGLSurfaceRenderer | null {
+    const options: WebGLContextAttributes = {antialias: true, preserveDrawingBuffer: true}
+    try {
+      const gl2 = canvas.getContext('webgl2', options)
+      if (gl2) return new WebGLSurfaceRenderer(gl2)
+      const gl = canvas.getContext('webgl', options)
+      // 32-bit indices are needed for grids above 65535 vertices
+      if (gl && gl.getExtension('OES_element_index_uint')) return new WebGLSurfaceRenderer(gl)
+    } catch (e) {
+      console.warn(`Surface3D: WebGL unavailable, falling back to Canvas2D (${e})`)
+    }
+    return null
+  }
+
+  private constructor(readonly gl: GL) {
+    const vs = compileShader(gl, gl.VERTEX_SHADER, VERTEX_SHADER)
+    const fs = compileShader(gl, gl.FRAGMENT_SHADER, FRAGMENT_SHADER)
+    this.program = gl.createProgram()!
+    gl.attachShader(this.program, vs)
+    gl.attachShader(this.program, fs)
+    gl.linkProgram(this.program)
+    if (!gl.getProgramParameter(this.program, gl.LINK_STATUS)) {
+      throw new Error(`Surface3D: program link failed: ${gl.getProgramInfoLog(this.program)}`)
+    }
+    this.a_position = gl.getAttribLocation(this.program, 'a_position')
+    this.a_color = gl.getAttribLocation(this.program, 'a_color')
+    this.u_matrix = gl.getUniformLocation(this.program, 'u_matrix')!
+    this.position_buffer = gl.createBuffer()!
+    this.color_buffer = gl.createBuffer()!
+    this.index_buffer = gl.createBuffer()!
+  }
+
+  /**
+   * Upload geometry: xyz positions (3 per vertex), RGBA colors (4 bytes per
+   * vertex) and triangle indices. Only needed when the data or colors change.
+   */
+  set_geometry(positions: Float32Array, colors: Uint8Array, indices: Uint32Array): void {
+    const gl = this.gl
+    gl.bindBuffer(gl.ARRAY_BUFFER, this.position_buffer)
+    gl.bufferData(gl.ARRAY_BUFFER, positions, gl.STATIC_DRAW)
+    gl.bindBuffer(gl.ARRAY_BUFFER, this.color_buffer)
+    gl.bufferData(gl.ARRAY_BUFFER, colors, gl.STATIC_DRAW)
+    gl.bindBuffer(gl.ELEMENT_ARRAY_BUFFER, this.index_buffer)
+    gl.bufferData(gl.ELEMENT_ARRAY_BUFFER, indices, gl.STATIC_DRAW)
+    this.n_indices = indices.length
+  }
+
+  /**
+   * Draw the uploaded geometry with a column-major 4x4 view matrix
+   */
+  draw(matrix: Float32Array, background: [number, number, number, number]): void {
+    const gl = this.gl
+    gl.viewport(0, 0, gl.drawingBufferWidth, gl.drawingBufferHeight)
+    gl.clearColor(background[0] / 255, background[1] / 255, background[2] / 255, background[3] / 255)
+    gl.clear(gl.COLOR_BUFFER_BIT | gl.DEPTH_BUFFER_BIT)
+    gl.enable(gl.DEPTH_TEST)
+    gl.depthFunc(gl.LESS)
+
+    gl.useProgram(this.program)
+    gl.uniformMatrix4fv(this.u_matrix, false, matrix)
+
+    gl.bindBuffer(gl.ARRAY_BUFFER, this.position_buffer)
+    gl.enableVertexAttribArray(this.a_position)
+    gl.vertexAttribPointer(this.a_position, 3, gl.FLOAT, false, 0, 0)
+
+    gl.bindBuffer(gl.ARRAY_BUFFER, this.color_buffer)
+    gl.enableVertexAttribArray(this.a_color)
+    gl.vertexAttribPointer(this.a_color, 4, gl.UNSIGNED_BYTE, true, 0, 0)
+
+    gl.bindBuffer(gl.ELEMENT_ARRAY_BUFFER, this.index_buffer)
+    gl.drawElements(gl.TRIANGLES, this.n_indices, gl.UNSIGNED_INT, 0)
+  }
+
+  dispose(): void {
+    const gl = this.gl
+    gl.deleteBuffer(this.position_buffer)
+    gl.deleteBuffer(this.color_buffer)
+    gl.deleteBuffer(this.index_buffer)
+    gl.deleteProgram(this.program)
+  }
+}
+
+/**
+ * Build the view matrix for vertices that are already centered on the data
+ * center, matching the Canvas2D projection (azimuth about z, then elevation
+ * tilt) so both backends show the same picture. Larger canvas depth means
+ * closer to the viewer, so it is mapped to smaller clip-space z.
+ */
+export function viewMatrix(
+  azim_rad: number,
+  elev_rad: number,
+  scale: number,
+  width: number,
+  height: number,
+  data_range: number
+): Float32Array {
+  const ca = Math.cos(azim_rad)
+  const sa = Math.sin(azim_rad)
+  const ce = Math.cos(elev_rad)
+  const se = Math.sin(elev_rad)
+  const kx = scale / (width / 2)
+  const ky = scale / (height / 2)
+  const kz = -1 / data_range
+
+  // Column-major: m[col * 4 + row]
+  return new Float32Array([
+    kx * ca, ky * sa * se, kz * sa * ce, 0,
+    -kx * sa, ky * ca * se, kz * ca * ce, 0,
+    0, ky * ce, -kz * se, 0,
+    0, 0, 0, 1,
+  ])
+}
@@ -0,0 +1,172 @@
+/**
+ * Web Worker renderer for Surface3D
+ *
+ * The canvas is transferred to a worker as an OffscreenCanvas and the
+ * Canvas2D kernel runs there, so projection, ordering and drawing no longer
+ * block the page. Geometry and colors are sent once per change as
+ * transferable copies; each frame only sends the view parameters.
+ */
+import {kernelSource} from "./kernel"
+import type {GridGeometry, ViewParams} from "./kernel"
+
+// Message handler evaluated in the worker after the kernel source. Draw
+// requests are coalesced so a slow frame never builds up a queue of stale
+// views.
+const WORKER_MAIN = `
+let ctx = null
+let geometry = null
+let colors = null
+let buffers = undefined
+let pending = null
+
+// Draw the latest view, then report its number so the page knows when the
+// canvas shows the last view it sent
+function draw() {
+  const {view, background, seq} = pending
+  pending = null
+  paint(view, background)
+  self.postMessage({type: "drawn", seq})
+}
+
+function paint(view, background) {
+  if (ctx == null || geometry == null || colors == null) return
+  const {n_lat, n_lon, triangles} = geometry
+  ctx.fillStyle = background
+  ctx.fillRect(0, 0, ctx.canvas.width, ctx.canvas.height)
+  if (triangles != null) {
+    buffers = ensureMeshBuffers(buffers, n_lon, triangles.length / 3)
+    projectVertices(geometry, view, buffers)
+    computeTriangleDepths(triangles, buffers)
+    let count = buffers.n_quads
+    let order
+    if (geometry.globe) {
+      count = cullHiddenTriangles(triangles, view, buffers)
+      order = sortQuadsByDepth(buffers, buffers.visible, count)
+    } else {
+      order = sortQuadsByDepth(buffers)
+    }
+    drawTriangles(ctx, triangles, buffers, order, count, colors.quad_index, colors.styles)
+    return
+  }
+  buffers = ensureFrameBuffers(buffers, n_lat, n_lon)
+  projectVertices(geometry, view, buffers)
+  let count = buffers.n_quads
+  let order
+  if (geometry.height_field) {
+    order = traverseBackToFront(geometry, view, buffers)
+  } else {
+    computeQuadDepths(n_lat, n_lon, buffers)
+    if (geometry.globe) {
+      count = cullHiddenQuads(n_lat, n_lon, view, buffers)
+      order = sortQuadsByDepth(buffers, buffers.visible, count)
+    } else {
+      order = sortQuadsByDepth(buffers)
+    }
+  }
+  drawQuads(ctx, n_lon, buffers, order, count, colors.quad_index, colors.styles)
+}
+
+self.onmessage = (event) => {
+  const message = event.data
+  switch (message.type) {
+    case "canvas":
+      ctx = message.canvas.getContext("2d")
+      break
+    case "geometry":
+      geometry = message.geometry
+      break
+    case "colors":
+      colors = message.colors
+      break
+    case "draw":
+      if (pending == null) setTimeout(draw, 0)
+      pending = message
+      break
+  }
+}
+`
+
+export class WorkerSurfaceRenderer {
+  private readonly url: string
+
+  /**
+   * Move the canvas to a new worker, or return null if OffscreenCanvas or
+   * workers are unavailable (e.g. blocked by a content security policy); the
+   * caller then falls back to Canvas2D on a new canvas, as this one may
+   * already have been transferred
+   */
+  static create(canvas: HTMLCanvasElement): WorkerSurfaceRenderer | null {
+    if (typeof canvas.transferControlToOffscreen !== 'function' || typeof Worker === 'undefined') {
+      return null
+    }
+    let url: string | undefined
+    try {
+      const blob = new Blob([kernelSource(), WORKER_MAIN], {type: 'text/javascript'})
+      url = URL.createObjectURL(blob)
+      const worker = new Worker(url)
+      const offscreen = canvas.transferControlToOffscreen()
+      worker.postMessage({type: 'canvas', canvas: offscreen}, [offscreen])
+      return new WorkerSurfaceRenderer(worker, url)
+    } catch (e) {
+      if (url != null) URL.revokeObjectURL(url)
+      console.warn(`Surface3D: worker rendering unavailable, falling back to Canvas2D (${e})`)
+      return null
+    }
+  }
+
+  // Numbers of the last draw request sent and of the last one drawn
+  private posted: number = 0
+  private drawn: number = 0
+
+  private constructor(readonly worker: Worker, url: string) {
+    this.url = url
+    worker.onmessage = (event) => {
+      if (event.data.type == 'drawn') this.drawn = event.data.seq
+    }
+  }
+
+  /**
+   * True when the worker has drawn the last view sent to it
+   */
+  get idle(): boolean {
+    return this.drawn == this.posted
+  }
+
+  /**
+   * Send vertex data. The arrays are copied and the copies transferred, so
+   * the caller's (and the model's) arrays stay usable.
+   */
+  set_geometry(geometry: GridGeometry): void {
+    const {n_lat, n_lon, rectilinear, height_field, globe} = geometry
+    const xs = Float64Array.from(geometry.xs)
+    const ys = Float64Array.from(geometry.ys)
+    const values = Float64Array.from(geometry.values)
+    const transfer: Transferable[] = [xs.buffer, ys.buffer, values.buffer]
+    let triangles: Uint32Array | undefined
+    if (geometry.triangles != null) {
+      triangles = Uint32Array.from(geometry.triangles)
+      transfer.push(triangles.buffer)
+    }
+    this.worker.postMessage(
+      {type: 'geometry', geometry: {n_lat, n_lon, rectilinear, height_field, xs, ys, values, triangles, globe}},
+      transfer,
+    )
+  }
+
+  /**
+   * Send per-quad color indices and the styles they index
+   */
+  set_colors(quad_index: Uint16Array, styles: string[]): void {
+    const copy = quad_index.slice()
+    this.worker.postMessage({type: 'colors', colors: {quad_index: copy, styles}}, [copy.buffer])
+  }
+
+  draw(view: ViewParams, background: string): void {
+    this.worker.postMessage({type: 'draw', view, background, seq: ++this.posted})
+  }
+
+  dispose(): void {
+    this.worker.terminate()
+    URL.revokeObjectURL(this.url)
+  }
+}